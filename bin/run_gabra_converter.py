@@ -8,166 +8,269 @@
 Convert a Ġabra database dump into a more accessible format.
 '''
 
+import io
 import os
+import sys
+import json
 import argparse
+import multiprocessing
+from typing import Optional
 import gabra_converter
-from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
-from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
-from gabra_converter.pipeline import pipeline, PipelineListener
-from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener \
-    import LexemePipelineListener
-from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_skip_log \
-    import LexemePipelineListenerSkipLog
-from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener \
-    import WordformPipelineListener
-from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_skip_log \
-    import WordformPipelineListenerSkipLog
-from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
-    get_all_lexeme_exporters
-)
+from gabra_converter.converters.checkpoint import DEFAULT_CHECKPOINT_INTERVAL
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
-    get_all_lexeme_cleaners
+    get_lexeme_cleaner_infos,
+    get_lexeme_cleaner,
 )
-from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
-    get_all_wordform_exporters
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_lexeme_exporter_infos,
+    get_lexeme_exporter,
 )
 from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
-    get_all_wordform_cleaners
+    get_wordform_cleaner_infos,
+    get_wordform_cleaner,
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_wordform_exporter_infos,
+    get_wordform_exporter,
 )
 
 
 #########################################
-class Listener(PipelineListener):
-    '''
-    Listens to the different high level stages in the pipeline process.
+def run_stream(
+    args: argparse.Namespace,
+) -> None:
     '''
+    Convert the documents read from standard input and write them to standard output.
+        Errors are written to standard error so that they do not get mixed with the output.
 
-    #########################################
-    def __init__(
-        self,
-    ) -> None:
-        '''
-        Initialiser.
-        '''
-        super().__init__()
-
-    #########################################
-    def started_extracting(
-        self,
-    ) -> None:
-        '''
-        Listen for when the compressed database dump started being extracted into BSON files.
-        '''
-        print('Extracting and processing database dump.')
-
-    #########################################
-    def started_exporting_lexemes(
-        self,
-    ) -> None:
-        '''
-        Listen for when the lexemes JSONL file started being exported into the target format.
-        '''
-        print('Exporting lexemes...')
-
-    #########################################
-    def ended_exporting_lexemes(
-        self,
-    ) -> None:
-        '''
-        Listen for when the lexemes JSONL file stopped being exported into the target format.
-        '''
-        print()
-
-    #########################################
-    def started_exporting_wordforms(
-        self,
-    ) -> None:
-        '''
-        Listen for when the wordforms JSONL file started being exported into the target format.
-        '''
-        print('Exporting wordforms...')
-
-    #########################################
-    def ended_exporting_wordforms(
-        self,
-    ) -> None:
-        '''
-        Listen for when the wordforms JSONL file stopped being exported into the target format.
-        '''
-        print()
-
-
-#########################################
-class LexemePipelineListener_(LexemePipelineListener):
+    :param args: The parsed command line arguments.
     '''
-    Lexeme pipeline listener.
-    '''
-
-    #########################################
-    def __init__(
-        self,
-    ) -> None:
-        '''
-        Initialiser.
-        '''
-        super().__init__()
-        self.count = 0
+    # The pipeline is only imported once the arguments are parsed so that showing the help or
+    # the version is quick.
+    # pylint: disable=import-outside-toplevel
+    from gabra_converter.row_iterators import iter_lexemes
+    from gabra_converter.stream_pipeline import stream_lexemes, stream_wordforms
 
-    #########################################
-    def row_exported(
-        self,
-        json_line: str,
-        row: LexemeRow,
-    ) -> None:
-        '''
-        Listen for when a row is successfully exported.
+    if (
+        args.stream == 'wordforms'
+        and args.stream_lexemes_path is None
+        and 'missing_lexeme' in args.wordform_cleaners
+    ):
+        print(
+            'Error: the missing_lexeme cleaner needs --stream_lexemes_path when streaming'
+            ' wordforms.',
+            file=sys.stderr,
+        )
+        return
 
-        :param json_line: The raw JSON line that was processed.
-        :param row: The processed row that was exported.
-        '''
-        self.count += 1
-        print(f'\r > Rows exported: {self.count}', end='')
+    lexeme_cleaners = [get_lexeme_cleaner(id_) for id_ in args.lexeme_cleaners]
+    wordform_cleaners = [get_wordform_cleaner(id_) for id_ in args.wordform_cleaners]
+    out_f = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='')
+    try:
+        if args.stream == 'lexemes':
+            stream_lexemes(
+                sys.stdin.buffer,
+                out_f,
+                cleaners=lexeme_cleaners,
+                stream_format=args.stream_format,
+            )
+        else:
+            lexemes_id_map: dict[str, int] = {}
+            if args.stream_lexemes_path is not None:
+                for _ in iter_lexemes(args.stream_lexemes_path, lexeme_cleaners, lexemes_id_map):
+                    pass
+            stream_wordforms(
+                sys.stdin.buffer,
+                out_f,
+                cleaners=wordform_cleaners,
+                stream_format=args.stream_format,
+                lexemes_id_map=lexemes_id_map,
+            )
+    except BrokenPipeError:
+        # The reading end of the pipe was closed (such as by head) so the rest of the output
+        # is not needed.
+        # Standard output is pointed to null so that Python does not fail flushing it on exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        out_f.detach()
 
 
 #########################################
-class WordformPipelineListener_(WordformPipelineListener):
-    '''
-    Wordform pipeline listener.
+def run_pipeline(
+    args: argparse.Namespace,
+) -> None:
     '''
+    Convert the database dump into the output folder.
 
-    #########################################
-    def __init__(
-        self,
-    ) -> None:
-        '''
-        Initialiser.
-        '''
-        super().__init__()
-        self.count = 0
-
-    #########################################
-    def row_exported(
-        self,
-        json_line: str,
-        row: WordformRow,
-    ) -> None:
-        '''
-        Listen for when a row is successfully exported.
+    :param args: The parsed command line arguments.
+    '''
+    # The pipeline is only imported once the arguments are parsed so that showing the help or
+    # the version is quick.
+    # pylint: disable=import-outside-toplevel
+    from gabra_converter.pipeline import DRY_RUN_REPORT_FNAME, PipelineListener, pipeline
+    from gabra_converter.pipeline_listener_memory_profile import PipelineListenerMemoryProfile
+    from gabra_converter.converters.memory_profiler import MemoryProfiler
+    from gabra_converter.pipeline_listener_cpu_profile import PipelineListenerCPUProfile
+    from gabra_converter.converters.cpu_profiler import CPUProfiler
+    from gabra_converter.pipeline_listener_metrics import PipelineListenerMetrics
+    from gabra_converter.converters.conversion_metrics import ConversionMetrics
+    from gabra_converter.pipeline_listener_progress import PipelineListenerProgress
+    from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener \
+        import LexemePipelineListener
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_progress import LexemePipelineListenerProgress
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_skip_log import LexemePipelineListenerSkipLog
+    from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_dafsa \
+        import LexemePipelineListenerDAFSA
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_fuzzy_index import LexemePipelineListenerFuzzyIndex
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_fts_index import LexemePipelineListenerFTSIndex
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_root_index import LexemePipelineListenerRootIndex
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_stats import LexemePipelineListenerStats
+    from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener \
+        import WordformPipelineListener
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_progress import WordformPipelineListenerProgress
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_skip_log import WordformPipelineListenerSkipLog
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_dafsa import WordformPipelineListenerDAFSA
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_stats import WordformPipelineListenerStats
+    from gabra_converter.converters.lexemes.pipeline.listeners \
+        .lexeme_pipeline_listener_memory_profile import LexemePipelineListenerMemoryProfile
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_memory_profile import WordformPipelineListenerMemoryProfile
+    from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_metrics \
+        import LexemePipelineListenerMetrics
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_metrics import WordformPipelineListenerMetrics
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_surface_form_lookup import (
+            WordformPipelineListenerSurfaceFormLookup
+        )
+    from gabra_converter.converters.wordforms.pipeline.listeners \
+        .wordform_pipeline_listener_fuzzy_index import WordformPipelineListenerFuzzyIndex
+    from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import (
+        NullLexemeExporter
+    )
+    from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+        NullWordformExporter
+    )
 
-        :param json_line: The raw JSON line that was processed.
-        :param row: The processed row that was exported.
-        '''
-        self.count += 1
-        print(f'\r > Rows exported: {self.count}', end='')
+    print('Starting process.')
+    os.makedirs(os.path.abspath(args.out_path), exist_ok=True)
+    lexeme_skip_log = LexemePipelineListenerSkipLog()
+    wordform_skip_log = WordformPipelineListenerSkipLog()
+    lexeme_pipeline_listeners: list[LexemePipelineListener] = [
+        lexeme_skip_log, LexemePipelineListenerProgress()
+    ]
+    wordform_pipeline_listeners: list[WordformPipelineListener] = [
+        wordform_skip_log, WordformPipelineListenerProgress()
+    ]
+    if args.dafsa:
+        lexeme_pipeline_listeners.append(LexemePipelineListenerDAFSA())
+        wordform_pipeline_listeners.append(WordformPipelineListenerDAFSA())
+    if args.fuzzy_index:
+        lexeme_pipeline_listeners.append(LexemePipelineListenerFuzzyIndex())
+        wordform_pipeline_listeners.append(WordformPipelineListenerFuzzyIndex())
+    if args.fts_index:
+        lexeme_pipeline_listeners.append(LexemePipelineListenerFTSIndex())
+    if args.root_index:
+        lexeme_pipeline_listeners.append(LexemePipelineListenerRootIndex())
+    if args.stats:
+        lexeme_pipeline_listeners.append(LexemePipelineListenerStats())
+        wordform_pipeline_listeners.append(WordformPipelineListenerStats())
+    if args.surface_form_lookup:
+        wordform_pipeline_listeners.append(WordformPipelineListenerSurfaceFormLookup())
+    lexeme_exporter = (
+        NullLexemeExporter() if args.lexeme_exporter is None
+        else get_lexeme_exporter(args.lexeme_exporter)
+    )
+    pipeline_listeners: list[PipelineListener] = [PipelineListenerProgress()]
+    if args.metrics_path is not None:
+        metrics = ConversionMetrics(os.path.abspath(args.metrics_path), args.metrics_interval)
+        pipeline_listeners.append(PipelineListenerMetrics(metrics))
+        lexeme_pipeline_listeners.append(LexemePipelineListenerMetrics(metrics, lexeme_exporter))
+        wordform_pipeline_listeners.append(WordformPipelineListenerMetrics(metrics))
+    memory_profiler: Optional[MemoryProfiler] = None
+    if args.memory_profile:
+        memory_profiler = MemoryProfiler(
+            os.path.join(os.path.abspath(args.out_path), 'memory_profile.txt')
+        )
+        pipeline_listeners.append(PipelineListenerMemoryProfile(memory_profiler))
+        lexeme_pipeline_listeners.append(
+            LexemePipelineListenerMemoryProfile(memory_profiler, args.memory_profile_interval)
+        )
+        wordform_pipeline_listeners.append(
+            WordformPipelineListenerMemoryProfile(memory_profiler, args.memory_profile_interval)
+        )
+        memory_profiler.start()
+    cpu_profiler: Optional[CPUProfiler] = None
+    if args.profile is not None:
+        cpu_profiler = CPUProfiler(
+            os.path.join(os.path.abspath(args.out_path), 'profile'),
+            args.profile,
+            args.profile_interval,
+        )
+        pipeline_listeners.append(PipelineListenerCPUProfile(cpu_profiler))
+    try:
+        pipeline(
+            gabra_dump_path=os.path.abspath(args.gabra_dump_path),
+            out_path=os.path.abspath(args.out_path),
+            lexeme_cleaners=[get_lexeme_cleaner(id_) for id_ in args.lexeme_cleaners],
+            wordform_cleaners=[get_wordform_cleaner(id_) for id_ in args.wordform_cleaners],
+            lexeme_exporter=lexeme_exporter,
+            wordform_exporter=(
+                NullWordformExporter() if args.wordform_exporter is None
+                else get_wordform_exporter(args.wordform_exporter)
+            ),
+            lexeme_pipeline_listeners=lexeme_pipeline_listeners,
+            wordform_pipeline_listeners=wordform_pipeline_listeners,
+            pipeline_listeners=pipeline_listeners,
+            index_jsonl=args.index_jsonl,
+            checkpoint_interval=args.checkpoint_interval,
+            resume=args.resume,
+            lexeme_order_by=args.lexeme_order_by,
+            wordform_order_by=args.wordform_order_by,
+            dry_run=args.dry_run,
+            num_processes=args.num_processes,
+            sample_fraction=args.sample_fraction,
+            sample_seed=args.sample_seed,
+        )
+    finally:
+        if cpu_profiler is not None:
+            cpu_profiler.stop()
+        if memory_profiler is not None:
+            memory_profiler.stop()
+    if args.dry_run:
+        with open(
+            os.path.join(os.path.abspath(args.out_path), DRY_RUN_REPORT_FNAME), 'r',
+            encoding='utf-8',
+        ) as f:
+            report = json.load(f)
+        for (collection, counts) in report.items():
+            print(f'{collection}:')
+            print(f'- rows: {counts["num_rows"]}')
+            print(f'- would be exported: {counts["num_exported"]}')
+            print(f'- invalid JSON: {counts["num_invalid_json"]}')
+            print(f'- schema mismatches: {counts["num_schema_mismatch"]}')
+            for (cleaner_id, count) in sorted(counts['num_skipped_by_cleaner'].items()):
+                print(f'- skipped by {cleaner_id}: {count}')
+    print('Process ready.')
 
 
 #########################################
 def main(
 ) -> None:
-    id_to_lexeme_exporter = {exporter.id_: exporter for exporter in get_all_lexeme_exporters()}
-    id_to_wordform_exporter = {exporter.id_: exporter for exporter in get_all_wordform_exporters()}
-    id_to_lexeme_cleaner = {cleaner.id_: cleaner for cleaner in get_all_lexeme_cleaners()}
-    id_to_wordform_cleaner = {cleaner.id_: cleaner for cleaner in get_all_wordform_cleaners()}
+    id_to_lexeme_exporter = {info.id_: info for info in get_lexeme_exporter_infos()}
+    id_to_wordform_exporter = {info.id_: info for info in get_wordform_exporter_infos()}
+    id_to_lexeme_cleaner = {info.id_: info for info in get_lexeme_cleaner_infos()}
+    id_to_wordform_cleaner = {info.id_: info for info in get_wordform_cleaner_infos()}
 
     parser = argparse.ArgumentParser(
         description='Convert a Ġabra database dump into a more accessible format.'
@@ -182,8 +285,12 @@ def main(
 
     parser.add_argument(
         '--gabra_dump_path',
-        required=True,
-        help='The path to the .tar.gz Ġabra dump file downloaded from the website.',
+        required=False,
+        default=None,
+        help=(
+            'The path to the .tar.gz Ġabra dump file downloaded from the website.'
+            ' Required unless --stream is used.'
+        ),
     )
     parser.add_argument(
         '--out_path',
@@ -226,10 +333,11 @@ def main(
     )
     parser.add_argument(
         '--lexeme_exporter',
-        required=True,
+        required=False,
+        default=None,
         choices=sorted(id_to_lexeme_exporter.keys()),
         help=(
-            'An exporter to apply to the lexemes.'
+            'An exporter to apply to the lexemes (required unless --stream or --dry_run is used).'
             ' The following exporters can be used -'
             ' ' + '; '.join(
                 f'*{id_}*: {id_to_lexeme_exporter[id_].description}'
@@ -239,10 +347,11 @@ def main(
     )
     parser.add_argument(
         '--wordform_exporter',
-        required=True,
+        required=False,
+        default=None,
         choices=sorted(id_to_wordform_exporter.keys()),
         help=(
-            'An exporter to apply to the wordforms.'
+            'An exporter to apply to the wordforms (required unless --stream or --dry_run is used).'
             ' The following exporters can be used -'
             ' ' + '; '.join(
                 f'*{id_}*: {id_to_wordform_exporter[id_].description}'
@@ -250,17 +359,279 @@ def main(
             )
         ),
     )
+    parser.add_argument(
+        '--index_jsonl',
+        action='store_true',
+        help=(
+            'Keep the extracted lexemes.jsonl and wordforms.jsonl files in the output folder'
+            ' together with a line offset index for each one (lexemes.jsonl.idx and'
+            ' wordforms.jsonl.idx) for looking up individual documents by line number or'
+            ' Ġabra ID later on.'
+        ),
+    )
+    parser.add_argument(
+        '--surface_form_lookup',
+        action='store_true',
+        help=(
+            'Also build a compact lookup file (wordforms_lookup.bin) in the output folder that'
+            ' maps every surface form to the IDs of the wordforms having it, to be read with'
+            ' gabra_converter.converters.surface_form_lookup.SurfaceFormLookupReader.'
+        ),
+    )
+    parser.add_argument(
+        '--dafsa',
+        action='store_true',
+        help=(
+            'Also build compact word lists (lexemes.dafsa with the lemmas and wordforms.dafsa'
+            ' with the surface forms, together with their alternatives) in the output folder'
+            ' for spell checking, to be read with'
+            ' gabra_converter.converters.dafsa.DAFSAReader.'
+        ),
+    )
+    parser.add_argument(
+        '--fuzzy_index',
+        action='store_true',
+        help=(
+            'Also build diacritic insensitive fuzzy indexes (lexemes_fuzzy.idx for the lemmas'
+            ' and wordforms_fuzzy.idx for the surface forms) in the output folder for finding'
+            ' the IDs of rows matching misspelled queries, to be read with'
+            ' gabra_converter.converters.fuzzy_index.FuzzyIndexReader.'
+        ),
+    )
+    parser.add_argument(
+        '--fts_index',
+        action='store_true',
+        help=(
+            'Also build an SQLite database (lexemes_fts.sqlite3) in the output folder with FTS5'
+            ' full text indexes of the glosses and examples of the lexemes for reverse lookup'
+            ' from English to Maltese.'
+        ),
+    )
+    parser.add_argument(
+        '--root_index',
+        action='store_true',
+        help=(
+            'Also build an index (lexemes_roots.idx) in the output folder mapping the roots of'
+            ' the lexemes (radicals and variant) to their IDs for browsing lexemes by root, to'
+            ' be read with gabra_converter.converters.root_index.RootIndexReader.'
+        ),
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help=(
+            'Also save statistics reports of the exported rows (lexemes_stats.json and'
+            ' wordforms_stats.json) in the output folder with the counts of the values of the'
+            ' categorical fields, the estimated number of distinct lemmas and surface forms,'
+            ' and histograms of the glosses and wordforms per lexeme.'
+            ' Reports of different exports can be merged with tools/merge_stats.py.'
+        ),
+    )
+    parser.add_argument(
+        '--checkpoint_interval',
+        required=False,
+        type=int,
+        default=None,
+        help=(
+            'Save a checkpoint of the export every given number of rows so that it can be'
+            ' resumed with --resume if it is interrupted.'
+            ' The extracted JSON lines files and the checkpoints are kept in the output folder'
+            ' until the export finishes.'
+        ),
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help=(
+            'Resume an interrupted export that was using --checkpoint_interval in the same'
+            ' output folder from its last checkpoint.'
+            f' Checkpoints every {DEFAULT_CHECKPOINT_INTERVAL} rows unless'
+            ' --checkpoint_interval is given.'
+        ),
+    )
+    parser.add_argument(
+        '--lexeme_order_by',
+        required=False,
+        default=None,
+        choices=['lemma', '_id'],
+        help=(
+            'Export the lexemes sorted by the given field (by Unicode code point) instead of in'
+            ' the order of the dump, numbering them in that order.'
+            ' The lexemes are sorted on disk with a bounded amount of memory.'
+        ),
+    )
+    parser.add_argument(
+        '--wordform_order_by',
+        required=False,
+        default=None,
+        choices=['surface_form', 'new_lexeme_id', '_id'],
+        help=(
+            'Export the wordforms sorted by the given field instead of in the order of the dump,'
+            ' numbering them in that order.'
+            ' *new_lexeme_id* groups the wordforms by lexeme in the order of the exported'
+            ' lexemes.'
+            ' The wordforms are sorted on disk with a bounded amount of memory.'
+        ),
+    )
+    parser.add_argument(
+        '--dry_run',
+        action='store_true',
+        help=(
+            'Only extract, fix, validate, and clean the rows without exporting them, and save'
+            ' the number of rows that would be exported and skipped, by reason, in'
+            ' dry_run_report.json in the output folder.'
+            ' The rows are checked in parallel using every core.'
+            ' The exporters are not required.'
+        ),
+    )
+    parser.add_argument(
+        '--num_processes',
+        required=False,
+        type=int,
+        default=None,
+        help='The number of processes to use with --dry_run (one per core by default).',
+    )
+    parser.add_argument(
+        '--sample_fraction',
+        required=False,
+        type=float,
+        default=None,
+        help=(
+            'Only convert a deterministic sample of the given fraction (more than 0 and at most'
+            ' 1) of the lexemes together with all their wordforms, for quick previews such as'
+            ' when trying out cleaners.'
+            ' Rows are sampled by a hash of the Ġabra ID of their lexeme so the same fraction'
+            ' always gives the same sample and no sampled wordform refers to a lexeme that was'
+            ' left out.'
+        ),
+    )
+    parser.add_argument(
+        '--sample_seed',
+        required=False,
+        default='',
+        help='A string that selects a different sample of the same --sample_fraction.',
+    )
+    parser.add_argument(
+        '--memory_profile',
+        action='store_true',
+        help=(
+            'Trace the memory allocations and write a report (memory_profile.txt) in the output'
+            ' folder with the code locations that hold the most memory and that grew the most at'
+            ' the start and end of every stage and every --memory_profile_interval rows.'
+            ' This makes the conversion several times slower.'
+        ),
+    )
+    parser.add_argument(
+        '--memory_profile_interval',
+        required=False,
+        type=int,
+        default=100000,
+        help='The number of rows between memory snapshots with --memory_profile.',
+    )
+    parser.add_argument(
+        '--profile',
+        required=False,
+        default=None,
+        choices=['deterministic', 'sampling'],
+        help=(
+            'Profile the processing time of every stage separately and save the profiles in a'
+            ' folder called profile in the output folder.'
+            ' The deterministic mode records every function call with cProfile in a .pstats'
+            ' file per stage, which makes the conversion about twice as slow.'
+            ' The sampling mode records the call stack every --profile_interval seconds in a'
+            ' .collapsed file per stage for flame graph tools, with little overhead.'
+        ),
+    )
+    parser.add_argument(
+        '--profile_interval',
+        required=False,
+        type=float,
+        default=0.01,
+        help='The number of seconds between call stack samples with --profile sampling.',
+    )
+    parser.add_argument(
+        '--metrics_path',
+        required=False,
+        default=None,
+        help=(
+            'The path to a file to keep the metrics of the conversion in, in the OpenMetrics'
+            ' text format, such as a .prom file in the folder of the textfile collector of the'
+            ' Prometheus node exporter.'
+            ' The metrics include the number of rows read, exported, and skipped by reason and'
+            ' cleaner, the time taken per row, the stage being run, and the size of the lexemes'
+            ' ID map.'
+        ),
+    )
+    parser.add_argument(
+        '--metrics_interval',
+        required=False,
+        type=float,
+        default=15.0,
+        help='The minimum number of seconds between writes of the --metrics_path file.',
+    )
+
+    parser.add_argument(
+        '--stream',
+        required=False,
+        default=None,
+        choices=['lexemes', 'wordforms'],
+        help=(
+            'Instead of converting a dump file, read the documents of the given collection in'
+            ' JSON lines format from standard input (such as the output of bsondump) and write'
+            ' the cleaned rows to standard output as they are converted, without writing'
+            ' anything to disk.'
+        ),
+    )
+    parser.add_argument(
+        '--stream_format',
+        required=False,
+        default='ndjson',
+        choices=['ndjson', 'csv'],
+        help=(
+            'The format of the output of --stream:'
+            ' *ndjson*: every cleaned row as a line of the jsonl exporter;'
+            ' *csv*: the main table of the csv exporter (lexemes.csv or wordforms.csv).'
+        ),
+    )
+    parser.add_argument(
+        '--stream_lexemes_path',
+        required=False,
+        default=None,
+        help=(
+            'The path to a lexemes JSON lines, BSON, or .tar.gz dump file to number the lexemes'
+            ' from when streaming wordforms, which is needed by the missing_lexeme cleaner and'
+            ' to fill the new_lexeme_id column of csv output.'
+            ' The lexemes are cleaned using --lexeme_cleaners.'
+        ),
+    )
 
     args = parser.parse_args()
+    if args.sample_fraction is not None and not 0.0 < args.sample_fraction <= 1.0:
+        parser.error('--sample_fraction must be more than 0 and at most 1.')
+    if args.profile_interval <= 0.0:
+        parser.error('--profile_interval must be more than 0.')
+
+    if args.stream is not None:
+        run_stream(args)
+        return
 
+    if args.gabra_dump_path is None:
+        print('Error: gabra_dump_path is required unless --stream is used.')
+        return
     if not args.gabra_dump_path.endswith('.tar.gz'):
         print('Error: gabra_dump_path must point to a .tar.gz file.')
         return
+    if not args.dry_run and (args.lexeme_exporter is None or args.wordform_exporter is None):
+        print(
+            'Error: lexeme_exporter and wordform_exporter are required unless --stream or'
+            ' --dry_run is used.'
+        )
+        return
 
     missing_required_cleaners = (
         id_to_lexeme_exporter[args.lexeme_exporter].required_cleaners
         - set(args.lexeme_cleaners)
-    )
+    ) if args.lexeme_exporter is not None else set()
     if len(missing_required_cleaners) > 0:
         missing = ', '.join(sorted(missing_required_cleaners))
         print(
@@ -272,7 +643,7 @@ def main(
     missing_required_cleaners = (
         id_to_wordform_exporter[args.wordform_exporter].required_cleaners
         - set(args.wordform_cleaners)
-    )
+    ) if args.wordform_exporter is not None else set()
     if len(missing_required_cleaners) > 0:
         missing = ', '.join(sorted(missing_required_cleaners))
         print(
@@ -281,25 +652,10 @@ def main(
         )
         return
 
-    print('Starting process.')
-    os.makedirs(os.path.abspath(args.out_path), exist_ok=True)
-    lexeme_skip_log = LexemePipelineListenerSkipLog()
-    lexeme_skip_log.create(os.path.abspath(args.out_path))
-    wordform_skip_log = WordformPipelineListenerSkipLog()
-    wordform_skip_log.create(os.path.abspath(args.out_path))
-    pipeline(
-        gabra_dump_path=os.path.abspath(args.gabra_dump_path),
-        out_path=os.path.abspath(args.out_path),
-        lexeme_cleaners=[id_to_lexeme_cleaner[id_] for id_ in args.lexeme_cleaners],
-        wordform_cleaners=[id_to_wordform_cleaner[id_] for id_ in args.wordform_cleaners],
-        lexeme_exporter=id_to_lexeme_exporter[args.lexeme_exporter],
-        wordform_exporter=id_to_wordform_exporter[args.wordform_exporter],
-        lexeme_pipeline_listeners=[lexeme_skip_log, LexemePipelineListener_()],
-        wordform_pipeline_listeners=[wordform_skip_log, WordformPipelineListener_()],
-        pipeline_listeners=[Listener()],
-    )
-    print('Process ready.')
+    run_pipeline(args)
 
 
 if __name__ == '__main__':
+    # Needed for the dry run processes when the script is frozen into an executable.
+    multiprocessing.freeze_support()
     main()
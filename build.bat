@@ -3,7 +3,7 @@
 call conda activate venv\ || pause && exit /b
 
 cd bin
-call pyinstaller --clean --onefile --name gabra_converter run_gabra_converter.py
+call pyinstaller --clean --onefile --collect-submodules gabra_converter --name gabra_converter run_gabra_converter.py
 cd ..
 
 call python -m build
@@ -4,7 +4,7 @@ set -e
 conda shell.bash activate venv/
 
 cd bin
-pyinstaller --clean --onefile --name gabra_converter run_gabra_converter.py
+pyinstaller --clean --onefile --collect-submodules gabra_converter --name gabra_converter run_gabra_converter.py
 cd ..
 
 call python -m build
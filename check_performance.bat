@@ -0,0 +1,8 @@
+@echo off
+
+call conda activate venv\ || pause && exit /b
+
+echo #########################################
+echo performance
+call python tools\check_performance.py || pause && exit /b
+echo.
@@ -0,0 +1,9 @@
+#!/bin/bash
+set -e
+
+conda shell.bash activate venv/
+
+echo "#########################################"
+echo "performance"
+python tools/check_performance.py
+echo ""
@@ -21,7 +21,8 @@ Feature requirements:
      - The program should be able to export lexeme and wordform rows
        into readable file formats such as CSV, with field containing
        lists being exported to separate files with foreign keys in order
-       to efficiently store the one-to-many relationships.
+       to efficiently store the one-to-many relationships, or into JSON
+       lines with one normalised object per row.
 
    * - ``cleaners``
      - The program should be able to clean and filter out undesirable
@@ -32,6 +33,107 @@ Feature requirements:
        lexemes and wordforms using a list of cleaners and an exporter,
        with JSON encoded rows that get rejected being loggable.
 
+   * - ``jsonl_index``
+     - The program should optionally be able to index the extracted JSON
+       lines files whilst processing them such that individual documents
+       can later be read by line number or Ġabra ID without reading the
+       whole file.
+
+   * - ``surface_form_lookup``
+     - The program should optionally be able to build a compact lookup
+       file mapping the surface forms of the exported wordforms to their
+       IDs which can be used without loading it into memory.
+
+   * - ``dafsa``
+     - The program should optionally be able to build compact word lists
+       of the exported lemmas and surface forms, together with their
+       alternatives, which can be checked for membership and enumerated by
+       prefix without loading them into memory.
+
+   * - ``fuzzy_index``
+     - The program should optionally be able to build indexes of the
+       exported lemmas and surface forms which find the IDs of the rows
+       matching a query regardless of diacritics and of small misspellings
+       without scanning all the rows.
+
+   * - ``fts_index``
+     - The program should optionally be able to build a full text index
+       of the glosses and examples of the exported lexemes, linked to the
+       exported lexeme IDs, for reverse lookup from English to Maltese.
+
+   * - ``root_index``
+     - The program should optionally be able to build an index mapping
+       the roots of the exported lexemes, including their variant, to the
+       exported lexeme IDs which can be used without loading it into
+       memory.
+
+   * - ``converted_tables``
+     - The program should provide a way to load the exported CSV files
+       into compact column oriented tables that can be queried and joined
+       from lexemes to wordforms without parsing them into dictionaries.
+
+   * - ``row_iterators``
+     - The program should provide a way to iterate over the fixed,
+       validated, and cleaned lexeme and wordform rows of a database dump,
+       BSON file, or JSON lines file lazily without exporting them.
+
+   * - ``stream_pipeline``
+     - The program should provide a way to convert JSON lines documents
+       read from standard input into a single NDJSON or CSV stream written
+       to standard output as they are converted, so that it can be used in
+       shell pipelines without writing to disk.
+
+   * - ``plugins``
+     - The program should list the available cleaners and exporters,
+       including ones provided by other packages, without importing
+       their implementations until they are used.
+
+   * - ``duplicate_detection``
+     - The program should be able to skip and report lexemes and
+       wordforms with repeated IDs and wordforms duplicated within a
+       lexeme without keeping every key as a Python object.
+
+   * - ``ordered_export``
+     - The program should optionally export the lexemes and wordforms
+       sorted by a field, such as by lemma or grouped by lexeme, using a
+       bounded amount of memory regardless of the size of the dump.
+
+   * - ``dataset_stats``
+     - The program should optionally accumulate statistics of the
+       exported rows, such as value counts, distinct counts, and
+       histograms, whilst exporting into reports that can be merged
+       across exports of different parts of a dump.
+
+   * - ``dry_run``
+     - The program should optionally only count the rows that would be
+       exported and skipped, by reason, without exporting anything,
+       checking the rows in parallel using every core.
+
+   * - ``sampling``
+     - The program should optionally only convert a deterministic
+       fraction of the lexemes together with all their wordforms, such
+       that the sample is reproducible and referentially intact.
+
+   * - ``diff_report``
+     - The program should report the lexemes and wordforms that were
+       added, removed, or modified between two databases or conversions,
+       matched by Ġabra ID, using a bounded amount of memory.
+
+   * - ``memory_profile``
+     - The program should optionally report the memory allocated by
+       every stage and every number of rows, attributed to the lines of
+       code that allocated it.
+
+   * - ``cpu_profile``
+     - The program should optionally profile the processing time of
+       every stage separately, either by recording every function call
+       or by sampling the call stack with little overhead.
+
+   * - ``metrics``
+     - The program should optionally keep the counts of rows read,
+       exported, and skipped, the time taken per row, and the stage being
+       run in a metrics file that is periodically updated for monitoring.
+
 ----
 
 Packages:
@@ -3,14 +3,22 @@ Database dump extraction code.
 '''
 
 import subprocess
+from typing import Iterator
+from gabra_converter.converters.jsonl_reader import READ_BUFFER_SIZE
 
 
 __all__ = [
+    'ARCHIVED_COLLECTION_PATH',
     'extract_archived_files',
     'convert_bson_file',
+    'read_bson_file_lines',
+    'read_archived_collection_lines',
 ]
 
 
+ARCHIVED_COLLECTION_PATH = 'tmp/gabra/{}.bson'
+
+
 #########################################
 def extract_archived_files(
     archive_path: str,
@@ -45,3 +53,85 @@ def convert_bson_file(
         bson_path,
         f'--outFile={dest_path}'
     ], check=True)
+
+
+#########################################
+def _read_process_lines(
+    commands: list[list[str]],
+) -> Iterator[bytes]:
+    '''
+    Run a pipeline of commands, with the output of each command piped into the next, and read
+    the non-empty lines of the last command's output as they are produced.
+        The commands are killed if the iterator is closed before reaching the end of the output.
+
+    :param commands: The commands, each being a list of arguments.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    processes: list[subprocess.Popen] = []
+    completed = False
+    try:
+        for command in commands:
+            processes.append(subprocess.Popen(  # pylint: disable=consider-using-with
+                command,
+                stdin=processes[-1].stdout if len(processes) > 0 else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                bufsize=READ_BUFFER_SIZE,
+            ))
+            if len(processes) > 1:
+                # Only the next process should hold the pipe so that it gets closed if the next
+                # process ends early.
+                prev_stdout = processes[-2].stdout
+                if prev_stdout is not None:
+                    prev_stdout.close()
+        stdout = processes[-1].stdout
+        if stdout is None:
+            raise ValueError('The output of the last command was not captured.')
+        for line in stdout:
+            if line not in (b'\n', b'\r\n'):
+                yield line
+        completed = True
+    finally:
+        for process in processes:
+            if not completed:
+                process.kill()
+            if process.stdout is not None:
+                process.stdout.close()
+            process.wait()
+    for (command, process) in zip(commands, processes):
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
+
+
+#########################################
+def read_bson_file_lines(
+    bson_path: str,
+) -> Iterator[bytes]:
+    '''
+    Convert a BSON file into JSON lines and read them as they are converted without writing
+    them to a file.
+
+    :param bson_path: The path to the BSON file.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    return _read_process_lines([
+        ['bsondump', bson_path],
+    ])
+
+
+#########################################
+def read_archived_collection_lines(
+    archive_path: str,
+    collection_name: str,
+) -> Iterator[bytes]:
+    '''
+    Extract a collection's BSON file from the archived database dump and convert it into JSON
+    lines, reading them as they are converted without writing anything to disk.
+
+    :param archive_path: The path to the archive to extract from.
+    :param collection_name: The name of the collection, such as 'lexemes' or 'wordforms'.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    return _read_process_lines([
+        ['tar', '-zxOf', archive_path, ARCHIVED_COLLECTION_PATH.format(collection_name)],
+        ['bsondump'],
+    ])
@@ -0,0 +1,120 @@
+'''
+Saving and restoring checkpoints of a conversion in progress so that it can be resumed after a
+crash.
+'''
+
+import os
+import json
+from typing import Any
+
+
+__all__ = [
+    'DEFAULT_CHECKPOINT_INTERVAL',
+    'CheckpointMismatchException',
+    'save_checkpoint',
+    'load_checkpoint',
+    'remove_checkpoint',
+    'get_file_sizes',
+    'truncate_files',
+]
+
+
+DEFAULT_CHECKPOINT_INTERVAL = 10000
+
+
+#########################################
+class CheckpointMismatchException(Exception):
+    '''
+    The files being resumed do not match the checkpoint being resumed from.
+    '''
+
+
+#########################################
+def save_checkpoint(
+    checkpoint_path: str,
+    checkpoint: dict[str, Any],
+) -> None:
+    '''
+    Save a checkpoint to a JSON file atomically such that a crash while saving leaves the previous
+    checkpoint intact.
+
+    :param checkpoint_path: The path to the checkpoint file.
+    :param checkpoint: The checkpoint to save.
+    '''
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, checkpoint_path)
+
+
+#########################################
+def load_checkpoint(
+    checkpoint_path: str,
+) -> dict[str, Any]:
+    '''
+    Load a checkpoint that was saved with ``save_checkpoint``.
+
+    :param checkpoint_path: The path to the checkpoint file.
+    :return: The checkpoint.
+    '''
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        checkpoint: dict[str, Any] = json.load(f)
+    return checkpoint
+
+
+#########################################
+def remove_checkpoint(
+    checkpoint_path: str,
+) -> None:
+    '''
+    Remove a checkpoint file together with any files saved next to it for the checkpoint, which
+    are the ones whose name starts with the checkpoint file's name followed by a dot.
+
+    :param checkpoint_path: The path to the checkpoint file.
+    '''
+    dir_path = os.path.dirname(checkpoint_path) or '.'
+    prefix = os.path.basename(checkpoint_path) + '.'
+    for fname in os.listdir(dir_path):
+        if fname.startswith(prefix):
+            os.remove(os.path.join(dir_path, fname))
+    os.remove(checkpoint_path)
+
+
+#########################################
+def get_file_sizes(
+    out_dir_path: str,
+    fnames: list[str],
+) -> dict[str, int]:
+    '''
+    Get the current sizes of a set of output files for including them in a checkpoint.
+
+    :param out_dir_path: The directory path to the folder containing the files.
+    :param fnames: The names of the files.
+    :return: A dictionary mapping file names to sizes in bytes.
+    '''
+    return {fname: os.path.getsize(os.path.join(out_dir_path, fname)) for fname in fnames}
+
+
+#########################################
+def truncate_files(
+    out_dir_path: str,
+    file_sizes: dict[str, int],
+) -> None:
+    '''
+    Truncate a set of output files to the sizes they had when a checkpoint was taken, discarding
+    anything that was written after the checkpoint.
+
+    :param out_dir_path: The directory path to the folder containing the files.
+    :param file_sizes: A dictionary mapping file names to sizes in bytes, as returned by
+        ``get_file_sizes``.
+    '''
+    for (fname, size) in file_sizes.items():
+        path = os.path.join(out_dir_path, fname)
+        if not os.path.isfile(path) or os.path.getsize(path) < size:
+            raise CheckpointMismatchException(
+                f'File {fname} is missing or shorter than it was at the checkpoint.'
+            )
+    for (fname, size) in file_sizes.items():
+        os.truncate(os.path.join(out_dir_path, fname), size)
@@ -0,0 +1,344 @@
+'''
+Keep metrics of a running conversion and write them periodically to a file in the OpenMetrics
+text format, such as for the textfile collector of the Prometheus node exporter.
+
+The metrics are updated by ``PipelineListenerMetrics``, ``LexemePipelineListenerMetrics``, and
+``WordformPipelineListenerMetrics`` and are:
+
+- ``gabra_converter_rows_read_total``, ``gabra_converter_rows_exported_total``, and
+  ``gabra_converter_rows_skipped_total`` counters by collection, with the skipped rows also by
+  reason ('invalid_json', 'schema_mismatch', or 'cleaner') and cleaner ID,
+- a ``gabra_converter_row_latency_seconds`` histogram by collection of the time taken to process
+  every row, from reading it to notifying the listeners,
+- a ``gabra_converter_stage`` gauge by stage which is 1 for the stage being run and 0 for the
+  stages that ended,
+- a ``gabra_converter_id_map_size`` gauge with the number of lexemes in the lexemes ID map, and
+- a ``gabra_converter_last_update_timestamp_seconds`` gauge with the Unix time of the write,
+  for alerting on conversions that stopped making progress.
+
+Updating a metric only increments integers, so keeping the metrics adds little to the time taken
+per row, and the file is only written when a stage starts or ends, when a collection finishes
+converting, and otherwise at most once every interval.
+The file is written next to its destination and then moved into place so that it is never read
+half written.
+'''
+
+import os
+import time
+import bisect
+from typing import Optional
+
+
+__all__ = [
+    'DEFAULT_METRICS_INTERVAL',
+    'DEFAULT_LATENCY_BUCKETS',
+    'LatencyHistogram',
+    'CollectionMetrics',
+    'ConversionMetrics',
+]
+
+
+DEFAULT_METRICS_INTERVAL = 15.0
+
+DEFAULT_LATENCY_BUCKETS = [
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1, 1.0,
+]
+
+_PREFIX = 'gabra_converter_'
+
+
+#########################################
+def _format_labels(
+    labels: list[tuple[str, str]],
+) -> str:
+    '''
+    Format the labels of a sample.
+
+    :param labels: A list of label names and values.
+    :return: The labels in braces, with the values escaped, or an empty string if there are no
+        labels.
+    '''
+    if len(labels) == 0:
+        return ''
+    return '{' + ','.join(
+        '{}="{}"'.format(
+            name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        )
+        for (name, value) in labels
+    ) + '}'
+
+
+#########################################
+def _format_value(
+    value: float,
+) -> str:
+    '''
+    Format the value of a sample.
+
+    :param value: The value.
+    :return: The value in the OpenMetrics text format.
+    '''
+    if value == float('inf'):
+        return '+Inf'
+    return repr(value)
+
+
+#########################################
+class LatencyHistogram:
+    '''
+    Count durations in buckets of upper bounds.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        upper_bounds: Optional[list[float]] = None,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param upper_bounds: The upper bounds in seconds of the buckets, in ascending order and
+            without infinity, or None to use ``DEFAULT_LATENCY_BUCKETS``.
+        '''
+        self.upper_bounds: list[float] = list(
+            DEFAULT_LATENCY_BUCKETS if upper_bounds is None else upper_bounds
+        )
+        self.counts: list[int] = [0]*(len(self.upper_bounds) + 1)
+        self.sum: float = 0.0
+
+    #########################################
+    def observe(
+        self,
+        duration: float,
+    ) -> None:
+        '''
+        Count a duration.
+
+        :param duration: The duration in seconds.
+        '''
+        self.counts[bisect.bisect_left(self.upper_bounds, duration)] += 1
+        self.sum += duration
+
+    #########################################
+    def get_cumulative_counts(
+        self,
+    ) -> list[tuple[float, int]]:
+        '''
+        Get the number of durations up to every upper bound.
+
+        :return: A list of upper bounds, ending with infinity, and the number of durations that
+            are less than or equal to them.
+        '''
+        cumulative_counts = []
+        total = 0
+        for (upper_bound, count) in zip(self.upper_bounds + [float('inf')], self.counts):
+            total += count
+            cumulative_counts.append((upper_bound, total))
+        return cumulative_counts
+
+
+#########################################
+class CollectionMetrics:
+    '''
+    The metrics of the rows of a collection.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        latency_buckets: Optional[list[float]] = None,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param latency_buckets: The upper bounds of the buckets of the latency histogram (see
+            ``LatencyHistogram``).
+        '''
+        self.num_exported: int = 0
+        self.num_invalid_json: int = 0
+        self.num_schema_mismatch: int = 0
+        self.num_skipped_by_cleaner: dict[str, int] = {}
+        self.latency: LatencyHistogram = LatencyHistogram(latency_buckets)
+
+
+#########################################
+class ConversionMetrics:
+    '''
+    The metrics of a conversion, which are written to a file.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        path: str,
+        interval: float = DEFAULT_METRICS_INTERVAL,
+        latency_buckets: Optional[list[float]] = None,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param path: The path to the file to write the metrics to, which should end in '.prom'
+            to be read by the node exporter.
+        :param interval: The minimum number of seconds between writes whilst rows are being
+            converted.
+        :param latency_buckets: The upper bounds of the buckets of the latency histograms (see
+            ``LatencyHistogram``).
+        '''
+        self.path: str = path
+        self.interval: float = interval
+        self.collections: dict[str, CollectionMetrics] = {
+            'lexemes': CollectionMetrics(latency_buckets),
+            'wordforms': CollectionMetrics(latency_buckets),
+        }
+        self.stages: dict[str, int] = {}
+        self.id_map_size: int = 0
+        self.next_write_time: float = 0.0
+
+    #########################################
+    def start_stage(
+        self,
+        stage: str,
+    ) -> None:
+        '''
+        Set the stage being run and write the metrics.
+
+        :param stage: The name of the stage.
+        '''
+        self.stages[stage] = 1
+        self.write()
+
+    #########################################
+    def end_stage(
+        self,
+        stage: str,
+    ) -> None:
+        '''
+        Set the stage as ended and write the metrics.
+
+        :param stage: The name of the stage.
+        '''
+        self.stages[stage] = 0
+        self.write()
+
+    #########################################
+    def render(
+        self,
+    ) -> str:
+        '''
+        Render the metrics in the OpenMetrics text format.
+
+        :return: The text, ending with the '# EOF' line.
+        '''
+        lines = []
+
+        #########################################
+        def add_family(
+            name: str,
+            type_: str,
+            help_: str,
+            samples: list[tuple[str, list[tuple[str, str]], float]],
+        ) -> None:
+            '''
+            Add a metric family.
+
+            :param name: The name of the family without the prefix.
+            :param type_: The OpenMetrics type, such as 'counter'.
+            :param help_: The description of the family.
+            :param samples: A list of the suffixes of the sample names, their labels, and their
+                values.
+            '''
+            lines.append(f'# TYPE {_PREFIX}{name} {type_}')
+            lines.append(f'# HELP {_PREFIX}{name} {help_}')
+            for (suffix, labels, value) in samples:
+                lines.append(
+                    f'{_PREFIX}{name}{suffix}{_format_labels(labels)} {_format_value(value)}'
+                )
+
+        read_samples: list[tuple[str, list[tuple[str, str]], float]] = []
+        exported_samples: list[tuple[str, list[tuple[str, str]], float]] = []
+        skipped_samples: list[tuple[str, list[tuple[str, str]], float]] = []
+        latency_samples: list[tuple[str, list[tuple[str, str]], float]] = []
+        for (collection, metrics) in self.collections.items():
+            collection_label = ('collection', collection)
+            num_skipped = (
+                metrics.num_invalid_json + metrics.num_schema_mismatch
+                + sum(metrics.num_skipped_by_cleaner.values())
+            )
+            read_samples.append(
+                ('_total', [collection_label], metrics.num_exported + num_skipped)
+            )
+            exported_samples.append(('_total', [collection_label], metrics.num_exported))
+            skipped_samples.append((
+                '_total',
+                [collection_label, ('reason', 'invalid_json'), ('cleaner', '')],
+                metrics.num_invalid_json,
+            ))
+            skipped_samples.append((
+                '_total',
+                [collection_label, ('reason', 'schema_mismatch'), ('cleaner', '')],
+                metrics.num_schema_mismatch,
+            ))
+            for (cleaner_id, count) in sorted(metrics.num_skipped_by_cleaner.items()):
+                skipped_samples.append((
+                    '_total',
+                    [collection_label, ('reason', 'cleaner'), ('cleaner', cleaner_id)],
+                    count,
+                ))
+            for (upper_bound, count) in metrics.latency.get_cumulative_counts():
+                latency_samples.append(
+                    ('_bucket', [collection_label, ('le', _format_value(upper_bound))], count)
+                )
+            latency_samples.append(('_count', [collection_label], sum(metrics.latency.counts)))
+            latency_samples.append(('_sum', [collection_label], metrics.latency.sum))
+
+        add_family(
+            'rows_read', 'counter', 'The number of rows read from the collections.', read_samples
+        )
+        add_family(
+            'rows_exported', 'counter', 'The number of rows that were exported.', exported_samples
+        )
+        add_family(
+            'rows_skipped',
+            'counter',
+            'The number of rows that were skipped, by reason and cleaner.',
+            skipped_samples,
+        )
+        add_family(
+            'row_latency_seconds',
+            'histogram',
+            'The time taken to process a row.',
+            latency_samples,
+        )
+        add_family(
+            'stage',
+            'gauge',
+            'Whether a stage of the pipeline is being run (1) or has ended (0).',
+            [('', [('stage', stage)], value) for (stage, value) in self.stages.items()],
+        )
+        add_family(
+            'id_map_size',
+            'gauge',
+            'The number of lexemes in the lexemes ID map.',
+            [('', [], self.id_map_size)],
+        )
+        add_family(
+            'last_update_timestamp_seconds',
+            'gauge',
+            'The Unix time when the metrics were written.',
+            [('', [], time.time())],
+        )
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    #########################################
+    def write(
+        self,
+    ) -> None:
+        '''
+        Write the metrics to the file, replacing it.
+        '''
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.path)
+        self.next_write_time = time.perf_counter() + self.interval
@@ -0,0 +1,988 @@
+'''
+An in-memory, column oriented view of the CSV files exported by the CSV exporters, meant for
+tools that need to query the converted data many times without parsing it into lists of
+dictionaries.
+
+Every table is loaded into one array per column, with rows identified by their ``new_id``:
+
+- Integer columns (including the foreign keys) are arrays of integers.
+- Boolean and enum columns (``pos``, ``number``, ``aspect``, etc.) are arrays of small integer
+  codes.
+- Text columns are arrays of codes into a pool of the column's distinct strings, which is
+  stored as a single string together with an array of offsets and sorted so that values can be
+  found by binary search.
+
+The one-to-many links between tables (lexeme to alternatives, sources, glosses, and wordforms,
+gloss to examples, and wordform to alternatives and sources) are stored in compressed sparse row
+form, that is, an array with the child IDs grouped by parent and an array with the offset of
+the first child of every parent.
+'''
+
+import os
+import csv
+import itertools
+from abc import ABC
+from array import array
+from enum import Enum
+from typing import Any, Iterable, Optional, Sequence
+from gabra_converter.converters.lexemes.row import lexeme_row
+from gabra_converter.converters.wordforms.row import wordform_row
+
+
+__all__ = [
+    'InvalidConvertedTableException',
+    'Column',
+    'IntColumn',
+    'BoolColumn',
+    'EnumColumn',
+    'StringColumn',
+    'OneToMany',
+    'Table',
+    'ConvertedTables',
+    'load_converted_tables',
+]
+
+
+_MISSING = -1
+_LOAD_BATCH_SIZE = 10000
+
+
+#########################################
+class InvalidConvertedTableException(Exception):
+    '''
+    An exported CSV file does not have the expected columns or IDs.
+    '''
+
+
+#########################################
+class Column(ABC):
+    '''
+    Abstract class for a column of a table, with values indexed by the ``new_id`` of the rows.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the column in the CSV file.
+        '''
+        self.name: str = name
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of values in the column.
+
+        :return: The number of values.
+        '''
+        raise NotImplementedError()
+
+    #########################################
+    def __getitem__(
+        self,
+        id_: int,
+    ) -> Any:
+        '''
+        Get the value of a row.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The value, which is None if it is missing.
+        '''
+        raise NotImplementedError()
+
+    #########################################
+    def get_text(
+        self,
+        id_: int,
+    ) -> str:
+        '''
+        Get the value of a row as it is written in the CSV file.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The text of the value, which is empty if it is missing.
+        '''
+        raise NotImplementedError()
+
+    #########################################
+    def extend_texts(
+        self,
+        texts: Iterable[str],
+    ) -> None:
+        '''
+        Add values to the end of the column from the text in a CSV file.
+
+        :param texts: The texts of the values.
+        '''
+        raise NotImplementedError()
+
+    #########################################
+    def finish(
+        self,
+    ) -> None:
+        '''
+        Compact the column after all its values have been added.
+        '''
+
+    #########################################
+    def find(
+        self,
+        value: Any,
+    ) -> list[int]:
+        '''
+        Find the rows having a value.
+
+        :param value: The value, which can be None to find the rows where it is missing.
+        :return: The sorted ``new_id`` of the rows.
+        '''
+        raise NotImplementedError()
+
+
+#########################################
+class IntColumn(Column):
+    '''
+    A column of non-negative integers.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the column in the CSV file.
+        '''
+        super().__init__(name)
+        self.values: array = array('i')
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of values in the column.
+
+        :return: The number of values.
+        '''
+        return len(self.values)
+
+    #########################################
+    def __getitem__(
+        self,
+        id_: int,
+    ) -> Optional[int]:
+        '''
+        Get the value of a row.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The value, which is None if it is missing.
+        '''
+        value: int = self.values[id_ - 1]
+        return value if value != _MISSING else None
+
+    #########################################
+    def get_text(
+        self,
+        id_: int,
+    ) -> str:
+        '''
+        Get the value of a row as it is written in the CSV file.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The text of the value, which is empty if it is missing.
+        '''
+        value = self.values[id_ - 1]
+        return str(value) if value != _MISSING else ''
+
+    #########################################
+    def extend_texts(
+        self,
+        texts: Iterable[str],
+    ) -> None:
+        '''
+        Add values to the end of the column from the text in a CSV file.
+
+        :param texts: The texts of the values.
+        '''
+        self.values.extend(int(text) if text != '' else _MISSING for text in texts)
+
+    #########################################
+    def find(
+        self,
+        value: Optional[int],
+    ) -> list[int]:
+        '''
+        Find the rows having a value.
+
+        :param value: The value, which can be None to find the rows where it is missing.
+        :return: The sorted ``new_id`` of the rows.
+        '''
+        code = value if value is not None else _MISSING
+        return [i for (i, row_value) in enumerate(self.values, 1) if row_value == code]
+
+
+#########################################
+class _CodedColumn(Column):
+    '''
+    A column of values with few distinct values that are stored as small integer codes.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+        values: Sequence[Any],
+        texts: Sequence[str],
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the column in the CSV file.
+        :param values: The distinct values, with the code of each value being its index.
+        :param texts: The text of every value in the CSV file, in the same order as values.
+        '''
+        super().__init__(name)
+        self.codes: array = array('b')
+        self.values: list[Any] = list(values)
+        self.__texts: list[str] = list(texts)
+        self.__text_to_code: dict[str, int] = {text: i for (i, text) in enumerate(texts)}
+        self.__text_to_code[''] = _MISSING
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of values in the column.
+
+        :return: The number of values.
+        '''
+        return len(self.codes)
+
+    #########################################
+    def __getitem__(
+        self,
+        id_: int,
+    ) -> Any:
+        '''
+        Get the value of a row.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The value, which is None if it is missing.
+        '''
+        code = self.codes[id_ - 1]
+        return self.values[code] if code != _MISSING else None
+
+    #########################################
+    def get_text(
+        self,
+        id_: int,
+    ) -> str:
+        '''
+        Get the value of a row as it is written in the CSV file.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The text of the value, which is empty if it is missing.
+        '''
+        code = self.codes[id_ - 1]
+        return self.__texts[code] if code != _MISSING else ''
+
+    #########################################
+    def extend_texts(
+        self,
+        texts: Iterable[str],
+    ) -> None:
+        '''
+        Add values to the end of the column from the text in a CSV file.
+
+        :param texts: The texts of the values.
+        '''
+        try:
+            self.codes.extend(map(self.__text_to_code.__getitem__, texts))
+        except KeyError as ex:
+            raise InvalidConvertedTableException(
+                f'Unknown value {ex.args[0]!r} in column {self.name}.'
+            ) from ex
+
+    #########################################
+    def find(
+        self,
+        value: Any,
+    ) -> list[int]:
+        '''
+        Find the rows having a value.
+
+        :param value: The value, which can be None to find the rows where it is missing.
+        :return: The sorted ``new_id`` of the rows.
+        '''
+        if value is None:
+            code = _MISSING
+        elif value in self.values:
+            code = self.values.index(value)
+        else:
+            return []
+        return [i for (i, row_code) in enumerate(self.codes, 1) if row_code == code]
+
+
+#########################################
+class BoolColumn(_CodedColumn):
+    '''
+    A column of booleans, written as 1 and 0 in the CSV file.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the column in the CSV file.
+        '''
+        super().__init__(name, [False, True], ['0', '1'])
+
+
+#########################################
+class EnumColumn(_CodedColumn):
+    '''
+    A column of enum members, such as a part of speech, written as their value in the CSV file.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+        enum_type: type[Enum],
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the column in the CSV file.
+        :param enum_type: The enum class of the values.
+        '''
+        super().__init__(name, list(enum_type), [member.value for member in enum_type])
+        self.enum_type: type[Enum] = enum_type
+
+
+#########################################
+class StringColumn(Column):
+    '''
+    A column of strings stored as codes into a sorted pool of the distinct strings in the column.
+        Code 0 is the empty string, which stands for a missing value.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the column in the CSV file.
+        '''
+        super().__init__(name)
+        self.codes: array = array('I')
+        self.__pool_text: str = ''
+        self.__pool_offsets: array = array('I', [0, 0])
+        self.__string_to_code: Optional[dict[str, int]] = {'': 0}
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of values in the column.
+
+        :return: The number of values.
+        '''
+        return len(self.codes)
+
+    #########################################
+    def __getitem__(
+        self,
+        id_: int,
+    ) -> Optional[str]:
+        '''
+        Get the value of a row.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The value, which is None if it is missing.
+        '''
+        code = self.codes[id_ - 1]
+        return self.get_pool_string(code) if code != 0 else None
+
+    #########################################
+    def get_text(
+        self,
+        id_: int,
+    ) -> str:
+        '''
+        Get the value of a row as it is written in the CSV file.
+
+        :param id_: The ``new_id`` of the row.
+        :return: The text of the value, which is empty if it is missing.
+        '''
+        return self.get_pool_string(self.codes[id_ - 1])
+
+    #########################################
+    def get_pool_size(
+        self,
+    ) -> int:
+        '''
+        Get the number of distinct strings in the column, including the empty string.
+
+        :return: The number of strings.
+        '''
+        return len(self.__pool_offsets) - 1
+
+    #########################################
+    def get_pool_string(
+        self,
+        code: int,
+    ) -> str:
+        '''
+        Get a string in the pool.
+
+        :param code: The code of the string.
+        :return: The string.
+        '''
+        return self.__pool_text[self.__pool_offsets[code]:self.__pool_offsets[code + 1]]
+
+    #########################################
+    def get_code(
+        self,
+        value: str,
+    ) -> Optional[int]:
+        '''
+        Get the code of a string in the pool using binary search.
+
+        :param value: The string.
+        :return: The code or None if no row has the string.
+        '''
+        low = 0
+        high = self.get_pool_size()
+        while low < high:
+            mid = (low + high)//2
+            if self.get_pool_string(mid) < value:
+                low = mid + 1
+            else:
+                high = mid
+        if low == self.get_pool_size() or self.get_pool_string(low) != value:
+            return None
+        return low
+
+    #########################################
+    def extend_texts(
+        self,
+        texts: Iterable[str],
+    ) -> None:
+        '''
+        Add values to the end of the column from the text in a CSV file.
+
+        :param texts: The texts of the values.
+        '''
+        string_to_code = self.__string_to_code
+        if string_to_code is None:
+            raise InvalidConvertedTableException(
+                f'Column {self.name} cannot be extended after being finished.'
+            )
+        texts = list(texts)
+        for text in dict.fromkeys(texts):
+            if text not in string_to_code:
+                string_to_code[text] = len(string_to_code)
+        self.codes.extend(map(string_to_code.__getitem__, texts))
+
+    #########################################
+    def finish(
+        self,
+    ) -> None:
+        '''
+        Compact the column after all its values have been added by sorting the pool of
+        strings and joining it into a single string.
+        '''
+        if self.__string_to_code is None:
+            return
+        strings = sorted(self.__string_to_code)
+        old_to_new_code = array('I', [0])*len(strings)
+        for (new_code, string) in enumerate(strings):
+            old_to_new_code[self.__string_to_code[string]] = new_code
+        self.__string_to_code = None
+        self.codes = array('I', map(old_to_new_code.__getitem__, self.codes))
+
+        self.__pool_offsets = array('I', [0])
+        for string in strings:
+            self.__pool_offsets.append(self.__pool_offsets[-1] + len(string))
+        self.__pool_text = ''.join(strings)
+
+    #########################################
+    def find(
+        self,
+        value: Optional[str],
+    ) -> list[int]:
+        '''
+        Find the rows having a value.
+
+        :param value: The value, which can be None to find the rows where it is missing.
+        :return: The sorted ``new_id`` of the rows.
+        '''
+        code = self.get_code(value if value is not None else '')
+        if code is None:
+            return []
+        return [i for (i, row_code) in enumerate(self.codes, 1) if row_code == code]
+
+
+#########################################
+class OneToMany:
+    '''
+    The children of every parent row in a one-to-many link between two tables, in compressed
+    sparse row form.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        foreign_keys: IntColumn,
+        num_parents: int,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param foreign_keys: The column of the child table with the parent IDs.
+        :param num_parents: The number of rows in the parent table.
+        '''
+        counts = array('I', [0])*(num_parents + 1)
+        is_sorted = True
+        prev_parent_id = 0
+        for parent_id in foreign_keys.values:
+            if parent_id == _MISSING:
+                is_sorted = False
+                continue
+            if not 1 <= parent_id <= num_parents:
+                raise InvalidConvertedTableException(
+                    f'Column {foreign_keys.name} refers to a row that does not exist: {parent_id}.'
+                )
+            counts[parent_id] += 1
+            if parent_id < prev_parent_id:
+                is_sorted = False
+            prev_parent_id = parent_id
+
+        self.offsets: array = array('I', [0])*(num_parents + 1)
+        for parent_id in range(1, num_parents + 1):
+            self.offsets[parent_id] = self.offsets[parent_id - 1] + counts[parent_id]
+
+        # Children that are already grouped by parent (which is how the exporters write them)
+        # do not need their IDs to be stored.
+        self.child_ids: Optional[array] = None
+        if not is_sorted:
+            next_positions = array('I', self.offsets)
+            self.child_ids = array('I', [0])*self.offsets[-1]
+            for (child_id, parent_id) in enumerate(foreign_keys.values, 1):
+                if parent_id != _MISSING:
+                    self.child_ids[next_positions[parent_id - 1]] = child_id
+                    next_positions[parent_id - 1] += 1
+
+    #########################################
+    def get(
+        self,
+        parent_id: int,
+    ) -> Sequence[int]:
+        '''
+        Get the children of a parent row.
+
+        :param parent_id: The ``new_id`` of the parent row.
+        :return: The sorted ``new_id`` of the child rows.
+        '''
+        start = self.offsets[parent_id - 1]
+        end = self.offsets[parent_id]
+        if self.child_ids is None:
+            return range(start + 1, end + 1)
+        return self.child_ids[start:end]
+
+
+#########################################
+class Table:
+    '''
+    A table exported to a CSV file, loaded into columns.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        name: str,
+        columns: list[Column],
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param name: The name of the table, which is the CSV file name without the extension.
+        :param columns: The columns of the table, except for ``new_id``, in the order of the CSV
+            file.
+        '''
+        self.name: str = name
+        self.columns: dict[str, Column] = {column.name: column for column in columns}
+        self.__num_rows: int = 0
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of rows in the table.
+
+        :return: The number of rows.
+        '''
+        return self.__num_rows
+
+    #########################################
+    def load(
+        self,
+        csv_path: str,
+    ) -> None:
+        '''
+        Load the rows of an exported CSV file, appending them to the table.
+
+        :param csv_path: The path to the CSV file.
+        '''
+        columns = list(self.columns.values())
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header: list[str] = next(reader, [])
+            if header != ['new_id'] + list(self.columns):
+                raise InvalidConvertedTableException(
+                    f'File {csv_path} does not have the columns of table {self.name}.'
+                )
+            while True:
+                batch = list(itertools.islice(reader, _LOAD_BATCH_SIZE))
+                if len(batch) == 0:
+                    break
+                if set(map(len, batch)) != {len(header)}:
+                    raise InvalidConvertedTableException(
+                        f'File {csv_path} has a row with the wrong number of values.'
+                    )
+                (ids, *texts) = zip(*batch)
+                if ids != tuple(map(str, range(
+                    self.__num_rows + 1, self.__num_rows + len(batch) + 1
+                ))):
+                    raise InvalidConvertedTableException(
+                        f'File {csv_path} does not have consecutive IDs starting from 1.'
+                    )
+                for (column, column_texts) in zip(columns, texts):
+                    column.extend_texts(column_texts)
+                self.__num_rows += len(batch)
+        for column in columns:
+            column.finish()
+
+    #########################################
+    def get(
+        self,
+        column_name: str,
+        id_: int,
+    ) -> Any:
+        '''
+        Get a value of a row.
+
+        :param column_name: The name of the column.
+        :param id_: The ``new_id`` of the row.
+        :return: The value, which is None if it is missing.
+        '''
+        return self.columns[column_name][id_]
+
+    #########################################
+    def get_row(
+        self,
+        id_: int,
+    ) -> dict[str, Any]:
+        '''
+        Get all the values of a row.
+
+        :param id_: The ``new_id`` of the row.
+        :return: A dictionary mapping column names (including ``new_id``) to values.
+        '''
+        if not 1 <= id_ <= self.__num_rows:
+            raise IndexError(f'Table {self.name} does not have a row with ID {id_}.')
+        row: dict[str, Any] = {'new_id': id_}
+        for (name, column) in self.columns.items():
+            row[name] = column[id_]
+        return row
+
+    #########################################
+    def find(
+        self,
+        column_name: str,
+        value: Any,
+    ) -> list[int]:
+        '''
+        Find the rows having a value in a column.
+
+        :param column_name: The name of the column.
+        :param value: The value, which can be None to find the rows where it is missing.
+        :return: The sorted ``new_id`` of the rows.
+        '''
+        return self.columns[column_name].find(value)
+
+
+#########################################
+def _make_grammeme_columns(
+    prefix: str,
+) -> list[Column]:
+    '''
+    Make the columns of a wordform grammeme.
+
+    :param prefix: The name of the grammeme.
+    :return: The person, number, and gender columns.
+    '''
+    return [
+        EnumColumn(f'{prefix}-person', wordform_row.Person),
+        EnumColumn(f'{prefix}-number', wordform_row.Number),
+        EnumColumn(f'{prefix}-gender', wordform_row.Gender),
+    ]
+
+
+#########################################
+def _make_tables(
+) -> list[Table]:
+    '''
+    Make the empty tables exported by the CSV exporters.
+
+    :return: The tables.
+    '''
+    return [
+        Table('lexemes', [
+            StringColumn('_id'),
+            StringColumn('lemma'),
+            EnumColumn('pos', lexeme_row.POS),
+            StringColumn('root-radicals'),
+            IntColumn('root-variant'),
+            StringColumn('headword-lemma'),
+            EnumColumn('headword-pos', lexeme_row.POS),
+            EnumColumn('form', lexeme_row.Form),
+            IntColumn('derived_form'),
+            EnumColumn('gender', lexeme_row.Gender),
+            BoolColumn('transitive'),
+            BoolColumn('intransitive'),
+            BoolColumn('ditransitive'),
+            BoolColumn('hypothetical'),
+            BoolColumn('archaic'),
+            BoolColumn('multiword'),
+            BoolColumn('pending'),
+            StringColumn('phonetic'),
+            StringColumn('apertium_paradigm'),
+            EnumColumn('onomastic_type', lexeme_row.OnomasticType),
+            StringColumn('comment'),
+        ]),
+        Table('lexemes_alternatives', [
+            IntColumn('new_lexeme_id'),
+            StringColumn('alternative'),
+        ]),
+        Table('lexemes_sources', [
+            IntColumn('new_lexeme_id'),
+            StringColumn('source'),
+        ]),
+        Table('lexemes_glosses', [
+            IntColumn('new_lexeme_id'),
+            StringColumn('gloss'),
+        ]),
+        Table('lexemes_examples', [
+            IntColumn('new_gloss_id'),
+            StringColumn('example'),
+            EnumColumn('type', lexeme_row.ExampleType),
+        ]),
+        Table('wordforms', [
+            IntColumn('new_lexeme_id'),
+            StringColumn('_id'),
+            StringColumn('lexeme_id'),
+            StringColumn('surface_form'),
+            StringColumn('gloss'),
+            EnumColumn('gender', wordform_row.Gender),
+            EnumColumn('number', wordform_row.Number),
+            StringColumn('plural_form'),
+            *_make_grammeme_columns('subject'),
+            *_make_grammeme_columns('dir_obj'),
+            *_make_grammeme_columns('ind_obj'),
+            *_make_grammeme_columns('possessor'),
+            EnumColumn('form', wordform_row.Form),
+            EnumColumn('aspect', wordform_row.Aspect),
+            EnumColumn('polarity', wordform_row.Polarity),
+            StringColumn('stem'),
+            StringColumn('phonetic'),
+            StringColumn('pattern'),
+            BoolColumn('hypothetical'),
+            BoolColumn('archaic'),
+            BoolColumn('generated'),
+            BoolColumn('pending'),
+        ]),
+        Table('wordforms_alternatives', [
+            IntColumn('new_wordform_id'),
+            StringColumn('alternative'),
+        ]),
+        Table('wordforms_sources', [
+            IntColumn('new_wordform_id'),
+            StringColumn('source'),
+        ]),
+    ]
+
+
+# Maps every child table to its foreign key column and its parent table.
+_LINKS = {
+    'lexemes_alternatives': ('new_lexeme_id', 'lexemes'),
+    'lexemes_sources': ('new_lexeme_id', 'lexemes'),
+    'lexemes_glosses': ('new_lexeme_id', 'lexemes'),
+    'lexemes_examples': ('new_gloss_id', 'lexemes_glosses'),
+    'wordforms': ('new_lexeme_id', 'lexemes'),
+    'wordforms_alternatives': ('new_wordform_id', 'wordforms'),
+    'wordforms_sources': ('new_wordform_id', 'wordforms'),
+}
+
+
+#########################################
+class ConvertedTables:
+    '''
+    All the tables exported by the CSV exporters, loaded into columns, together with the links
+    between them.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        tables: list[Table],
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param tables: The loaded tables.
+        '''
+        self.tables: dict[str, Table] = {table.name: table for table in tables}
+        self.links: dict[str, OneToMany] = {
+            child_name: OneToMany(
+                self.__get_int_column(child_name, foreign_key_name),
+                len(self.tables[parent_name]),
+            )
+            for (child_name, (foreign_key_name, parent_name)) in _LINKS.items()
+        }
+
+    #########################################
+    def __get_int_column(
+        self,
+        table_name: str,
+        column_name: str,
+    ) -> IntColumn:
+        '''
+        Get an integer column.
+
+        :param table_name: The name of the table.
+        :param column_name: The name of the column.
+        :return: The column.
+        '''
+        column = self.tables[table_name].columns[column_name]
+        if not isinstance(column, IntColumn):
+            raise InvalidConvertedTableException(
+                f'Column {column_name} of table {table_name} is not an integer column.'
+            )
+        return column
+
+    #########################################
+    def __getitem__(
+        self,
+        table_name: str,
+    ) -> Table:
+        '''
+        Get a table.
+
+        :param table_name: The name of the table, such as ``lexemes`` or ``wordforms``.
+        :return: The table.
+        '''
+        return self.tables[table_name]
+
+    #########################################
+    def get_child_ids(
+        self,
+        child_table_name: str,
+        parent_id: int,
+    ) -> Sequence[int]:
+        '''
+        Get the rows of a table that refer to a row of its parent table, such as the glosses of
+        a lexeme or the examples of a gloss.
+
+        :param child_table_name: The name of the child table, such as ``lexemes_glosses``.
+        :param parent_id: The ``new_id`` of the parent row.
+        :return: The sorted ``new_id`` of the child rows.
+        '''
+        return self.links[child_table_name].get(parent_id)
+
+    #########################################
+    def get_child_values(
+        self,
+        child_table_name: str,
+        column_name: str,
+        parent_id: int,
+    ) -> list[Any]:
+        '''
+        Get a column of the rows of a table that refer to a row of its parent table, such as the
+        alternatives of a lexeme.
+
+        :param child_table_name: The name of the child table, such as ``lexemes_alternatives``.
+        :param column_name: The name of the column in the child table, such as ``alternative``.
+        :param parent_id: The ``new_id`` of the parent row.
+        :return: The values, ordered by the ``new_id`` of the child rows.
+        '''
+        column = self.tables[child_table_name].columns[column_name]
+        return [column[child_id] for child_id in self.links[child_table_name].get(parent_id)]
+
+    #########################################
+    def get_lexeme_wordform_ids(
+        self,
+        lexeme_id: int,
+    ) -> Sequence[int]:
+        '''
+        Get the wordforms of a lexeme.
+
+        :param lexeme_id: The ``new_id`` of the lexeme.
+        :return: The sorted ``new_id`` of the wordforms.
+        '''
+        return self.links['wordforms'].get(lexeme_id)
+
+    #########################################
+    def join_lexeme_wordforms(
+        self,
+        lexeme_ids: Optional[Iterable[int]] = None,
+    ) -> list[tuple[int, int]]:
+        '''
+        Join lexemes to their wordforms.
+
+        :param lexeme_ids: The ``new_id`` of the lexemes to join or None for all the lexemes.
+        :return: Pairs consisting of the ``new_id`` of a lexeme and that of one of its
+            wordforms, ordered by lexeme in the order given and then by wordform.
+        '''
+        link = self.links['wordforms']
+        if lexeme_ids is None:
+            lexeme_ids = range(1, len(self.tables['lexemes']) + 1)
+        return [
+            (lexeme_id, wordform_id)
+            for lexeme_id in lexeme_ids
+            for wordform_id in link.get(lexeme_id)
+        ]
+
+
+#########################################
+def load_converted_tables(
+    out_dir_path: str,
+) -> ConvertedTables:
+    '''
+    Load the CSV files exported by the CSV exporters.
+
+    :param out_dir_path: The directory path to the folder containing the CSV files.
+    :return: The loaded tables.
+    '''
+    tables = _make_tables()
+    for table in tables:
+        table.load(os.path.join(out_dir_path, f'{table.name}.csv'))
+    return ConvertedTables(tables)
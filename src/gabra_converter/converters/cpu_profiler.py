@@ -0,0 +1,224 @@
+'''
+Attribute the processing time of a conversion to the functions that spent it, separately for
+every stage of the pipeline.
+
+A ``CPUProfiler`` profiles one stage at a time (see ``PipelineListenerCPUProfile``) in one of two
+modes:
+
+- 'deterministic', which records every function call of the stage with ``cProfile`` and saves
+  it to a ``<stage>.pstats`` file that can be read with ``pstats`` or a viewer such as snakeviz.
+  Every call is timed, which makes the conversion about twice as slow.
+- 'sampling', which records the call stack of the profiled thread at a fixed interval from a
+  background thread and saves the number of times that every call stack was seen to a
+  ``<stage>.collapsed`` file in the collapsed stack format of flame graph tools (such as
+  flamegraph.pl or speedscope).
+  The cost does not depend on the number of calls, so it is suitable for full size dumps.
+
+cProfile only records which function called which, not the whole call stacks, so the collapsed
+stacks are only available from the sampling mode.
+The wall clock and CPU time of every stage are also saved in a summary, where a stage that waits
+for a subprocess (such as extracting the dump) takes more wall clock time than CPU time.
+Only the thread that starts a stage is profiled, so the worker processes of a parallel dry run
+are not included.
+'''
+
+import os
+import sys
+import time
+import types
+import cProfile
+import threading
+from typing import Optional
+
+
+__all__ = [
+    'CPU_PROFILER_MODES',
+    'CPU_PROFILE_SUMMARY_FNAME',
+    'CPUProfilerStageException',
+    'CPUProfiler',
+]
+
+
+CPU_PROFILER_MODES = ['deterministic', 'sampling']
+
+CPU_PROFILE_SUMMARY_FNAME = 'summary.txt'
+
+
+#########################################
+class CPUProfilerStageException(Exception):
+    '''
+    A stage was started whilst another stage was being profiled or ended without being started.
+    '''
+
+
+#########################################
+class CPUProfiler:
+    '''
+    Profile the stages of a conversion one at a time and save a profile for each one.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        out_dir_path: str,
+        mode: str = 'deterministic',
+        interval: float = 0.01,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param out_dir_path: The path to the folder to save the profiles in, which is created if
+            it does not exist.
+        :param mode: The profiling mode, which is one of ``CPU_PROFILER_MODES``.
+        :param interval: The number of seconds between samples in the sampling mode.
+        '''
+        if mode not in CPU_PROFILER_MODES:
+            raise ValueError(f'Unknown profiling mode {mode}.')
+        if interval <= 0.0:
+            raise ValueError(f'The sampling interval must be more than 0, not {interval}.')
+        self.out_dir_path: str = out_dir_path
+        self.mode: str = mode
+        self.interval: float = interval
+        self.summary: list[tuple[str, float, float, int]] = []
+        self.__stage: Optional[str] = None
+        self.__start_wall_time: float = 0.0
+        self.__start_cpu_time: float = 0.0
+        self.__profile: Optional[cProfile.Profile] = None
+        self.__sampler: Optional[threading.Thread] = None
+        self.__stop_sampling: threading.Event = threading.Event()
+        self.__stack_counts: dict[str, int] = {}
+        self.__frame_labels: dict[types.CodeType, str] = {}
+
+    #########################################
+    def start_stage(
+        self,
+        stage: str,
+    ) -> None:
+        '''
+        Start profiling a stage in the current thread.
+
+        :param stage: The name of the stage, which is used in the names of its files.
+        '''
+        if self.__stage is not None:
+            raise CPUProfilerStageException(
+                f'Cannot start profiling stage {stage} whilst stage {self.__stage} is being'
+                ' profiled.'
+            )
+        os.makedirs(self.out_dir_path, exist_ok=True)
+        self.__stage = stage
+        self.__start_wall_time = time.perf_counter()
+        self.__start_cpu_time = time.process_time()
+        if self.mode == 'deterministic':
+            self.__profile = cProfile.Profile()
+            self.__profile.enable()
+        else:
+            self.__stack_counts = {}
+            self.__stop_sampling.clear()
+            self.__sampler = threading.Thread(
+                target=self.__sample,
+                args=(threading.get_ident(),),
+                name='CPUProfilerSampler',
+                daemon=True,
+            )
+            self.__sampler.start()
+
+    #########################################
+    def __get_frame_label(
+        self,
+        code: types.CodeType,
+    ) -> str:
+        '''
+        Get the label of a function in a collapsed stack.
+
+        :param code: The code object of the function.
+        :return: The label, such as 'add_row (.../lexeme_pipeline.py:246)'.
+        '''
+        label = self.__frame_labels.get(code)
+        if label is None:
+            # Semicolons separate the frames of a collapsed stack.
+            label = f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})'.replace(
+                ';', ':'
+            )
+            self.__frame_labels[code] = label
+        return label
+
+    #########################################
+    def __sample(
+        self,
+        thread_id: int,
+    ) -> None:
+        '''
+        Record the call stack of a thread every interval until sampling is stopped.
+
+        :param thread_id: The identifier of the profiled thread.
+        '''
+        stack_counts = self.__stack_counts
+        while not self.__stop_sampling.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)  # pylint: disable=protected-access
+            labels = []
+            while frame is not None:
+                labels.append(self.__get_frame_label(frame.f_code))
+                frame = frame.f_back
+            if len(labels) > 0:
+                stack = ';'.join(reversed(labels))
+                stack_counts[stack] = stack_counts.get(stack, 0) + 1
+
+    #########################################
+    def end_stage(
+        self,
+    ) -> None:
+        '''
+        Stop profiling the current stage and save its profile.
+        '''
+        if self.__stage is None:
+            raise CPUProfilerStageException('Cannot end a stage without starting one.')
+        stage = self.__stage
+        num_samples = 0
+        if self.__profile is not None:
+            self.__profile.disable()
+            self.__profile.dump_stats(os.path.join(self.out_dir_path, f'{stage}.pstats'))
+            self.__profile = None
+        if self.__sampler is not None:
+            self.__stop_sampling.set()
+            self.__sampler.join()
+            self.__sampler = None
+            with open(
+                os.path.join(self.out_dir_path, f'{stage}.collapsed'), 'w', encoding='utf-8'
+            ) as f:
+                for (stack, count) in sorted(self.__stack_counts.items()):
+                    f.write(f'{stack} {count}\n')
+                    num_samples += count
+            self.__stack_counts = {}
+        self.summary.append((
+            stage,
+            time.perf_counter() - self.__start_wall_time,
+            time.process_time() - self.__start_cpu_time,
+            num_samples,
+        ))
+        self.__stage = None
+
+    #########################################
+    def stop(
+        self,
+    ) -> None:
+        '''
+        End the stage being profiled, if any, such as when the conversion failed, and save the
+        summary of all the profiled stages.
+        '''
+        if self.__stage is not None:
+            self.end_stage()
+        if len(self.summary) == 0:
+            return
+        with open(
+            os.path.join(self.out_dir_path, CPU_PROFILE_SUMMARY_FNAME), 'w', encoding='utf-8'
+        ) as f:
+            f.write(f'CPU profile ({self.mode})\n')
+            f.write(f'{"wall (s)":>10} {"cpu (s)":>10}')
+            if self.mode == 'sampling':
+                f.write(f' {"samples":>9}')
+            f.write('  stage\n')
+            for (stage, wall_time, cpu_time, num_samples) in self.summary:
+                f.write(f'{wall_time:>10.3f} {cpu_time:>10.3f}')
+                if self.mode == 'sampling':
+                    f.write(f' {num_samples:>9}')
+                f.write(f'  {stage}\n')
@@ -0,0 +1,381 @@
+'''
+A compact word list in the form of a minimal deterministic acyclic finite state automaton
+(DAFSA) over the UTF-8 bytes of the words, meant to be memory mapped by applications such as
+spell checkers rather than loaded.
+
+The automaton is built with the incremental algorithm for sorted input of Daciuk et al. (2000)
+which merges equivalent suffixes as soon as they are complete, so the words are streamed into it
+one at a time and only the automaton itself is kept in memory.
+Words collected in any order are first written to a words file, one JSON string per line (see
+``get_word_line``), which is sorted on disk with ``sort_jsonl_file`` (see
+``build_dafsa_from_words_file``).
+States are numbered in the order that they are found to be unique, so every state is numbered
+after the states its edges lead to and the start state is the last one.
+
+The DAFSA file consists of:
+
+- A header with a magic string, a format version, the number of words, the number of states,
+  and the number of edges.
+- The index of the first outgoing edge of every state as a little endian unsigned 32-bit
+  integer, followed by the number of edges.
+  The outgoing edges of a state are stored contiguously and sorted by label.
+- Whether every state is final (accepts a word) as an unsigned 8-bit integer.
+- The label of every edge as an unsigned 8-bit integer (a byte of UTF-8).
+- The target state of every edge as a little endian unsigned 32-bit integer.
+'''
+
+import sys
+import json
+import mmap
+import struct
+from array import array
+from types import TracebackType
+from typing import Iterable, Iterator, Optional
+from gabra_converter.converters.external_sort import DEFAULT_MAX_RUN_SIZE, sort_jsonl_file
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+
+
+__all__ = [
+    'InvalidDAFSAException',
+    'UnsortedDAFSAWordsException',
+    'build_dafsa',
+    'get_word_line',
+    'build_dafsa_from_words_file',
+    'DAFSAReader',
+]
+
+
+_MAGIC = b'GDFA'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQQ')
+_STATE = struct.Struct('<I')
+_STATE_RANGE = struct.Struct('<II')
+_LABELS = [bytes([label]) for label in range(256)]
+_WORD_END = -1
+
+
+#########################################
+class InvalidDAFSAException(Exception):
+    '''
+    A file that was loaded as a DAFSA file is not valid.
+    '''
+
+
+#########################################
+class UnsortedDAFSAWordsException(Exception):
+    '''
+    The words that a DAFSA was built from were not sorted by their UTF-8 bytes.
+    '''
+
+
+#########################################
+def build_dafsa(
+    dafsa_path: str,
+    words: Iterable[bytes],
+) -> None:
+    '''
+    Build a DAFSA file from a stream of sorted words.
+
+    :param dafsa_path: The path to the DAFSA file to create.
+    :param words: The UTF-8 encoded words to include, sorted by their bytes.
+        Repeated words must be next to each other and are only included once.
+    '''
+    edge_starts = array('I')
+    finals = bytearray()
+    labels = bytearray()
+    targets = array('I')
+    # Maps the final flag and edges of every unique state to its number.
+    register: dict[tuple[int, ...], int] = {}
+
+    # The states along the path of the previous word that are not yet known to be unique, each
+    # being a list with the final flag followed by the label and target state of every edge
+    # except the one leading to the next state in the path.
+    path: list[list[int]] = [[0]]
+    path_labels = bytearray()
+
+    def close_state(
+    ) -> int:
+        '''
+        Remove the last state from the path and replace it with an equivalent unique state.
+
+        :return: The number of the unique state.
+        '''
+        state = path.pop()
+        signature = tuple(state)
+        state_num = register.get(signature)
+        if state_num is None:
+            state_num = len(finals)
+            register[signature] = state_num
+            edge_starts.append(len(labels))
+            finals.append(state[0])
+            labels.extend(state[1::2])
+            targets.extend(state[2::2])
+        return state_num
+
+    num_words = 0
+    prev_word = b''
+    for word in words:
+        if num_words > 0 and word <= prev_word:
+            if word == prev_word:
+                continue
+            raise UnsortedDAFSAWordsException(
+                f'Word {word!r} comes after {prev_word!r} but is smaller.'
+            )
+        common = 0
+        for (label, prev_label) in zip(word, prev_word):
+            if label != prev_label:
+                break
+            common += 1
+        while len(path) > common + 1:
+            state_num = close_state()
+            path[-1].extend((path_labels.pop(), state_num))
+        for label in word[common:]:
+            path.append([0])
+            path_labels.append(label)
+        path[-1][0] = 1
+        prev_word = word
+        num_words += 1
+    while len(path) > 1:
+        state_num = close_state()
+        path[-1].extend((path_labels.pop(), state_num))
+    close_state()
+    edge_starts.append(len(labels))
+
+    if sys.byteorder != 'little':
+        edge_starts.byteswap()
+        targets.byteswap()
+    with open(dafsa_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, num_words, len(finals), len(labels)))
+        edge_starts.tofile(f)
+        f.write(finals)
+        f.write(labels)
+        targets.tofile(f)
+
+
+#########################################
+def get_word_line(
+    word: str,
+) -> bytes:
+    '''
+    Get the line of a word in a words file.
+
+    :param word: The word.
+    :return: The word as a UTF-8 encoded JSON string followed by a new line, so that words with
+        new lines in them still take a single line.
+    '''
+    return json.dumps(word, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+#########################################
+def _get_word(
+    line: bytes,
+) -> bytes:
+    '''
+    Get the UTF-8 encoded word of a line in a words file, which is also its sort key.
+
+    :param line: The line.
+    :return: The word.
+    '''
+    word: str = json.loads(line.decode('utf-8'))
+    return word.encode('utf-8')
+
+
+#########################################
+def build_dafsa_from_words_file(
+    dafsa_path: str,
+    words_path: str,
+    tmp_dir_path: Optional[str] = None,
+    max_run_size: int = DEFAULT_MAX_RUN_SIZE,
+) -> None:
+    '''
+    Build a DAFSA file from a words file, which is first sorted in place on disk.
+
+    :param dafsa_path: The path to the DAFSA file to create.
+    :param words_path: The path to the words file, with the lines of the words (see
+        ``get_word_line``) in any order and possibly repeated.
+    :param tmp_dir_path: The path to a folder in which to sort the words file or None to use the
+        default temporary folder.
+    :param max_run_size: The maximum size in bytes of the lines sorted in memory at once (see
+        ``sort_jsonl_file``).
+    '''
+    sort_jsonl_file(words_path, words_path, _get_word, tmp_dir_path, max_run_size)
+    build_dafsa(dafsa_path, (_get_word(line) for line in read_jsonl_lines(words_path)))
+
+
+#########################################
+class DAFSAReader:
+    '''
+    Check whether words are in a memory mapped DAFSA file and enumerate its words.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        dafsa_path: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param dafsa_path: The path to the DAFSA file.
+        '''
+        with open(dafsa_path, 'rb') as f:
+            self.__data: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__data) < _HEADER.size:
+            self.close()
+            raise InvalidDAFSAException('File is too short to be a DAFSA file.')
+        (magic, version, num_words, num_states, num_edges) = _HEADER.unpack_from(self.__data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise InvalidDAFSAException('File is not a DAFSA file or is of a different version.')
+        self.__num_words: int = num_words
+        self.__start: int = num_states - 1
+        self.__edge_starts_start: int = _HEADER.size
+        self.__finals_start: int = self.__edge_starts_start + (num_states + 1)*_STATE.size
+        self.__labels_start: int = self.__finals_start + num_states
+        self.__targets_start: int = self.__labels_start + num_edges
+        if num_states == 0 or len(self.__data) != self.__targets_start + num_edges*_STATE.size:
+            self.close()
+            raise InvalidDAFSAException('DAFSA file is truncated.')
+
+    #########################################
+    def __enter__(
+        self,
+    ) -> 'DAFSAReader':
+        '''
+        Use the reader in a with statement.
+
+        :return: The reader.
+        '''
+        return self
+
+    #########################################
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        '''
+        Close the reader at the end of a with statement.
+
+        :param exc_type: The type of exception raised in the with statement, if any.
+        :param exc_value: The exception raised in the with statement, if any.
+        :param traceback: The traceback of the exception raised in the with statement, if any.
+        '''
+        self.close()
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of words in the DAFSA file.
+
+        :return: The number of words.
+        '''
+        return self.__num_words
+
+    #########################################
+    def __contains__(
+        self,
+        word: object,
+    ) -> bool:
+        '''
+        Check if a word is in the DAFSA file.
+
+        :param word: The word.
+        :return: Whether the word is in the DAFSA file.
+        '''
+        if not isinstance(word, str):
+            return False
+        state = self.__walk(word.encode('utf-8'))
+        return state is not None and self.__data[self.__finals_start + state] == 1
+
+    #########################################
+    def __iter__(
+        self,
+    ) -> Iterator[str]:
+        '''
+        Iterate over all the words in the DAFSA file in sorted order (by UTF-8 bytes).
+
+        :return: An iterator of words.
+        '''
+        return self.iter_words()
+
+    #########################################
+    def __walk(
+        self,
+        prefix: bytes,
+    ) -> Optional[int]:
+        '''
+        Follow the edges of a prefix from the start state.
+
+        :param prefix: The UTF-8 encoded prefix.
+        :return: The state reached or None if no word starts with the prefix.
+        '''
+        data = self.__data
+        edge_starts_start = self.__edge_starts_start
+        labels_start = self.__labels_start
+        targets_start = self.__targets_start
+        state: int = self.__start
+        for label in prefix:
+            (start, end) = _STATE_RANGE.unpack_from(data, edge_starts_start + state*_STATE.size)
+            edge = data.find(_LABELS[label], labels_start + start, labels_start + end)
+            if edge == -1:
+                return None
+            state = _STATE.unpack_from(data, targets_start + (edge - labels_start)*_STATE.size)[0]
+        return state
+
+    #########################################
+    def iter_words(
+        self,
+        prefix: str = '',
+    ) -> Iterator[str]:
+        '''
+        Iterate over the words in the DAFSA file that start with a prefix in sorted order (by
+        UTF-8 bytes).
+
+        :param prefix: The prefix, which includes all words if empty.
+        :return: An iterator of words.
+        '''
+        encoded_prefix = prefix.encode('utf-8')
+        state = self.__walk(encoded_prefix)
+        if state is None:
+            return
+
+        data = self.__data
+        stack: list[tuple[int, bytes]] = [(state, encoded_prefix)]
+        if data[self.__finals_start + state] == 1:
+            stack.append((_WORD_END, encoded_prefix))
+        while len(stack) > 0:
+            (state, word) = stack.pop()
+            if state == _WORD_END:
+                yield word.decode('utf-8')
+                continue
+            (start, end) = _STATE_RANGE.unpack_from(
+                data, self.__edge_starts_start + state*_STATE.size
+            )
+            children: list[tuple[int, bytes]] = []
+            for (label, (target,)) in zip(
+                data[self.__labels_start + start:self.__labels_start + end],
+                _STATE.iter_unpack(data[
+                    self.__targets_start + start*_STATE.size:
+                    self.__targets_start + end*_STATE.size
+                ]),
+            ):
+                child_word = word + _LABELS[label]
+                if data[self.__finals_start + target] == 1:
+                    children.append((_WORD_END, child_word))
+                children.append((target, child_word))
+            # Reversed so that each word is popped before the longer words that it prefixes.
+            stack.extend(reversed(children))
+
+    #########################################
+    def close(
+        self,
+    ) -> None:
+        '''
+        Close the memory mapped file.
+        '''
+        self.__data.close()
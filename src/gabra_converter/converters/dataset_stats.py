@@ -0,0 +1,329 @@
+'''
+Statistics of the rows of a collection that are accumulated in a single streaming pass and can be
+merged with the statistics of other passes, such as those of parallel workers over parts of the
+same collection.
+
+The statistics are:
+
+- the number of rows,
+- the number of rows having each value of a field (such as the part of speech), which is bounded
+  by the number of possible values,
+- the estimated number of distinct values of a field (such as the surface form), using a
+  ``HyperLogLog``,
+- histograms of integers per row (such as the number of glosses per lexeme), using a
+  ``Log2Histogram``, and
+- histograms of the number of rows per group (such as the number of wordforms per lexeme), which
+  keep a count for every group so that groups split across passes are still counted exactly.
+
+A report is a JSON object with the readable statistics together with a 'state' field from which
+the statistics can be restored and merged with other reports using ``merge_stats_reports``.
+'''
+
+import json
+from enum import Enum
+from typing import Any, Optional
+from gabra_converter.converters.sketches import HyperLogLog, Log2Histogram
+
+
+__all__ = [
+    'IncompatibleStatsException',
+    'DatasetStats',
+    'merge_stats_reports',
+    'save_stats_report',
+    'load_stats_report',
+]
+
+
+#########################################
+class IncompatibleStatsException(Exception):
+    '''
+    Statistics of different collections were merged.
+    '''
+
+
+#########################################
+def _get_value_key(
+    value: Any,
+) -> str:
+    '''
+    Get the key under which a field value is counted.
+
+    :param value: The value, which can be None, a boolean, an enum, or a string.
+    :return: The key, which is 'null', 'true', or 'false' for None and booleans and the string
+        value otherwise.
+    '''
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+#########################################
+class DatasetStats:
+    '''
+    Statistics of the rows of a collection.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        collection: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param collection: The name of the collection, such as 'lexemes'.
+            Only statistics of the same collection can be merged.
+        '''
+        self.collection: str = collection
+        self.num_rows: int = 0
+        self.value_counts: dict[str, dict[str, int]] = {}
+        self.distinct: dict[str, HyperLogLog] = {}
+        self.histograms: dict[str, Log2Histogram] = {}
+        self.group_sizes: dict[str, dict[str, int]] = {}
+
+    #########################################
+    def add_row(
+        self,
+    ) -> None:
+        '''
+        Count a row.
+        '''
+        self.num_rows += 1
+
+    #########################################
+    def count_value(
+        self,
+        field: str,
+        value: Any,
+    ) -> None:
+        '''
+        Count a field value of a row.
+
+        :param field: The name of the field.
+        :param value: The value (see ``_get_value_key``).
+        '''
+        counts = self.value_counts.setdefault(field, {})
+        key = _get_value_key(value)
+        counts[key] = counts.get(key, 0) + 1
+
+    #########################################
+    def add_distinct(
+        self,
+        field: str,
+        value: str,
+    ) -> None:
+        '''
+        Add a field value of a row to be counted once among the distinct values of the field.
+
+        :param field: The name of the field.
+        :param value: The value.
+        '''
+        if field not in self.distinct:
+            self.distinct[field] = HyperLogLog()
+        self.distinct[field].add(value)
+
+    #########################################
+    def add_to_histogram(
+        self,
+        name: str,
+        value: int,
+    ) -> None:
+        '''
+        Add an integer of a row to a histogram.
+
+        :param name: The name of the histogram, such as 'glosses_per_lexeme'.
+        :param value: The integer.
+        '''
+        if name not in self.histograms:
+            self.histograms[name] = Log2Histogram()
+        self.histograms[name].add(value)
+
+    #########################################
+    def add_to_group(
+        self,
+        name: str,
+        key: str,
+    ) -> None:
+        '''
+        Count a row in the group it belongs to for a histogram of the group sizes.
+
+        :param name: The name of the histogram, such as 'wordforms_per_lexeme'.
+        :param key: The key of the group, such as the lexeme ID.
+        '''
+        sizes = self.group_sizes.setdefault(name, {})
+        sizes[key] = sizes.get(key, 0) + 1
+
+    #########################################
+    def merge(
+        self,
+        other: 'DatasetStats',
+    ) -> None:
+        '''
+        Add the statistics of another set of rows of the same collection.
+
+        :param other: The statistics of the other rows.
+        '''
+        if other.collection != self.collection:
+            raise IncompatibleStatsException(
+                f'Cannot merge statistics of {other.collection} into statistics of'
+                f' {self.collection}.'
+            )
+        self.num_rows += other.num_rows
+        for (field, other_counts) in other.value_counts.items():
+            counts = self.value_counts.setdefault(field, {})
+            for (key, count) in other_counts.items():
+                counts[key] = counts.get(key, 0) + count
+        for (field, other_hll) in other.distinct.items():
+            if field not in self.distinct:
+                self.distinct[field] = HyperLogLog(other_hll.precision)
+            self.distinct[field].merge(other_hll)
+        for (name, other_histogram) in other.histograms.items():
+            if name not in self.histograms:
+                self.histograms[name] = Log2Histogram()
+            self.histograms[name].merge(other_histogram)
+        for (name, other_sizes) in other.group_sizes.items():
+            sizes = self.group_sizes.setdefault(name, {})
+            for (key, size) in other_sizes.items():
+                sizes[key] = sizes.get(key, 0) + size
+
+    #########################################
+    def get_state(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the statistics such that they can be restored with ``load_state``.
+
+        :return: A JSON serialisable state.
+        '''
+        return {
+            'collection': self.collection,
+            'num_rows': self.num_rows,
+            'value_counts': self.value_counts,
+            'distinct': {field: hll.get_state() for (field, hll) in self.distinct.items()},
+            'histograms': {
+                name: histogram.get_state() for (name, histogram) in self.histograms.items()
+            },
+            'group_sizes': self.group_sizes,
+        }
+
+    #########################################
+    def load_state(
+        self,
+        state: dict[str, Any],
+    ) -> None:
+        '''
+        Replace the statistics with those of a saved state.
+
+        :param state: A state returned by ``get_state``.
+        '''
+        self.collection = state['collection']
+        self.num_rows = state['num_rows']
+        self.value_counts = {
+            field: dict(counts) for (field, counts) in state['value_counts'].items()
+        }
+        self.distinct = {}
+        for (field, hll_state) in state['distinct'].items():
+            self.distinct[field] = HyperLogLog(hll_state['precision'])
+            self.distinct[field].load_state(hll_state)
+        self.histograms = {}
+        for (name, histogram_state) in state['histograms'].items():
+            self.histograms[name] = Log2Histogram()
+            self.histograms[name].load_state(histogram_state)
+        self.group_sizes = {name: dict(sizes) for (name, sizes) in state['group_sizes'].items()}
+
+    #########################################
+    def get_report(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the report of the statistics.
+
+        :return: A JSON serialisable report with the fields 'collection', 'num_rows',
+            'value_counts', 'value_shares' (the fraction of rows having each value),
+            'distinct_counts' (estimates), 'histograms' (summaries of both the integer and the
+            group size histograms), and 'state' (see ``get_state``).
+        '''
+        histograms = {
+            name: histogram.get_summary() for (name, histogram) in self.histograms.items()
+        }
+        for (name, sizes) in self.group_sizes.items():
+            histogram = Log2Histogram()
+            for size in sizes.values():
+                histogram.add(size)
+            histograms[name] = histogram.get_summary()
+
+        return {
+            'collection': self.collection,
+            'num_rows': self.num_rows,
+            'value_counts': {
+                field: dict(sorted(counts.items()))
+                for (field, counts) in sorted(self.value_counts.items())
+            },
+            'value_shares': {
+                field: {key: count/self.num_rows for (key, count) in sorted(counts.items())}
+                for (field, counts) in sorted(self.value_counts.items())
+            },
+            'distinct_counts': {
+                field: hll.estimate() for (field, hll) in sorted(self.distinct.items())
+            },
+            'histograms': dict(sorted(histograms.items())),
+            'state': self.get_state(),
+        }
+
+
+#########################################
+def merge_stats_reports(
+    reports: list[dict[str, Any]],
+) -> dict[str, Any]:
+    '''
+    Merge the reports of different passes over the same collection into a single report, as if
+    all their rows were passed through a single ``DatasetStats``.
+
+    :param reports: The reports returned by ``DatasetStats.get_report``.
+    :return: The merged report.
+    '''
+    merged: Optional[DatasetStats] = None
+    for report in reports:
+        stats = DatasetStats(report['collection'])
+        stats.load_state(report['state'])
+        if merged is None:
+            merged = stats
+        else:
+            merged.merge(stats)
+    if merged is None:
+        raise ValueError('Cannot merge an empty list of reports.')
+    return merged.get_report()
+
+
+#########################################
+def save_stats_report(
+    path: str,
+    report: dict[str, Any],
+) -> None:
+    '''
+    Save a statistics report to a JSON file.
+
+    :param path: The path to the JSON file.
+    :param report: The report.
+    '''
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+
+
+#########################################
+def load_stats_report(
+    path: str,
+) -> dict[str, Any]:
+    '''
+    Load a statistics report saved with ``save_stats_report``.
+
+    :param path: The path to the JSON file.
+    :return: The report.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        report: dict[str, Any] = json.load(f)
+    return report
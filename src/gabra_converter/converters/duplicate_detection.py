@@ -0,0 +1,421 @@
+'''
+Detect repeated keys (such as Ġabra IDs) in collections of any size without holding every key as
+a Python object.
+
+Keys are byte strings and two ways of detecting the repeated ones are provided:
+
+- ``DuplicateDetector`` detects duplicates in a single pass, as needed by cleaners, by keeping
+  every key in a ``CompactKeySet``, a hash set of fixed size keys packed into a single byte
+  array.
+  Every key has to be kept anyway, so a Bloom filter in front of the set would only add memory
+  and a hash per key.
+  The keys are kept in the order they were seen, so they can be saved incrementally with a
+  checkpoint by appending only the keys seen since the previous one to a file.
+- ``find_duplicates`` detects duplicates in two passes over the keys, such as for reports, where
+  the first pass only collects the keys that a ``BloomFilter`` suspects to be duplicates and the
+  second pass counts the occurrences of only those keys, so only the suspected keys are kept.
+'''
+
+import os
+import math
+import array
+import hashlib
+from typing import Callable, Iterable, TypeVar
+from gabra_converter.converters.checkpoint import CheckpointMismatchException
+
+
+__all__ = [
+    'KeySizeMismatchException',
+    'BloomFilter',
+    'CompactKeySet',
+    'DuplicateDetector',
+    'find_duplicates',
+    'get_id_key',
+]
+
+
+T = TypeVar('T')
+
+_DIGEST_SIZE = 16
+
+
+#########################################
+def get_id_key(
+    oid: str,
+) -> bytes:
+    '''
+    Get the key of a Ġabra ID.
+
+    :param oid: The hexadecimal ID.
+    :return: The 12 bytes of the ID or, if it is not a valid ID, its UTF-8 encoding.
+    '''
+    try:
+        return bytes.fromhex(oid)
+    except ValueError:
+        return oid.encode('utf-8')
+
+
+#########################################
+class KeySizeMismatchException(Exception):
+    '''
+    A key of a different size from the one given to a CompactKeySet was added to it.
+    '''
+
+
+#########################################
+class BloomFilter:
+    '''
+    A set of keys that can have false positives but no false negatives, taking a fixed number of
+    bits per key regardless of the size of the keys.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = 0.01,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param capacity: The number of keys expected to be added.
+            Adding more keys than this increases the false positive rate.
+        :param false_positive_rate: The probability that a key that was not added is reported
+            as added once ``capacity`` keys are added.
+        '''
+        capacity = max(capacity, 1)
+        num_bits = max(
+            math.ceil(-capacity*math.log(false_positive_rate)/(math.log(2)**2)), 8
+        )
+        self.num_hashes: int = max(round(num_bits/capacity*math.log(2)), 1)
+        self.num_bits: int = num_bits
+        self.__bits: bytearray = bytearray((num_bits + 7)//8)
+
+    #########################################
+    def __get_positions(
+        self,
+        key: bytes,
+    ) -> list[int]:
+        '''
+        Get the bit positions of a key using double hashing of a single digest.
+
+        :param key: The key.
+        :return: The bit positions.
+        '''
+        digest = hashlib.blake2b(key, digest_size=_DIGEST_SIZE).digest()
+        hash_1 = int.from_bytes(digest[:8], 'little')
+        hash_2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return [(hash_1 + i*hash_2)%num_bits for i in range(self.num_hashes)]
+
+    #########################################
+    def __contains__(
+        self,
+        key: object,
+    ) -> bool:
+        '''
+        Check if a key was possibly added.
+
+        :param key: The key.
+        :return: False if the key was definitely not added and True if it possibly was.
+        '''
+        if not isinstance(key, bytes):
+            return False
+        bits = self.__bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self.__get_positions(key)
+        )
+
+    #########################################
+    def add(
+        self,
+        key: bytes,
+    ) -> bool:
+        '''
+        Add a key.
+
+        :param key: The key.
+        :return: Whether the key was possibly added before (False if it definitely was not).
+        '''
+        bits = self.__bits
+        possibly_added = True
+        for position in self.__get_positions(key):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                possibly_added = False
+                bits[position >> 3] |= mask
+        return possibly_added
+
+
+#########################################
+class CompactKeySet:
+    '''
+    An exact set of keys of a fixed size packed in the order they were added into a single byte
+    array, which is indexed by an open addressing hash table of integers, taking a few bytes more
+    than the key size per key.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        key_size: int,
+        initial_capacity: int = 1024,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param key_size: The size in bytes of every key.
+        :param initial_capacity: The number of keys to allocate space for, which grows as needed.
+        '''
+        self.key_size: int = key_size
+        num_slots = 8
+        while num_slots < 2*initial_capacity:
+            num_slots *= 2
+        self.__num_slots: int = num_slots
+        self.__size: int = 0
+        # Every slot holds the position of its key plus one, with 0 for an empty slot.
+        self.__slots: array.array = array.array('I', bytes(4*num_slots))
+        self.__keys: bytearray = bytearray()
+
+    #########################################
+    def __find_slot(
+        self,
+        key: bytes,
+    ) -> int:
+        '''
+        Find the slot with a key or the empty slot where it would go using linear probing.
+
+        :param key: The key.
+        :return: The slot index.
+        '''
+        key_size = self.key_size
+        mask = self.__num_slots - 1
+        slots = self.__slots
+        keys = self.__keys
+        slot = hash(key) & mask
+        while slots[slot] != 0:
+            start = (slots[slot] - 1)*key_size
+            if keys[start:start + key_size] == key:
+                break
+            slot = (slot + 1) & mask
+        return slot
+
+    #########################################
+    def __grow(
+        self,
+    ) -> None:
+        '''
+        Double the number of slots and reinsert every key.
+        '''
+        key_size = self.key_size
+        keys = self.__keys
+        self.__num_slots *= 2
+        self.__slots = array.array('I', bytes(4*self.__num_slots))
+        for position in range(self.__size):
+            start = position*key_size
+            self.__slots[self.__find_slot(bytes(keys[start:start + key_size]))] = position + 1
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of keys in the set.
+
+        :return: The number of keys.
+        '''
+        return self.__size
+
+    #########################################
+    def __contains__(
+        self,
+        key: object,
+    ) -> bool:
+        '''
+        Check if a key is in the set.
+
+        :param key: The key.
+        :return: Whether the key is in the set.
+        '''
+        if not isinstance(key, bytes) or len(key) != self.key_size:
+            return False
+        return self.__slots[self.__find_slot(key)] != 0
+
+    #########################################
+    def add(
+        self,
+        key: bytes,
+    ) -> bool:
+        '''
+        Add a key to the set.
+
+        :param key: The key, which must be ``key_size`` bytes long.
+        :return: Whether the key was added, which is False if it was already in the set.
+        '''
+        if len(key) != self.key_size:
+            raise KeySizeMismatchException(
+                f'Expected a key of {self.key_size} bytes but got {len(key)} bytes.'
+            )
+        slot = self.__find_slot(key)
+        if self.__slots[slot] != 0:
+            return False
+        self.__keys += key
+        self.__size += 1
+        self.__slots[slot] = self.__size
+        if 2*self.__size > self.__num_slots:
+            self.__grow()
+        return True
+
+    #########################################
+    def get_packed_keys(
+        self,
+        start: int = 0,
+    ) -> bytes:
+        '''
+        Get the keys in the order they were added, concatenated.
+
+        :param start: The number of keys to leave out from the beginning.
+        :return: The keys from position ``start`` onwards.
+        '''
+        return bytes(self.__keys[start*self.key_size:])
+
+
+#########################################
+class DuplicateDetector:
+    '''
+    Detect keys that were seen before in a single pass.
+        Keys that are not of ``key_size`` bytes are replaced by a digest of that size, which
+        makes the check exact up to digest collisions.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        key_size: int = _DIGEST_SIZE,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param key_size: The size in bytes of the keys to keep (see ``CompactKeySet``).
+        '''
+        self.key_size: int = key_size
+        self.__keys: CompactKeySet = CompactKeySet(key_size)
+        self.__num_saved_keys: int = 0
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of distinct keys seen so far.
+
+        :return: The number of keys.
+        '''
+        return len(self.__keys)
+
+    #########################################
+    def reset(
+        self,
+    ) -> None:
+        '''
+        Forget all the keys seen so far.
+        '''
+        self.__keys = CompactKeySet(self.key_size)
+        self.__num_saved_keys = 0
+
+    #########################################
+    def add(
+        self,
+        key: bytes,
+    ) -> bool:
+        '''
+        Add a key and check if it was seen before.
+
+        :param key: The key.
+        :return: Whether the key is a duplicate of a previously added key.
+        '''
+        if len(key) != self.key_size:
+            key = hashlib.blake2b(key, digest_size=self.key_size).digest()
+        return not self.__keys.add(key)
+
+    #########################################
+    def save(
+        self,
+        path: str,
+    ) -> int:
+        '''
+        Save the keys seen so far to a file such that detection can later be resumed from this
+        point using ``load``.
+            Only the keys seen since the previous save are appended to the file, after discarding
+            anything written to it after the previous save.
+
+        :param path: The path to the file, which is created if the detector was never saved.
+        :return: The number of keys in the file, which is needed to load it.
+        '''
+        with open(path, 'ab') as f:
+            f.truncate(self.__num_saved_keys*self.key_size)
+            f.write(self.__keys.get_packed_keys(self.__num_saved_keys))
+            f.flush()
+            os.fsync(f.fileno())
+        self.__num_saved_keys = len(self.__keys)
+        return self.__num_saved_keys
+
+    #########################################
+    def load(
+        self,
+        path: str,
+        num_keys: int,
+    ) -> None:
+        '''
+        Replace the keys seen so far with the ones in a file saved by ``save``.
+
+        :param path: The path to the file.
+        :param num_keys: The number of keys returned by ``save``, where any keys after them in the
+            file are ignored.
+        '''
+        self.reset()
+        key_size = self.key_size
+        if not os.path.isfile(path) or os.path.getsize(path) < num_keys*key_size:
+            raise CheckpointMismatchException(
+                f'File {path} is missing or shorter than it was at the checkpoint.'
+            )
+        with open(path, 'rb') as f:
+            packed_keys = f.read(num_keys*key_size)
+        keys = self.__keys
+        for start in range(0, len(packed_keys), key_size):
+            keys.add(packed_keys[start:start + key_size])
+        self.__num_saved_keys = num_keys
+
+
+#########################################
+def find_duplicates(
+    get_items: Callable[[], Iterable[tuple[bytes, T]]],
+    expected_count: int,
+    false_positive_rate: float = 0.01,
+) -> list[list[T]]:
+    '''
+    Find the keys that occur more than once in two passes.
+
+    :param get_items: A function that returns a new iterable of key-value pairs every time it is
+        called, which is called twice.
+        The values are used to describe the occurrences of duplicate keys, such as by line
+        number or ID, and are only kept for suspected duplicates.
+    :param expected_count: The number of keys expected (see ``BloomFilter``).
+    :param false_positive_rate: The false positive rate of the Bloom filter, which is the
+        fraction of unique keys that are kept for the second pass.
+    :return: The values of the occurrences of every duplicate key, in the order of their first
+        occurrence.
+    '''
+    bloom_filter = BloomFilter(expected_count, false_positive_rate)
+    suspects: set[bytes] = set()
+    for (key, _) in get_items():
+        if bloom_filter.add(key):
+            suspects.add(key)
+    del bloom_filter
+
+    occurrences: dict[bytes, list[T]] = {}
+    for (key, value) in get_items():
+        if key in suspects:
+            occurrences.setdefault(key, []).append(value)
+    return [values for values in occurrences.values() if len(values) > 1]
@@ -0,0 +1,179 @@
+'''
+Sort the lines of a JSON lines file of any size by a key using a bounded amount of memory.
+
+This is an external merge sort: the lines are read in runs of up to ``max_run_size`` bytes
+which are sorted in memory and spilled to temporary files, and the runs are then merged into the
+sorted file, at most ``max_merge_fan_in`` runs at a time so that the number of open files is also
+bounded.
+Every spilled record is a key-line pair written with ``marshal`` so that keys are only computed
+once, when the lines are first read.
+The sort is stable, so lines with equal keys keep their original order.
+'''
+
+import os
+import heapq
+import marshal
+import operator
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, Optional
+from gabra_converter.converters.jsonl_reader import READ_BUFFER_SIZE, read_jsonl_lines
+
+
+__all__ = [
+    'UnknownOrderException',
+    'DEFAULT_MAX_RUN_SIZE',
+    'DEFAULT_MAX_MERGE_FAN_IN',
+    'sort_jsonl_file',
+]
+
+
+DEFAULT_MAX_RUN_SIZE = 64*1024*1024
+DEFAULT_MAX_MERGE_FAN_IN = 64
+
+_get_record_key = operator.itemgetter(0)
+
+
+#########################################
+class UnknownOrderException(Exception):
+    '''
+    An order that rows cannot be sorted by was requested.
+    '''
+
+
+#########################################
+def _write_run(
+    records: Iterable[tuple[Any, bytes]],
+    run_path: str,
+) -> None:
+    '''
+    Write a run of records to a file in sorted order.
+
+    :param records: The key-line pairs, which are sorted first if they are a list and are
+        otherwise expected to already be sorted.
+    :param run_path: The path to the run file to write.
+    '''
+    if isinstance(records, list):
+        records.sort(key=_get_record_key)
+    dump = marshal.dump
+    with open(run_path, 'wb', buffering=READ_BUFFER_SIZE) as f:
+        for record in records:
+            dump(record, f)
+
+
+#########################################
+def _read_run(
+    run_path: str,
+) -> Iterator[tuple[Any, bytes]]:
+    '''
+    Read the records of a run file written by ``_write_run``, deleting the file once read.
+
+    :param run_path: The path to the run file.
+    :return: An iterator of key-line pairs.
+    '''
+    load = marshal.load
+    with open(run_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        while True:
+            try:
+                record: tuple[Any, bytes] = load(f)
+            except EOFError:
+                break
+            yield record
+    os.remove(run_path)
+
+
+#########################################
+def _merge_runs(
+    run_paths: list[str],
+) -> Iterable[tuple[Any, bytes]]:
+    '''
+    Merge sorted runs into a single sorted iterator of records.
+        Records with equal keys are kept in the order of the runs.
+
+    :param run_paths: The paths to the run files, in the order of the lines they were made from.
+    :return: An iterable of key-line pairs.
+    '''
+    return heapq.merge(
+        *[_read_run(run_path) for run_path in run_paths],
+        key=_get_record_key,
+    )
+
+
+#########################################
+def sort_jsonl_file(
+    in_file_path: str,
+    out_file_path: str,
+    get_key: Callable[[bytes], Any],
+    tmp_dir_path: Optional[str] = None,
+    max_run_size: int = DEFAULT_MAX_RUN_SIZE,
+    max_merge_fan_in: int = DEFAULT_MAX_MERGE_FAN_IN,
+) -> int:
+    '''
+    Sort the lines of a JSON lines file by a key.
+        Empty lines are dropped and every line in the sorted file ends with a new line.
+
+    :param in_file_path: The path to the JSON lines file to sort.
+    :param out_file_path: The path to the sorted file to write, which can be the same as
+        ``in_file_path`` to sort the file in place.
+        The sorted file is first written next to it and then moved into place.
+    :param get_key: A function that returns the sort key of a line.
+        Keys must be comparable with each other and serialisable with ``marshal``, such as
+        tuples of strings and integers.
+    :param tmp_dir_path: The path to a folder in which to spill the runs or None to use the
+        default temporary folder.
+    :param max_run_size: The maximum total size in bytes of the lines kept in memory at once.
+    :param max_merge_fan_in: The maximum number of runs to merge at once.
+    :return: The number of runs that were spilled, which is 0 if the whole file fit in memory.
+    '''
+    if max_merge_fan_in < 2:
+        raise ValueError(f'Cannot merge runs with a fan in of {max_merge_fan_in}.')
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir_path) as runs_path:
+        run_paths: list[str] = []
+        records: list[tuple[Any, bytes]] = []
+        records_size = 0
+        for line in read_jsonl_lines(in_file_path):
+            if not line.endswith(b'\n'):
+                line += b'\n'
+            records.append((get_key(line), line))
+            records_size += len(line)
+            if records_size >= max_run_size:
+                run_paths.append(os.path.join(runs_path, f'{len(run_paths)}.run'))
+                _write_run(records, run_paths[-1])
+                records = []
+                records_size = 0
+
+        num_runs = 0
+        if len(run_paths) == 0:
+            records.sort(key=_get_record_key)
+            sorted_records: Iterable[tuple[Any, bytes]] = records
+        else:
+            if len(records) > 0:
+                run_paths.append(os.path.join(runs_path, f'{len(run_paths)}.run'))
+                _write_run(records, run_paths[-1])
+                records = []
+            num_runs = len(run_paths)
+
+            # Runs are merged in passes of consecutive groups, with each merged run taking the
+            # place of its group, so that the runs stay in the order of their lines and the sort
+            # stays stable.
+            next_run_id = len(run_paths)
+            while len(run_paths) > max_merge_fan_in:
+                merged_run_paths: list[str] = []
+                for i in range(0, len(run_paths), max_merge_fan_in):
+                    group = run_paths[i:i + max_merge_fan_in]
+                    if len(group) == 1:
+                        merged_run_paths.append(group[0])
+                        continue
+                    merged_run_paths.append(os.path.join(runs_path, f'{next_run_id}.run'))
+                    next_run_id += 1
+                    _write_run(_merge_runs(group), merged_run_paths[-1])
+                run_paths = merged_run_paths
+            sorted_records = _merge_runs(run_paths)
+
+        tmp_out_file_path = out_file_path + '.sorting'
+        with open(tmp_out_file_path, 'wb', buffering=READ_BUFFER_SIZE) as f:
+            for (_, line) in sorted_records:
+                f.write(line)
+        os.replace(tmp_out_file_path, out_file_path)
+
+    return num_runs
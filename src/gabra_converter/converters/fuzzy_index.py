@@ -0,0 +1,355 @@
+'''
+A diacritic insensitive fuzzy lookup index mapping words such as surface forms or lemmas to the
+integer IDs of the rows having them, meant to be memory mapped by search applications rather
+than loaded.
+
+Words are first folded by lowercasing them, replacing the Maltese letters ċ, ġ, ħ, and ż with c,
+g, h, and z, and removing accents from vowels, so that a query typed without diacritics finds
+the same rows as the properly spelled word.
+Misspelled queries are answered by finding the folded words that share enough trigrams with the
+folded query (using the q-gram lemma as a filter) and then keeping those that are within a given
+edit distance of it.
+
+The index file consists of:
+
+- A header with a magic string, a format version, and the length in characters of the longest
+  folded word.
+- For every length from 0 to one more than that of the longest folded word, the index of the
+  first folded word in the folded words table that is at least that long, as a little endian
+  unsigned 64-bit integer.
+- The folded words table, mapping every folded word to the sorted row IDs having it, with the
+  folded words sorted by length and then by their UTF-8 bytes.
+  This allows the trigram postings to be restricted to the folded words with lengths that are
+  close enough to that of the query.
+- The trigrams table, mapping every trigram of the folded words (with the words padded by two
+  null characters on either side) to the sorted indexes in the folded words table of the folded
+  words containing it, with the trigrams sorted by their UTF-8 bytes.
+
+The tables are in the format of ``postings_table``.
+'''
+
+import sys
+import mmap
+import bisect
+import struct
+import unicodedata
+from array import array
+from collections import Counter
+from types import TracebackType
+from typing import Optional
+from gabra_converter.converters.postings_table import (
+    TruncatedPostingsTableException,
+    write_postings_table,
+    PostingsTableReader,
+)
+
+
+__all__ = [
+    'InvalidFuzzyIndexException',
+    'fold_diacritics',
+    'build_fuzzy_index',
+    'FuzzyIndexReader',
+]
+
+
+_MAGIC = b'GFZX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQ')
+_OFFSET = struct.Struct('<Q')
+
+_MALTESE_FOLDS = str.maketrans('ċġħżĊĠĦŻ', 'cghzCGHZ')
+_PADDING = '\0\0'
+_TRIGRAM_SIZE = 3
+
+
+#########################################
+def fold_diacritics(
+    text: str,
+) -> str:
+    '''
+    Fold a word into a diacritic insensitive key.
+
+    :param text: The word.
+    :return: The word in lowercase without diacritics.
+    '''
+    decomposed = unicodedata.normalize('NFD', text.translate(_MALTESE_FOLDS).lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+#########################################
+def _get_trigrams(
+    folded: str,
+) -> set[str]:
+    '''
+    Get the distinct trigrams of a folded word padded on either side.
+
+    :param folded: The folded word.
+    :return: The trigrams.
+    '''
+    padded = _PADDING + folded + _PADDING
+    return {padded[i:i + _TRIGRAM_SIZE] for i in range(len(padded) - _TRIGRAM_SIZE + 1)}
+
+
+#########################################
+def _get_edit_distance(
+    text1: str,
+    text2: str,
+    max_distance: int,
+) -> int:
+    '''
+    Get the Levenshtein distance between two strings, giving up early once it exceeds a maximum.
+
+    :param text1: The first string.
+    :param text2: The second string.
+    :param max_distance: The largest distance of interest.
+    :return: The distance or a number greater than max_distance if it is greater.
+    '''
+    prev_row = list(range(len(text2) + 1))
+    for (i, char1) in enumerate(text1, 1):
+        row = [i]
+        for (j, char2) in enumerate(text2, 1):
+            row.append(min(
+                prev_row[j] + 1,
+                row[j - 1] + 1,
+                prev_row[j - 1] + (char1 != char2),
+            ))
+        if min(row) > max_distance:
+            return max_distance + 1
+        prev_row = row
+    return prev_row[-1]
+
+
+#########################################
+class InvalidFuzzyIndexException(Exception):
+    '''
+    A file that was loaded as a fuzzy index is not valid.
+    '''
+
+
+#########################################
+def build_fuzzy_index(
+    index_path: str,
+    postings: dict[str, list[int]],
+) -> None:
+    '''
+    Build a fuzzy index file.
+
+    :param index_path: The path to the index file to create.
+    :param postings: A dictionary mapping every distinct word to the row IDs having it.
+    '''
+    folded_postings: dict[bytes, set[int]] = {}
+    for (word, ids) in postings.items():
+        folded_postings.setdefault(fold_diacritics(word).encode('utf-8'), set()).update(ids)
+    folded_keys = sorted(folded_postings, key=lambda key: (len(key.decode('utf-8')), key))
+    max_length = len(folded_keys[-1].decode('utf-8')) if len(folded_keys) > 0 else 0
+    length_starts = array('Q')
+    for (i, folded_key) in enumerate(folded_keys):
+        while len(length_starts) <= len(folded_key.decode('utf-8')):
+            length_starts.append(i)
+    while len(length_starts) < max_length + 2:
+        length_starts.append(len(folded_keys))
+    if sys.byteorder != 'little':
+        length_starts.byteswap()
+
+    trigram_postings: dict[bytes, array] = {}
+    for (i, folded_key) in enumerate(folded_keys):
+        for trigram in _get_trigrams(folded_key.decode('utf-8')):
+            encoded_trigram = trigram.encode('utf-8')
+            if encoded_trigram not in trigram_postings:
+                trigram_postings[encoded_trigram] = array('I')
+            trigram_postings[encoded_trigram].append(i)
+
+    with open(index_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, max_length))
+        length_starts.tofile(f)
+        write_postings_table(f, [
+            (folded_key, array('I', sorted(folded_postings[folded_key])))
+            for folded_key in folded_keys
+        ])
+        write_postings_table(f, sorted(trigram_postings.items()))
+
+
+#########################################
+class FuzzyIndexReader:
+    '''
+    Find the row IDs of words in a memory mapped fuzzy index, ignoring diacritics and tolerating
+    misspellings.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        index_path: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param index_path: The path to the index file.
+        '''
+        with open(index_path, 'rb') as f:
+            self.__data: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self.__data) < _HEADER.size:
+                raise InvalidFuzzyIndexException('File is too short to be an index.')
+            (magic, version, max_length) = _HEADER.unpack_from(self.__data, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise InvalidFuzzyIndexException(
+                    'File is not a fuzzy index or is of a different version.'
+                )
+            self.__max_length: int = max_length
+            length_starts_end = _HEADER.size + (max_length + 2)*_OFFSET.size
+            if len(self.__data) < length_starts_end:
+                raise InvalidFuzzyIndexException('Index file is truncated.')
+            self.__length_starts: array = array('Q')
+            self.__length_starts.frombytes(self.__data[_HEADER.size:length_starts_end])
+            if sys.byteorder != 'little':
+                self.__length_starts.byteswap()
+            try:
+                self.__folded: PostingsTableReader = PostingsTableReader(
+                    self.__data, length_starts_end
+                )
+                self.__trigrams: PostingsTableReader = PostingsTableReader(
+                    self.__data, self.__folded.end
+                )
+            except TruncatedPostingsTableException as ex:
+                raise InvalidFuzzyIndexException('Index file is truncated.') from ex
+            if len(self.__data) != self.__trigrams.end:
+                raise InvalidFuzzyIndexException('Index file has trailing data.')
+        except InvalidFuzzyIndexException:
+            self.close()
+            raise
+
+    #########################################
+    def __enter__(
+        self,
+    ) -> 'FuzzyIndexReader':
+        '''
+        Use the reader in a with statement.
+
+        :return: The reader.
+        '''
+        return self
+
+    #########################################
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        '''
+        Close the reader at the end of a with statement.
+
+        :param exc_type: The type of exception raised in the with statement, if any.
+        :param exc_value: The exception raised in the with statement, if any.
+        :param traceback: The traceback of the exception raised in the with statement, if any.
+        '''
+        self.close()
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of distinct folded words in the index.
+
+        :return: The number of folded words.
+        '''
+        return self.__folded.num_keys
+
+    #########################################
+    def __get_length_range(
+        self,
+        min_length: int,
+        max_length: int,
+    ) -> tuple[int, int]:
+        '''
+        Get the range of folded words in the folded words table with lengths in a given range.
+
+        :param min_length: The smallest length.
+        :param max_length: The largest length.
+        :return: A pair consisting of the index of the first folded word in the range and the
+            index after the last one.
+        '''
+        return (
+            self.__length_starts[min(max(min_length, 0), self.__max_length + 1)],
+            self.__length_starts[min(max(max_length + 1, 0), self.__max_length + 1)],
+        )
+
+    #########################################
+    def get(
+        self,
+        query: str,
+    ) -> list[int]:
+        '''
+        Get the IDs of the rows whose word is equal to a query when ignoring diacritics and case.
+
+        :param query: The query.
+        :return: The sorted row IDs, which is empty if nothing matches.
+        '''
+        folded_query = fold_diacritics(query)
+        (low, high) = self.__get_length_range(len(folded_query), len(folded_query))
+        i = self.__folded.find(folded_query.encode('utf-8'), low, high)
+        if i is None:
+            return []
+        return self.__folded.get_postings(i).tolist()
+
+    #########################################
+    def get_candidates(
+        self,
+        query: str,
+        max_distance: int = 1,
+    ) -> list[int]:
+        '''
+        Get the IDs of the rows whose word is within an edit distance of a query when ignoring
+        diacritics and case.
+            Only words sharing at least one trigram with the query are considered, which only
+            matters for queries of a character or two.
+
+        :param query: The query.
+        :param max_distance: The largest Levenshtein distance between the folded query and a
+            folded word for its rows to be included.
+        :return: The row IDs sorted by the distance of their word and then by ID.
+        '''
+        folded_query = fold_diacritics(query)
+        trigrams = _get_trigrams(folded_query)
+        # Every edit changes at most three trigrams, so a word within max_distance edits must
+        # contain all the query's distinct trigrams except at most three per edit.
+        min_shared = max(1, len(trigrams) - _TRIGRAM_SIZE*max_distance)
+
+        (low, high) = self.__get_length_range(
+            len(folded_query) - max_distance, len(folded_query) + max_distance
+        )
+
+        counts: Counter = Counter()
+        for trigram in trigrams:
+            i = self.__trigrams.find(trigram.encode('utf-8'), 0, self.__trigrams.num_keys)
+            if i is not None:
+                postings = self.__trigrams.get_postings(i)
+                counts.update(postings[
+                    bisect.bisect_left(postings, low):bisect.bisect_left(postings, high)
+                ])
+
+        found: list[tuple[int, int]] = []
+        for folded_index in [
+            folded_index for (folded_index, count) in counts.items() if count >= min_shared
+        ]:
+            folded = self.__folded.get_key(folded_index).decode('utf-8')
+            distance = _get_edit_distance(folded_query, folded, max_distance)
+            if distance <= max_distance:
+                found.extend(
+                    (distance, id_) for id_ in self.__folded.get_postings(folded_index)
+                )
+        found.sort()
+
+        return [id_ for (_, id_) in found]
+
+    #########################################
+    def close(
+        self,
+    ) -> None:
+        '''
+        Close the memory mapped file.
+        '''
+        self.__data.close()
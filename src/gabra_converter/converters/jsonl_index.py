@@ -0,0 +1,298 @@
+'''
+A compact line offset index over an extracted JSON lines collection file for random access to
+its documents by line number or by Ġabra ID.
+
+The index file consists of:
+
+- A header with a magic string, a format version, the number of lines, and the number of IDs.
+- The byte offset of every non-empty line as a little endian unsigned 64-bit integer, followed
+  by the size of the JSON lines file.
+- A list of Ġabra ID records sorted by ID, each consisting of the 12 byte ObjectId followed by
+  the line number of its document as a little endian unsigned 64-bit integer.
+
+Line numbers count non-empty lines only and start from 0.
+'''
+
+import os
+import re
+import sys
+import mmap
+import struct
+from array import array
+from types import TracebackType
+from typing import Optional, Union
+
+
+__all__ = [
+    'InvalidJSONLIndexException',
+    'JSONLIndexBuilder',
+    'JSONLIndexReader',
+]
+
+
+_MAGIC = b'GJLX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQ')
+_OFFSET = struct.Struct('<Q')
+_ID_RECORD = struct.Struct('<12sQ')
+_ID_SIZE = 12
+
+_ID_PATTERN = re.compile(rb'"_id"\s*:\s*\{\s*"\$oid"\s*:\s*"([0-9a-fA-F]{24})"')
+
+
+#########################################
+def _map_file(
+    path: str,
+) -> Union[mmap.mmap, bytes]:
+    '''
+    Memory map a file for reading.
+
+    :param path: The path to the file.
+    :return: The memory mapped file or an empty bytes object if the file is empty (empty files
+        cannot be memory mapped).
+    '''
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+#########################################
+class InvalidJSONLIndexException(Exception):
+    '''
+    A file that was loaded as a JSON lines index is not a valid index or does not match its JSON
+    lines file.
+    '''
+
+
+#########################################
+class JSONLIndexBuilder:
+    '''
+    Build a line offset index incrementally whilst a JSON lines file is being streamed.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        self.__offsets: array = array('Q')
+        self.__id_records: list[bytes] = []
+
+    #########################################
+    def add_line(
+        self,
+        offset: int,
+        json_line: bytes,
+    ) -> None:
+        '''
+        Add the next non-empty line of the JSON lines file to the index.
+
+        :param offset: The byte offset of the start of the line in the file.
+        :param json_line: The UTF-8 encoded line.
+        '''
+        match = _ID_PATTERN.search(json_line)
+        if match is not None:
+            self.__id_records.append(
+                _ID_RECORD.pack(bytes.fromhex(match.group(1).decode('ascii')), len(self.__offsets))
+            )
+        self.__offsets.append(offset)
+
+    #########################################
+    def save(
+        self,
+        index_path: str,
+        file_size: int,
+    ) -> None:
+        '''
+        Save the index to a file.
+
+        :param index_path: The path to the index file to create.
+        :param file_size: The size in bytes of the JSON lines file that was indexed.
+        '''
+        # Sorting on the record bytes sorts by ID and then by line number so that the first
+        # occurrence of a duplicated ID is the one that will be found.
+        self.__id_records.sort()
+        offsets = array('Q', self.__offsets)
+        offsets.append(file_size)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        with open(index_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self.__offsets), len(self.__id_records)))
+            offsets.tofile(f)
+            for record in self.__id_records:
+                f.write(record)
+
+
+#########################################
+class JSONLIndexReader:
+    '''
+    Random access to the documents of a JSON lines file using its line offset index.
+        Both files are memory mapped rather than loaded.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        in_file_path: str,
+        index_path: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param in_file_path: The path to the JSON lines file.
+        :param index_path: The path to the index file made for the JSON lines file.
+        '''
+        self.__data: Union[mmap.mmap, bytes] = _map_file(in_file_path)
+        self.__index: Union[mmap.mmap, bytes] = _map_file(index_path)
+
+        if len(self.__index) < _HEADER.size:
+            self.close()
+            raise InvalidJSONLIndexException('File is too short to be an index.')
+        (magic, version, num_lines, num_ids) = _HEADER.unpack_from(self.__index, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise InvalidJSONLIndexException('File is not an index or is of a different version.')
+        self.__num_lines: int = num_lines
+        self.__num_ids: int = num_ids
+        self.__ids_start: int = _HEADER.size + (num_lines + 1)*_OFFSET.size
+        if len(self.__index) != self.__ids_start + num_ids*_ID_RECORD.size:
+            self.close()
+            raise InvalidJSONLIndexException('Index file is truncated.')
+        if self.__get_offset(num_lines) != len(self.__data):
+            self.close()
+            raise InvalidJSONLIndexException('Index was not made for this JSON lines file.')
+
+    #########################################
+    def __enter__(
+        self,
+    ) -> 'JSONLIndexReader':
+        '''
+        Use the reader in a with statement.
+
+        :return: The reader.
+        '''
+        return self
+
+    #########################################
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        '''
+        Close the reader at the end of a with statement.
+
+        :param exc_type: The type of exception raised in the with statement, if any.
+        :param exc_value: The exception raised in the with statement, if any.
+        :param traceback: The traceback of the exception raised in the with statement, if any.
+        '''
+        self.close()
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of lines in the JSON lines file.
+
+        :return: The number of lines.
+        '''
+        return self.__num_lines
+
+    #########################################
+    def __get_offset(
+        self,
+        line_num: int,
+    ) -> int:
+        '''
+        Get the byte offset of a line in the JSON lines file.
+
+        :param line_num: The line number.
+        :return: The offset.
+        '''
+        offset: int = _OFFSET.unpack_from(self.__index, _HEADER.size + line_num*_OFFSET.size)[0]
+        return offset
+
+    #########################################
+    def get_line(
+        self,
+        line_num: int,
+    ) -> bytes:
+        '''
+        Get a line from the JSON lines file.
+
+        :param line_num: The line number, counting only non-empty lines.
+        :return: The UTF-8 encoded line without its line terminator.
+        '''
+        if not 0 <= line_num < self.__num_lines:
+            raise IndexError(f'Line number {line_num} is out of range.')
+        return self.__data[
+            self.__get_offset(line_num):self.__get_offset(line_num + 1)
+        ].rstrip(b'\r\n')
+
+    #########################################
+    def get_line_num(
+        self,
+        id_: str,
+    ) -> int:
+        '''
+        Get the line number of the document with a given Ġabra ID.
+            If the ID occurs more than once then the first line is returned.
+
+        :param id_: The hexadecimal Ġabra ID (the $oid of the _id field).
+        :return: The line number.
+        '''
+        try:
+            key = bytes.fromhex(id_)
+        except ValueError as ex:
+            raise KeyError(id_) from ex
+        if len(key) != _ID_SIZE:
+            raise KeyError(id_)
+
+        low = 0
+        high = self.__num_ids
+        while low < high:
+            mid = (low + high)//2
+            record_start = self.__ids_start + mid*_ID_RECORD.size
+            if self.__index[record_start:record_start + _ID_SIZE] < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low == self.__num_ids:
+            raise KeyError(id_)
+        (found_key, line_num) = _ID_RECORD.unpack_from(
+            self.__index, self.__ids_start + low*_ID_RECORD.size
+        )
+        if found_key != key:
+            raise KeyError(id_)
+        return int(line_num)
+
+    #########################################
+    def get_line_by_id(
+        self,
+        id_: str,
+    ) -> bytes:
+        '''
+        Get the line of the document with a given Ġabra ID.
+
+        :param id_: The hexadecimal Ġabra ID (the $oid of the _id field).
+        :return: The UTF-8 encoded line without its line terminator.
+        '''
+        return self.get_line(self.get_line_num(id_))
+
+    #########################################
+    def close(
+        self,
+    ) -> None:
+        '''
+        Close the memory mapped files.
+        '''
+        if isinstance(self.__data, mmap.mmap):
+            self.__data.close()
+        if isinstance(self.__index, mmap.mmap):
+            self.__index.close()
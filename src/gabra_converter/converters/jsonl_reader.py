@@ -0,0 +1,146 @@
+'''
+Read the lines of extracted JSON lines collection files as raw bytes.
+'''
+
+import os
+from typing import BinaryIO, Iterator
+
+
+__all__ = [
+    'READ_BUFFER_SIZE',
+    'read_jsonl_stream_lines',
+    'read_jsonl_lines',
+    'read_jsonl_lines_with_offsets',
+    'read_jsonl_lines_in_range',
+    'split_jsonl_file',
+]
+
+
+READ_BUFFER_SIZE = 1024*1024
+
+
+#########################################
+def read_jsonl_stream_lines(
+    f: BinaryIO,
+) -> Iterator[bytes]:
+    '''
+    Read the non-empty lines of an open JSON lines stream, such as standard input, without
+    decoding them.
+        Lines are yielded as soon as they are read so that a stream that is still being written
+        to can be processed incrementally.
+
+    :param f: The stream, opened in binary mode.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    for line in f:
+        if line not in (b'\n', b'\r\n'):
+            yield line
+
+
+#########################################
+def read_jsonl_lines(
+    in_file_path: str,
+    start_offset: int = 0,
+) -> Iterator[bytes]:
+    '''
+    Read the non-empty lines of a JSON lines file without decoding them.
+        Lines are kept as bytes so that they can be passed on to listeners such as skip logs
+        without being decoded and encoded again.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param start_offset: The byte offset in the file from which to start reading.
+        Must be the start of a line.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    with open(in_file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        f.seek(start_offset)
+        yield from read_jsonl_stream_lines(f)
+
+
+#########################################
+def read_jsonl_lines_with_offsets(
+    in_file_path: str,
+    start_offset: int = 0,
+) -> Iterator[tuple[int, bytes]]:
+    '''
+    Read the non-empty lines of a JSON lines file without decoding them together with the byte
+    offset at which each line starts.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param start_offset: The byte offset in the file from which to start reading.
+        Must be the start of a line.
+    :return: An iterator of offset-line pairs, each line including its line terminator.
+    '''
+    offset = start_offset
+    with open(in_file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        f.seek(start_offset)
+        for line in f:
+            if line not in (b'\n', b'\r\n'):
+                yield (offset, line)
+            offset += len(line)
+
+
+#########################################
+def read_jsonl_lines_in_range(
+    in_file_path: str,
+    start_offset: int,
+    end_offset: int,
+) -> Iterator[bytes]:
+    '''
+    Read the non-empty lines of a JSON lines file that start within a range of byte offsets
+    without decoding them.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param start_offset: The byte offset in the file from which to start reading.
+        Must be the start of a line.
+    :param end_offset: The byte offset in the file at which to stop reading.
+        Must be the start of a line or the size of the file.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    offset = start_offset
+    with open(in_file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        f.seek(start_offset)
+        for line in f:
+            if offset >= end_offset:
+                break
+            offset += len(line)
+            if line not in (b'\n', b'\r\n'):
+                yield line
+
+
+#########################################
+def split_jsonl_file(
+    in_file_path: str,
+    num_parts: int,
+    min_part_size: int = 0,
+) -> list[tuple[int, int]]:
+    '''
+    Split a JSON lines file into consecutive parts of about the same size that start and end at
+    line boundaries, such as for processing the parts in parallel with
+    ``read_jsonl_lines_in_range``.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param num_parts: The maximum number of parts.
+    :param min_part_size: The minimum size in bytes of a part, which limits the number of parts
+        of small files.
+    :return: A list of start-end byte offset pairs, which is empty if the file is empty.
+    '''
+    file_size = os.path.getsize(in_file_path)
+    num_parts = max(min(num_parts, file_size//max(min_part_size, 1)), 1)
+    offsets = [0]
+    with open(in_file_path, 'rb') as f:
+        for i in range(1, num_parts):
+            target_offset = file_size*i//num_parts
+            if target_offset <= offsets[-1]:
+                continue
+            f.seek(target_offset - 1)
+            f.readline()  # Move to the start of the next line unless already at one.
+            offset = f.tell()
+            if offsets[-1] < offset < file_size:
+                offsets.append(offset)
+    offsets.append(file_size)
+    return [
+        (start_offset, end_offset)
+        for (start_offset, end_offset) in zip(offsets, offsets[1:])
+        if end_offset > start_offset
+    ]
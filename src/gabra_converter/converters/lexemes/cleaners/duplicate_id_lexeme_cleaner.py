@@ -0,0 +1,100 @@
+'''
+Skip any lexemes whose ID was already used by a previous lexeme.
+'''
+
+import os
+from typing import Any, Optional
+from gabra_converter.converters.duplicate_detection import DuplicateDetector, get_id_key
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+
+
+__all__ = [
+    'DuplicateIdLexemeCleaner',
+]
+
+
+#########################################
+class DuplicateIdLexemeCleaner(LexemeCleaner):
+    '''
+    Skip any lexemes whose ID was already used by a previous lexeme, keeping only the first
+    lexeme with a given ID.
+        This should be the last cleaner so that a skipped lexeme does not make a later lexeme with
+        the same ID count as a duplicate.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__(
+            id_='duplicate_id',
+            description='Skip any lexemes whose ID was already used by a previous lexeme.',
+        )
+        self.__detector: Optional[DuplicateDetector] = None
+
+    #########################################
+    def reset(
+        self,
+    ) -> None:
+        '''
+        Forget the IDs of the previously cleaned rows.
+        '''
+        self.__detector = None
+
+    #########################################
+    def get_checkpoint(
+        self,
+        checkpoint_path: str,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the cleaner such that cleaning can later be resumed from this point
+        using ``resume``.
+            The IDs of the previously cleaned rows are saved to a file (see
+            ``DuplicateDetector.save``).
+
+        :param checkpoint_path: The path to the file to save the IDs to.
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__detector is None:
+            self.__detector = DuplicateDetector(key_size=12)
+        return {
+            'keys_fname': os.path.basename(checkpoint_path),
+            'num_keys': self.__detector.save(checkpoint_path),
+        }
+
+    #########################################
+    def resume(
+        self,
+        checkpoint_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue cleaning from a checkpoint, remembering the IDs of the rows cleaned before it.
+
+        :param checkpoint_dir_path: The directory path to the folder containing the saved file.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.__detector = DuplicateDetector(key_size=12)
+        self.__detector.load(
+            os.path.join(checkpoint_dir_path, checkpoint['keys_fname']), checkpoint['num_keys']
+        )
+
+    #########################################
+    def clean(
+        self,
+        row: LexemeRow,
+    ) -> bool:
+        '''
+        Clean a row using a particular process.
+
+        :param row: A lexeme row to be checked and cleaned.
+        :return: Whether the row passes the cleaner's filter.
+            A False indicates that it should be skipped.
+        '''
+        if self.__detector is None:
+            self.__detector = DuplicateDetector(key_size=12)
+        return not self.__detector.add(get_id_key(row.id_.oid))
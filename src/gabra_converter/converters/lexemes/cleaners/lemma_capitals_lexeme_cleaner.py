@@ -2,6 +2,7 @@
 Skip any lexemes whose lemma contains uppercase letters.
 '''
 
+from gabra_converter.converters.text_properties import get_text_properties
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
 
@@ -41,4 +42,4 @@ class LemmaCapitalsLexemeCleaner(LexemeCleaner):
         :return: Whether the row passes the cleaner's filter.
             A False indicates that it should be skipped.
         '''
-        return row.lemma == row.lemma.lower()
+        return not get_text_properties(row.lemma).has_uppercase
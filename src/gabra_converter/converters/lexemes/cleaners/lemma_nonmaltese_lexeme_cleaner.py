@@ -2,6 +2,7 @@
 Skip any lexemes whose lemma contains non-Maltese letters.
 '''
 
+from gabra_converter.converters.text_properties import get_text_properties
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
 
@@ -11,9 +12,6 @@ __all__ = [
 ]
 
 
-MALTESE_LETTERS = set(' abċdefġghħijklmnopqrstuvwxżzàèìòù\'')
-
-
 #########################################
 class LemmaNonmalteseLexemeCleaner(LexemeCleaner):
     '''
@@ -44,4 +42,4 @@ class LemmaNonmalteseLexemeCleaner(LexemeCleaner):
         :return: Whether the row passes the cleaner's filter.
             A False indicates that it should be skipped.
         '''
-        return set(row.lemma.lower()) <= MALTESE_LETTERS
+        return get_text_properties(row.lemma).all_maltese
@@ -2,6 +2,7 @@
 Skip any lexemes whose lemma contains spaces.
 '''
 
+from gabra_converter.converters.text_properties import get_text_properties
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
 
@@ -41,4 +42,4 @@ class LemmaSpacesLexemeCleaner(LexemeCleaner):
         :return: Whether the row passes the cleaner's filter.
             A False indicates that it should be skipped.
         '''
-        return ' ' not in row.lemma
+        return not get_text_properties(row.lemma).has_space
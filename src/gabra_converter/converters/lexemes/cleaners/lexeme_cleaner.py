@@ -3,6 +3,7 @@ Clean or flag for skipping a lexeme row based on some condition.
 '''
 
 from abc import ABC
+from typing import Any
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 
 
@@ -33,6 +34,55 @@ class LexemeCleaner(ABC):
         self.id_: str = id_
         self.description: str = description
 
+    #########################################
+    def reset(
+        self,
+    ) -> None:
+        '''
+        Forget anything remembered from previously cleaned rows.
+            This is called by the pipeline when it creates a set of files and, unless ``resume``
+            is overriden, when it resumes one.
+            Can be overriden by subclass.
+        '''
+
+    #########################################
+    def get_checkpoint(
+        self,
+        checkpoint_path: str, # pylint: disable=unused-argument
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the cleaner such that cleaning can later be resumed from this point
+        using ``resume``.
+            A cleaner that remembers previously cleaned rows should override this together with
+            ``resume`` so that a resumed conversion gives the same output as an uninterrupted one.
+            Can be overriden by subclass.
+
+        :param checkpoint_path: The path to a file that the cleaner can save any state to that is
+            too big for the checkpoint, which is next to the pipeline's checkpoint file.
+            Only its name should be kept in the checkpoint so that the folder can be moved or
+            given as a different relative path when resuming.
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {}
+
+    #########################################
+    def resume(
+        self,
+        checkpoint_dir_path: str, # pylint: disable=unused-argument
+        checkpoint: dict[str, Any], # pylint: disable=unused-argument
+    ) -> None:
+        '''
+        Continue cleaning from a checkpoint, forgetting anything remembered after it.
+            By default, this forgets everything using ``reset``.
+            Can be overriden by subclass.
+
+        :param checkpoint_dir_path: The directory path to the folder containing the pipeline's
+            checkpoint file, against which the names of any files saved by ``get_checkpoint``
+            are resolved.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.reset()
+
     #########################################
     def clean(
         self,
@@ -1,44 +1,119 @@
 '''
 A list of available lexeme cleaners.
+
+Cleaners are listed through their ``PluginInfo`` descriptions so that their implementations are
+only imported when they are used.
+Besides the cleaners that come with the program, cleaners provided by other packages through
+entry points in the ``gabra_converter.lexeme_cleaners`` group are also included.
 '''
 
-from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
-from gabra_converter.converters.lexemes.cleaners.new_lines_lexeme_cleaner import (
-    NewLinesLexemeCleaner
-)
-from gabra_converter.converters.lexemes.cleaners.lemma_spaces_lexeme_cleaner import (
-    LemmaSpacesLexemeCleaner
-)
-from gabra_converter.converters.lexemes.cleaners.lemma_capitals_lexeme_cleaner import (
-    LemmaCapitalsLexemeCleaner
-)
-from gabra_converter.converters.lexemes.cleaners.lemma_nonmaltese_lexeme_cleaner import (
-    LemmaNonmalteseLexemeCleaner
-)
-from gabra_converter.converters.lexemes.cleaners.pending_lexeme_cleaner import (
-    PendingLexemeCleaner
+from typing import TYPE_CHECKING, Optional
+from gabra_converter.converters.plugin_info import (
+    InvalidPluginException,
+    PluginInfo,
+    get_entry_point_plugin_infos,
 )
 
+if TYPE_CHECKING:
+    from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+
 
 __all__ = [
+    'LEXEME_CLEANERS_ENTRY_POINT_GROUP',
+    'get_lexeme_cleaner_infos',
+    'get_lexeme_cleaner',
     'get_all_lexeme_cleaners',
 ]
 
 
-#########################################
-__all_lexeme_cleaners: list[LexemeCleaner] = [
-    NewLinesLexemeCleaner(),
-    LemmaSpacesLexemeCleaner(),
-    LemmaCapitalsLexemeCleaner(),
-    LemmaNonmalteseLexemeCleaner(),
-    PendingLexemeCleaner(),
+LEXEME_CLEANERS_ENTRY_POINT_GROUP = 'gabra_converter.lexeme_cleaners'
 
+_BUILTIN_LEXEME_CLEANER_INFOS = [
+    PluginInfo(
+        id_='new_lines',
+        description='Remove new lines from the glosses and examples of lexemes.',
+        module_name='gabra_converter.converters.lexemes.cleaners.new_lines_lexeme_cleaner',
+        class_name='NewLinesLexemeCleaner',
+    ),
+    PluginInfo(
+        id_='lemma_spaces',
+        description='Skip any lexemes whose lemma contains spaces.',
+        module_name='gabra_converter.converters.lexemes.cleaners.lemma_spaces_lexeme_cleaner',
+        class_name='LemmaSpacesLexemeCleaner',
+    ),
+    PluginInfo(
+        id_='lemma_capitals',
+        description='Skip any lexemes whose lemma contains uppercase letters.',
+        module_name='gabra_converter.converters.lexemes.cleaners.lemma_capitals_lexeme_cleaner',
+        class_name='LemmaCapitalsLexemeCleaner',
+    ),
+    PluginInfo(
+        id_='lemma_nonmaltese',
+        description='Skip any lexemes whose lemma contains non-Maltese letters.',
+        module_name='gabra_converter.converters.lexemes.cleaners.lemma_nonmaltese_lexeme_cleaner',
+        class_name='LemmaNonmalteseLexemeCleaner',
+    ),
+    PluginInfo(
+        id_='pending',
+        description='Skip any lexemes whose pending field is not set to false.',
+        module_name='gabra_converter.converters.lexemes.cleaners.pending_lexeme_cleaner',
+        class_name='PendingLexemeCleaner',
+    ),
+    PluginInfo(
+        id_='duplicate_id',
+        description='Skip any lexemes whose ID was already used by a previous lexeme.',
+        module_name='gabra_converter.converters.lexemes.cleaners.duplicate_id_lexeme_cleaner',
+        class_name='DuplicateIdLexemeCleaner',
+    ),
 ]
+__lexeme_cleaner_infos: Optional[list[PluginInfo]] = None
+
+
+#########################################
+def get_lexeme_cleaner_infos(
+) -> list[PluginInfo]:
+    '''
+    Get the descriptions of all the available lexeme cleaners without importing them.
+
+    :return: The list of descriptions, with the ones that come with the program first.
+    '''
+    global __lexeme_cleaner_infos # pylint: disable=global-statement,invalid-name
+    if __lexeme_cleaner_infos is None:
+        infos = _BUILTIN_LEXEME_CLEANER_INFOS + get_entry_point_plugin_infos(
+            LEXEME_CLEANERS_ENTRY_POINT_GROUP
+        )
+        ids = [info.id_ for info in infos]
+        if len(set(ids)) != len(ids):
+            raise InvalidPluginException(
+                f'Lexeme cleaner IDs are not unique: {", ".join(ids)}.'
+            )
+        __lexeme_cleaner_infos = infos
+    return __lexeme_cleaner_infos
+
+
+#########################################
+def get_lexeme_cleaner(
+    id_: str,
+) -> 'LexemeCleaner':
+    '''
+    Get a lexeme cleaner by ID, importing only its implementation.
+
+    :param id_: The ID of the cleaner.
+    :return: The cleaner.
+    '''
+    for info in get_lexeme_cleaner_infos():
+        if info.id_ == id_:
+            return info.load()
+    raise KeyError(id_)
+
+
+#########################################
 def get_all_lexeme_cleaners(
-) -> list[LexemeCleaner]:
+) -> list['LexemeCleaner']:
     '''
     Get a list of all the available lexeme cleaners.
+        This imports all of their implementations.
 
     :return: The list.
     '''
-    return __all_lexeme_cleaners
+    return [info.load() for info in get_lexeme_cleaner_infos()]
@@ -4,15 +4,110 @@ Export lexeme rows to CSV files.
 
 import os
 import csv
+from typing import Any
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
 
 
 __all__ = [
-    'CSVLexemeExporter'
+    'LEXEMES_CSV_COLUMNS',
+    'get_lexeme_csv_values',
+    'CSVLexemeExporter',
 ]
 
 
+_FILE_NAMES = [
+    'lexemes.csv',
+    'lexemes_alternatives.csv',
+    'lexemes_sources.csv',
+    'lexemes_glosses.csv',
+    'lexemes_examples.csv',
+]
+
+LEXEMES_CSV_COLUMNS = [
+    'new_id',
+    '_id',
+    'lemma',
+    'pos',
+    'root-radicals',
+    'root-variant',
+    'headword-lemma',
+    'headword-pos',
+    'form',
+    'derived_form',
+    'gender',
+    'transitive',
+    'intransitive',
+    'ditransitive',
+    'hypothetical',
+    'archaic',
+    'multiword',
+    'pending',
+    'phonetic',
+    'apertium_paradigm',
+    'onomastic_type',
+    'comment',
+]
+
+
+#########################################
+def get_lexeme_csv_values(
+    lexeme_id: int,
+    row: LexemeRow,
+) -> list[str]:
+    '''
+    Get the values of a lexeme row in the main CSV file.
+
+    :param lexeme_id: The integer ID given to the lexeme.
+    :param row: The lexeme row.
+    :return: The values, in the order of ``LEXEMES_CSV_COLUMNS``.
+    '''
+    return [
+        str(lexeme_id),
+        row.id_.oid,
+        row.lemma,
+        row.pos.value
+            if row.pos is not None else '',
+        row.root.radicals
+            if row.root is not None else '',
+        str(row.root.variant.numberInt)
+            if row.root is not None and row.root.variant is not None else '',
+        row.headword.lemma
+            if row.headword is not None else '',
+        row.headword.pos.value
+            if row.headword is not None and row.headword.pos is not None else '',
+        row.form.value
+            if row.form is not None else '',
+        str(row.derived_form.numberInt)
+            if row.derived_form is not None else '',
+        row.gender.value
+            if row.gender is not None else '',
+        ('1' if row.transitive else '0')
+            if row.transitive is not None else '',
+        ('1' if row.intransitive else '0')
+            if row.intransitive is not None else '',
+        ('1' if row.ditransitive else '0')
+            if row.ditransitive is not None else '',
+        ('1' if row.hypothetical else '0')
+            if row.hypothetical is not None else '',
+        ('1' if row.archaic else '0')
+            if row.archaic is not None else '',
+        ('1' if row.multiword else '0')
+            if row.multiword is not None else '',
+        ('1' if row.pending else '0')
+            if row.pending is not None else '',
+        row.phonetic
+            if row.phonetic is not None else '',
+        row.apertium_paradigm
+            if row.apertium_paradigm is not None else '',
+        row.onomastic_type.value
+            if row.onomastic_type is not None else '',
+        row.comment
+            if row.comment is not None else '',
+    ]
+
+
 #########################################
 class CSVLexemeExporter(LexemeExporter):
     '''
@@ -76,30 +171,7 @@ class CSVLexemeExporter(LexemeExporter):
             glosses_w = csv.writer(glosses_f)
             examples_w = csv.writer(examples_f)
 
-            lexemes_w.writerow([
-                'new_id',
-                '_id',
-                'lemma',
-                'pos',
-                'root-radicals',
-                'root-variant',
-                'headword-lemma',
-                'headword-pos',
-                'form',
-                'derived_form',
-                'gender',
-                'transitive',
-                'intransitive',
-                'ditransitive',
-                'hypothetical',
-                'archaic',
-                'multiword',
-                'pending',
-                'phonetic',
-                'apertium_paradigm',
-                'onomastic_type',
-                'comment',
-            ])
+            lexemes_w.writerow(LEXEMES_CSV_COLUMNS)
             alternatives_w.writerow([
                 'new_id',
                 'new_lexeme_id',
@@ -122,6 +194,46 @@ class CSVLexemeExporter(LexemeExporter):
                 'type',
             ])
 
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the exporter such that exporting can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        checkpoint = super().get_checkpoint()
+        checkpoint['lexeme_id'] = self.__lexeme_id
+        checkpoint['alternative_id'] = self.__alternative_id
+        checkpoint['source_id'] = self.__source_id
+        checkpoint['gloss_id'] = self.__gloss_id
+        checkpoint['example_id'] = self.__example_id
+        checkpoint['file_sizes'] = get_file_sizes(self.out_dir_path, _FILE_NAMES)
+        return checkpoint
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue exporting into an existing set of files from a checkpoint, discarding anything
+        exported after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        super().resume(out_dir_path, checkpoint)
+        self.__lexeme_id = checkpoint['lexeme_id']
+        self.__alternative_id = checkpoint['alternative_id']
+        self.__source_id = checkpoint['source_id']
+        self.__gloss_id = checkpoint['gloss_id']
+        self.__example_id = checkpoint['example_id']
+
     #########################################
     def add_row(
         self,
@@ -157,49 +269,7 @@ class CSVLexemeExporter(LexemeExporter):
             examples_w = csv.writer(examples_f)
 
             self.__lexeme_id += 1
-            lexemes_w.writerow([
-                str(self.__lexeme_id),
-                row.id_.oid,
-                row.lemma,
-                row.pos.value
-                    if row.pos is not None else '',
-                row.root.radicals
-                    if row.root is not None else '',
-                str(row.root.variant.numberInt)
-                    if row.root is not None and row.root.variant is not None else '',
-                row.headword.lemma
-                    if row.headword is not None else '',
-                row.headword.pos.value
-                    if row.headword is not None and row.headword.pos is not None else '',
-                row.form.value
-                    if row.form is not None else '',
-                str(row.derived_form.numberInt)
-                    if row.derived_form is not None else '',
-                row.gender.value
-                    if row.gender is not None else '',
-                ('1' if row.transitive else '0')
-                    if row.transitive is not None else '',
-                ('1' if row.intransitive else '0')
-                    if row.intransitive is not None else '',
-                ('1' if row.ditransitive else '0')
-                    if row.ditransitive is not None else '',
-                ('1' if row.hypothetical else '0')
-                    if row.hypothetical is not None else '',
-                ('1' if row.archaic else '0')
-                    if row.archaic is not None else '',
-                ('1' if row.multiword else '0')
-                    if row.multiword is not None else '',
-                ('1' if row.pending else '0')
-                    if row.pending is not None else '',
-                row.phonetic
-                    if row.phonetic is not None else '',
-                row.apertium_paradigm
-                    if row.apertium_paradigm is not None else '',
-                row.onomastic_type.value
-                    if row.onomastic_type is not None else '',
-                row.comment
-                    if row.comment is not None else '',
-            ])
+            lexemes_w.writerow(get_lexeme_csv_values(self.__lexeme_id, row))
 
             if row.alternatives is not None:
                 for alternative in row.alternatives:
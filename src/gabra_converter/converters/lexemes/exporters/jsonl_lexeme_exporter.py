@@ -0,0 +1,239 @@
+'''
+A lexeme exporter for JSON lines files.
+'''
+
+import os
+import json
+from typing import IO, Any, Optional
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter import (
+    AddingLexemeRowBeforeFilesCreationException,
+    LexemeExporter,
+)
+
+
+__all__ = [
+    'JSONL_WRITE_BUFFER_SIZE',
+    'get_lexeme_json_object',
+    'get_lexeme_json_line',
+    'JSONLLexemeExporter',
+]
+
+
+JSONL_WRITE_BUFFER_SIZE = 1024*1024
+
+_FILE_NAME = 'lexemes.ndjson'
+
+# The C accelerated encoder is used directly and circular reference checks are skipped as rows
+# are trees.
+_ENCODE = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(',', ':')
+).encode
+
+
+#########################################
+def get_lexeme_json_object(
+    lexeme_id: int,
+    row: LexemeRow,
+) -> dict[str, Any]:
+    '''
+    Get the JSON object of a lexeme row in the JSON lines file.
+        Every object has all the fields of the schema, with null for missing values.
+
+    :param lexeme_id: The integer ID given to the lexeme.
+    :param row: The lexeme row.
+    :return: The JSON serialisable object.
+    '''
+    return {
+        'new_id': lexeme_id,
+        '_id': row.id_.oid,
+        'lemma': row.lemma,
+        'alternatives': row.alternatives,
+        'pos': row.pos.value
+            if row.pos is not None else None,
+        'sources': row.sources,
+        'glosses': [
+            {
+                'gloss': gloss.gloss,
+                'examples': [
+                    {
+                        'example': example.example,
+                        'type': example.type_.value
+                            if example.type_ is not None else None,
+                    }
+                    for example in gloss.examples
+                ] if gloss.examples is not None else None,
+            }
+            for gloss in row.glosses
+        ] if row.glosses is not None else None,
+        'root': {
+            'radicals': row.root.radicals,
+            'variant': row.root.variant.numberInt
+                if row.root.variant is not None else None,
+        } if row.root is not None else None,
+        'headword': {
+            'lemma': row.headword.lemma,
+            'pos': row.headword.pos.value
+                if row.headword.pos is not None else None,
+        } if row.headword is not None else None,
+        'form': row.form.value
+            if row.form is not None else None,
+        'derived_form': row.derived_form.numberInt
+            if row.derived_form is not None else None,
+        'gender': row.gender.value
+            if row.gender is not None else None,
+        'transitive': row.transitive,
+        'intransitive': row.intransitive,
+        'ditransitive': row.ditransitive,
+        'hypothetical': row.hypothetical,
+        'archaic': row.archaic,
+        'multiword': row.multiword,
+        'pending': row.pending,
+        'phonetic': row.phonetic,
+        'apertium_paradigm': row.apertium_paradigm,
+        'onomastic_type': row.onomastic_type.value
+            if row.onomastic_type is not None else None,
+        'comment': row.comment,
+    }
+
+
+#########################################
+def get_lexeme_json_line(
+    lexeme_id: int,
+    row: LexemeRow,
+) -> str:
+    '''
+    Get the line of a lexeme row in the JSON lines file.
+
+    :param lexeme_id: The integer ID given to the lexeme.
+    :param row: The lexeme row.
+    :return: The JSON object of the row (see ``get_lexeme_json_object``) in compact JSON,
+        followed by a new line.
+    '''
+    return _ENCODE(get_lexeme_json_object(lexeme_id, row)) + '\n'
+
+
+#########################################
+class JSONLLexemeExporter(LexemeExporter):
+    '''
+    A concrete LexemeExporter class that exports lexemes to a JSON lines file.
+        The file is kept open between rows and written through a large buffer, which is only
+        flushed when a checkpoint is taken or when the conversion ends.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__(
+            id_='jsonl',
+            description=(
+                'Export the data into a JSON lines file with one JSON object per lexeme,'
+                ' including its glosses and examples.'
+            ),
+            required_cleaners=set(),
+        )
+        self.__lexeme_id: int = 0
+        self.__f: Optional[IO[str]] = None
+
+    #########################################
+    def __open(
+        self,
+        mode: str,
+    ) -> None:
+        '''
+        Open the JSON lines file, closing any previously open one.
+
+        :param mode: The mode to open the file with.
+        '''
+        if self.__f is not None:
+            self.__f.close()
+        self.__f = open(  # pylint: disable=consider-using-with
+            os.path.join(self.out_dir_path, _FILE_NAME),
+            mode, encoding='utf-8', newline='\n', buffering=JSONL_WRITE_BUFFER_SIZE,
+        )
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        super().create(out_dir_path)
+        self.__lexeme_id = 0
+        self.__open('w')
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the exporter such that exporting can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__f is not None:
+            self.__f.flush()
+        checkpoint = super().get_checkpoint()
+        checkpoint['lexeme_id'] = self.__lexeme_id
+        checkpoint['file_sizes'] = get_file_sizes(self.out_dir_path, [_FILE_NAME])
+        return checkpoint
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue exporting into an existing set of files from a checkpoint, discarding anything
+        exported after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        if self.__f is not None:
+            self.__f.close()
+            self.__f = None
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        super().resume(out_dir_path, checkpoint)
+        self.__lexeme_id = checkpoint['lexeme_id']
+        self.__open('a')
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Close the JSON lines file when the whole JSON lines file has been converted.
+        '''
+        if self.__f is not None:
+            self.__f.close()
+            self.__f = None
+
+    #########################################
+    def add_row(
+        self,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Add a row to the current set of files.
+
+        :param row: A lexeme row to be exported and appended to the files.
+        '''
+        super().add_row(row)
+        if self.__f is None:
+            raise AddingLexemeRowBeforeFilesCreationException()
+
+        self.__lexeme_id += 1
+        self.__f.write(get_lexeme_json_line(self.__lexeme_id, row))
+        self.id_map[row.id_.oid] = self.__lexeme_id
@@ -3,6 +3,7 @@ Export lexeme rows to some file format.
 '''
 
 from abc import ABC
+from typing import Any
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 
 
@@ -73,6 +74,50 @@ class LexemeExporter(ABC):
         self.out_dir_path = out_dir_path
         self.__files_created = True
 
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the exporter such that exporting can later be resumed from this point
+        using ``resume``.
+            Must be overriden and called by subclass.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {
+            'id_map': self.id_map,
+        }
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue exporting into an existing set of files from a checkpoint, discarding anything
+        exported after it.
+            Must be overriden and called by subclass.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.id_map = dict(checkpoint['id_map'])
+        self.out_dir_path = out_dir_path
+        self.__files_created = True
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Finish exporting when the whole JSON lines file has been converted, such as by closing
+        any files kept open between rows.
+            This is called by the pipeline at the end of ``convert_file``.
+            Can be overriden by subclass.
+        '''
+
     #########################################
     def add_row(
         self,
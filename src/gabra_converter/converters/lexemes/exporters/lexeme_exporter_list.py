@@ -1,25 +1,100 @@
 '''
 A list of available lexeme exporters.
+
+Exporters are listed through their ``PluginInfo`` descriptions so that their implementations are
+only imported when they are used.
+Besides the exporters that come with the program, exporters provided by other packages through
+entry points in the ``gabra_converter.lexeme_exporters`` group are also included.
 '''
 
-from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
-from gabra_converter.converters.lexemes.exporters.csv_lexeme_exporter import CSVLexemeExporter
+from typing import TYPE_CHECKING, Optional
+from gabra_converter.converters.plugin_info import (
+    InvalidPluginException,
+    PluginInfo,
+    get_entry_point_plugin_infos,
+)
+
+if TYPE_CHECKING:
+    from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
 
 
 __all__ = [
+    'LEXEME_EXPORTERS_ENTRY_POINT_GROUP',
+    'get_lexeme_exporter_infos',
+    'get_lexeme_exporter',
     'get_all_lexeme_exporters',
 ]
 
 
-#########################################
-__all_lexeme_exporters: list[LexemeExporter] = [
-    CSVLexemeExporter(),
+LEXEME_EXPORTERS_ENTRY_POINT_GROUP = 'gabra_converter.lexeme_exporters'
+
+_BUILTIN_LEXEME_EXPORTER_INFOS = [
+    PluginInfo(
+        id_='csv',
+        description='Export the data into a comma separated file.',
+        module_name='gabra_converter.converters.lexemes.exporters.csv_lexeme_exporter',
+        class_name='CSVLexemeExporter',
+        required_cleaners=set(),
+    ),
+    PluginInfo(
+        id_='jsonl',
+        description=(
+            'Export the data into a JSON lines file with one JSON object per lexeme,'
+            ' including its glosses and examples.'
+        ),
+        module_name='gabra_converter.converters.lexemes.exporters.jsonl_lexeme_exporter',
+        class_name='JSONLLexemeExporter',
+        required_cleaners=set(),
+    ),
 ]
+__lexeme_exporter_infos: Optional[list[PluginInfo]] = None
+
+
+#########################################
+def get_lexeme_exporter_infos(
+) -> list[PluginInfo]:
+    '''
+    Get the descriptions of all the available lexeme exporters without importing them.
+
+    :return: The list of descriptions, with the ones that come with the program first.
+    '''
+    global __lexeme_exporter_infos # pylint: disable=global-statement,invalid-name
+    if __lexeme_exporter_infos is None:
+        infos = _BUILTIN_LEXEME_EXPORTER_INFOS + get_entry_point_plugin_infos(
+            LEXEME_EXPORTERS_ENTRY_POINT_GROUP
+        )
+        ids = [info.id_ for info in infos]
+        if len(set(ids)) != len(ids):
+            raise InvalidPluginException(
+                f'Lexeme exporter IDs are not unique: {", ".join(ids)}.'
+            )
+        __lexeme_exporter_infos = infos
+    return __lexeme_exporter_infos
+
+
+#########################################
+def get_lexeme_exporter(
+    id_: str,
+) -> 'LexemeExporter':
+    '''
+    Get a lexeme exporter by ID, importing only its implementation.
+
+    :param id_: The ID of the exporter.
+    :return: The exporter.
+    '''
+    for info in get_lexeme_exporter_infos():
+        if info.id_ == id_:
+            return info.load()
+    raise KeyError(id_)
+
+
+#########################################
 def get_all_lexeme_exporters(
-) -> list[LexemeExporter]:
+) -> list['LexemeExporter']:
     '''
     Get a list of all the available lexeme exporters.
+        This imports all of their implementations.
 
     :return: The list.
     '''
-    return __all_lexeme_exporters
+    return [info.load() for info in get_lexeme_exporter_infos()]
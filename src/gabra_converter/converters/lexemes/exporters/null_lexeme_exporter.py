@@ -0,0 +1,45 @@
+'''
+Export lexeme rows to nowhere.
+'''
+
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
+
+
+__all__ = [
+    'NullLexemeExporter'
+]
+
+
+#########################################
+class NullLexemeExporter(LexemeExporter):
+    '''
+    A concrete LexemeExporter class that does not write anything and only keeps the ID map,
+    which is used when the processed rows are consumed directly instead of being exported.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__(
+            id_='null',
+            description='Do not export anything.',
+            required_cleaners=set(),
+        )
+
+    #########################################
+    def add_row(
+        self,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Add a row to the current set of files.
+
+        :param row: A lexeme row to be exported and appended to the files.
+        '''
+        super().add_row(row)
+        self.id_map[row.id_.oid] = len(self.id_map) + 1
@@ -2,8 +2,20 @@
 A pipeline that processes JSON encoded lexeme rows and exports them.
 '''
 
+import os
 import json
+from typing import Any, Callable, Iterable, Iterator, Optional
 import pydantic
+from gabra_converter.converters.jsonl_reader import (
+    read_jsonl_lines,
+    read_jsonl_lines_with_offsets,
+)
+from gabra_converter.converters.jsonl_index import JSONLIndexBuilder
+from gabra_converter.converters.checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    CheckpointMismatchException,
+    save_checkpoint,
+)
 from gabra_converter.converters.lexemes.row.lexeme_row_fixer import fix_lexeme_row
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
@@ -41,9 +53,13 @@ class LexemePipeline:
             )
 
         self.out_dir_path: str = ''
-        self.cleaners: list[LexemeCleaner] = cleaners
+        # These are tuples as the per-row processing function is compiled from them, so they
+        # cannot be changed without it being recompiled.
+        self.cleaners: tuple[LexemeCleaner, ...] = tuple(cleaners)
         self.exporter: LexemeExporter = exporter
-        self.listeners: list[LexemePipelineListener] = []
+        self.listeners: tuple[LexemePipelineListener, ...] = ()
+        self.__in_file_offset: int = 0
+        self.__process_row: Callable[[bytes], Optional[LexemeRow]] = self.__compile_row_processor()
 
     #########################################
     def add_listener(
@@ -52,10 +68,12 @@ class LexemePipeline:
     ) -> None:
         '''
         Add a listener to observe the rows being exported.
+            The per-row processing function is recompiled to include the listener.
 
         :param listener: The listener.
         '''
-        self.listeners.append(listener)
+        self.listeners += (listener,)
+        self.__process_row = self.__compile_row_processor()
 
     #########################################
     def get_id_map(
@@ -79,72 +97,275 @@ class LexemePipeline:
 
         :param out_dir_path: The directory path to a folder to contain the files.
         '''
+        self.out_dir_path = out_dir_path
         self.exporter.create(out_dir_path)
+        for cleaner in self.cleaners:
+            cleaner.reset()
+        for listener in self.listeners:
+            listener.create(out_dir_path)
+        self.__in_file_offset = 0
 
     #########################################
-    def add_row(
+    def get_checkpoint(
+        self,
+        in_file_offset: int,
+        checkpoint_path: str,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the pipeline such that converting can later be resumed from this point
+        using ``resume``.
+
+        :param in_file_offset: The byte offset in the JSON lines file of the next line to convert.
+        :param checkpoint_path: The path to the checkpoint file, next to which the cleaners save
+            any state that is too big for the checkpoint, in files named after the checkpoint
+            file followed by the cleaner's ID.
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {
+            'in_file_offset': in_file_offset,
+            'exporter': self.exporter.get_checkpoint(),
+            'cleaners': [
+                cleaner.get_checkpoint(f'{checkpoint_path}.{cleaner.id_}')
+                for cleaner in self.cleaners
+            ],
+            'listeners': [listener.get_checkpoint() for listener in self.listeners],
+        }
+
+    #########################################
+    def resume(
         self,
-        json_line: str,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+        checkpoint_path: str,
     ) -> None:
         '''
-        Export another row.
+        Continue exporting into an existing set of files from a checkpoint instead of creating
+        new ones, discarding anything exported after the checkpoint.
+            The next call to ``convert_file`` will continue from where the checkpoint was taken.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        :param checkpoint_path: The path to the checkpoint file that the checkpoint was loaded
+            from, next to which the cleaners saved their state.
+        '''
+        if len(checkpoint['cleaners']) != len(self.cleaners):
+            raise CheckpointMismatchException(
+                f'The checkpoint has {len(checkpoint["cleaners"])} cleaners but the pipeline'
+                f' has {len(self.cleaners)}.'
+            )
+        if len(checkpoint['listeners']) != len(self.listeners):
+            raise CheckpointMismatchException(
+                f'The checkpoint has {len(checkpoint["listeners"])} listeners but the pipeline'
+                f' has {len(self.listeners)}.'
+            )
+        self.out_dir_path = out_dir_path
+        self.exporter.resume(out_dir_path, checkpoint['exporter'])
+        for (cleaner, cleaner_checkpoint) in zip(self.cleaners, checkpoint['cleaners']):
+            cleaner.resume(os.path.dirname(checkpoint_path), cleaner_checkpoint)
+        for (listener, listener_checkpoint) in zip(self.listeners, checkpoint['listeners']):
+            listener.resume(out_dir_path, listener_checkpoint)
+        self.__in_file_offset = checkpoint['in_file_offset']
 
-        :param json_line: A line from the extracted lexemes collection.
-        '''
-        try:
-            loaded_json = json.loads(json_line)
-        except json.decoder.JSONDecodeError:
-            for listener in self.listeners:
-                listener.row_skipped(
-                    json_line,
-                    invalid_json=True,
-                    schema_mismatch=False,
-                    cleaner=None,
-                )
-            return
-
-        fix_lexeme_row(loaded_json)
-
-        try:
-            row = LexemeRow(**loaded_json)
-        except pydantic.ValidationError:
-            for listener in self.listeners:
-                listener.row_skipped(
-                    json_line,
-                    invalid_json=False,
-                    schema_mismatch=True,
-                    cleaner=None,
-                )
-            return
+    #########################################
+    def __compile_row_processor(
+        self,
+    ) -> Callable[[bytes], Optional[LexemeRow]]:
+        '''
+        Compile a function that processes a single row using exactly the configured fixer,
+        cleaners, exporter, and listeners.
+            Listeners that do not override an event are left out of that event's dispatch and
+            dispatch loops that would be empty are left out altogether.
 
-        for cleaner in self.cleaners:
-            accepted = cleaner.clean(row)
-            if not accepted:
-                for listener in self.listeners:
-                    listener.row_skipped(
+        :return: The row processing function.
+        '''
+        loads = json.loads
+        decode_errors = (json.decoder.JSONDecodeError, UnicodeDecodeError)
+        validation_error = pydantic.ValidationError
+        cleaners = tuple((cleaner, cleaner.clean) for cleaner in self.cleaners)
+        exporter_add_row = self.exporter.add_row
+        row_exported_listeners = tuple(
+            listener.row_exported for listener in self.listeners
+            if type(listener).row_exported is not LexemePipelineListener.row_exported
+        )
+        row_skipped_listeners = tuple(
+            listener.row_skipped for listener in self.listeners
+            if type(listener).row_skipped is not LexemePipelineListener.row_skipped
+        )
+
+        def process_row(
+            json_line: bytes,
+        ) -> Optional[LexemeRow]:
+            '''
+            Fix, validate, clean, and export a row.
+
+            :param json_line: A UTF-8 encoded line from the extracted lexemes collection.
+            :return: The exported row or None if it was skipped.
+            '''
+            try:
+                loaded_json = loads(json_line.decode('utf-8'))
+            except decode_errors:
+                for row_skipped in row_skipped_listeners:
+                    row_skipped(
                         json_line,
-                        invalid_json=False,
+                        invalid_json=True,
                         schema_mismatch=False,
-                        cleaner=cleaner,
+                        cleaner=None,
                     )
-                return
+                return None
 
-        self.exporter.add_row(row)
-        for listener in self.listeners:
-            listener.row_exported(json_line, row)
+            fix_lexeme_row(loaded_json)
+
+            try:
+                row = LexemeRow(**loaded_json)
+            except validation_error:
+                for row_skipped in row_skipped_listeners:
+                    row_skipped(
+                        json_line,
+                        invalid_json=False,
+                        schema_mismatch=True,
+                        cleaner=None,
+                    )
+                return None
+
+            for (cleaner, clean) in cleaners:
+                if not clean(row):
+                    for row_skipped in row_skipped_listeners:
+                        row_skipped(
+                            json_line,
+                            invalid_json=False,
+                            schema_mismatch=False,
+                            cleaner=cleaner,
+                        )
+                    return None
+
+            exporter_add_row(row)
+            return row
+
+        if len(row_exported_listeners) == 0:
+            return process_row
+
+        def process_row_and_notify(
+            json_line: bytes,
+        ) -> Optional[LexemeRow]:
+            '''
+            Fix, validate, clean, and export a row and then notify the listeners if it was
+            exported.
+
+            :param json_line: A UTF-8 encoded line from the extracted lexemes collection.
+            :return: The exported row or None if it was skipped.
+            '''
+            row = process_row(json_line)
+            if row is not None:
+                for row_exported in row_exported_listeners:
+                    row_exported(json_line, row)
+            return row
+
+        return process_row_and_notify
+
+    #########################################
+    def add_row(
+        self,
+        json_line: bytes,
+    ) -> None:
+        '''
+        Export another row.
+
+        :param json_line: A UTF-8 encoded line from the extracted lexemes collection.
+        '''
+        self.__process_row(json_line)
+
+    #########################################
+    def iter_rows(
+        self,
+        json_lines: Iterable[bytes],
+    ) -> Iterator[LexemeRow]:
+        '''
+        Export rows one at a time and yield the ones that were exported.
+            Lines are only read as rows are requested so this can be used to process rows
+            lazily, typically with a ``NullLexemeExporter`` when the rows are not to be saved.
+
+        :param json_lines: UTF-8 encoded lines from the extracted lexemes collection.
+        :return: An iterator of the exported rows.
+        '''
+        process_row = self.__process_row
+        for json_line in json_lines:
+            row = process_row(json_line)
+            if row is not None:
+                yield row
 
     #########################################
     def convert_file(
         self,
         in_file_path: str,
+        index_path: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
     ) -> None:
         '''
         Convert an entire JSON lines file.
 
         :param in_file_path: The directory path to an extracted JSON lines collection
             file extracted from Ġabra.
+        :param index_path: The path to a line offset index file to build whilst converting
+            (see ``JSONLIndexReader``) or None to not build one.
+        :param checkpoint_path: The path to a checkpoint file to periodically save the state of
+            the conversion to (see ``resume``) or None to not save checkpoints.
+            A final checkpoint is saved once the whole file is converted.
+            The cleaners may save their state in files next to it (see ``get_checkpoint``).
+            The temporary files of the listeners are then kept after the conversion ends, as
+            resuming from the final checkpoint needs them, until ``remove_tmp_files`` is called.
+        :param checkpoint_interval: The number of rows to convert between checkpoints.
         '''
-        with open(in_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line != '\n':
-                    self.add_row(line)
+        process_row = self.__process_row
+        start_offset = self.__in_file_offset
+        if index_path is None and checkpoint_path is None:
+            for line in read_jsonl_lines(in_file_path, start_offset):
+                process_row(line)
+        else:
+            # The index needs the offsets of all the lines so lines before the start offset are
+            # read but not converted.
+            index_builder = JSONLIndexBuilder() if index_path is not None else None
+            rows_since_checkpoint = 0
+            for (offset, line) in read_jsonl_lines_with_offsets(
+                in_file_path, 0 if index_builder is not None else start_offset
+            ):
+                if index_builder is not None:
+                    index_builder.add_line(offset, line)
+                if offset < start_offset:
+                    continue
+                process_row(line)
+                if checkpoint_path is not None:
+                    rows_since_checkpoint += 1
+                    if rows_since_checkpoint == checkpoint_interval:
+                        save_checkpoint(
+                            checkpoint_path,
+                            self.get_checkpoint(offset + len(line), checkpoint_path),
+                        )
+                        rows_since_checkpoint = 0
+            if index_builder is not None and index_path is not None:
+                index_builder.save(index_path, os.path.getsize(in_file_path))
+
+        self.__in_file_offset = os.path.getsize(in_file_path)
+        if checkpoint_path is not None:
+            save_checkpoint(
+                checkpoint_path, self.get_checkpoint(self.__in_file_offset, checkpoint_path)
+            )
+        self.exporter.conversion_ended()
+        for listener in self.listeners:
+            listener.conversion_ended()
+        if checkpoint_path is None:
+            self.remove_tmp_files()
+
+    #########################################
+    def remove_tmp_files(
+        self,
+    ) -> None:
+        '''
+        Remove the temporary files of the listeners (see ``get_tmp_fnames``) once the conversion
+        has ended and its checkpoint was removed, if it was saved.
+        '''
+        for listener in self.listeners:
+            for fname in listener.get_tmp_fnames():
+                path = os.path.join(self.out_dir_path, fname)
+                if os.path.isfile(path):
+                    os.remove(path)
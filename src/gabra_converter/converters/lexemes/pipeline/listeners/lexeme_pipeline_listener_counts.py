@@ -0,0 +1,142 @@
+'''
+Count the lexemes that were exported and skipped, by reason.
+'''
+
+from typing import Any, Optional
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener import (
+    LexemePipelineListener
+)
+
+__all__ = [
+    'LexemePipelineListenerCounts',
+]
+
+
+#########################################
+class LexemePipelineListenerCounts(LexemePipelineListener):
+    '''
+    Count the lexemes that were exported, that were not valid JSON, that did not conform to the
+    Ġabra schema, and that were skipped by each cleaner, without writing anything.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.num_exported: int = 0
+        self.num_invalid_json: int = 0
+        self.num_schema_mismatch: int = 0
+        self.num_skipped_by_cleaner: dict[str, int] = {}
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        self.num_exported = 0
+        self.num_invalid_json = 0
+        self.num_schema_mismatch = 0
+        self.num_skipped_by_cleaner = {}
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return self.get_counts()
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.num_exported = checkpoint['num_exported']
+        self.num_invalid_json = checkpoint['num_invalid_json']
+        self.num_schema_mismatch = checkpoint['num_schema_mismatch']
+        self.num_skipped_by_cleaner = dict(checkpoint['num_skipped_by_cleaner'])
+
+    #########################################
+    def get_counts(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the counts.
+
+        :return: A JSON serialisable dictionary with the fields 'num_rows', 'num_exported',
+            'num_invalid_json', 'num_schema_mismatch', and 'num_skipped_by_cleaner' (a
+            dictionary mapping cleaner IDs to counts).
+        '''
+        return {
+            'num_rows': (
+                self.num_exported + self.num_invalid_json + self.num_schema_mismatch
+                + sum(self.num_skipped_by_cleaner.values())
+            ),
+            'num_exported': self.num_exported,
+            'num_invalid_json': self.num_invalid_json,
+            'num_schema_mismatch': self.num_schema_mismatch,
+            'num_skipped_by_cleaner': dict(self.num_skipped_by_cleaner),
+        }
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Listen for when a row was exported.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was exported.
+        :param row: The parsed row object that was exported.
+        '''
+        self.num_exported += 1
+
+    #########################################
+    def row_skipped(
+        self,
+        json_line: bytes,
+        invalid_json: bool,
+        schema_mismatch: bool,
+        cleaner: Optional[LexemeCleaner],
+    ) -> None:
+        '''
+        Listen for when a row was skipped.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was skipped.
+        :param invalid_json: Whether the JSON row was not in valid JSON format.
+        :param schema_mismatch: Whether the JSON row did not conform to the Ġabra schema.
+        :param cleaner: The cleaner that determined that the row should be skipped.
+            If None, then the reason is that it was either not valid JSON or did not conform
+            to the Ġabra schema.
+        '''
+        if cleaner is not None:
+            self.num_skipped_by_cleaner[cleaner.id_] = (
+                self.num_skipped_by_cleaner.get(cleaner.id_, 0) + 1
+            )
+        elif invalid_json:
+            self.num_invalid_json += 1
+        elif schema_mismatch:
+            self.num_schema_mismatch += 1
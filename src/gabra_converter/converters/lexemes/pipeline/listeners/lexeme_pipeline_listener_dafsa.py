@@ -0,0 +1,158 @@
+'''
+Build a DAFSA word list of the lemmas and their alternatives from the lexemes that were
+exported.
+'''
+
+import os
+from typing import Any, BinaryIO, Optional
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
+from gabra_converter.converters.dafsa import build_dafsa_from_words_file, get_word_line
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener import (
+    LexemePipelineListener
+)
+
+__all__ = [
+    'AddingLexemeWordsBeforeFileCreationException',
+    'LexemePipelineListenerDAFSA',
+]
+
+
+_WORDS_FNAME = 'lexemes_words.tmp'
+_DAFSA_FNAME = 'lexemes.dafsa'
+
+
+#########################################
+class AddingLexemeWordsBeforeFileCreationException(Exception):
+    '''
+    A LexemePipelineListenerDAFSA object was used to add an exported row before creating its
+    files.
+    '''
+
+
+#########################################
+class LexemePipelineListenerDAFSA(LexemePipelineListener):
+    '''
+    Build a DAFSA word list of the lemmas and alternatives of the exported lexemes.
+        The words are collected in a temporary file whilst converting which is sorted on disk
+        and streamed into the DAFSA file at the end of the conversion.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.out_dir_path: str = ''
+        self.__words_f: Optional[BinaryIO] = None
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        if self.__words_f is not None:
+            self.__words_f.close()
+        self.__words_f = open(  # pylint: disable=consider-using-with
+            os.path.join(out_dir_path, _WORDS_FNAME), 'wb'
+        )
+        self.out_dir_path = out_dir_path
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__words_f is not None:
+            self.__words_f.flush()
+        return {
+            'file_sizes': get_file_sizes(self.out_dir_path, [_WORDS_FNAME]),
+        }
+
+    #########################################
+    def get_tmp_fnames(
+        self,
+    ) -> list[str]:
+        '''
+        Get the names of the temporary files that the listener keeps in the output folder whilst
+        converting.
+
+        :return: The file names.
+        '''
+        return [_WORDS_FNAME]
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        if self.__words_f is not None:
+            self.__words_f.close()
+        self.__words_f = open(  # pylint: disable=consider-using-with
+            os.path.join(out_dir_path, _WORDS_FNAME), 'ab'
+        )
+        self.out_dir_path = out_dir_path
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Listen for when a row was exported.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was exported.
+        :param row: The parsed row object that was exported.
+        '''
+        super().row_exported(json_line, row)
+
+        if self.__words_f is None:
+            raise AddingLexemeWordsBeforeFileCreationException()
+
+        words = [row.lemma]
+        if row.alternatives is not None:
+            words.extend(row.alternatives)
+        for word in words:
+            self.__words_f.write(get_word_line(word))
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+            This is called by the pipeline at the end of ``convert_file``.
+        '''
+        super().conversion_ended()
+
+        if self.__words_f is None:
+            raise AddingLexemeWordsBeforeFileCreationException()
+        self.__words_f.close()
+        self.__words_f = None
+
+        words_path = os.path.join(self.out_dir_path, _WORDS_FNAME)
+        build_dafsa_from_words_file(
+            os.path.join(self.out_dir_path, _DAFSA_FNAME), words_path, self.out_dir_path
+        )
@@ -0,0 +1,223 @@
+'''
+Build an SQLite FTS5 full text index of the glosses and examples of the lexemes that were
+exported.
+'''
+
+import os
+import sqlite3
+from typing import Any, Optional
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener import (
+    LexemePipelineListener
+)
+
+__all__ = [
+    'FTS_BATCH_SIZE',
+    'AddingLexemeToFTSIndexBeforeFileCreationException',
+    'LexemePipelineListenerFTSIndex',
+]
+
+
+FTS_BATCH_SIZE = 10000
+
+_INDEX_FNAME = 'lexemes_fts.sqlite3'
+_SCHEMA = [
+    'CREATE VIRTUAL TABLE glosses USING fts5(gloss, new_lexeme_id UNINDEXED)',
+    'CREATE VIRTUAL TABLE examples USING fts5('
+    'example, new_gloss_id UNINDEXED, new_lexeme_id UNINDEXED)',
+]
+
+
+#########################################
+class AddingLexemeToFTSIndexBeforeFileCreationException(Exception):
+    '''
+    A LexemePipelineListenerFTSIndex object was used to add an exported row before creating its
+    files.
+    '''
+
+
+#########################################
+class LexemePipelineListenerFTSIndex(LexemePipelineListener):
+    '''
+    Build an SQLite database with FTS5 tables of glosses and examples for reverse lookup.
+        The ``rowid`` of the glosses and examples tables is the ``new_id`` of the glosses and
+        examples and the lexeme IDs are the consecutive integers starting from 1 that are given
+        to the lexemes in the order they are exported, which is how the CSV exporter numbers
+        them.
+        Rows are inserted in bulk every ``FTS_BATCH_SIZE`` lexemes.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.out_dir_path: str = ''
+        self.__conn: Optional[sqlite3.Connection] = None
+        self.__lexeme_id: int = 0
+        self.__gloss_id: int = 0
+        self.__example_id: int = 0
+        self.__num_pending: int = 0
+        self.__pending_glosses: list[tuple[int, str, int]] = []
+        self.__pending_examples: list[tuple[int, str, int, int]] = []
+
+    #########################################
+    def __connect(
+        self,
+        out_dir_path: str,
+    ) -> sqlite3.Connection:
+        '''
+        Open the database, closing any previously opened one.
+
+        :param out_dir_path: The directory path to the folder containing the database.
+        :return: The connection to the database.
+        '''
+        if self.__conn is not None:
+            self.__conn.close()
+        conn = sqlite3.connect(os.path.join(out_dir_path, _INDEX_FNAME))
+        conn.execute('PRAGMA synchronous = NORMAL')
+        self.__conn = conn
+        self.out_dir_path = out_dir_path
+        self.__num_pending = 0
+        self.__pending_glosses = []
+        self.__pending_examples = []
+        return conn
+
+    #########################################
+    def __flush(
+        self,
+    ) -> None:
+        '''
+        Insert the pending rows into the database and commit them.
+        '''
+        if self.__conn is None:
+            raise AddingLexemeToFTSIndexBeforeFileCreationException()
+        with self.__conn:
+            self.__conn.executemany(
+                'INSERT INTO glosses(rowid, gloss, new_lexeme_id) VALUES (?, ?, ?)',
+                self.__pending_glosses,
+            )
+            self.__conn.executemany(
+                'INSERT INTO examples(rowid, example, new_gloss_id, new_lexeme_id)'
+                ' VALUES (?, ?, ?, ?)',
+                self.__pending_examples,
+            )
+        self.__num_pending = 0
+        self.__pending_glosses = []
+        self.__pending_examples = []
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        if self.__conn is not None:
+            self.__conn.close()
+            self.__conn = None
+        if os.path.exists(os.path.join(out_dir_path, _INDEX_FNAME)):
+            os.remove(os.path.join(out_dir_path, _INDEX_FNAME))
+        conn = self.__connect(out_dir_path)
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        self.__lexeme_id = 0
+        self.__gloss_id = 0
+        self.__example_id = 0
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        self.__flush()
+        return {
+            'lexeme_id': self.__lexeme_id,
+            'gloss_id': self.__gloss_id,
+            'example_id': self.__example_id,
+        }
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        conn = self.__connect(out_dir_path)
+        with conn:
+            conn.execute('DELETE FROM glosses WHERE rowid > ?', (checkpoint['gloss_id'],))
+            conn.execute('DELETE FROM examples WHERE rowid > ?', (checkpoint['example_id'],))
+        self.__lexeme_id = checkpoint['lexeme_id']
+        self.__gloss_id = checkpoint['gloss_id']
+        self.__example_id = checkpoint['example_id']
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Listen for when a row was exported.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was exported.
+        :param row: The parsed row object that was exported.
+        '''
+        super().row_exported(json_line, row)
+
+        if self.__conn is None:
+            raise AddingLexemeToFTSIndexBeforeFileCreationException()
+
+        self.__lexeme_id += 1
+        if row.glosses is not None:
+            for gloss in row.glosses:
+                self.__gloss_id += 1
+                self.__pending_glosses.append((self.__gloss_id, gloss.gloss, self.__lexeme_id))
+                if gloss.examples is not None:
+                    for example in gloss.examples:
+                        self.__example_id += 1
+                        self.__pending_examples.append((
+                            self.__example_id, example.example, self.__gloss_id, self.__lexeme_id
+                        ))
+
+        self.__num_pending += 1
+        if self.__num_pending >= FTS_BATCH_SIZE:
+            self.__flush()
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+            This is called by the pipeline at the end of ``convert_file``.
+        '''
+        super().conversion_ended()
+
+        if self.__conn is None:
+            raise AddingLexemeToFTSIndexBeforeFileCreationException()
+        conn = self.__conn
+        self.__flush()
+        with conn:
+            conn.execute("INSERT INTO glosses(glosses) VALUES ('optimize')")
+            conn.execute("INSERT INTO examples(examples) VALUES ('optimize')")
+        conn.close()
+        self.__conn = None
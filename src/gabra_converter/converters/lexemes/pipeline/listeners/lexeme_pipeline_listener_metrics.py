@@ -0,0 +1,177 @@
+'''
+Keep the metrics of the lexemes being converted.
+'''
+
+import time
+from typing import Any, Optional
+from gabra_converter.converters.conversion_metrics import CollectionMetrics, ConversionMetrics
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener import (
+    LexemePipelineListener
+)
+
+__all__ = [
+    'LexemePipelineListenerMetrics',
+]
+
+
+#########################################
+class LexemePipelineListenerMetrics(LexemePipelineListener):
+    '''
+    Count the lexemes that were exported and skipped, by reason, and time how long every lexeme
+    took to process in the metrics of a conversion, writing them every interval.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        metrics: ConversionMetrics,
+        exporter: Optional[LexemeExporter] = None,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param metrics: The metrics of the conversion.
+        :param exporter: The exporter of the pipeline, whose lexemes ID map size is kept in the
+            metrics, or None to leave it out.
+        '''
+        super().__init__()
+        self.metrics: ConversionMetrics = metrics
+        self.exporter: Optional[LexemeExporter] = exporter
+        self.collection_metrics: CollectionMetrics = metrics.collections['lexemes']
+        self.__previous_time: Optional[float] = None
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create any files that the listener writes to.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        self.collection_metrics.num_exported = 0
+        self.collection_metrics.num_invalid_json = 0
+        self.collection_metrics.num_schema_mismatch = 0
+        self.collection_metrics.num_skipped_by_cleaner = {}
+        self.__previous_time = None
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+            Only the counts are kept, not the latencies.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {
+            'num_exported': self.collection_metrics.num_exported,
+            'num_invalid_json': self.collection_metrics.num_invalid_json,
+            'num_schema_mismatch': self.collection_metrics.num_schema_mismatch,
+            'num_skipped_by_cleaner': dict(self.collection_metrics.num_skipped_by_cleaner),
+        }
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.collection_metrics.num_exported = checkpoint['num_exported']
+        self.collection_metrics.num_invalid_json = checkpoint['num_invalid_json']
+        self.collection_metrics.num_schema_mismatch = checkpoint['num_schema_mismatch']
+        self.collection_metrics.num_skipped_by_cleaner = dict(
+            checkpoint['num_skipped_by_cleaner']
+        )
+        self.__previous_time = None
+
+    #########################################
+    def __write(
+        self,
+    ) -> None:
+        '''
+        Write the metrics with the current size of the lexemes ID map.
+        '''
+        if self.exporter is not None:
+            self.metrics.id_map_size = len(self.exporter.get_id_map())
+        self.metrics.write()
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+        '''
+        self.__previous_time = None
+        self.__write()
+
+    #########################################
+    def __row_processed(
+        self,
+    ) -> None:
+        '''
+        Time a processed row from when the previous one was processed and write the metrics if
+        the interval has passed.
+        '''
+        now = time.perf_counter()
+        if self.__previous_time is not None:
+            self.collection_metrics.latency.observe(now - self.__previous_time)
+        self.__previous_time = now
+        if now >= self.metrics.next_write_time:
+            self.__write()
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Listen for when a row is successfully exported.
+
+        :param json_line: The raw UTF-8 encoded JSON line that was processed.
+        :param row: The processed row that was exported.
+        '''
+        self.collection_metrics.num_exported += 1
+        self.__row_processed()
+
+    #########################################
+    def row_skipped(
+        self,
+        json_line: bytes,
+        invalid_json: bool,
+        schema_mismatch: bool,
+        cleaner: Optional[LexemeCleaner],
+    ) -> None:
+        '''
+        Listen for when a row was skipped.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was skipped.
+        :param invalid_json: Whether the JSON row was not in valid JSON format.
+        :param schema_mismatch: Whether the JSON row did not conform to the Ġabra schema.
+        :param cleaner: The cleaner that determined that the row should be skipped.
+            If None, then the reason is that it was either not valid JSON or did not conform
+            to the Ġabra schema.
+        '''
+        if cleaner is not None:
+            self.collection_metrics.num_skipped_by_cleaner[cleaner.id_] = (
+                self.collection_metrics.num_skipped_by_cleaner.get(cleaner.id_, 0) + 1
+            )
+        elif invalid_json:
+            self.collection_metrics.num_invalid_json += 1
+        elif schema_mismatch:
+            self.collection_metrics.num_schema_mismatch += 1
+        self.__row_processed()
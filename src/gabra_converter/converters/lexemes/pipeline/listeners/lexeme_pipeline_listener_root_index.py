@@ -0,0 +1,182 @@
+'''
+Build a root index from the lexemes that were exported.
+'''
+
+import os
+import struct
+from typing import Any, BinaryIO, Optional
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
+from gabra_converter.converters.root_index import build_root_index
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener import (
+    LexemePipelineListener
+)
+
+__all__ = [
+    'AddingRootBeforeFileCreationException',
+    'LexemePipelineListenerRootIndex',
+]
+
+
+_ROOTS_FNAME = 'lexemes_roots.tmp'
+_INDEX_FNAME = 'lexemes_roots.idx'
+_RECORD_HEADER = struct.Struct('<III')
+
+
+#########################################
+class AddingRootBeforeFileCreationException(Exception):
+    '''
+    A LexemePipelineListenerRootIndex object was used to add an exported row before creating its
+    files.
+    '''
+
+
+#########################################
+class LexemePipelineListenerRootIndex(LexemePipelineListener):
+    '''
+    Build an index mapping roots (radicals and variant) to the lexeme IDs having them.
+        Lexeme IDs are the consecutive integers starting from 1 that are given to the lexemes in
+        the order they are exported, which is how the CSV exporter numbers them.
+        Lexemes without a root are not included in the index.
+        The roots are collected in a temporary file whilst converting and the index is built
+        from it at the end of the conversion.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.out_dir_path: str = ''
+        self.__roots_f: Optional[BinaryIO] = None
+        self.__num_exported: int = 0
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        if self.__roots_f is not None:
+            self.__roots_f.close()
+        self.__roots_f = open(  # pylint: disable=consider-using-with
+            os.path.join(out_dir_path, _ROOTS_FNAME), 'wb'
+        )
+        self.out_dir_path = out_dir_path
+        self.__num_exported = 0
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__roots_f is not None:
+            self.__roots_f.flush()
+        return {
+            'num_exported': self.__num_exported,
+            'file_sizes': get_file_sizes(self.out_dir_path, [_ROOTS_FNAME]),
+        }
+
+    #########################################
+    def get_tmp_fnames(
+        self,
+    ) -> list[str]:
+        '''
+        Get the names of the temporary files that the listener keeps in the output folder whilst
+        converting.
+
+        :return: The file names.
+        '''
+        return [_ROOTS_FNAME]
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        if self.__roots_f is not None:
+            self.__roots_f.close()
+        self.__roots_f = open(  # pylint: disable=consider-using-with
+            os.path.join(out_dir_path, _ROOTS_FNAME), 'ab'
+        )
+        self.out_dir_path = out_dir_path
+        self.__num_exported = checkpoint['num_exported']
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: LexemeRow,
+    ) -> None:
+        '''
+        Listen for when a row was exported.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was exported.
+        :param row: The parsed row object that was exported.
+        '''
+        super().row_exported(json_line, row)
+
+        if self.__roots_f is None:
+            raise AddingRootBeforeFileCreationException()
+
+        self.__num_exported += 1
+        if row.root is None:
+            return
+        radicals = row.root.radicals.encode('utf-8')
+        # Variants are stored shifted by one so that zero can mean that there is no variant.
+        variant = row.root.variant.numberInt + 1 if row.root.variant is not None else 0
+        self.__roots_f.write(
+            _RECORD_HEADER.pack(self.__num_exported, variant, len(radicals)) + radicals
+        )
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+            This is called by the pipeline at the end of ``convert_file``.
+        '''
+        super().conversion_ended()
+
+        if self.__roots_f is None:
+            raise AddingRootBeforeFileCreationException()
+        self.__roots_f.close()
+        self.__roots_f = None
+
+        roots_path = os.path.join(self.out_dir_path, _ROOTS_FNAME)
+        postings: dict[tuple[str, Optional[int]], list[int]] = {}
+        with open(roots_path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset < len(data):
+            (lexeme_id, variant, length) = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size
+            radicals = data[offset:offset + length].decode('utf-8')
+            offset += length
+            postings.setdefault(
+                (radicals, variant - 1 if variant > 0 else None), []
+            ).append(lexeme_id)
+        del data
+
+        build_root_index(os.path.join(self.out_dir_path, _INDEX_FNAME), postings)
@@ -0,0 +1,80 @@
+'''
+Sort keys for ordering the lexemes collection before it is exported.
+
+Keys are taken from the raw JSON documents, which the row fixers do not change for these fields,
+so that a line only needs to be decoded to get its key.
+Lines without a valid value for the field are placed after all the others.
+Strings are ordered by Unicode code point, which is the same as the order of their UTF-8 bytes.
+'''
+
+import json
+from typing import Any, Callable
+from gabra_converter.converters.external_sort import UnknownOrderException
+
+
+__all__ = [
+    'LEXEME_ORDERS',
+    'get_lexeme_order_key',
+]
+
+
+LEXEME_ORDERS = ['lemma', '_id']
+
+_MISSING_KEY = (1,)
+
+
+#########################################
+def _get_lemma_key(
+    json_line: bytes,
+) -> tuple[Any, ...]:
+    '''
+    Get the key of a line for ordering by lemma.
+
+    :param json_line: A UTF-8 encoded line from the extracted lexemes collection.
+    :return: The sort key.
+    '''
+    try:
+        lemma = json.loads(json_line.decode('utf-8')).get('lemma')
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError, AttributeError):
+        return _MISSING_KEY
+    if not isinstance(lemma, str):
+        return _MISSING_KEY
+    return (0, lemma)
+
+
+#########################################
+def _get_id_key(
+    json_line: bytes,
+) -> tuple[Any, ...]:
+    '''
+    Get the key of a line for ordering by Ġabra ID.
+
+    :param json_line: A UTF-8 encoded line from the extracted lexemes collection.
+    :return: The sort key.
+    '''
+    try:
+        oid = json.loads(json_line.decode('utf-8'))['_id']['$oid']
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+        return _MISSING_KEY
+    if not isinstance(oid, str):
+        return _MISSING_KEY
+    return (0, oid)
+
+
+#########################################
+def get_lexeme_order_key(
+    order_by: str,
+) -> Callable[[bytes], tuple[Any, ...]]:
+    '''
+    Get the function that gives the sort key of a lexeme line for a given order.
+
+    :param order_by: The order, one of ``LEXEME_ORDERS``.
+        'lemma' orders the lexemes by their lemma and '_id' orders them by their Ġabra ID, which
+        is roughly the order in which they were added to Ġabra.
+    :return: The key function, to be used with ``sort_jsonl_file``.
+    '''
+    if order_by == 'lemma':
+        return _get_lemma_key
+    if order_by == '_id':
+        return _get_id_key
+    raise UnknownOrderException(f'Lexemes cannot be ordered by {order_by}.')
@@ -0,0 +1,196 @@
+'''
+Attribute the memory used by a conversion to the places in the code that allocated it.
+
+A ``MemoryProfiler`` traces the Python memory allocations with ``tracemalloc`` and takes labelled
+snapshots of them, such as at the start and end of every pipeline stage and every number of
+rows (see ``PipelineListenerMemoryProfile``, ``LexemePipelineListenerMemoryProfile``, and
+``WordformPipelineListenerMemoryProfile``).
+Every snapshot is written to a text report as soon as it is taken, with the allocation sites
+holding the most memory and those that grew the most since the previous snapshot, followed by a
+summary of all the snapshots when profiling stops.
+Only the previous snapshot is kept in memory.
+
+Tracing memory allocations makes the conversion several times slower and is only meant for
+investigating memory usage.
+'''
+
+import tracemalloc
+from typing import Optional, TextIO
+
+
+__all__ = [
+    'MemoryProfilerNotStartedException',
+    'MemoryProfiler',
+]
+
+
+#########################################
+class MemoryProfilerNotStartedException(Exception):
+    '''
+    A snapshot was taken before the memory profiler was started.
+    '''
+
+
+#########################################
+def _format_size(
+    num_bytes: int,
+) -> str:
+    '''
+    Format a number of bytes in readable units.
+
+    :param num_bytes: The number of bytes, which can be negative.
+    :return: The formatted size, such as '1.5 MiB'.
+    '''
+    size = float(num_bytes)
+    for unit in ['B', 'KiB', 'MiB']:
+        if abs(size) < 1024:
+            return f'{size:.1f} {unit}' if unit != 'B' else f'{num_bytes} B'
+        size /= 1024
+    return f'{size:.1f} GiB'
+
+
+#########################################
+class MemoryProfiler:
+    '''
+    Take labelled snapshots of the Python memory allocations and report them.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        report_path: str,
+        num_top: int = 10,
+        num_frames: int = 1,
+        key_type: str = 'lineno',
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param report_path: The path to the text file to write the report to.
+        :param num_top: The number of allocation sites to report per snapshot.
+        :param num_frames: The number of stack frames to keep for each allocation, which makes
+            tracing slower but shows the callers of the allocation sites.
+        :param key_type: How to group allocations into sites, which is 'lineno' for lines of
+            code, 'filename' for modules, or 'traceback' for the whole kept stack.
+        '''
+        self.report_path: str = report_path
+        self.num_top: int = num_top
+        self.num_frames: int = num_frames
+        self.key_type: str = key_type
+        self.summary: list[tuple[str, int, int]] = []
+        self.__f: Optional[TextIO] = None
+        self.__started_tracing: bool = False
+        self.__previous_label: str = ''
+        self.__previous_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    #########################################
+    def start(
+        self,
+    ) -> None:
+        '''
+        Start tracing memory allocations, unless they are already being traced, and start a new
+        report.
+        '''
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.num_frames)
+            self.__started_tracing = True
+        self.summary = []
+        self.__previous_label = ''
+        self.__previous_snapshot = None
+        self.__f = open(  # pylint: disable=consider-using-with
+            self.report_path, 'w', encoding='utf-8'
+        )
+        self.__f.write('Memory profile\n')
+        self.__f.write(f'Allocation sites are grouped by {self.key_type}.\n')
+
+    #########################################
+    def take_snapshot(
+        self,
+        label: str,
+    ) -> None:
+        '''
+        Take a snapshot of the memory allocations and write it to the report.
+
+        :param label: A description of the point at which the snapshot is taken, such as the
+            name of the pipeline stage.
+        '''
+        if self.__f is None:
+            raise MemoryProfilerNotStartedException(
+                f'Cannot take snapshot {label} before starting the memory profiler.'
+            )
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ])
+        (current, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self.summary.append((label, current, peak))
+
+        f = self.__f
+        f.write('\n')
+        f.write(f'=== {label} ===\n')
+        f.write(
+            f'Traced memory: {_format_size(current)}'
+            f' (peak since the previous snapshot: {_format_size(peak)})\n'
+        )
+        f.write('Largest allocation sites:\n')
+        for stat in snapshot.statistics(self.key_type)[:self.num_top]:
+            f.write(
+                f'  {_format_size(stat.size):>12} in {stat.count:>9} blocks:'
+                f' {self.__format_traceback(stat.traceback)}\n'
+            )
+        if self.__previous_snapshot is not None:
+            f.write(f'Largest growth since {self.__previous_label}:\n')
+            diffs = [
+                diff
+                for diff in snapshot.compare_to(self.__previous_snapshot, self.key_type)
+                if diff.size_diff > 0
+            ]
+            for diff in diffs[:self.num_top]:
+                f.write(
+                    f'  {"+" + _format_size(diff.size_diff):>12}'
+                    f' in {diff.count_diff:>+9} blocks:'
+                    f' {self.__format_traceback(diff.traceback)}\n'
+                )
+        f.flush()
+
+        self.__previous_label = label
+        self.__previous_snapshot = snapshot
+
+    #########################################
+    def __format_traceback(
+        self,
+        traceback: tracemalloc.Traceback,
+    ) -> str:
+        '''
+        Format the traceback of an allocation site on a single line.
+
+        :param traceback: The traceback, with the most recent frame first.
+        :return: The frames, each as 'file:line', from the most recent to the oldest.
+        '''
+        if self.key_type == 'filename':
+            return traceback[0].filename
+        return ' <- '.join(f'{frame.filename}:{frame.lineno}' for frame in traceback)
+
+    #########################################
+    def stop(
+        self,
+    ) -> None:
+        '''
+        Write the summary of all the snapshots to the report, close it, and stop tracing
+        memory allocations if they were started by this profiler.
+        '''
+        if self.__f is not None:
+            f = self.__f
+            f.write('\n')
+            f.write('=== Summary ===\n')
+            f.write(f'{"traced":>12} {"peak before":>12}  snapshot\n')
+            for (label, current, peak) in self.summary:
+                f.write(f'{_format_size(current):>12} {_format_size(peak):>12}  {label}\n')
+            f.close()
+            self.__f = None
+        self.__previous_snapshot = None
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
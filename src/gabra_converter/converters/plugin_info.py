@@ -0,0 +1,115 @@
+'''
+Lightweight descriptions of the available cleaners and exporters (plugins) that are used to list
+them without importing their implementation, which is only imported when they are used.
+
+Besides the plugins that come with the program, other packages can provide their own by
+declaring entry points in one of the ``*_ENTRY_POINT_GROUP`` groups of the plugin lists (such as
+``gabra_converter.lexeme_cleaners``), each referring to a ``PluginInfo`` object.
+The module with the ``PluginInfo`` object should be kept light as it is imported whenever the
+plugins are listed.
+'''
+
+import sys
+import importlib
+import importlib.metadata
+from typing import Any, Optional
+
+
+__all__ = [
+    'InvalidPluginException',
+    'PluginInfo',
+    'get_entry_point_plugin_infos',
+]
+
+
+#########################################
+class InvalidPluginException(Exception):
+    '''
+    A plugin does not match its description or an entry point does not refer to a PluginInfo
+    object.
+    '''
+
+
+#########################################
+class PluginInfo:
+    '''
+    The description of a cleaner or exporter together with where to find its implementation.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        id_: str,
+        description: str,
+        module_name: str,
+        class_name: str,
+        required_cleaners: Optional[set[str]] = None,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param id_: The short unique identifier of the plugin, which must be the same as that of
+            the plugin object.
+        :param description: A short description of what the plugin does.
+        :param module_name: The full name of the module with the plugin's class.
+        :param class_name: The name of the plugin's class, which must be constructible without
+            arguments.
+        :param required_cleaners: The set of cleaner IDs that the plugin requires in order to
+            work, for exporters, or None if not applicable.
+        '''
+        self.id_: str = id_
+        self.description: str = description
+        self.module_name: str = module_name
+        self.class_name: str = class_name
+        self.required_cleaners: set[str] = (
+            required_cleaners if required_cleaners is not None else set()
+        )
+        self.__plugin: Optional[Any] = None
+
+    #########################################
+    def load(
+        self,
+    ) -> Any:
+        '''
+        Import the plugin's module and get the plugin object.
+            The same object is returned every time.
+
+        :return: The plugin object.
+        '''
+        if self.__plugin is None:
+            module = importlib.import_module(self.module_name)
+            plugin = getattr(module, self.class_name)()
+            if plugin.id_ != self.id_:
+                raise InvalidPluginException(
+                    f'Plugin {self.module_name}.{self.class_name} has ID {plugin.id_} but is'
+                    f' described as {self.id_}.'
+                )
+            self.__plugin = plugin
+        return self.__plugin
+
+
+#########################################
+def get_entry_point_plugin_infos(
+    group: str,
+) -> list[PluginInfo]:
+    '''
+    Get the descriptions of the plugins provided by installed packages through entry points.
+
+    :param group: The name of the entry point group.
+    :return: The list of plugin descriptions, in the order of the entry point names.
+    '''
+    if sys.version_info >= (3, 10):
+        entry_points = list(importlib.metadata.entry_points(group=group))
+    else:
+        entry_points = list(importlib.metadata.entry_points().get(group, []))
+
+    infos: list[PluginInfo] = []
+    for entry_point in sorted(entry_points, key=lambda entry_point: entry_point.name):
+        info = entry_point.load()
+        if not isinstance(info, PluginInfo):
+            raise InvalidPluginException(
+                f'Entry point {entry_point.name} in group {group} does not refer to a PluginInfo'
+                ' object.'
+            )
+        infos.append(info)
+    return infos
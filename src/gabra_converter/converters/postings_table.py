@@ -0,0 +1,203 @@
+'''
+A table mapping UTF-8 encoded keys, stored in a chosen order, to sorted lists of unsigned 32-bit
+integer postings, which is embedded in index files that are memory mapped.
+
+A table consists of:
+
+- A header with the number of keys, the number of postings, and the size of the keys area.
+- The start offset of every key in the keys area as a little endian unsigned 64-bit integer,
+  followed by the size of the keys area.
+- The start index of the postings of every key in the postings area as a little endian
+  unsigned 64-bit integer, followed by the number of postings.
+- The postings area, with every posting being a little endian unsigned 32-bit integer.
+- The keys area.
+'''
+
+import sys
+import mmap
+import struct
+from array import array
+from typing import BinaryIO, Optional, Union
+
+
+__all__ = [
+    'TruncatedPostingsTableException',
+    'write_postings_table',
+    'PostingsTableReader',
+]
+
+
+_TABLE_HEADER = struct.Struct('<QQQ')
+_OFFSET = struct.Struct('<Q')
+_OFFSET_RANGE = struct.Struct('<QQ')
+_POSTING = struct.Struct('<I')
+
+
+#########################################
+class TruncatedPostingsTableException(Exception):
+    '''
+    A postings table extends beyond the end of the file containing it.
+    '''
+
+
+#########################################
+def write_postings_table(
+    f: BinaryIO,
+    postings: list[tuple[bytes, array]],
+) -> None:
+    '''
+    Write a table of keys and their postings to an index file.
+
+    :param f: The index file.
+    :param postings: A list of pairs consisting of a UTF-8 encoded key and its sorted postings,
+        in the order that the keys are to be stored.
+    '''
+    key_offsets = array('Q', [0])
+    posting_offsets = array('Q', [0])
+    for (key, key_postings) in postings:
+        key_offsets.append(key_offsets[-1] + len(key))
+        posting_offsets.append(posting_offsets[-1] + len(key_postings))
+    if sys.byteorder != 'little':
+        key_offsets.byteswap()
+        posting_offsets.byteswap()
+
+    f.write(_TABLE_HEADER.pack(len(postings), posting_offsets[-1], key_offsets[-1]))
+    key_offsets.tofile(f)
+    posting_offsets.tofile(f)
+    for (_, key_postings) in postings:
+        if sys.byteorder != 'little':
+            key_postings = array('I', key_postings)
+            key_postings.byteswap()
+        key_postings.tofile(f)
+    for (key, _) in postings:
+        f.write(key)
+
+
+#########################################
+class PostingsTableReader:
+    '''
+    Read a table of keys and their postings from a memory mapped index file.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        data: Union[mmap.mmap, bytes],
+        start: int,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param data: The memory mapped index file.
+        :param start: The offset of the table in the index file.
+        '''
+        if len(data) < start + _TABLE_HEADER.size:
+            raise TruncatedPostingsTableException()
+        (num_keys, num_postings, keys_size) = _TABLE_HEADER.unpack_from(data, start)
+        self.data: Union[mmap.mmap, bytes] = data
+        self.num_keys: int = num_keys
+        self.key_offsets_start: int = start + _TABLE_HEADER.size
+        self.posting_offsets_start: int = self.key_offsets_start + (num_keys + 1)*_OFFSET.size
+        self.postings_start: int = self.posting_offsets_start + (num_keys + 1)*_OFFSET.size
+        self.keys_start: int = self.postings_start + num_postings*_POSTING.size
+        self.end: int = self.keys_start + keys_size
+        if len(data) < self.end:
+            raise TruncatedPostingsTableException()
+
+    #########################################
+    def get_key(
+        self,
+        i: int,
+    ) -> bytes:
+        '''
+        Get a key.
+
+        :param i: The index of the key in the table.
+        :return: The UTF-8 encoded key.
+        '''
+        (start, end) = _OFFSET_RANGE.unpack_from(
+            self.data, self.key_offsets_start + i*_OFFSET.size
+        )
+        return self.data[self.keys_start + start:self.keys_start + end]
+
+    #########################################
+    def get_postings(
+        self,
+        i: int,
+    ) -> array:
+        '''
+        Get the postings of a key.
+
+        :param i: The index of the key in the table.
+        :return: The postings.
+        '''
+        (start, end) = _OFFSET_RANGE.unpack_from(
+            self.data, self.posting_offsets_start + i*_OFFSET.size
+        )
+        postings = array('I')
+        postings.frombytes(self.data[
+            self.postings_start + start*_POSTING.size:self.postings_start + end*_POSTING.size
+        ])
+        if sys.byteorder != 'little':
+            postings.byteswap()
+        return postings
+
+    #########################################
+    def find(
+        self,
+        key: bytes,
+        low: int,
+        high: int,
+    ) -> Optional[int]:
+        '''
+        Find a key using binary search within a range of keys that are sorted by their bytes.
+
+        :param key: The UTF-8 encoded key.
+        :param low: The index of the first key in the range.
+        :param high: The index after the last key in the range.
+        :return: The index of the key in the table or None if it is not in the range.
+        '''
+        end = high
+        while low < high:
+            mid = (low + high)//2
+            if self.get_key(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low == end or self.get_key(low) != key:
+            return None
+        return low
+
+    #########################################
+    def find_prefix(
+        self,
+        prefix: bytes,
+        low: int,
+        high: int,
+    ) -> tuple[int, int]:
+        '''
+        Find the keys that start with a prefix using binary search within a range of keys that
+        are sorted by their bytes.
+
+        :param prefix: The UTF-8 encoded prefix.
+        :param low: The index of the first key in the range.
+        :param high: The index after the last key in the range.
+        :return: A pair consisting of the index of the first key with the prefix and the index
+            after the last one (both equal if there are none).
+        '''
+        end = high
+        while low < high:
+            mid = (low + high)//2
+            if self.get_key(mid) < prefix:
+                low = mid + 1
+            else:
+                high = mid
+        first = low
+        high = end
+        while low < high:
+            mid = (low + high)//2
+            if self.get_key(mid).startswith(prefix):
+                low = mid + 1
+            else:
+                high = mid
+        return (first, low)
@@ -0,0 +1,293 @@
+'''
+A compact index mapping the roots of the exported lexemes (their radicals together with their
+variant, if any) to the integer IDs of the lexemes having them, meant to be memory mapped by
+root browsing applications rather than loaded.
+
+Every root is stored as a key consisting of its UTF-8 encoded radicals, a null byte, and then its
+variant as a big endian unsigned 32-bit integer (nothing if it has no variant).
+Sorting the keys by their bytes therefore keeps the roots sorted by their radicals, with all the
+variants of the same radicals being next to each other, the root without a variant first, and
+the rest ordered by variant.
+
+The index file consists of:
+
+- A header with a magic string and a format version.
+- The roots table, mapping every root key to the sorted lexeme IDs having it, in the format of
+  ``postings_table``.
+'''
+
+import mmap
+import heapq
+import struct
+from types import TracebackType
+from typing import Iterator, Optional
+from array import array
+from gabra_converter.converters.postings_table import (
+    TruncatedPostingsTableException,
+    write_postings_table,
+    PostingsTableReader,
+)
+
+
+__all__ = [
+    'InvalidRootIndexException',
+    'build_root_index',
+    'RootIndexReader',
+]
+
+
+_MAGIC = b'GRTX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sI')
+_VARIANT = struct.Struct('>I')
+_SEPARATOR = b'\0'
+
+
+#########################################
+def _encode_root(
+    radicals: str,
+    variant: Optional[int],
+) -> bytes:
+    '''
+    Encode a root into a key.
+
+    :param radicals: The radicals of the root.
+    :param variant: The variant of the root or None if it has no variant.
+    :return: The key.
+    '''
+    key = radicals.encode('utf-8') + _SEPARATOR
+    if variant is not None:
+        key += _VARIANT.pack(variant)
+    return key
+
+
+#########################################
+def _decode_root(
+    key: bytes,
+) -> tuple[str, Optional[int]]:
+    '''
+    Decode a key into a root.
+
+    :param key: The key.
+    :return: A pair consisting of the radicals and the variant of the root (None if it has no
+        variant).
+    '''
+    separator_index = key.index(_SEPARATOR)
+    radicals = key[:separator_index].decode('utf-8')
+    if separator_index + 1 == len(key):
+        return (radicals, None)
+    return (radicals, _VARIANT.unpack_from(key, separator_index + 1)[0])
+
+
+#########################################
+class InvalidRootIndexException(Exception):
+    '''
+    A file that was loaded as a root index is not valid.
+    '''
+
+
+#########################################
+def build_root_index(
+    index_path: str,
+    postings: dict[tuple[str, Optional[int]], list[int]],
+) -> None:
+    '''
+    Build a root index file.
+
+    :param index_path: The path to the index file to create.
+    :param postings: A dictionary mapping every distinct root, as a pair consisting of its
+        radicals and its variant (None if it has no variant), to the lexeme IDs having it.
+    '''
+    with open(index_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION))
+        write_postings_table(f, sorted(
+            (_encode_root(radicals, variant), array('I', sorted(ids)))
+            for ((radicals, variant), ids) in postings.items()
+        ))
+
+
+#########################################
+class RootIndexReader:
+    '''
+    Look up the lexeme IDs of roots in a memory mapped root index and enumerate its roots.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        index_path: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param index_path: The path to the index file.
+        '''
+        with open(index_path, 'rb') as f:
+            self.__data: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self.__data) < _HEADER.size:
+                raise InvalidRootIndexException('File is too short to be an index.')
+            (magic, version) = _HEADER.unpack_from(self.__data, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise InvalidRootIndexException(
+                    'File is not a root index or is of a different version.'
+                )
+            try:
+                self.__roots: PostingsTableReader = PostingsTableReader(self.__data, _HEADER.size)
+            except TruncatedPostingsTableException as ex:
+                raise InvalidRootIndexException('Index file is truncated.') from ex
+            if len(self.__data) != self.__roots.end:
+                raise InvalidRootIndexException('Index file has trailing data.')
+        except InvalidRootIndexException:
+            self.close()
+            raise
+
+    #########################################
+    def __enter__(
+        self,
+    ) -> 'RootIndexReader':
+        '''
+        Use the reader in a with statement.
+
+        :return: The reader.
+        '''
+        return self
+
+    #########################################
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        '''
+        Close the reader at the end of a with statement.
+
+        :param exc_type: The type of exception raised in the with statement, if any.
+        :param exc_value: The exception raised in the with statement, if any.
+        :param traceback: The traceback of the exception raised in the with statement, if any.
+        '''
+        self.close()
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of distinct roots (counting variants separately) in the index.
+
+        :return: The number of roots.
+        '''
+        return self.__roots.num_keys
+
+    #########################################
+    def __contains__(
+        self,
+        root: object,
+    ) -> bool:
+        '''
+        Check if a root is in the index.
+
+        :param root: A pair consisting of the radicals and the variant of the root (None if it
+            has no variant).
+        :return: Whether the root is in the index.
+        '''
+        if not isinstance(root, tuple) or len(root) != 2:
+            return False
+        (radicals, variant) = root
+        if not isinstance(radicals, str) or not (variant is None or isinstance(variant, int)):
+            return False
+        return self.__roots.find(
+            _encode_root(radicals, variant), 0, self.__roots.num_keys
+        ) is not None
+
+    #########################################
+    def __iter__(
+        self,
+    ) -> Iterator[tuple[str, Optional[int]]]:
+        '''
+        Iterate over all the roots in the index in sorted order.
+
+        :return: An iterator of pairs consisting of the radicals and the variant of every root
+            (None if it has no variant).
+        '''
+        return self.iter_roots()
+
+    #########################################
+    def get(
+        self,
+        radicals: str,
+        variant: Optional[int] = None,
+    ) -> list[int]:
+        '''
+        Get the IDs of the lexemes having a given root.
+
+        :param radicals: The radicals of the root.
+        :param variant: The variant of the root or None for the root without a variant.
+        :return: The sorted lexeme IDs, which is empty if the root is not in the index.
+        '''
+        i = self.__roots.find(_encode_root(radicals, variant), 0, self.__roots.num_keys)
+        if i is None:
+            return []
+        return self.__roots.get_postings(i).tolist()
+
+    #########################################
+    def get_variants(
+        self,
+        radicals: str,
+    ) -> list[Optional[int]]:
+        '''
+        Get the variants of the roots having given radicals.
+
+        :param radicals: The radicals.
+        :return: The sorted variants, with None first for the root without a variant, which is
+            empty if no root has the radicals.
+        '''
+        (low, high) = self.__roots.find_prefix(
+            radicals.encode('utf-8') + _SEPARATOR, 0, self.__roots.num_keys
+        )
+        return [_decode_root(self.__roots.get_key(i))[1] for i in range(low, high)]
+
+    #########################################
+    def get_all_variants(
+        self,
+        radicals: str,
+    ) -> list[int]:
+        '''
+        Get the IDs of the lexemes having a root with given radicals, regardless of its variant.
+
+        :param radicals: The radicals.
+        :return: The sorted lexeme IDs, which is empty if no root has the radicals.
+        '''
+        (low, high) = self.__roots.find_prefix(
+            radicals.encode('utf-8') + _SEPARATOR, 0, self.__roots.num_keys
+        )
+        return list(heapq.merge(*(self.__roots.get_postings(i) for i in range(low, high))))
+
+    #########################################
+    def iter_roots(
+        self,
+        prefix: str = '',
+    ) -> Iterator[tuple[str, Optional[int]]]:
+        '''
+        Iterate over the roots in the index whose radicals start with a prefix in sorted order.
+
+        :param prefix: The prefix, which includes all roots if empty.
+        :return: An iterator of pairs consisting of the radicals and the variant of every root
+            (None if it has no variant).
+        '''
+        (low, high) = self.__roots.find_prefix(
+            prefix.encode('utf-8'), 0, self.__roots.num_keys
+        )
+        for i in range(low, high):
+            yield _decode_root(self.__roots.get_key(i))
+
+    #########################################
+    def close(
+        self,
+    ) -> None:
+        '''
+        Close the memory mapped file.
+        '''
+        self.__data.close()
@@ -0,0 +1,183 @@
+'''
+Take a deterministic sample of the extracted collections for quick preview conversions.
+
+Whether a row is sampled depends only on a hash of its lexeme's Ġabra ID (the '_id' of a lexeme
+and the 'lexeme_id' of a wordform) together with a seed, so:
+
+- the same fraction and seed always give the same sample, regardless of the order of the rows,
+- every sampled wordform whose lexeme exists has its lexeme sampled too, and every wordform of a
+  sampled lexeme is sampled, so the sample stays referentially intact, and
+- wordforms whose lexeme is missing from the dump are still sampled at the same fraction, so
+  cleaners such as missing_lexeme skip a representative number of them.
+
+Rows without a readable ID, such as rows that are not valid JSON, are sampled by a hash of the
+whole line instead so that they are also represented.
+'''
+
+import os
+import json
+import hashlib
+from typing import Optional
+from gabra_converter.converters.jsonl_reader import READ_BUFFER_SIZE, read_jsonl_lines
+
+
+__all__ = [
+    'RowSampler',
+    'sample_lexemes_file',
+    'sample_wordforms_file',
+]
+
+
+_HASH_BITS = 64
+
+
+#########################################
+def _get_oid(
+    json_line: bytes,
+    field: str,
+) -> Optional[str]:
+    '''
+    Get a Ġabra ID field from a raw JSON line.
+
+    :param json_line: A UTF-8 encoded line from an extracted collection.
+    :param field: The name of the ID field, such as '_id'.
+    :return: The ID or None if the line does not have a readable ID in the field.
+    '''
+    try:
+        oid = json.loads(json_line.decode('utf-8'))[field]['$oid']
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+        return None
+    if not isinstance(oid, str):
+        return None
+    return oid
+
+
+#########################################
+class RowSampler:
+    '''
+    Decide which rows are in a deterministic sample of a given fraction.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        fraction: float,
+        seed: str = '',
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param fraction: The fraction of lexemes to sample, more than 0 and at most 1.
+        :param seed: A string that selects a different sample of the same fraction.
+        '''
+        if not 0.0 < fraction <= 1.0:
+            raise ValueError(
+                f'The sample fraction must be more than 0 and at most 1, not {fraction}.'
+            )
+        self.fraction: float = fraction
+        self.seed: str = seed
+        self.__threshold: int = int(fraction*(1 << _HASH_BITS))
+        self.__salt: bytes = hashlib.blake2b(seed.encode('utf-8'), digest_size=16).digest()
+
+    #########################################
+    def is_sampled(
+        self,
+        key: bytes,
+    ) -> bool:
+        '''
+        Check if a key is in the sample.
+
+        :param key: The key, such as a UTF-8 encoded Ġabra ID.
+        :return: Whether the key is sampled.
+        '''
+        hash_ = int.from_bytes(
+            hashlib.blake2b(key, digest_size=_HASH_BITS//8, salt=self.__salt).digest(), 'big'
+        )
+        return hash_ < self.__threshold
+
+    #########################################
+    def is_line_sampled(
+        self,
+        json_line: bytes,
+        field: str,
+    ) -> bool:
+        '''
+        Check if a raw JSON line is in the sample.
+
+        :param json_line: A UTF-8 encoded line from an extracted collection.
+        :param field: The name of the field with the Ġabra ID of the lexeme, which is '_id' for
+            lexemes and 'lexeme_id' for wordforms.
+        :return: Whether the line is sampled.
+        '''
+        oid = _get_oid(json_line, field)
+        if oid is None:
+            return self.is_sampled(json_line.rstrip(b'\r\n'))
+        return self.is_sampled(oid.encode('utf-8'))
+
+
+#########################################
+def _sample_file(
+    in_file_path: str,
+    out_file_path: str,
+    sampler: RowSampler,
+    field: str,
+) -> int:
+    '''
+    Write the sampled lines of a JSON lines file.
+
+    :param in_file_path: The path to the JSON lines file to sample.
+    :param out_file_path: The path to the sampled file to write, which can be the same as
+        ``in_file_path`` to sample the file in place.
+        The sampled file is first written next to it and then moved into place.
+    :param sampler: The sampler.
+    :param field: The name of the field with the Ġabra ID of the lexeme.
+    :return: The number of sampled lines.
+    '''
+    num_sampled = 0
+    tmp_out_file_path = out_file_path + '.sampling'
+    with open(tmp_out_file_path, 'wb', buffering=READ_BUFFER_SIZE) as f:
+        for line in read_jsonl_lines(in_file_path):
+            if sampler.is_line_sampled(line, field):
+                if not line.endswith(b'\n'):
+                    line += b'\n'
+                f.write(line)
+                num_sampled += 1
+    os.replace(tmp_out_file_path, out_file_path)
+    return num_sampled
+
+
+#########################################
+def sample_lexemes_file(
+    in_file_path: str,
+    out_file_path: str,
+    sampler: RowSampler,
+) -> int:
+    '''
+    Write the sampled lines of an extracted lexemes file, in their original order.
+
+    :param in_file_path: The path to the lexemes JSON lines file.
+    :param out_file_path: The path to the sampled file to write, which can be the same as
+        ``in_file_path``.
+    :param sampler: The sampler.
+    :return: The number of sampled lexemes.
+    '''
+    return _sample_file(in_file_path, out_file_path, sampler, '_id')
+
+
+#########################################
+def sample_wordforms_file(
+    in_file_path: str,
+    out_file_path: str,
+    sampler: RowSampler,
+) -> int:
+    '''
+    Write the sampled lines of an extracted wordforms file, in their original order, which are
+    those whose lexeme is sampled by the same sampler in ``sample_lexemes_file``.
+
+    :param in_file_path: The path to the wordforms JSON lines file.
+    :param out_file_path: The path to the sampled file to write, which can be the same as
+        ``in_file_path``.
+    :param sampler: The sampler.
+    :return: The number of sampled wordforms.
+    '''
+    return _sample_file(in_file_path, out_file_path, sampler, 'lexeme_id')
@@ -0,0 +1,258 @@
+'''
+Fixed size summaries (sketches) of streams of values which can be merged with the summaries of
+other streams, such as those of parallel workers, and saved as JSON.
+
+- ``HyperLogLog`` estimates the number of distinct values using one byte per register.
+- ``Log2Histogram`` counts integers in power of two buckets.
+'''
+
+import math
+import base64
+import hashlib
+from typing import Any
+
+
+__all__ = [
+    'IncompatibleSketchesException',
+    'HyperLogLog',
+    'Log2Histogram',
+]
+
+
+_HASH_BITS = 64
+_NUM_LOG2_BUCKETS = 65
+
+
+#########################################
+class IncompatibleSketchesException(Exception):
+    '''
+    Sketches with different parameters were merged.
+    '''
+
+
+#########################################
+class HyperLogLog:
+    '''
+    Estimate the number of distinct strings using a fixed number of registers.
+        The relative standard error of the estimate is about ``1.04/sqrt(2**precision)``, which is
+        under 1% with the default precision of 14 (16KB of registers).
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        precision: int = 14,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param precision: The number of hash bits used to choose a register, from 4 to 16.
+        '''
+        if not 4 <= precision <= 16:
+            raise ValueError(f'The precision must be from 4 to 16, not {precision}.')
+        self.precision: int = precision
+        self.__registers: bytearray = bytearray(1 << precision)
+
+    #########################################
+    def add(
+        self,
+        value: str,
+    ) -> None:
+        '''
+        Add a string.
+
+        :param value: The string.
+        '''
+        hash_ = int.from_bytes(
+            hashlib.blake2b(value.encode('utf-8'), digest_size=_HASH_BITS//8).digest(), 'big'
+        )
+        num_rest_bits = _HASH_BITS - self.precision
+        index = hash_ >> num_rest_bits
+        rank = num_rest_bits - (hash_ & ((1 << num_rest_bits) - 1)).bit_length() + 1
+        if rank > self.__registers[index]:
+            self.__registers[index] = rank
+
+    #########################################
+    def merge(
+        self,
+        other: 'HyperLogLog',
+    ) -> None:
+        '''
+        Add all the strings added to another HyperLogLog of the same precision.
+
+        :param other: The other HyperLogLog.
+        '''
+        if other.precision != self.precision:
+            raise IncompatibleSketchesException(
+                f'Cannot merge a HyperLogLog of precision {other.precision} into one of precision'
+                f' {self.precision}.'
+            )
+        registers = self.__registers
+        for (index, rank) in enumerate(other.__registers):  # pylint: disable=protected-access
+            if rank > registers[index]:
+                registers[index] = rank
+
+    #########################################
+    def estimate(
+        self,
+    ) -> int:
+        '''
+        Estimate the number of distinct strings added.
+
+        :return: The estimate.
+        '''
+        registers = self.__registers
+        num_registers = len(registers)
+        alpha = 0.7213/(1 + 1.079/num_registers)
+        estimate = alpha*num_registers**2/sum(
+            count*2.0**-rank
+            for (rank, count) in enumerate(
+                registers.count(rank) for rank in range(_HASH_BITS + 1)
+            )
+        )
+        num_zeros = registers.count(0)
+        if estimate <= 2.5*num_registers and num_zeros > 0:
+            estimate = num_registers*math.log(num_registers/num_zeros)
+        return round(estimate)
+
+    #########################################
+    def get_state(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the HyperLogLog such that it can be restored with ``load_state``.
+
+        :return: A JSON serialisable state.
+        '''
+        return {
+            'precision': self.precision,
+            'registers': base64.b64encode(self.__registers).decode('ascii'),
+        }
+
+    #########################################
+    def load_state(
+        self,
+        state: dict[str, Any],
+    ) -> None:
+        '''
+        Replace the strings added so far by those of a saved state.
+
+        :param state: A state returned by ``get_state``.
+        '''
+        registers = bytearray(base64.b64decode(state['registers']))
+        if len(registers) != 1 << state['precision']:
+            raise IncompatibleSketchesException(
+                f'A HyperLogLog of precision {state["precision"]} cannot have {len(registers)}'
+                ' registers.'
+            )
+        self.precision = state['precision']
+        self.__registers = registers
+
+
+#########################################
+class Log2Histogram:
+    '''
+    Count non-negative integers in buckets of powers of two, where bucket 0 is for 0 and bucket
+    ``i`` is for the integers from ``2**(i - 1)`` to ``2**i - 1``.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        self.buckets: list[int] = [0]*_NUM_LOG2_BUCKETS
+        self.total: int = 0
+        self.maximum: int = 0
+
+    #########################################
+    def add(
+        self,
+        value: int,
+    ) -> None:
+        '''
+        Add an integer.
+
+        :param value: The integer, which must be less than ``2**64``.
+        '''
+        if value < 0:
+            raise ValueError(f'Cannot add negative value {value}.')
+        self.buckets[value.bit_length()] += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    #########################################
+    def merge(
+        self,
+        other: 'Log2Histogram',
+    ) -> None:
+        '''
+        Add all the integers added to another histogram.
+
+        :param other: The other histogram.
+        '''
+        for (index, count) in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    #########################################
+    def get_summary(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get a readable summary of the histogram with its non-empty buckets.
+
+        :return: A JSON serialisable summary.
+        '''
+        count = sum(self.buckets)
+        return {
+            'count': count,
+            'total': self.total,
+            'mean': self.total/count if count > 0 else None,
+            'max': self.maximum if count > 0 else None,
+            'buckets': [
+                {
+                    'min': 0 if index == 0 else 2**(index - 1),
+                    'max': 0 if index == 0 else 2**index - 1,
+                    'count': bucket_count,
+                }
+                for (index, bucket_count) in enumerate(self.buckets)
+                if bucket_count > 0
+            ],
+        }
+
+    #########################################
+    def get_state(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the histogram such that it can be restored with ``load_state``.
+
+        :return: A JSON serialisable state.
+        '''
+        num_buckets = len(self.buckets)
+        while num_buckets > 0 and self.buckets[num_buckets - 1] == 0:
+            num_buckets -= 1
+        return {
+            'buckets': self.buckets[:num_buckets],
+            'total': self.total,
+            'max': self.maximum,
+        }
+
+    #########################################
+    def load_state(
+        self,
+        state: dict[str, Any],
+    ) -> None:
+        '''
+        Replace the integers added so far by those of a saved state.
+
+        :param state: A state returned by ``get_state``.
+        '''
+        self.buckets = state['buckets'] + [0]*(_NUM_LOG2_BUCKETS - len(state['buckets']))
+        self.total = state['total']
+        self.maximum = state['max']
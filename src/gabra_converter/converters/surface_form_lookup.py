@@ -0,0 +1,383 @@
+'''
+A compact lookup file mapping the distinct surface forms of the exported wordforms to the
+integer IDs of the wordforms having them, meant to be memory mapped by applications rather than
+loaded.
+
+Surface forms are located using a minimal perfect hash function made with the hash and displace
+method: every surface form is hashed into a bucket and each bucket stores a displacement that
+sends its surface forms to distinct slots, with there being exactly as many slots as surface
+forms.
+Each slot stores its surface form (to reject strings that are not in the file) and a range of
+postings, which are the sorted wordform IDs.
+
+The lookup file consists of:
+
+- A header with a magic string, a format version, the hash salt, the number of surface forms,
+  the number of buckets, and the number of postings.
+- The displacement of every bucket as a little endian signed 32-bit integer.
+  Negative displacements directly encode the slot of a bucket with a single surface form.
+- The start offset of the surface form of every slot in the surface forms area, as a little
+  endian unsigned 64-bit integer, followed by the size of the surface forms area.
+- The start index of the postings of every slot in the postings area, as a little endian
+  unsigned 64-bit integer, followed by the number of postings.
+- The postings area, with every wordform ID being a little endian unsigned 32-bit integer.
+- The surface forms area, with every surface form being UTF-8 encoded.
+'''
+
+import sys
+import mmap
+import struct
+import hashlib
+from array import array
+from types import TracebackType
+from typing import Optional
+
+
+__all__ = [
+    'InvalidSurfaceFormLookupException',
+    'build_surface_form_lookup',
+    'SurfaceFormLookupReader',
+]
+
+
+_MAGIC = b'GSFL'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQQQ')
+_DISPLACEMENT = struct.Struct('<i')
+_OFFSET = struct.Struct('<Q')
+_POSTING = struct.Struct('<I')
+_HASHES = struct.Struct('<QQQ')
+
+_KEYS_PER_BUCKET = 2
+_MAX_DISPLACEMENT = 1 << 20
+_MAX_SALT = 16
+
+
+#########################################
+def _hash(
+    key: bytes,
+    salt: int,
+) -> tuple[int, int, int]:
+    '''
+    Hash a surface form into the three hash values used to find its slot.
+
+    :param key: The UTF-8 encoded surface form.
+    :param salt: The salt of the hash function.
+    :return: A triple consisting of the bucket hash, the slot hash, and the displacement
+        multiplier hash.
+    '''
+    (bucket_hash, slot_hash, step_hash) = _HASHES.unpack(
+        hashlib.blake2b(key, digest_size=_HASHES.size, salt=salt.to_bytes(16, 'little')).digest()
+    )
+    return (bucket_hash, slot_hash, step_hash | 1)
+
+
+#########################################
+class InvalidSurfaceFormLookupException(Exception):
+    '''
+    A file that was loaded as a surface form lookup file is not valid.
+    '''
+
+
+#########################################
+class _DisplacementNotFoundException(Exception):
+    '''
+    No displacement could be found for a bucket with the current salt.
+    '''
+
+
+#########################################
+def _find_slots(
+    keys: list[bytes],
+    salt: int,
+) -> tuple[array, list[int]]:
+    '''
+    Find a minimal perfect hash function for a list of distinct keys with a given salt.
+
+    :param keys: The UTF-8 encoded surface forms.
+    :param salt: The salt of the hash function.
+    :return: A pair consisting of the bucket displacements and the slot of every key.
+    '''
+    num_keys = len(keys)
+    num_buckets = num_keys//_KEYS_PER_BUCKET + 1
+    hashes = [_hash(key, salt) for key in keys]
+    buckets: list[list[int]] = [[] for _ in range(num_buckets)]
+    for (i, (bucket_hash, _, _)) in enumerate(hashes):
+        buckets[bucket_hash%num_buckets].append(i)
+
+    displacements = array('i', [0])*num_buckets
+    key_slots = [0]*num_keys
+    slot_used = bytearray(num_keys)
+    singletons: list[int] = []
+    for bucket in sorted(range(num_buckets), key=lambda b: len(buckets[b]), reverse=True):
+        bucket_keys = buckets[bucket]
+        if len(bucket_keys) == 0:
+            break
+        if len(bucket_keys) == 1:
+            singletons.append(bucket)
+            continue
+        for displacement in range(1, _MAX_DISPLACEMENT):
+            slots = [
+                (hashes[i][1] + displacement*hashes[i][2])%num_keys
+                for i in bucket_keys
+            ]
+            if (
+                len(set(slots)) == len(slots)
+                and not any(slot_used[slot] for slot in slots)
+            ):
+                break
+        else:
+            raise _DisplacementNotFoundException()
+        displacements[bucket] = displacement
+        for (i, slot) in zip(bucket_keys, slots):
+            key_slots[i] = slot
+            slot_used[slot] = 1
+
+    # Buckets with a single key are placed directly in the remaining free slots.
+    free_slots = [slot for slot in range(num_keys) if not slot_used[slot]]
+    for (bucket, slot) in zip(singletons, free_slots):
+        displacements[bucket] = -slot - 1
+        key_slots[buckets[bucket][0]] = slot
+
+    return (displacements, key_slots)
+
+
+#########################################
+def build_surface_form_lookup(
+    lookup_path: str,
+    postings: dict[str, list[int]],
+) -> None:
+    '''
+    Build a surface form lookup file.
+
+    :param lookup_path: The path to the lookup file to create.
+    :param postings: A dictionary mapping every distinct surface form to the wordform IDs having
+        it.
+    '''
+    keys = [surface_form.encode('utf-8') for surface_form in sorted(postings)]
+    for salt in range(_MAX_SALT):
+        try:
+            (displacements, key_slots) = _find_slots(keys, salt)
+            break
+        except _DisplacementNotFoundException:
+            pass
+    else:
+        raise ValueError('Could not find a perfect hash function for the surface forms.')
+
+    slot_keys = [0]*len(keys)
+    for (i, slot) in enumerate(key_slots):
+        slot_keys[slot] = i
+
+    key_offsets = array('Q')
+    posting_offsets = array('Q')
+    all_postings = array('I')
+    key_offset = 0
+    for i in slot_keys:
+        key_offsets.append(key_offset)
+        posting_offsets.append(len(all_postings))
+        key_offset += len(keys[i])
+        all_postings.extend(sorted(postings[keys[i].decode('utf-8')]))
+    key_offsets.append(key_offset)
+    posting_offsets.append(len(all_postings))
+    if sys.byteorder != 'little':
+        for arr in [displacements, key_offsets, posting_offsets, all_postings]:
+            arr.byteswap()
+
+    with open(lookup_path, 'wb') as f:
+        f.write(_HEADER.pack(
+            _MAGIC, _VERSION, salt, len(keys), len(displacements), len(all_postings)
+        ))
+        displacements.tofile(f)
+        key_offsets.tofile(f)
+        posting_offsets.tofile(f)
+        all_postings.tofile(f)
+        for i in slot_keys:
+            f.write(keys[i])
+
+
+#########################################
+class SurfaceFormLookupReader:
+    '''
+    Look up the wordform IDs of surface forms in a memory mapped surface form lookup file.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        lookup_path: str,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param lookup_path: The path to the lookup file.
+        '''
+        with open(lookup_path, 'rb') as f:
+            self.__data: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__data) < _HEADER.size:
+            self.close()
+            raise InvalidSurfaceFormLookupException('File is too short to be a lookup file.')
+        (magic, version, salt, num_keys, num_buckets, num_postings) = _HEADER.unpack_from(
+            self.__data, 0
+        )
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise InvalidSurfaceFormLookupException(
+                'File is not a lookup file or is of a different version.'
+            )
+        self.__salt: int = salt
+        self.__num_keys: int = num_keys
+        self.__num_buckets: int = num_buckets
+        self.__key_offsets_start: int = _HEADER.size + num_buckets*_DISPLACEMENT.size
+        self.__posting_offsets_start: int = (
+            self.__key_offsets_start + (num_keys + 1)*_OFFSET.size
+        )
+        self.__postings_start: int = self.__posting_offsets_start + (num_keys + 1)*_OFFSET.size
+        self.__keys_start: int = self.__postings_start + num_postings*_POSTING.size
+        if (
+            len(self.__data) < self.__keys_start
+            or len(self.__data) != self.__keys_start + self.__get_key_offset(num_keys)
+        ):
+            self.close()
+            raise InvalidSurfaceFormLookupException('Lookup file is truncated.')
+
+    #########################################
+    def __enter__(
+        self,
+    ) -> 'SurfaceFormLookupReader':
+        '''
+        Use the reader in a with statement.
+
+        :return: The reader.
+        '''
+        return self
+
+    #########################################
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        '''
+        Close the reader at the end of a with statement.
+
+        :param exc_type: The type of exception raised in the with statement, if any.
+        :param exc_value: The exception raised in the with statement, if any.
+        :param traceback: The traceback of the exception raised in the with statement, if any.
+        '''
+        self.close()
+
+    #########################################
+    def __len__(
+        self,
+    ) -> int:
+        '''
+        Get the number of distinct surface forms in the lookup file.
+
+        :return: The number of surface forms.
+        '''
+        return self.__num_keys
+
+    #########################################
+    def __contains__(
+        self,
+        surface_form: object,
+    ) -> bool:
+        '''
+        Check if a surface form is in the lookup file.
+
+        :param surface_form: The surface form.
+        :return: Whether the surface form is in the lookup file.
+        '''
+        return isinstance(surface_form, str) and self.__find_slot(surface_form) is not None
+
+    #########################################
+    def __get_key_offset(
+        self,
+        slot: int,
+    ) -> int:
+        '''
+        Get the start offset of the surface form of a slot in the surface forms area.
+
+        :param slot: The slot.
+        :return: The offset.
+        '''
+        offset: int = _OFFSET.unpack_from(
+            self.__data, self.__key_offsets_start + slot*_OFFSET.size
+        )[0]
+        return offset
+
+    #########################################
+    def __get_posting_offset(
+        self,
+        slot: int,
+    ) -> int:
+        '''
+        Get the start index of the postings of a slot in the postings area.
+
+        :param slot: The slot.
+        :return: The index.
+        '''
+        offset: int = _OFFSET.unpack_from(
+            self.__data, self.__posting_offsets_start + slot*_OFFSET.size
+        )[0]
+        return offset
+
+    #########################################
+    def __find_slot(
+        self,
+        surface_form: str,
+    ) -> Optional[int]:
+        '''
+        Find the slot of a surface form.
+
+        :param surface_form: The surface form.
+        :return: The slot or None if the surface form is not in the lookup file.
+        '''
+        if self.__num_keys == 0:
+            return None
+        key = surface_form.encode('utf-8')
+        (bucket_hash, slot_hash, step_hash) = _hash(key, self.__salt)
+        displacement: int = _DISPLACEMENT.unpack_from(
+            self.__data,
+            _HEADER.size + (bucket_hash%self.__num_buckets)*_DISPLACEMENT.size
+        )[0]
+        if displacement < 0:
+            slot = -displacement - 1
+        else:
+            slot = (slot_hash + displacement*step_hash)%self.__num_keys
+        if self.__data[
+            self.__keys_start + self.__get_key_offset(slot):
+            self.__keys_start + self.__get_key_offset(slot + 1)
+        ] != key:
+            return None
+        return slot
+
+    #########################################
+    def get(
+        self,
+        surface_form: str,
+    ) -> list[int]:
+        '''
+        Get the IDs of the wordforms having a given surface form.
+
+        :param surface_form: The surface form.
+        :return: The sorted wordform IDs, which is empty if the surface form is not in the lookup
+            file.
+        '''
+        slot = self.__find_slot(surface_form)
+        if slot is None:
+            return []
+        start = self.__postings_start + self.__get_posting_offset(slot)*_POSTING.size
+        end = self.__postings_start + self.__get_posting_offset(slot + 1)*_POSTING.size
+        return [posting for (posting,) in _POSTING.iter_unpack(self.__data[start:end])]
+
+    #########################################
+    def close(
+        self,
+    ) -> None:
+        '''
+        Close the memory mapped file.
+        '''
+        self.__data.close()
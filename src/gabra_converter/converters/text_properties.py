@@ -0,0 +1,53 @@
+'''
+Shared character-level analysis of lemmas and surface forms used by the text cleaners.
+'''
+
+import functools
+from typing import NamedTuple
+
+
+__all__ = [
+    'MALTESE_LETTERS',
+    'TextProperties',
+    'get_text_properties',
+]
+
+
+MALTESE_LETTERS = frozenset(' abċdefġghħijklmnopqrstuvwxżzàèìòù\'')
+
+_DELETE_MALTESE_LETTERS_TABLE = str.maketrans('', '', ''.join(sorted(MALTESE_LETTERS)))
+
+_CACHE_SIZE = 65536
+
+
+#########################################
+class TextProperties(NamedTuple):
+    '''
+    The character properties of a piece of text.
+    '''
+    has_space: bool
+    has_uppercase: bool
+    all_maltese: bool
+    has_new_line: bool
+
+
+#########################################
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def get_text_properties(
+    text: str,
+) -> TextProperties:
+    '''
+    Get all the character properties of a text at once.
+        Results are memoised in a bounded least recently used cache so that the different
+        cleaners checking the same lemma or surface form only analyse it once.
+
+    :param text: The text to analyse.
+    :return: The properties of the text.
+    '''
+    lowercase_text = text.lower()
+    return TextProperties(
+        has_space=' ' in text,
+        has_uppercase=lowercase_text != text,
+        all_maltese=lowercase_text.translate(_DELETE_MALTESE_LETTERS_TABLE) == '',
+        has_new_line='\n' in text,
+    )
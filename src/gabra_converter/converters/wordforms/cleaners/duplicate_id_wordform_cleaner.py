@@ -0,0 +1,103 @@
+'''
+Skip any wordforms whose ID was already used by a previous wordform.
+'''
+
+import os
+from typing import Any, Optional
+from gabra_converter.converters.duplicate_detection import DuplicateDetector, get_id_key
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+
+
+__all__ = [
+    'DuplicateIdWordformCleaner',
+]
+
+
+#########################################
+class DuplicateIdWordformCleaner(WordformCleaner):
+    '''
+    Skip any wordforms whose ID was already used by a previous wordform, keeping only the first
+    wordform with a given ID.
+        This should be the last cleaner so that a skipped wordform does not make a later wordform
+        with the same ID count as a duplicate.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__(
+            id_='duplicate_id',
+            description='Skip any wordforms whose ID was already used by a previous wordform.',
+        )
+        self.__detector: Optional[DuplicateDetector] = None
+
+    #########################################
+    def reset(
+        self,
+    ) -> None:
+        '''
+        Forget the IDs of the previously cleaned rows.
+        '''
+        self.__detector = None
+
+    #########################################
+    def get_checkpoint(
+        self,
+        checkpoint_path: str,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the cleaner such that cleaning can later be resumed from this point
+        using ``resume``.
+            The IDs of the previously cleaned rows are saved to a file (see
+            ``DuplicateDetector.save``).
+
+        :param checkpoint_path: The path to the file to save the IDs to.
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__detector is None:
+            self.__detector = DuplicateDetector(key_size=12)
+        return {
+            'keys_fname': os.path.basename(checkpoint_path),
+            'num_keys': self.__detector.save(checkpoint_path),
+        }
+
+    #########################################
+    def resume(
+        self,
+        checkpoint_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue cleaning from a checkpoint, remembering the IDs of the rows cleaned before it.
+
+        :param checkpoint_dir_path: The directory path to the folder containing the saved file.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.__detector = DuplicateDetector(key_size=12)
+        self.__detector.load(
+            os.path.join(checkpoint_dir_path, checkpoint['keys_fname']), checkpoint['num_keys']
+        )
+
+    #########################################
+    def clean(
+        self,
+        row: WordformRow,
+        lexemes_id_map: dict[str, int], # pylint: disable=unused-argument
+    ) -> bool:
+        '''
+        Clean a row using a particular process.
+
+        :param row: A wordform row to be checked and cleaned.
+        :param lexemes_id_map: A dictionary mapping the original lexeme hexademical unique IDs to
+            their given decimal unique IDs.
+        :return: Whether the row passes the cleaner's filter.
+            A False indicates that it should be skipped.
+        '''
+        if self.__detector is None:
+            self.__detector = DuplicateDetector(key_size=12)
+        return not self.__detector.add(get_id_key(row.id_.oid))
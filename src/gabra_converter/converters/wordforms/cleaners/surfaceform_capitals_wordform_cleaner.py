@@ -2,6 +2,7 @@
 Skip any wordforms whose surfaceform contains uppercase letters.
 '''
 
+from gabra_converter.converters.text_properties import get_text_properties
 from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
 from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
 
@@ -44,4 +45,4 @@ class SurfaceformCapitalsWordformCleaner(WordformCleaner):
         :return: Whether the row passes the cleaner's filter.
             A False indicates that it should be skipped.
         '''
-        return row.surface_form == row.surface_form.lower()
+        return not get_text_properties(row.surface_form).has_uppercase
@@ -2,6 +2,7 @@
 Skip any wordforms whose surfaceform contains non-Maltese letters.
 '''
 
+from gabra_converter.converters.text_properties import get_text_properties
 from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
 from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
 
@@ -11,9 +12,6 @@ __all__ = [
 ]
 
 
-MALTESE_LETTERS = set(' abċdefġghħijklmnopqrstuvwxżzàèìòù\'')
-
-
 #########################################
 class SurfaceformNonmalteseWordformCleaner(WordformCleaner):
     '''
@@ -47,4 +45,4 @@ class SurfaceformNonmalteseWordformCleaner(WordformCleaner):
         :return: Whether the row passes the cleaner's filter.
             A False indicates that it should be skipped.
         '''
-        return set(row.surface_form.lower()) <= MALTESE_LETTERS
+        return get_text_properties(row.surface_form).all_maltese
@@ -1,44 +1,143 @@
 '''
 A list of available wordform cleaners.
+
+Cleaners are listed through their ``PluginInfo`` descriptions so that their implementations are
+only imported when they are used.
+Besides the cleaners that come with the program, cleaners provided by other packages through
+entry points in the ``gabra_converter.wordform_cleaners`` group are also included.
 '''
 
-from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
-from gabra_converter.converters.wordforms.cleaners.missing_lexeme_wordform_cleaner import (
-    MissingLexemeWordformCleaner
-)
-from gabra_converter.converters.wordforms.cleaners.surfaceform_spaces_wordform_cleaner import (
-    SurfaceformSpacesWordformCleaner
-)
-from gabra_converter.converters.wordforms.cleaners.surfaceform_capitals_wordform_cleaner import (
-    SurfaceformCapitalsWordformCleaner
-)
-from gabra_converter.converters.wordforms.cleaners.surfaceform_nonmaltese_wordform_cleaner import (
-    SurfaceformNonmalteseWordformCleaner
-)
-from gabra_converter.converters.wordforms.cleaners.pending_wordform_cleaner import (
-    PendingWordformCleaner
+from typing import TYPE_CHECKING, Optional
+from gabra_converter.converters.plugin_info import (
+    InvalidPluginException,
+    PluginInfo,
+    get_entry_point_plugin_infos,
 )
 
+if TYPE_CHECKING:
+    from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+
 
 __all__ = [
+    'WORDFORM_CLEANERS_ENTRY_POINT_GROUP',
+    'get_wordform_cleaner_infos',
+    'get_wordform_cleaner',
     'get_all_wordform_cleaners',
 ]
 
 
-#########################################
-__all_wordform_cleaners: list[WordformCleaner] = [
-    MissingLexemeWordformCleaner(),
-    SurfaceformSpacesWordformCleaner(),
-    SurfaceformCapitalsWordformCleaner(),
-    SurfaceformNonmalteseWordformCleaner(),
-    PendingWordformCleaner(),
+WORDFORM_CLEANERS_ENTRY_POINT_GROUP = 'gabra_converter.wordform_cleaners'
 
+_BUILTIN_WORDFORM_CLEANER_INFOS = [
+    PluginInfo(
+        id_='missing_lexeme',
+        description='Skip any wordforms whose lexeme ID does not refer to an existing lexeme.',
+        module_name='gabra_converter.converters.wordforms.cleaners.missing_lexeme_wordform_cleaner',
+        class_name='MissingLexemeWordformCleaner',
+    ),
+    PluginInfo(
+        id_='surfaceform_spaces',
+        description='Skip any wordforms whose surfaceform contains spaces.',
+        module_name=(
+            'gabra_converter.converters.wordforms.cleaners'
+            '.surfaceform_spaces_wordform_cleaner'
+        ),
+        class_name='SurfaceformSpacesWordformCleaner',
+    ),
+    PluginInfo(
+        id_='surfaceform_capitals',
+        description='Skip any wordforms whose surfaceform contains uppercase letters.',
+        module_name=(
+            'gabra_converter.converters.wordforms.cleaners'
+            '.surfaceform_capitals_wordform_cleaner'
+        ),
+        class_name='SurfaceformCapitalsWordformCleaner',
+    ),
+    PluginInfo(
+        id_='surfaceform_nonmaltese',
+        description='Skip any wordforms whose surfaceform contains non-Maltese letters.',
+        module_name=(
+            'gabra_converter.converters.wordforms.cleaners'
+            '.surfaceform_nonmaltese_wordform_cleaner'
+        ),
+        class_name='SurfaceformNonmalteseWordformCleaner',
+    ),
+    PluginInfo(
+        id_='pending',
+        description='Skip any wordforms whose pending field is not set to false.',
+        module_name='gabra_converter.converters.wordforms.cleaners.pending_wordform_cleaner',
+        class_name='PendingWordformCleaner',
+    ),
+    PluginInfo(
+        id_='duplicate_id',
+        description='Skip any wordforms whose ID was already used by a previous wordform.',
+        module_name=(
+            'gabra_converter.converters.wordforms.cleaners'
+            '.duplicate_id_wordform_cleaner'
+        ),
+        class_name='DuplicateIdWordformCleaner',
+    ),
+    PluginInfo(
+        id_='duplicate_wordform',
+        description=(
+            'Skip any wordforms that are identical to a previous wordform of the same lexeme'
+            ' apart from their ID.'
+        ),
+        module_name=(
+            'gabra_converter.converters.wordforms.cleaners'
+            '.duplicate_wordform_cleaner'
+        ),
+        class_name='DuplicateWordformCleaner',
+    ),
 ]
+__wordform_cleaner_infos: Optional[list[PluginInfo]] = None
+
+
+#########################################
+def get_wordform_cleaner_infos(
+) -> list[PluginInfo]:
+    '''
+    Get the descriptions of all the available wordform cleaners without importing them.
+
+    :return: The list of descriptions, with the ones that come with the program first.
+    '''
+    global __wordform_cleaner_infos # pylint: disable=global-statement,invalid-name
+    if __wordform_cleaner_infos is None:
+        infos = _BUILTIN_WORDFORM_CLEANER_INFOS + get_entry_point_plugin_infos(
+            WORDFORM_CLEANERS_ENTRY_POINT_GROUP
+        )
+        ids = [info.id_ for info in infos]
+        if len(set(ids)) != len(ids):
+            raise InvalidPluginException(
+                f'Wordform cleaner IDs are not unique: {", ".join(ids)}.'
+            )
+        __wordform_cleaner_infos = infos
+    return __wordform_cleaner_infos
+
+
+#########################################
+def get_wordform_cleaner(
+    id_: str,
+) -> 'WordformCleaner':
+    '''
+    Get a wordform cleaner by ID, importing only its implementation.
+
+    :param id_: The ID of the cleaner.
+    :return: The cleaner.
+    '''
+    for info in get_wordform_cleaner_infos():
+        if info.id_ == id_:
+            return info.load()
+    raise KeyError(id_)
+
+
+#########################################
 def get_all_wordform_cleaners(
-) -> list[WordformCleaner]:
+) -> list['WordformCleaner']:
     '''
     Get a list of all the available wordform cleaners.
+        This imports all of their implementations.
 
     :return: The list.
     '''
-    return __all_wordform_cleaners
+    return [info.load() for info in get_wordform_cleaner_infos()]
@@ -4,15 +4,135 @@ Export wordform rows to CSV files.
 
 import os
 import csv
+from typing import Any
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
 from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
 from gabra_converter.converters.wordforms.exporters.wordform_exporter import WordformExporter
 
 
 __all__ = [
-    'CSVWordformExporter'
+    'WORDFORMS_CSV_COLUMNS',
+    'get_wordform_csv_values',
+    'CSVWordformExporter',
 ]
 
 
+_FILE_NAMES = [
+    'wordforms.csv',
+    'wordforms_alternatives.csv',
+    'wordforms_sources.csv',
+]
+
+WORDFORMS_CSV_COLUMNS = [
+    'new_id',
+    'new_lexeme_id',
+    '_id',
+    'lexeme_id',
+    'surface_form',
+    'gloss',
+    'gender',
+    'number',
+    'plural_form',
+    'subject-person',
+    'subject-number',
+    'subject-gender',
+    'dir_obj-person',
+    'dir_obj-number',
+    'dir_obj-gender',
+    'ind_obj-person',
+    'ind_obj-number',
+    'ind_obj-gender',
+    'possessor-person',
+    'possessor-number',
+    'possessor-gender',
+    'form',
+    'aspect',
+    'polarity',
+    'stem',
+    'phonetic',
+    'pattern',
+    'hypothetical',
+    'archaic',
+    'generated',
+    'pending',
+]
+
+
+#########################################
+def get_wordform_csv_values(
+    wordform_id: int,
+    row: WordformRow,
+    lexemes_id_map: dict[str, int],
+) -> list[str]:
+    '''
+    Get the values of a wordform row in the main CSV file.
+
+    :param wordform_id: The integer ID given to the wordform.
+    :param row: The wordform row.
+    :param lexemes_id_map: a dictionary mapping lexeme Ġabra IDs to integer IDs.
+    :return: The values, in the order of ``WORDFORMS_CSV_COLUMNS``.
+    '''
+    return [
+        str(wordform_id),
+        str(lexemes_id_map.get(row.lexeme_id.oid, '')),
+        row.id_.oid,
+        row.lexeme_id.oid,
+        row.surface_form,
+        row.gloss
+            if row.gloss is not None else '',
+        row.gender.value
+            if row.gender is not None else '',
+        row.number.value
+            if row.number is not None else '',
+        row.plural_form
+            if row.plural_form is not None else '',
+        row.subject.person.value
+            if row.subject is not None else '',
+        row.subject.number.value
+            if row.subject is not None else '',
+        row.subject.gender.value
+            if row.subject is not None and row.subject.gender is not None else '',
+        row.dir_obj.person.value
+            if row.dir_obj is not None else '',
+        row.dir_obj.number.value
+            if row.dir_obj is not None else '',
+        row.dir_obj.gender.value
+            if row.dir_obj is not None and row.dir_obj.gender is not None else '',
+        row.ind_obj.person.value
+            if row.ind_obj is not None else '',
+        row.ind_obj.number.value
+            if row.ind_obj is not None else '',
+        row.ind_obj.gender.value
+            if row.ind_obj is not None and row.ind_obj.gender is not None else '',
+        row.possessor.person.value
+            if row.possessor is not None else '',
+        row.possessor.number.value
+            if row.possessor is not None else '',
+        row.possessor.gender.value
+            if row.possessor is not None and row.possessor.gender is not None else '',
+        row.form.value
+            if row.form is not None else '',
+        row.aspect.value
+            if row.aspect is not None else '',
+        row.polarity.value
+            if row.polarity is not None else '',
+        row.stem
+            if row.stem is not None else '',
+        row.phonetic
+            if row.phonetic is not None else '',
+        row.pattern
+            if row.pattern is not None else '',
+        ('1' if row.hypothetical else '0')
+            if row.hypothetical is not None else '',
+        ('1' if row.archaic else '0')
+            if row.archaic is not None else '',
+        ('1' if row.generated else '0')
+            if row.generated is not None else '',
+        ('1' if row.pending else '0')
+            if row.pending is not None else '',
+    ]
+
+
 #########################################
 class CSVWordformExporter(WordformExporter):
     '''
@@ -64,39 +184,7 @@ class CSVWordformExporter(WordformExporter):
             alternatives_w = csv.writer(alternatives_f)
             sources_w = csv.writer(sources_f)
 
-            wordforms_w.writerow([
-                'new_id',
-                'new_lexeme_id',
-                '_id',
-                'lexeme_id',
-                'surface_form',
-                'gloss',
-                'gender',
-                'number',
-                'plural_form',
-                'subject-person',
-                'subject-number',
-                'subject-gender',
-                'dir_obj-person',
-                'dir_obj-number',
-                'dir_obj-gender',
-                'ind_obj-person',
-                'ind_obj-number',
-                'ind_obj-gender',
-                'possessor-person',
-                'possessor-number',
-                'possessor-gender',
-                'form',
-                'aspect',
-                'polarity',
-                'stem',
-                'phonetic',
-                'pattern',
-                'hypothetical',
-                'archaic',
-                'generated',
-                'pending',
-            ])
+            wordforms_w.writerow(WORDFORMS_CSV_COLUMNS)
             alternatives_w.writerow([
                 'new_id',
                 'new_wordform_id',
@@ -108,6 +196,42 @@ class CSVWordformExporter(WordformExporter):
                 'source',
             ])
 
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the exporter such that exporting can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        checkpoint = super().get_checkpoint()
+        checkpoint['wordform_id'] = self.__wordform_id
+        checkpoint['alternative_id'] = self.__alternative_id
+        checkpoint['source_id'] = self.__source_id
+        checkpoint['file_sizes'] = get_file_sizes(self.out_dir_path, _FILE_NAMES)
+        return checkpoint
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue exporting into an existing set of files from a checkpoint, discarding anything
+        exported after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        super().resume(out_dir_path, checkpoint)
+        self.__wordform_id = checkpoint['wordform_id']
+        self.__alternative_id = checkpoint['alternative_id']
+        self.__source_id = checkpoint['source_id']
+
     #########################################
     def add_row(
         self,
@@ -138,65 +262,9 @@ class CSVWordformExporter(WordformExporter):
             sources_w = csv.writer(sources_f)
 
             self.__wordform_id += 1
-            wordforms_w.writerow([
-                str(self.__wordform_id),
-                str(lexemes_id_map.get(row.lexeme_id.oid, '')),
-                row.id_.oid,
-                row.lexeme_id.oid,
-                row.surface_form,
-                row.gloss
-                    if row.gloss is not None else '',
-                row.gender.value
-                    if row.gender is not None else '',
-                row.number.value
-                    if row.number is not None else '',
-                row.plural_form
-                    if row.plural_form is not None else '',
-                row.subject.person.value
-                    if row.subject is not None else '',
-                row.subject.number.value
-                    if row.subject is not None else '',
-                row.subject.gender.value
-                    if row.subject is not None and row.subject.gender is not None else '',
-                row.dir_obj.person.value
-                    if row.dir_obj is not None else '',
-                row.dir_obj.number.value
-                    if row.dir_obj is not None else '',
-                row.dir_obj.gender.value
-                    if row.dir_obj is not None and row.dir_obj.gender is not None else '',
-                row.ind_obj.person.value
-                    if row.ind_obj is not None else '',
-                row.ind_obj.number.value
-                    if row.ind_obj is not None else '',
-                row.ind_obj.gender.value
-                    if row.ind_obj is not None and row.ind_obj.gender is not None else '',
-                row.possessor.person.value
-                    if row.possessor is not None else '',
-                row.possessor.number.value
-                    if row.possessor is not None else '',
-                row.possessor.gender.value
-                    if row.possessor is not None and row.possessor.gender is not None else '',
-                row.form.value
-                    if row.form is not None else '',
-                row.aspect.value
-                    if row.aspect is not None else '',
-                row.polarity.value
-                    if row.polarity is not None else '',
-                row.stem
-                    if row.stem is not None else '',
-                row.phonetic
-                    if row.phonetic is not None else '',
-                row.pattern
-                    if row.pattern is not None else '',
-                ('1' if row.hypothetical else '0')
-                    if row.hypothetical is not None else '',
-                ('1' if row.archaic else '0')
-                    if row.archaic is not None else '',
-                ('1' if row.generated else '0')
-                    if row.generated is not None else '',
-                ('1' if row.pending else '0')
-                    if row.pending is not None else '',
-            ])
+            wordforms_w.writerow(
+                get_wordform_csv_values(self.__wordform_id, row, lexemes_id_map)
+            )
 
             if row.alternatives is not None:
                 for alternative in row.alternatives:
@@ -0,0 +1,201 @@
+'''
+A wordform exporter for JSON lines files.
+'''
+
+import os
+import json
+from typing import IO, Any, Optional
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.row.wordform_row_content import (
+    get_wordform_content_object
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter import (
+    AddingWordformRowBeforeFilesCreationException,
+    WordformExporter,
+)
+
+
+__all__ = [
+    'JSONL_WRITE_BUFFER_SIZE',
+    'get_wordform_json_object',
+    'get_wordform_json_line',
+    'JSONLWordformExporter',
+]
+
+
+JSONL_WRITE_BUFFER_SIZE = 1024*1024
+
+_FILE_NAME = 'wordforms.ndjson'
+
+# The C accelerated encoder is used directly and circular reference checks are skipped as rows
+# are trees.
+_ENCODE = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(',', ':')
+).encode
+
+
+#########################################
+def get_wordform_json_object(
+    wordform_id: int,
+    row: WordformRow,
+    lexemes_id_map: dict[str, int],
+) -> dict[str, Any]:
+    '''
+    Get the JSON object of a wordform row in the JSON lines file.
+        Every object has the integer IDs and the Ġabra ID followed by the content of the row (see
+        ``get_wordform_content_object``), with null for missing values.
+
+    :param wordform_id: The integer ID given to the wordform.
+    :param row: The wordform row.
+    :param lexemes_id_map: a dictionary mapping lexeme Ġabra IDs to integer IDs.
+    :return: The JSON serialisable object.
+    '''
+    return {
+        'new_id': wordform_id,
+        'new_lexeme_id': lexemes_id_map.get(row.lexeme_id.oid),
+        '_id': row.id_.oid,
+        **get_wordform_content_object(row),
+    }
+
+
+#########################################
+def get_wordform_json_line(
+    wordform_id: int,
+    row: WordformRow,
+    lexemes_id_map: dict[str, int],
+) -> str:
+    '''
+    Get the line of a wordform row in the JSON lines file.
+
+    :param wordform_id: The integer ID given to the wordform.
+    :param row: The wordform row.
+    :param lexemes_id_map: a dictionary mapping lexeme Ġabra IDs to integer IDs.
+    :return: The JSON object of the row (see ``get_wordform_json_object``) in compact JSON,
+        followed by a new line.
+    '''
+    return _ENCODE(get_wordform_json_object(wordform_id, row, lexemes_id_map)) + '\n'
+
+
+#########################################
+class JSONLWordformExporter(WordformExporter):
+    '''
+    A concrete WordformExporter class that exports wordforms to a JSON lines file.
+        The file is kept open between rows and written through a large buffer, which is only
+        flushed when a checkpoint is taken or when the conversion ends.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__(
+            id_='jsonl',
+            description='Export the data into a JSON lines file with one JSON object per wordform.',
+            required_cleaners=set(),
+        )
+        self.__wordform_id: int = 0
+        self.__f: Optional[IO[str]] = None
+
+    #########################################
+    def __open(
+        self,
+        mode: str,
+    ) -> None:
+        '''
+        Open the JSON lines file, closing any previously open one.
+
+        :param mode: The mode to open the file with.
+        '''
+        if self.__f is not None:
+            self.__f.close()
+        self.__f = open(  # pylint: disable=consider-using-with
+            os.path.join(self.out_dir_path, _FILE_NAME),
+            mode, encoding='utf-8', newline='\n', buffering=JSONL_WRITE_BUFFER_SIZE,
+        )
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        super().create(out_dir_path)
+        self.__wordform_id = 0
+        self.__open('w')
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the exporter such that exporting can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__f is not None:
+            self.__f.flush()
+        checkpoint = super().get_checkpoint()
+        checkpoint['wordform_id'] = self.__wordform_id
+        checkpoint['file_sizes'] = get_file_sizes(self.out_dir_path, [_FILE_NAME])
+        return checkpoint
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue exporting into an existing set of files from a checkpoint, discarding anything
+        exported after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        if self.__f is not None:
+            self.__f.close()
+            self.__f = None
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        super().resume(out_dir_path, checkpoint)
+        self.__wordform_id = checkpoint['wordform_id']
+        self.__open('a')
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Close the JSON lines file when the whole JSON lines file has been converted.
+        '''
+        if self.__f is not None:
+            self.__f.close()
+            self.__f = None
+
+    #########################################
+    def add_row(
+        self,
+        row: WordformRow,
+        lexemes_id_map: dict[str, int],
+    ) -> None:
+        '''
+        Add a row to the current set of files.
+
+        :param row: A wordform row to be exported and appended to the files.
+        :param lexemes_id_map: a dictionary mapping lexeme Ġabra IDs to integer IDs.
+            This is returned by a LexemesExporter object.
+        '''
+        super().add_row(row, lexemes_id_map)
+        if self.__f is None:
+            raise AddingWordformRowBeforeFilesCreationException()
+
+        self.__wordform_id += 1
+        self.__f.write(get_wordform_json_line(self.__wordform_id, row, lexemes_id_map))
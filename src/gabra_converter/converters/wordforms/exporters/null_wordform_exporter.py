@@ -0,0 +1,31 @@
+'''
+Export wordform rows to nowhere.
+'''
+
+from gabra_converter.converters.wordforms.exporters.wordform_exporter import WordformExporter
+
+
+__all__ = [
+    'NullWordformExporter'
+]
+
+
+#########################################
+class NullWordformExporter(WordformExporter):
+    '''
+    A concrete WordformExporter class that does not write anything, which is used when the
+    processed rows are consumed directly instead of being exported.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__(
+            id_='null',
+            description='Do not export anything.',
+            required_cleaners=set(),
+        )
@@ -1,25 +1,97 @@
 '''
 A list of available wordform exporters.
+
+Exporters are listed through their ``PluginInfo`` descriptions so that their implementations are
+only imported when they are used.
+Besides the exporters that come with the program, exporters provided by other packages through
+entry points in the ``gabra_converter.wordform_exporters`` group are also included.
 '''
 
-from gabra_converter.converters.wordforms.exporters.wordform_exporter import WordformExporter
-from gabra_converter.converters.wordforms.exporters.csv_wordform_exporter import CSVWordformExporter
+from typing import TYPE_CHECKING, Optional
+from gabra_converter.converters.plugin_info import (
+    InvalidPluginException,
+    PluginInfo,
+    get_entry_point_plugin_infos,
+)
+
+if TYPE_CHECKING:
+    from gabra_converter.converters.wordforms.exporters.wordform_exporter import WordformExporter
 
 
 __all__ = [
+    'WORDFORM_EXPORTERS_ENTRY_POINT_GROUP',
+    'get_wordform_exporter_infos',
+    'get_wordform_exporter',
     'get_all_wordform_exporters',
 ]
 
 
-#########################################
-__all_wordform_exporters: list[WordformExporter] = [
-    CSVWordformExporter(),
+WORDFORM_EXPORTERS_ENTRY_POINT_GROUP = 'gabra_converter.wordform_exporters'
+
+_BUILTIN_WORDFORM_EXPORTER_INFOS = [
+    PluginInfo(
+        id_='csv',
+        description='Export the data into a comma separated file.',
+        module_name='gabra_converter.converters.wordforms.exporters.csv_wordform_exporter',
+        class_name='CSVWordformExporter',
+        required_cleaners=set(),
+    ),
+    PluginInfo(
+        id_='jsonl',
+        description='Export the data into a JSON lines file with one JSON object per wordform.',
+        module_name='gabra_converter.converters.wordforms.exporters.jsonl_wordform_exporter',
+        class_name='JSONLWordformExporter',
+        required_cleaners=set(),
+    ),
 ]
+__wordform_exporter_infos: Optional[list[PluginInfo]] = None
+
+
+#########################################
+def get_wordform_exporter_infos(
+) -> list[PluginInfo]:
+    '''
+    Get the descriptions of all the available wordform exporters without importing them.
+
+    :return: The list of descriptions, with the ones that come with the program first.
+    '''
+    global __wordform_exporter_infos # pylint: disable=global-statement,invalid-name
+    if __wordform_exporter_infos is None:
+        infos = _BUILTIN_WORDFORM_EXPORTER_INFOS + get_entry_point_plugin_infos(
+            WORDFORM_EXPORTERS_ENTRY_POINT_GROUP
+        )
+        ids = [info.id_ for info in infos]
+        if len(set(ids)) != len(ids):
+            raise InvalidPluginException(
+                f'Wordform exporter IDs are not unique: {", ".join(ids)}.'
+            )
+        __wordform_exporter_infos = infos
+    return __wordform_exporter_infos
+
+
+#########################################
+def get_wordform_exporter(
+    id_: str,
+) -> 'WordformExporter':
+    '''
+    Get a wordform exporter by ID, importing only its implementation.
+
+    :param id_: The ID of the exporter.
+    :return: The exporter.
+    '''
+    for info in get_wordform_exporter_infos():
+        if info.id_ == id_:
+            return info.load()
+    raise KeyError(id_)
+
+
+#########################################
 def get_all_wordform_exporters(
-) -> list[WordformExporter]:
+) -> list['WordformExporter']:
     '''
     Get a list of all the available wordform exporters.
+        This imports all of their implementations.
 
     :return: The list.
     '''
-    return __all_wordform_exporters
+    return [info.load() for info in get_wordform_exporter_infos()]
@@ -3,7 +3,7 @@ Listen for events while a wordform pipeline is in progress.
 '''
 
 from abc import ABC
-from typing import Optional
+from typing import Any, Optional
 from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
 from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
 
@@ -25,23 +25,88 @@ class WordformPipelineListener(ABC):
         Initialiser.
         '''
 
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create any files that the listener writes to.
+            This is called by the pipeline when it creates its own files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+            This is called by the pipeline at the end of ``convert_file``.
+        '''
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {}
+
+    #########################################
+    def get_tmp_fnames(
+        self,
+    ) -> list[str]:
+        '''
+        Get the names of the temporary files that the listener keeps in the output folder whilst
+        converting.
+            They are needed to resume from any checkpoint of the conversion, including the final
+            one, so the pipeline removes them at the end of ``convert_file`` only if no
+            checkpoint was saved and otherwise leaves them until its checkpoint is removed (see
+            ``WordformPipeline.remove_tmp_files``).
+            Can be overriden by subclass.
+
+        :return: The file names.
+        '''
+        return []
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+            This is called by the pipeline when it resumes from a checkpoint instead of
+            ``create``.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+
     #########################################
     def row_exported(
         self,
-        json_line: str,
+        json_line: bytes,
         row: WordformRow,
     ) -> None:
         '''
         Listen for when a row is successfully exported.
 
-        :param json_line: The raw JSON line that was processed.
+        :param json_line: The raw UTF-8 encoded JSON line that was processed.
         :param row: The processed row that was exported.
         '''
 
     #########################################
     def row_skipped(
         self,
-        json_line: str, # pylint: disable=unused-argument
+        json_line: bytes, # pylint: disable=unused-argument
         invalid_json: bool,
         schema_mismatch: bool,
         cleaner: Optional[WordformCleaner],
@@ -49,7 +114,7 @@ class WordformPipelineListener(ABC):
         '''
         Listen for when a row was skipped.
 
-        :param json_line: The verbatim JSON row that was skipped.
+        :param json_line: The verbatim UTF-8 encoded JSON row that was skipped.
         :param invalid_json: Whether the JSON row was not in valid JSON format.
         :param schema_mismatch: Whether the JSON row did not conform to the Ġabra schema.
         :param cleaner: The cleaner that determined that the row should be skipped.
@@ -0,0 +1,106 @@
+'''
+Take snapshots of the memory allocations every number of wordforms.
+'''
+
+from typing import Optional
+from gabra_converter.converters.memory_profiler import MemoryProfiler
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+
+__all__ = [
+    'WordformPipelineListenerMemoryProfile',
+]
+
+
+#########################################
+class WordformPipelineListenerMemoryProfile(WordformPipelineListener):
+    '''
+    Take a snapshot with a memory profiler every number of wordforms processed, whether exported
+    or skipped, and at the end of the conversion.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        profiler: MemoryProfiler,
+        interval: int = 100000,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param profiler: The started memory profiler to take the snapshots with.
+        :param interval: The number of rows to process between snapshots.
+        '''
+        super().__init__()
+        self.profiler: MemoryProfiler = profiler
+        self.interval: int = interval
+        self.count: int = 0
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create any files that the listener writes to.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        self.count = 0
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+        '''
+        self.profiler.take_snapshot(f'wordforms: conversion ended after {self.count} rows')
+
+    #########################################
+    def __row_processed(
+        self,
+    ) -> None:
+        '''
+        Count a processed row and take a snapshot if the interval is reached.
+        '''
+        self.count += 1
+        if self.count%self.interval == 0:
+            self.profiler.take_snapshot(f'wordforms: {self.count} rows')
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: WordformRow,
+    ) -> None:
+        '''
+        Listen for when a row is successfully exported.
+
+        :param json_line: The raw UTF-8 encoded JSON line that was processed.
+        :param row: The processed row that was exported.
+        '''
+        self.__row_processed()
+
+    #########################################
+    def row_skipped(
+        self,
+        json_line: bytes,
+        invalid_json: bool,
+        schema_mismatch: bool,
+        cleaner: Optional[WordformCleaner],
+    ) -> None:
+        '''
+        Listen for when a row was skipped.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was skipped.
+        :param invalid_json: Whether the JSON row was not in valid JSON format.
+        :param schema_mismatch: Whether the JSON row did not conform to the Ġabra schema.
+        :param cleaner: The cleaner that determined that the row should be skipped.
+            If None, then the reason is that it was either not valid JSON or did not conform
+            to the Ġabra schema.
+        '''
+        self.__row_processed()
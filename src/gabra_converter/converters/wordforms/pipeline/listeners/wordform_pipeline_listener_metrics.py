@@ -0,0 +1,161 @@
+'''
+Keep the metrics of the wordforms being converted.
+'''
+
+import time
+from typing import Any, Optional
+from gabra_converter.converters.conversion_metrics import CollectionMetrics, ConversionMetrics
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+
+__all__ = [
+    'WordformPipelineListenerMetrics',
+]
+
+
+#########################################
+class WordformPipelineListenerMetrics(WordformPipelineListener):
+    '''
+    Count the wordforms that were exported and skipped, by reason, and time how long every
+    wordform took to process in the metrics of a conversion, writing them every interval.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        metrics: ConversionMetrics,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param metrics: The metrics of the conversion.
+        '''
+        super().__init__()
+        self.metrics: ConversionMetrics = metrics
+        self.collection_metrics: CollectionMetrics = metrics.collections['wordforms']
+        self.__previous_time: Optional[float] = None
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create any files that the listener writes to.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        self.collection_metrics.num_exported = 0
+        self.collection_metrics.num_invalid_json = 0
+        self.collection_metrics.num_schema_mismatch = 0
+        self.collection_metrics.num_skipped_by_cleaner = {}
+        self.__previous_time = None
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+            Only the counts are kept, not the latencies.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {
+            'num_exported': self.collection_metrics.num_exported,
+            'num_invalid_json': self.collection_metrics.num_invalid_json,
+            'num_schema_mismatch': self.collection_metrics.num_schema_mismatch,
+            'num_skipped_by_cleaner': dict(self.collection_metrics.num_skipped_by_cleaner),
+        }
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.collection_metrics.num_exported = checkpoint['num_exported']
+        self.collection_metrics.num_invalid_json = checkpoint['num_invalid_json']
+        self.collection_metrics.num_schema_mismatch = checkpoint['num_schema_mismatch']
+        self.collection_metrics.num_skipped_by_cleaner = dict(
+            checkpoint['num_skipped_by_cleaner']
+        )
+        self.__previous_time = None
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+        '''
+        self.__previous_time = None
+        self.metrics.write()
+
+    #########################################
+    def __row_processed(
+        self,
+    ) -> None:
+        '''
+        Time a processed row from when the previous one was processed and write the metrics if
+        the interval has passed.
+        '''
+        now = time.perf_counter()
+        if self.__previous_time is not None:
+            self.collection_metrics.latency.observe(now - self.__previous_time)
+        self.__previous_time = now
+        if now >= self.metrics.next_write_time:
+            self.metrics.write()
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: WordformRow,
+    ) -> None:
+        '''
+        Listen for when a row is successfully exported.
+
+        :param json_line: The raw UTF-8 encoded JSON line that was processed.
+        :param row: The processed row that was exported.
+        '''
+        self.collection_metrics.num_exported += 1
+        self.__row_processed()
+
+    #########################################
+    def row_skipped(
+        self,
+        json_line: bytes,
+        invalid_json: bool,
+        schema_mismatch: bool,
+        cleaner: Optional[WordformCleaner],
+    ) -> None:
+        '''
+        Listen for when a row was skipped.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was skipped.
+        :param invalid_json: Whether the JSON row was not in valid JSON format.
+        :param schema_mismatch: Whether the JSON row did not conform to the Ġabra schema.
+        :param cleaner: The cleaner that determined that the row should be skipped.
+            If None, then the reason is that it was either not valid JSON or did not conform
+            to the Ġabra schema.
+        '''
+        if cleaner is not None:
+            self.collection_metrics.num_skipped_by_cleaner[cleaner.id_] = (
+                self.collection_metrics.num_skipped_by_cleaner.get(cleaner.id_, 0) + 1
+            )
+        elif invalid_json:
+            self.collection_metrics.num_invalid_json += 1
+        elif schema_mismatch:
+            self.collection_metrics.num_schema_mismatch += 1
+        self.__row_processed()
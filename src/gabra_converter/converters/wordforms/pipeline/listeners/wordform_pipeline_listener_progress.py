@@ -0,0 +1,45 @@
+'''
+Report the progress of a wordform pipeline on the console.
+'''
+
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+
+__all__ = [
+    'WordformPipelineListenerProgress',
+]
+
+
+#########################################
+class WordformPipelineListenerProgress(WordformPipelineListener):
+    '''
+    Print the number of rows exported so far, overwriting the same console line.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.count: int = 0
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: WordformRow,
+    ) -> None:
+        '''
+        Listen for when a row is successfully exported.
+
+        :param json_line: The raw UTF-8 encoded JSON line that was processed.
+        :param row: The processed row that was exported.
+        '''
+        super().row_exported(json_line, row)
+        self.count += 1
+        print(f'\r > Rows exported: {self.count}', end='')
@@ -3,7 +3,8 @@ Keep a log of all the wordforms that were skipped in a tab separated values file
 '''
 
 import os
-from typing import Optional
+from typing import Any, Optional
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
 from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
     WordformPipelineListener
 )
@@ -58,10 +59,40 @@ class WordformPipelineListenerSkipLog(WordformPipelineListener):
         self.out_dir_path = out_dir_path
         self.__files_created = True
 
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {
+            'file_sizes': get_file_sizes(self.out_dir_path, ['wordforms_skipped_log.txt']),
+        }
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        self.out_dir_path = out_dir_path
+        self.__files_created = True
+
     #########################################
     def row_skipped(
         self,
-        json_line: str,
+        json_line: bytes,
         invalid_json: bool,
         schema_mismatch: bool,
         cleaner: Optional[WordformCleaner],
@@ -69,7 +100,7 @@ class WordformPipelineListenerSkipLog(WordformPipelineListener):
         '''
         Listen for when a row was skipped.
 
-        :param json_line: The verbatim JSON row that was skipped.
+        :param json_line: The verbatim UTF-8 encoded JSON row that was skipped.
         :param invalid_json: Whether the JSON row was not in valid JSON format.
         :param schema_mismatch: Whether the JSON row did not conform to the Ġabra schema.
         :param cleaner: The cleaner that determined that the row should be skipped.
@@ -95,6 +126,6 @@ class WordformPipelineListenerSkipLog(WordformPipelineListener):
 
         with open(
             os.path.join(self.out_dir_path, 'wordforms_skipped_log.txt'),
-            'a', encoding='utf-8', newline=''
+            'ab'
         ) as skipped_f:
-            print(json_line.strip(), reason, sep='\t', file=skipped_f)
+            skipped_f.write(json_line.strip() + b'\t' + reason.encode('utf-8') + b'\n')
@@ -0,0 +1,124 @@
+'''
+Accumulate statistics of the wordforms that were exported.
+'''
+
+import os
+from typing import Any
+from gabra_converter.converters.dataset_stats import DatasetStats, save_stats_report
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+
+__all__ = [
+    'WordformPipelineListenerStats',
+]
+
+
+_REPORT_FNAME = 'wordforms_stats.json'
+
+
+#########################################
+class WordformPipelineListenerStats(WordformPipelineListener):
+    '''
+    Accumulate statistics of the exported wordforms (see ``DatasetStats``) and save their report
+    at the end of the conversion.
+        The statistics are the counts of the values of the categorical fields (such as the
+        number, the aspect, and the pending flag), the estimated number of distinct surface
+        forms, and the histogram of the number of wordforms per lexeme.
+        The statistics are kept in the checkpoints so that a resumed conversion has the same
+        report.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.out_dir_path: str = ''
+        self.stats: DatasetStats = DatasetStats('wordforms')
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        self.out_dir_path = out_dir_path
+        self.stats = DatasetStats('wordforms')
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        return {
+            'stats': self.stats.get_state(),
+        }
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        self.out_dir_path = out_dir_path
+        self.stats = DatasetStats('wordforms')
+        self.stats.load_state(checkpoint['stats'])
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: WordformRow,
+    ) -> None:
+        '''
+        Listen for when a row was exported.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was exported.
+        :param row: The parsed row object that was exported.
+        '''
+        super().row_exported(json_line, row)
+
+        stats = self.stats
+        stats.add_row()
+        stats.count_value('gender', row.gender)
+        stats.count_value('number', row.number)
+        stats.count_value('form', row.form)
+        stats.count_value('aspect', row.aspect)
+        stats.count_value('polarity', row.polarity)
+        stats.count_value('hypothetical', row.hypothetical)
+        stats.count_value('archaic', row.archaic)
+        stats.count_value('generated', row.generated)
+        stats.count_value('pending', row.pending)
+        stats.add_distinct('surface_form', row.surface_form)
+        stats.add_to_group('wordforms_per_lexeme', row.lexeme_id.oid)
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+            This is called by the pipeline at the end of ``convert_file``.
+        '''
+        super().conversion_ended()
+        save_stats_report(os.path.join(self.out_dir_path, _REPORT_FNAME), self.stats.get_report())
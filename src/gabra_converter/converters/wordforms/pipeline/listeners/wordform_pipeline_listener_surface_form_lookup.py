@@ -0,0 +1,175 @@
+'''
+Build a surface form lookup file from the wordforms that were exported.
+'''
+
+import os
+import struct
+from typing import Any, BinaryIO, Optional
+from gabra_converter.converters.checkpoint import get_file_sizes, truncate_files
+from gabra_converter.converters.surface_form_lookup import build_surface_form_lookup
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+
+__all__ = [
+    'AddingSurfaceFormBeforeFileCreationException',
+    'WordformPipelineListenerSurfaceFormLookup',
+]
+
+
+_POSTINGS_FNAME = 'wordforms_lookup_postings.tmp'
+_LOOKUP_FNAME = 'wordforms_lookup.bin'
+_RECORD_HEADER = struct.Struct('<II')
+
+
+#########################################
+class AddingSurfaceFormBeforeFileCreationException(Exception):
+    '''
+    A WordformPipelineListenerSurfaceFormLookup object was used to add an exported row before
+    creating its files.
+    '''
+
+
+#########################################
+class WordformPipelineListenerSurfaceFormLookup(WordformPipelineListener):
+    '''
+    Build a lookup file mapping surface forms to the wordform IDs having them.
+        Wordform IDs are the consecutive integers starting from 1 that are given to the
+        wordforms in the order they are exported, which is how the CSV exporter numbers them.
+        The surface forms are collected in a temporary file whilst converting and the lookup
+        file is built from it at the end of the conversion.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+    ) -> None:
+        '''
+        Initialiser.
+        '''
+        super().__init__()
+        self.out_dir_path: str = ''
+        self.__postings_f: Optional[BinaryIO] = None
+        self.__num_exported: int = 0
+
+    #########################################
+    def create(
+        self,
+        out_dir_path: str,
+    ) -> None:
+        '''
+        Create a new set of files.
+
+        :param out_dir_path: The directory path to a folder to contain the files.
+        '''
+        if self.__postings_f is not None:
+            self.__postings_f.close()
+        self.__postings_f = open(  # pylint: disable=consider-using-with
+            os.path.join(out_dir_path, _POSTINGS_FNAME), 'wb'
+        )
+        self.out_dir_path = out_dir_path
+        self.__num_exported = 0
+
+    #########################################
+    def get_checkpoint(
+        self,
+    ) -> dict[str, Any]:
+        '''
+        Get the state of the listener such that listening can later be resumed from this point
+        using ``resume``.
+
+        :return: A JSON serialisable checkpoint.
+        '''
+        if self.__postings_f is not None:
+            self.__postings_f.flush()
+        return {
+            'num_exported': self.__num_exported,
+            'file_sizes': get_file_sizes(self.out_dir_path, [_POSTINGS_FNAME]),
+        }
+
+    #########################################
+    def get_tmp_fnames(
+        self,
+    ) -> list[str]:
+        '''
+        Get the names of the temporary files that the listener keeps in the output folder whilst
+        converting.
+
+        :return: The file names.
+        '''
+        return [_POSTINGS_FNAME]
+
+    #########################################
+    def resume(
+        self,
+        out_dir_path: str,
+        checkpoint: dict[str, Any],
+    ) -> None:
+        '''
+        Continue listening from a checkpoint, discarding anything written to files after it.
+
+        :param out_dir_path: The directory path to the folder containing the files.
+        :param checkpoint: A checkpoint returned by ``get_checkpoint``.
+        '''
+        truncate_files(out_dir_path, checkpoint['file_sizes'])
+        if self.__postings_f is not None:
+            self.__postings_f.close()
+        self.__postings_f = open(  # pylint: disable=consider-using-with
+            os.path.join(out_dir_path, _POSTINGS_FNAME), 'ab'
+        )
+        self.out_dir_path = out_dir_path
+        self.__num_exported = checkpoint['num_exported']
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: WordformRow,
+    ) -> None:
+        '''
+        Listen for when a row was exported.
+
+        :param json_line: The verbatim UTF-8 encoded JSON row that was exported.
+        :param row: The parsed row object that was exported.
+        '''
+        super().row_exported(json_line, row)
+
+        if self.__postings_f is None:
+            raise AddingSurfaceFormBeforeFileCreationException()
+
+        self.__num_exported += 1
+        surface_form = row.surface_form.encode('utf-8')
+        self.__postings_f.write(
+            _RECORD_HEADER.pack(self.__num_exported, len(surface_form)) + surface_form
+        )
+
+    #########################################
+    def conversion_ended(
+        self,
+    ) -> None:
+        '''
+        Listen for when the whole JSON lines file has been converted.
+            This is called by the pipeline at the end of ``convert_file``.
+        '''
+        super().conversion_ended()
+
+        if self.__postings_f is None:
+            raise AddingSurfaceFormBeforeFileCreationException()
+        self.__postings_f.close()
+        self.__postings_f = None
+
+        postings_path = os.path.join(self.out_dir_path, _POSTINGS_FNAME)
+        postings: dict[str, list[int]] = {}
+        with open(postings_path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        while offset < len(data):
+            (wordform_id, length) = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size
+            surface_form = data[offset:offset + length].decode('utf-8')
+            offset += length
+            postings.setdefault(surface_form, []).append(wordform_id)
+        del data
+
+        build_surface_form_lookup(os.path.join(self.out_dir_path, _LOOKUP_FNAME), postings)
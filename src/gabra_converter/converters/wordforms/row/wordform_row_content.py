@@ -0,0 +1,100 @@
+'''
+The content of a wordform, which is every field of the row apart from its ID.
+
+The content is used both as the body of the exported JSON objects and to find wordforms that only
+differ by their ID.
+'''
+
+import json
+from typing import Any, Optional
+from gabra_converter.converters.wordforms.row.wordform_row import Grammeme, WordformRow
+
+
+__all__ = [
+    'get_wordform_content_object',
+    'get_wordform_content_key',
+]
+
+
+# The C accelerated encoder is used directly and circular reference checks are skipped as rows
+# are trees.
+_ENCODE = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(',', ':')
+).encode
+
+
+#########################################
+def _get_grammeme_json_object(
+    grammeme: Optional[Grammeme],
+) -> Optional[dict[str, Any]]:
+    '''
+    Get the JSON object of a grammeme.
+
+    :param grammeme: The grammeme or None if missing.
+    :return: The JSON serialisable object or None if the grammeme is missing.
+    '''
+    if grammeme is None:
+        return None
+    return {
+        'person': grammeme.person.value,
+        'number': grammeme.number.value,
+        'gender': grammeme.gender.value
+            if grammeme.gender is not None else None,
+    }
+
+
+#########################################
+def get_wordform_content_object(
+    row: WordformRow,
+) -> dict[str, Any]:
+    '''
+    Get the JSON object of the content of a wordform row.
+        Every object has all the fields of the schema apart from the ID, with null for missing
+        values.
+
+    :param row: The wordform row.
+    :return: The JSON serialisable object.
+    '''
+    return {
+        'lexeme_id': row.lexeme_id.oid,
+        'surface_form': row.surface_form,
+        'alternatives': row.alternatives,
+        'gloss': row.gloss,
+        'sources': row.sources,
+        'gender': row.gender.value
+            if row.gender is not None else None,
+        'number': row.number.value
+            if row.number is not None else None,
+        'plural_form': row.plural_form,
+        'subject': _get_grammeme_json_object(row.subject),
+        'dir_obj': _get_grammeme_json_object(row.dir_obj),
+        'ind_obj': _get_grammeme_json_object(row.ind_obj),
+        'possessor': _get_grammeme_json_object(row.possessor),
+        'form': row.form.value
+            if row.form is not None else None,
+        'aspect': row.aspect.value
+            if row.aspect is not None else None,
+        'polarity': row.polarity.value
+            if row.polarity is not None else None,
+        'stem': row.stem,
+        'phonetic': row.phonetic,
+        'pattern': row.pattern,
+        'hypothetical': row.hypothetical,
+        'archaic': row.archaic,
+        'generated': row.generated,
+        'pending': row.pending,
+    }
+
+
+#########################################
+def get_wordform_content_key(
+    row: WordformRow,
+) -> bytes:
+    '''
+    Get a key of the content of a wordform, which is the same for wordforms that have the same
+    lexeme and the same values in all of their fields except for their ID.
+
+    :param row: The wordform row.
+    :return: The key.
+    '''
+    return _ENCODE(get_wordform_content_object(row)).encode('utf-8')
@@ -0,0 +1,104 @@
+'''
+Sort keys for ordering the wordforms collection before it is exported.
+
+Keys are taken from the raw JSON documents, which the row fixers do not change for these fields,
+so that a line only needs to be decoded to get its key.
+Lines without a valid value for the field are placed after all the others.
+Strings are ordered by Unicode code point, which is the same as the order of their UTF-8 bytes.
+'''
+
+import json
+from typing import Any, Callable
+from gabra_converter.converters.external_sort import UnknownOrderException
+
+
+__all__ = [
+    'WORDFORM_ORDERS',
+    'get_wordform_order_key',
+]
+
+
+WORDFORM_ORDERS = ['surface_form', 'new_lexeme_id', '_id']
+
+_MISSING_KEY = (1,)
+
+
+#########################################
+def _get_surface_form_key(
+    json_line: bytes,
+) -> tuple[Any, ...]:
+    '''
+    Get the key of a line for ordering by surface form.
+
+    :param json_line: A UTF-8 encoded line from the extracted wordforms collection.
+    :return: The sort key.
+    '''
+    try:
+        surface_form = json.loads(json_line.decode('utf-8')).get('surface_form')
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError, AttributeError):
+        return _MISSING_KEY
+    if not isinstance(surface_form, str):
+        return _MISSING_KEY
+    return (0, surface_form)
+
+
+#########################################
+def _get_oid_key(
+    json_line: bytes,
+    field: str,
+) -> tuple[Any, ...]:
+    '''
+    Get the key of a line for ordering by a Ġabra ID field.
+
+    :param json_line: A UTF-8 encoded line from the extracted wordforms collection.
+    :param field: The name of the ID field, such as '_id'.
+    :return: The sort key, with the ID as a string.
+    '''
+    try:
+        oid = json.loads(json_line.decode('utf-8'))[field]['$oid']
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+        return _MISSING_KEY
+    if not isinstance(oid, str):
+        return _MISSING_KEY
+    return (0, oid)
+
+
+#########################################
+def get_wordform_order_key(
+    order_by: str,
+    lexemes_id_map: dict[str, int],
+) -> Callable[[bytes], tuple[Any, ...]]:
+    '''
+    Get the function that gives the sort key of a wordform line for a given order.
+
+    :param order_by: The order, one of ``WORDFORM_ORDERS``.
+        'surface_form' orders the wordforms by their surface form, 'new_lexeme_id' groups them
+        by lexeme in the order of the exported lexemes, and '_id' orders them by their Ġabra
+        ID, which is roughly the order in which they were added to Ġabra.
+    :param lexemes_id_map: A dictionary mapping lexeme Ġabra IDs to integer IDs, as returned
+        by the lexeme exporter, which is needed for ordering by 'new_lexeme_id'.
+        Wordforms whose lexeme is not in it are placed after all the others.
+    :return: The key function, to be used with ``sort_jsonl_file``.
+    '''
+    if order_by == 'surface_form':
+        return _get_surface_form_key
+    if order_by == '_id':
+        return lambda json_line: _get_oid_key(json_line, '_id')
+    if order_by == 'new_lexeme_id':
+        #########################################
+        def get_new_lexeme_id_key(
+            json_line: bytes,
+        ) -> tuple[Any, ...]:
+            '''
+            Get the key of a line for ordering by the integer ID of its lexeme.
+
+            :param json_line: A UTF-8 encoded line from the extracted wordforms collection.
+            :return: The sort key.
+            '''
+            key = _get_oid_key(json_line, 'lexeme_id')
+            if key == _MISSING_KEY or key[1] not in lexemes_id_map:
+                return _MISSING_KEY
+            return (0, lexemes_id_map[key[1]])
+
+        return get_new_lexeme_id_key
+    raise UnknownOrderException(f'Wordforms cannot be ordered by {order_by}.')
@@ -0,0 +1,301 @@
+'''
+Report the lexemes and wordforms that were added, removed, or modified between two Ġabra
+databases or two conversions of them.
+
+Rows are matched by their Ġabra ID rather than by the integer IDs given by the exporters, which
+change whenever a row is added or removed before them.
+Both sides of each collection are first normalised into the JSON objects of the jsonl exporters
+(without the integer IDs) and sorted by Ġabra ID on disk with ``sort_jsonl_file``, after which
+they are compared in a single streaming merge join, so memory usage does not grow with the size
+of the databases.
+'''
+
+import os
+import csv
+import json
+import tempfile
+from typing import Any, Iterable, Iterator, Optional
+from gabra_converter.converters.external_sort import DEFAULT_MAX_RUN_SIZE, sort_jsonl_file
+from gabra_converter.converters.jsonl_reader import READ_BUFFER_SIZE, read_jsonl_lines
+from gabra_converter.converters.lexemes.exporters.jsonl_lexeme_exporter import (
+    get_lexeme_json_object
+)
+from gabra_converter.converters.wordforms.exporters.jsonl_wordform_exporter import (
+    get_wordform_json_object
+)
+from gabra_converter.row_iterators import iter_lexemes, iter_wordforms
+
+
+__all__ = [
+    'DIFF_REPORT_COLUMNS',
+    'iter_lexeme_objects',
+    'iter_wordform_objects',
+    'diff_sorted_objects',
+    'get_changed_fields',
+    'write_diff_report',
+]
+
+
+DIFF_REPORT_COLUMNS = ['collection', 'change', '_id', 'field', 'old_value', 'new_value']
+
+# The fields given by the exporters which depend on the position of a row rather than its content.
+_POSITIONAL_FIELDS = ['new_id', 'new_lexeme_id']
+
+_ID_PREFIX = '{"_id":'
+
+_ENCODE = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(',', ':')
+).encode
+_DECODE_PREFIX = json.JSONDecoder().raw_decode
+
+
+#########################################
+def _read_conversion_objects(
+    source_path: str,
+) -> Iterator[dict[str, Any]]:
+    '''
+    Read the JSON objects of a file written by a jsonl exporter without the positional fields.
+
+    :param source_path: The path to the lexemes.ndjson or wordforms.ndjson file.
+    :return: An iterator of JSON objects.
+    '''
+    for line in read_jsonl_lines(source_path):
+        obj: dict[str, Any] = json.loads(line.decode('utf-8'))
+        for field in _POSITIONAL_FIELDS:
+            obj.pop(field, None)
+        yield obj
+
+
+#########################################
+def iter_lexeme_objects(
+    source_path: str,
+) -> Iterator[dict[str, Any]]:
+    '''
+    Iterate over the lexemes of a database or of a conversion as normalised JSON objects.
+
+    :param source_path: The path to a lexemes.ndjson file written by the jsonl exporter or else
+        to the database dump or to a lexemes BSON or JSON lines file (see
+        ``read_collection_lines``), whose lexemes are fixed and validated without any cleaners.
+    :return: An iterator of the JSON objects of the jsonl exporter (see
+        ``get_lexeme_json_object``) without the 'new_id' field.
+    '''
+    if source_path.endswith('.ndjson'):
+        yield from _read_conversion_objects(source_path)
+        return
+    for row in iter_lexemes(source_path):
+        obj = get_lexeme_json_object(0, row)
+        for field in _POSITIONAL_FIELDS:
+            obj.pop(field, None)
+        yield obj
+
+
+#########################################
+def iter_wordform_objects(
+    source_path: str,
+) -> Iterator[dict[str, Any]]:
+    '''
+    Iterate over the wordforms of a database or of a conversion as normalised JSON objects.
+
+    :param source_path: The path to a wordforms.ndjson file written by the jsonl exporter or
+        else to the database dump or to a wordforms BSON or JSON lines file (see
+        ``read_collection_lines``), whose wordforms are fixed and validated without any
+        cleaners.
+    :return: An iterator of the JSON objects of the jsonl exporter (see
+        ``get_wordform_json_object``) without the 'new_id' and 'new_lexeme_id' fields.
+    '''
+    if source_path.endswith('.ndjson'):
+        yield from _read_conversion_objects(source_path)
+        return
+    for row in iter_wordforms(source_path):
+        obj = get_wordform_json_object(0, row, {})
+        for field in _POSITIONAL_FIELDS:
+            obj.pop(field, None)
+        yield obj
+
+
+#########################################
+def _get_id_key(
+    line: bytes,
+) -> str:
+    '''
+    Get the Ġabra ID of a line written by ``_write_sorted_objects``, which starts with it, without
+    decoding the rest of the line.
+
+    :param line: The line.
+    :return: The ID.
+    '''
+    oid: str = _DECODE_PREFIX(line.decode('utf-8'), len(_ID_PREFIX))[0]
+    return oid
+
+
+#########################################
+def _write_sorted_objects(
+    objects: Iterable[dict[str, Any]],
+    out_file_path: str,
+    tmp_dir_path: str,
+    max_run_size: int,
+) -> None:
+    '''
+    Write JSON objects to a JSON lines file sorted by Ġabra ID.
+        Objects with the same ID are kept in their original order.
+
+    :param objects: The JSON objects, each with an '_id' field.
+    :param out_file_path: The path to the JSON lines file to write.
+    :param tmp_dir_path: The path to a folder in which to sort the file.
+    :param max_run_size: The maximum size in bytes of the lines sorted in memory at once (see
+        ``sort_jsonl_file``).
+    '''
+    with open(out_file_path, 'wb', buffering=READ_BUFFER_SIZE) as f:
+        for obj in objects:
+            # The ID is put first so that the sort key can be read from the start of the line.
+            f.write(_ENCODE({'_id': obj['_id'], **obj}).encode('utf-8'))
+            f.write(b'\n')
+    sort_jsonl_file(out_file_path, out_file_path, _get_id_key, tmp_dir_path, max_run_size)
+
+
+#########################################
+def _read_sorted_objects(
+    in_file_path: str,
+) -> Iterator[dict[str, Any]]:
+    '''
+    Read the JSON objects written by ``_write_sorted_objects``.
+
+    :param in_file_path: The path to the JSON lines file.
+    :return: An iterator of JSON objects in the order of their IDs.
+    '''
+    for line in read_jsonl_lines(in_file_path):
+        obj: dict[str, Any] = json.loads(line.decode('utf-8'))
+        yield obj
+
+
+#########################################
+def get_changed_fields(
+    old_object: dict[str, Any],
+    new_object: dict[str, Any],
+) -> list[str]:
+    '''
+    Get the fields whose values differ between two versions of a JSON object.
+
+    :param old_object: The old version.
+    :param new_object: The new version.
+    :return: The names of the changed fields, including those missing from either version, in
+        the order of the new version followed by those only in the old version.
+    '''
+    fields = list(new_object) + [field for field in old_object if field not in new_object]
+    return [field for field in fields if old_object.get(field) != new_object.get(field)]
+
+
+#########################################
+def diff_sorted_objects(
+    old_objects: Iterable[dict[str, Any]],
+    new_objects: Iterable[dict[str, Any]],
+) -> Iterator[tuple[str, str, Optional[dict[str, Any]], Optional[dict[str, Any]]]]:
+    '''
+    Compare two sequences of JSON objects sorted by Ġabra ID in a merge join.
+        Objects with the same ID are matched in order, so an ID repeated more times in one
+        sequence than in the other is reported as added or removed for the extra objects.
+
+    :param old_objects: The old objects, sorted by their '_id' field.
+    :param new_objects: The new objects, sorted by their '_id' field.
+    :return: An iterator of the differences, each being a tuple with the type of change
+        ('added', 'removed', or 'modified'), the ID, the old object (None if added), and the
+        new object (None if removed), in the order of the IDs.
+    '''
+    old_iter = iter(old_objects)
+    new_iter = iter(new_objects)
+    old_object = next(old_iter, None)
+    new_object = next(new_iter, None)
+    while old_object is not None and new_object is not None:
+        if old_object['_id'] < new_object['_id']:
+            yield ('removed', old_object['_id'], old_object, None)
+            old_object = next(old_iter, None)
+        elif new_object['_id'] < old_object['_id']:
+            yield ('added', new_object['_id'], None, new_object)
+            new_object = next(new_iter, None)
+        else:
+            if old_object != new_object:
+                yield ('modified', new_object['_id'], old_object, new_object)
+            old_object = next(old_iter, None)
+            new_object = next(new_iter, None)
+    while old_object is not None:
+        yield ('removed', old_object['_id'], old_object, None)
+        old_object = next(old_iter, None)
+    while new_object is not None:
+        yield ('added', new_object['_id'], None, new_object)
+        new_object = next(new_iter, None)
+
+
+#########################################
+def write_diff_report(
+    old_lexemes_path: str,
+    new_lexemes_path: str,
+    old_wordforms_path: str,
+    new_wordforms_path: str,
+    report_path: str,
+    tmp_dir_path: Optional[str] = None,
+    max_run_size: int = DEFAULT_MAX_RUN_SIZE,
+) -> dict[str, dict[str, int]]:
+    '''
+    Write a CSV report of the differences between two databases or conversions.
+
+    :param old_lexemes_path: The path to the old lexemes (see ``iter_lexeme_objects``).
+    :param new_lexemes_path: The path to the new lexemes (see ``iter_lexeme_objects``).
+    :param old_wordforms_path: The path to the old wordforms (see ``iter_wordform_objects``).
+    :param new_wordforms_path: The path to the new wordforms (see ``iter_wordform_objects``).
+    :param report_path: The path to the CSV file to write, with the columns in
+        ``DIFF_REPORT_COLUMNS``.
+        Added and removed rows take a single line without a field and modified rows take a line
+        for every changed field, with the old and new values in JSON.
+    :param tmp_dir_path: The path to a folder in which to sort the rows or None to use the
+        default temporary folder.
+    :param max_run_size: The maximum size in bytes of the rows sorted in memory at once (see
+        ``sort_jsonl_file``).
+    :return: The number of added, removed, and modified rows of each collection, as a
+        dictionary keyed by 'lexemes' and 'wordforms' of dictionaries keyed by 'added',
+        'removed', and 'modified'.
+    '''
+    counts: dict[str, dict[str, int]] = {}
+    with tempfile.TemporaryDirectory(dir=tmp_dir_path) as sorted_path:
+        with open(report_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(DIFF_REPORT_COLUMNS)
+            for (collection, old_objects, new_objects) in [
+                (
+                    'lexemes',
+                    iter_lexeme_objects(old_lexemes_path),
+                    iter_lexeme_objects(new_lexemes_path),
+                ),
+                (
+                    'wordforms',
+                    iter_wordform_objects(old_wordforms_path),
+                    iter_wordform_objects(new_wordforms_path),
+                ),
+            ]:
+                old_sorted_path = os.path.join(sorted_path, f'old_{collection}.jsonl')
+                new_sorted_path = os.path.join(sorted_path, f'new_{collection}.jsonl')
+                _write_sorted_objects(old_objects, old_sorted_path, sorted_path, max_run_size)
+                _write_sorted_objects(new_objects, new_sorted_path, sorted_path, max_run_size)
+
+                collection_counts = {'added': 0, 'removed': 0, 'modified': 0}
+                for (change, oid, old_object, new_object) in diff_sorted_objects(
+                    _read_sorted_objects(old_sorted_path),
+                    _read_sorted_objects(new_sorted_path),
+                ):
+                    collection_counts[change] += 1
+                    if old_object is None or new_object is None:
+                        writer.writerow([collection, change, oid, '', '', ''])
+                        continue
+                    for field in get_changed_fields(old_object, new_object):
+                        writer.writerow([
+                            collection,
+                            change,
+                            oid,
+                            field,
+                            json.dumps(old_object.get(field), ensure_ascii=False),
+                            json.dumps(new_object.get(field), ensure_ascii=False),
+                        ])
+                counts[collection] = collection_counts
+
+                os.remove(old_sorted_path)
+                os.remove(new_sorted_path)
+    return counts
@@ -0,0 +1,230 @@
+'''
+Check how many rows of the extracted collections would be exported or skipped, and why, without
+exporting anything.
+
+Rows are fixed, validated, and cleaned exactly as in an export but only counted (see
+``LexemePipelineListenerCounts`` and ``WordformPipelineListenerCounts``).
+The JSON lines files are split into parts at line boundaries which are checked in parallel by a
+pool of processes, one per core by default, so the check is limited by the number of cores
+rather than by a single core.
+Cleaners that keep state between rows (those that override ``reset``, such as the duplicate
+cleaners) need to see all the rows in order, so a collection with such a cleaner is checked in a
+single process.
+'''
+
+import os
+import multiprocessing
+from typing import Any, Optional
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines_in_range, split_jsonl_file
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_counts \
+    import LexemePipelineListenerCounts
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_counts \
+    import WordformPipelineListenerCounts
+
+
+__all__ = [
+    'DEFAULT_MIN_PART_SIZE',
+    'dry_run_lexemes',
+    'dry_run_wordforms',
+]
+
+
+DEFAULT_MIN_PART_SIZE = 4*1024*1024
+
+# Every process checks several parts so that processes that finish early can take more.
+_PARTS_PER_PROCESS = 4
+
+# The cleaners and lexemes ID map of a worker process, which are sent once per process rather
+# than once per part.
+_worker_state: dict[str, Any] = {}
+
+
+#########################################
+def _init_worker(
+    cleaners: list[Any],
+    lexemes_id_map: dict[str, int],
+) -> None:
+    '''
+    Initialise a worker process.
+
+    :param cleaners: The cleaners to apply.
+    :param lexemes_id_map: The lexemes ID map for checking wordforms (empty for lexemes).
+    '''
+    _worker_state['cleaners'] = cleaners
+    _worker_state['lexemes_id_map'] = lexemes_id_map
+
+
+#########################################
+def _add_counts(
+    total_counts: dict[str, Any],
+    counts: dict[str, Any],
+) -> None:
+    '''
+    Add the counts of a part to the total counts.
+
+    :param total_counts: The total counts, which are updated.
+    :param counts: The counts returned by a counts listener.
+    '''
+    for (key, value) in counts.items():
+        if key == 'num_skipped_by_cleaner':
+            skipped = total_counts.setdefault(key, {})
+            for (cleaner_id, count) in value.items():
+                skipped[cleaner_id] = skipped.get(cleaner_id, 0) + count
+        else:
+            total_counts[key] = total_counts.get(key, 0) + value
+
+
+#########################################
+def _check_lexemes_part(
+    part: tuple[str, int, int],
+) -> tuple[dict[str, Any], list[str]]:
+    '''
+    Check a part of the lexemes file using the worker's cleaners.
+
+    :param part: A tuple with the path to the file and the start and end offsets of the part.
+    :return: A tuple with the counts and the IDs of the lexemes that would be exported, in order.
+    '''
+    (in_file_path, start_offset, end_offset) = part
+    exporter = NullLexemeExporter()
+    counts_listener = LexemePipelineListenerCounts()
+    lexeme_pipeline = LexemePipeline(_worker_state['cleaners'], exporter)
+    lexeme_pipeline.add_listener(counts_listener)
+    lexeme_pipeline.create('')
+    for json_line in read_jsonl_lines_in_range(in_file_path, start_offset, end_offset):
+        lexeme_pipeline.add_row(json_line)
+    return (counts_listener.get_counts(), list(exporter.id_map))
+
+
+#########################################
+def _check_wordforms_part(
+    part: tuple[str, int, int],
+) -> dict[str, Any]:
+    '''
+    Check a part of the wordforms file using the worker's cleaners and lexemes ID map.
+
+    :param part: A tuple with the path to the file and the start and end offsets of the part.
+    :return: The counts.
+    '''
+    (in_file_path, start_offset, end_offset) = part
+    counts_listener = WordformPipelineListenerCounts()
+    wordform_pipeline = WordformPipeline(_worker_state['cleaners'], NullWordformExporter())
+    wordform_pipeline.add_listener(counts_listener)
+    wordform_pipeline.create('')
+    lexemes_id_map = _worker_state['lexemes_id_map']
+    for json_line in read_jsonl_lines_in_range(in_file_path, start_offset, end_offset):
+        wordform_pipeline.add_row(json_line, lexemes_id_map)
+    return counts_listener.get_counts()
+
+
+#########################################
+def _get_parts(
+    in_file_path: str,
+    num_processes: int,
+    min_part_size: int,
+) -> list[tuple[str, int, int]]:
+    '''
+    Split a file into the parts to check.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param num_processes: The number of processes, which is 1 to check the file as a whole.
+    :param min_part_size: The minimum size in bytes of a part.
+    :return: A list of tuples with the path to the file and the start and end offsets of a part.
+    '''
+    return [
+        (in_file_path, start_offset, end_offset)
+        for (start_offset, end_offset) in split_jsonl_file(
+            in_file_path,
+            num_processes*_PARTS_PER_PROCESS if num_processes > 1 else 1,
+            min_part_size,
+        )
+    ]
+
+
+#########################################
+def dry_run_lexemes(
+    in_file_path: str,
+    cleaners: list[LexemeCleaner],
+    num_processes: Optional[int] = None,
+    min_part_size: int = DEFAULT_MIN_PART_SIZE,
+) -> tuple[dict[str, Any], dict[str, int]]:
+    '''
+    Count the lexemes that would be exported and skipped from an extracted lexemes file.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param cleaners: The cleaners to apply.
+    :param num_processes: The number of processes to use or None to use one per core.
+    :param min_part_size: The minimum size in bytes of a part of the file checked by a process,
+        so that small files are checked in fewer processes.
+    :return: A tuple with the counts (see ``LexemePipelineListenerCounts.get_counts``) and the
+        lexemes ID map that the exporters would have, for checking the wordforms.
+    '''
+    if num_processes is None:
+        num_processes = os.cpu_count() or 1
+    if any(type(cleaner).reset is not LexemeCleaner.reset for cleaner in cleaners):
+        num_processes = 1
+    parts = _get_parts(in_file_path, num_processes, min_part_size)
+
+    total_counts: dict[str, Any] = LexemePipelineListenerCounts().get_counts()
+    id_map: dict[str, int] = {}
+    if len(parts) <= 1:
+        _init_worker(cleaners, {})
+        results = [_check_lexemes_part(part) for part in parts]
+        _worker_state.clear()
+    else:
+        with multiprocessing.Pool(
+            min(num_processes, len(parts)), _init_worker, (cleaners, {}),
+        ) as pool:
+            results = pool.map(_check_lexemes_part, parts)
+    for (counts, exported_ids) in results:
+        _add_counts(total_counts, counts)
+        for oid in exported_ids:
+            id_map[oid] = len(id_map) + 1
+    return (total_counts, id_map)
+
+
+#########################################
+def dry_run_wordforms(
+    in_file_path: str,
+    cleaners: list[WordformCleaner],
+    lexemes_id_map: dict[str, int],
+    num_processes: Optional[int] = None,
+    min_part_size: int = DEFAULT_MIN_PART_SIZE,
+) -> dict[str, Any]:
+    '''
+    Count the wordforms that would be exported and skipped from an extracted wordforms file.
+
+    :param in_file_path: The path to the JSON lines file.
+    :param cleaners: The cleaners to apply.
+    :param lexemes_id_map: The lexemes ID map returned by ``dry_run_lexemes``.
+    :param num_processes: The number of processes to use or None to use one per core.
+    :param min_part_size: The minimum size in bytes of a part of the file checked by a process,
+        so that small files are checked in fewer processes.
+    :return: The counts (see ``WordformPipelineListenerCounts.get_counts``).
+    '''
+    if num_processes is None:
+        num_processes = os.cpu_count() or 1
+    if any(type(cleaner).reset is not WordformCleaner.reset for cleaner in cleaners):
+        num_processes = 1
+    parts = _get_parts(in_file_path, num_processes, min_part_size)
+
+    total_counts: dict[str, Any] = WordformPipelineListenerCounts().get_counts()
+    if len(parts) <= 1:
+        _init_worker(cleaners, lexemes_id_map)
+        results = [_check_wordforms_part(part) for part in parts]
+        _worker_state.clear()
+    else:
+        with multiprocessing.Pool(
+            min(num_processes, len(parts)), _init_worker, (cleaners, lexemes_id_map),
+        ) as pool:
+            results = pool.map(_check_wordforms_part, parts)
+    for counts in results:
+        _add_counts(total_counts, counts)
+    return total_counts
@@ -0,0 +1,121 @@
+'''
+Report the repeated lexeme IDs, wordform IDs, and duplicated wordforms in a Ġabra database.
+
+Duplicates are found in two passes over the rows, where the first pass only collects the keys
+that a Bloom filter suspects to be repeated and the second pass finds the occurrences of only
+those keys, so memory usage does not grow with the size of the database.
+The rows are read using ``row_iterators`` without any cleaners, so each pass reads the whole
+database again.
+'''
+
+import csv
+from gabra_converter.converters.duplicate_detection import find_duplicates, get_id_key
+from gabra_converter.converters.wordforms.row.wordform_row_content import (
+    get_wordform_content_key
+)
+from gabra_converter.row_iterators import iter_lexemes, iter_wordforms
+
+
+__all__ = [
+    'DUPLICATES_REPORT_COLUMNS',
+    'find_duplicate_lexeme_ids',
+    'find_duplicate_wordform_ids',
+    'find_duplicate_wordforms',
+    'write_duplicates_report',
+]
+
+
+DUPLICATES_REPORT_COLUMNS = ['collection', 'duplicate_type', 'num_occurrences', '_ids']
+
+
+#########################################
+def find_duplicate_lexeme_ids(
+    source_path: str,
+    expected_count: int = 100000,
+) -> list[list[str]]:
+    '''
+    Find the Ġabra IDs that are used by more than one lexeme.
+
+    :param source_path: The path to the database dump or to a lexemes BSON or JSON lines file
+        (see ``read_collection_lines``).
+    :param expected_count: The number of lexemes expected (see ``find_duplicates``).
+    :return: A list with the IDs of every occurrence of each repeated ID.
+    '''
+    return find_duplicates(
+        lambda: ((get_id_key(row.id_.oid), row.id_.oid) for row in iter_lexemes(source_path)),
+        expected_count,
+    )
+
+
+#########################################
+def find_duplicate_wordform_ids(
+    source_path: str,
+    expected_count: int = 10000000,
+) -> list[list[str]]:
+    '''
+    Find the Ġabra IDs that are used by more than one wordform.
+
+    :param source_path: The path to the database dump or to a wordforms BSON or JSON lines file
+        (see ``read_collection_lines``).
+    :param expected_count: The number of wordforms expected (see ``find_duplicates``).
+    :return: A list with the IDs of every occurrence of each repeated ID.
+    '''
+    return find_duplicates(
+        lambda: ((get_id_key(row.id_.oid), row.id_.oid) for row in iter_wordforms(source_path)),
+        expected_count,
+    )
+
+
+#########################################
+def find_duplicate_wordforms(
+    source_path: str,
+    expected_count: int = 10000000,
+) -> list[list[str]]:
+    '''
+    Find the wordforms that are identical to another wordform of the same lexeme apart from
+    their ID (see ``get_wordform_content_key``).
+
+    :param source_path: The path to the database dump or to a wordforms BSON or JSON lines file
+        (see ``read_collection_lines``).
+    :param expected_count: The number of wordforms expected (see ``find_duplicates``).
+    :return: A list with the IDs of the wordforms in each group of identical wordforms.
+    '''
+    return find_duplicates(
+        lambda: (
+            (get_wordform_content_key(row), row.id_.oid) for row in iter_wordforms(source_path)
+        ),
+        expected_count,
+    )
+
+
+#########################################
+def write_duplicates_report(
+    lexemes_source_path: str,
+    wordforms_source_path: str,
+    report_path: str,
+) -> int:
+    '''
+    Write a CSV report of all the duplicates in a database, with a row for every repeated
+    lexeme ID, repeated wordform ID, and group of identical wordforms.
+
+    :param lexemes_source_path: The path to the database dump or to a lexemes BSON or JSON lines
+        file (see ``read_collection_lines``).
+    :param wordforms_source_path: The path to the database dump or to a wordforms BSON or JSON
+        lines file (see ``read_collection_lines``).
+    :param report_path: The path to the CSV file to write, with the columns in
+        ``DUPLICATES_REPORT_COLUMNS`` and the IDs separated by spaces.
+    :return: The number of duplicates found.
+    '''
+    num_duplicates = 0
+    with open(report_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(DUPLICATES_REPORT_COLUMNS)
+        for (collection, duplicate_type, duplicates) in [
+            ('lexemes', 'id', find_duplicate_lexeme_ids(lexemes_source_path)),
+            ('wordforms', 'id', find_duplicate_wordform_ids(wordforms_source_path)),
+            ('wordforms', 'content', find_duplicate_wordforms(wordforms_source_path)),
+        ]:
+            for ids in duplicates:
+                writer.writerow([collection, duplicate_type, str(len(ids)), ' '.join(ids)])
+                num_duplicates += 1
+    return num_duplicates
@@ -3,27 +3,49 @@ A pipeline that completely processes a Ġabra database dump and exports it from
 '''
 
 import os
+import json
 import tempfile
 from abc import ABC
+from typing import Optional
 from gabra_converter.converters.archive_extractor import extract_archived_files, convert_bson_file
+from gabra_converter.converters.checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    save_checkpoint,
+    load_checkpoint,
+    remove_checkpoint,
+    get_file_sizes,
+)
+from gabra_converter.converters.external_sort import sort_jsonl_file
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
 from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
 from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.row.lexeme_row_order import get_lexeme_order_key
 from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener \
     import LexemePipelineListener
 from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
 from gabra_converter.converters.wordforms.exporters.wordform_exporter import WordformExporter
 from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.row.wordform_row_order import get_wordform_order_key
+from gabra_converter.converters.sampling import (
+    RowSampler,
+    sample_lexemes_file,
+    sample_wordforms_file,
+)
+from gabra_converter.dry_run import dry_run_lexemes, dry_run_wordforms
 from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener \
     import WordformPipelineListener
 
 
 __all__ = [
+    'DRY_RUN_REPORT_FNAME',
     'PipelineListener',
     'pipeline',
 ]
 
 
+DRY_RUN_REPORT_FNAME = 'dry_run_report.json'
+
+
 #########################################
 class PipelineListener(ABC):
     '''
@@ -37,8 +59,18 @@ class PipelineListener(ABC):
     - ended_converting_lexemes
     - started_converting_wordforms
     - ended_converting_wordforms
+    - started_sampling (only if sampling)
+    - ended_sampling (only if sampling)
+    - started_sorting_lexemes (only if the lexemes are ordered)
+    - ended_sorting_lexemes (only if the lexemes are ordered)
+    - started_checking_lexemes (only in a dry run)
+    - ended_checking_lexemes (only in a dry run)
+    - started_checking_wordforms (only in a dry run)
+    - ended_checking_wordforms (only in a dry run)
     - started_exporting_lexemes
     - ended_exporting_lexemes
+    - started_sorting_wordforms (only if the wordforms are ordered)
+    - ended_sorting_wordforms (only if the wordforms are ordered)
     - started_exporting_wordforms
     - ended_exporting_wordforms
 
@@ -101,6 +133,70 @@ class PipelineListener(ABC):
         Listen for when the wordforms BSON file stopped being converted into a JSONL file.
         '''
 
+    #########################################
+    def started_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files started being sampled.
+        '''
+
+    #########################################
+    def ended_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files stopped being sampled.
+        '''
+
+    #########################################
+    def started_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being sorted into the export order.
+        '''
+
+    #########################################
+    def ended_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being sorted into the export order.
+        '''
+
+    #########################################
+    def started_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being checked in a dry run.
+        '''
+
+    #########################################
+    def ended_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being checked in a dry run.
+        '''
+
+    #########################################
+    def started_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being checked in a dry run.
+        '''
+
+    #########################################
+    def ended_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being checked in a dry run.
+        '''
+
     #########################################
     def started_exporting_lexemes(
         self,
@@ -117,6 +213,22 @@ class PipelineListener(ABC):
         Listen for when the lexemes JSONL file stopped being exported into the target format.
         '''
 
+    #########################################
+    def started_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being sorted into the export order.
+        '''
+
+    #########################################
+    def ended_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being sorted into the export order.
+        '''
+
     #########################################
     def started_exporting_wordforms(
         self,
@@ -145,6 +257,15 @@ def pipeline(
     lexeme_pipeline_listeners: list[LexemePipelineListener],
     wordform_pipeline_listeners: list[WordformPipelineListener],
     pipeline_listeners: list[PipelineListener],
+    index_jsonl: bool = False,
+    checkpoint_interval: Optional[int] = None,
+    resume: bool = False,
+    lexeme_order_by: Optional[str] = None,
+    wordform_order_by: Optional[str] = None,
+    dry_run: bool = False,
+    num_processes: Optional[int] = None,
+    sample_fraction: Optional[float] = None,
+    sample_seed: str = '',
 ) -> None:
     '''
     Export the data in a Ġabra dump file from start to finish.
@@ -159,51 +280,218 @@ def pipeline(
     :param lexeme_pipeline_listeners: A list of listeners for each lexeme exported.
     :param wordform_pipeline_listeners: A list of listeners for each wordform exported.
     :param pipeline_listeners: A list of listeners for the different high level pipeline stages.
+    :param index_jsonl: Whether to keep the extracted lexemes and wordforms JSON lines files in
+        ``out_path`` together with a line offset index for each one (see ``JSONLIndexReader``)
+        so that individual documents can be looked up and reprocessed later.
+    :param checkpoint_interval: The number of rows to export between checkpoints or None to not
+        save checkpoints.
+        Whilst checkpointing, the extracted JSON lines files and the checkpoint files are kept in
+        ``out_path`` and then deleted once the export is finished (unless ``index_jsonl`` is
+        true, in which case the JSON lines files are kept).
+    :param resume: Whether to resume a previous checkpointed export in ``out_path`` that did not
+        finish.
+        Extraction is skipped if it had finished and each collection's export continues from its
+        last checkpoint, with the output files being truncated to their checkpointed sizes.
+        The final output is identical to that of an export that was never interrupted, as the
+        cleaners that remember previous rows, such as the duplicate cleaners, save them with
+        every checkpoint (see ``LexemeCleaner.get_checkpoint``).
+        Implies checkpointing, using the default interval if ``checkpoint_interval`` is None.
+    :param lexeme_order_by: The order to export the lexemes in (see ``get_lexeme_order_key``) or
+        None to export them in the order of the dump.
+        The extracted lexemes are sorted with an external merge sort before being exported, so
+        the exported integer IDs follow the same order.
+    :param wordform_order_by: The order to export the wordforms in (see
+        ``get_wordform_order_key``) or None to export them in the order of the dump.
+        The extracted wordforms are sorted in the same way once the lexemes are exported.
+    :param dry_run: Whether to only count the rows that would be exported and skipped, by
+        reason, instead of exporting them (see ``dry_run_lexemes``), saving the counts in a
+        JSON file called ``DRY_RUN_REPORT_FNAME`` in ``out_path``.
+        The exporters and the lexeme and wordform pipeline listeners are not used and
+        ``index_jsonl``, ``checkpoint_interval``, ``resume``, and the orders are ignored.
+    :param num_processes: The number of processes to check the rows with in a dry run or None to
+        use one per core.
+    :param sample_fraction: The fraction of lexemes to convert, together with their wordforms,
+        for a quick preview (see ``RowSampler``) or None to convert everything.
+        The sample is taken right after extraction, so a resumed export keeps the sample of the
+        export it resumes.
+    :param sample_seed: A string that selects a different sample of the same fraction.
     '''
+    if dry_run:
+        index_jsonl = False
+        checkpoint_interval = None
+        resume = False
+        lexeme_order_by = None
+        wordform_order_by = None
+    checkpointing = resume or checkpoint_interval is not None
+    if checkpoint_interval is None:
+        checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+    extraction_checkpoint_path = os.path.join(out_path, 'extraction_checkpoint.json')
+    lexemes_checkpoint_path = os.path.join(out_path, 'lexemes_checkpoint.json')
+    wordforms_checkpoint_path = os.path.join(out_path, 'wordforms_checkpoint.json')
+
     with tempfile.TemporaryDirectory() as tmp_path:
-        for listener in pipeline_listeners:
-            listener.started_extracting()
-        extract_archived_files(gabra_dump_path, tmp_path)
-        for listener in pipeline_listeners:
-            listener.ended_extracting()
+        jsonl_path = out_path if index_jsonl or checkpointing else tmp_path
+        lexemes_jsonl_path = os.path.join(jsonl_path, 'lexemes.jsonl')
+        wordforms_jsonl_path = os.path.join(jsonl_path, 'wordforms.jsonl')
+        os.makedirs(out_path, exist_ok=True)
 
-        for listener in pipeline_listeners:
-            listener.started_converting_lexemes()
-        convert_bson_file(
-            os.path.join(tmp_path, 'tmp', 'gabra', 'lexemes.bson'),
-            os.path.join(tmp_path, 'lexemes.jsonl'),
+        extracted = (
+            resume
+            and os.path.isfile(extraction_checkpoint_path)
+            and os.path.isfile(lexemes_jsonl_path)
+            and os.path.isfile(wordforms_jsonl_path)
+            and load_checkpoint(extraction_checkpoint_path) == get_file_sizes(
+                out_path, ['lexemes.jsonl', 'wordforms.jsonl']
+            )
         )
-        for listener in pipeline_listeners:
-            listener.ended_converting_lexemes()
+        if not extracted:
+            for listener in pipeline_listeners:
+                listener.started_extracting()
+            extract_archived_files(gabra_dump_path, tmp_path)
+            for listener in pipeline_listeners:
+                listener.ended_extracting()
 
-        for listener in pipeline_listeners:
-            listener.started_converting_wordforms()
-        convert_bson_file(
-            os.path.join(tmp_path, 'tmp', 'gabra', 'wordforms.bson'),
-            os.path.join(tmp_path, 'wordforms.jsonl'),
-        )
-        for listener in pipeline_listeners:
-            listener.ended_converting_wordforms()
+            for listener in pipeline_listeners:
+                listener.started_converting_lexemes()
+            convert_bson_file(
+                os.path.join(tmp_path, 'tmp', 'gabra', 'lexemes.bson'),
+                lexemes_jsonl_path,
+            )
+            for listener in pipeline_listeners:
+                listener.ended_converting_lexemes()
 
-        os.makedirs(out_path, exist_ok=True)
+            for listener in pipeline_listeners:
+                listener.started_converting_wordforms()
+            convert_bson_file(
+                os.path.join(tmp_path, 'tmp', 'gabra', 'wordforms.bson'),
+                wordforms_jsonl_path,
+            )
+            for listener in pipeline_listeners:
+                listener.ended_converting_wordforms()
+
+            if sample_fraction is not None:
+                for listener in pipeline_listeners:
+                    listener.started_sampling()
+                sampler = RowSampler(sample_fraction, sample_seed)
+                sample_lexemes_file(lexemes_jsonl_path, lexemes_jsonl_path, sampler)
+                sample_wordforms_file(wordforms_jsonl_path, wordforms_jsonl_path, sampler)
+                for listener in pipeline_listeners:
+                    listener.ended_sampling()
+
+            if lexeme_order_by is not None:
+                for listener in pipeline_listeners:
+                    listener.started_sorting_lexemes()
+                sort_jsonl_file(
+                    lexemes_jsonl_path,
+                    lexemes_jsonl_path,
+                    get_lexeme_order_key(lexeme_order_by),
+                    tmp_path,
+                )
+                for listener in pipeline_listeners:
+                    listener.ended_sorting_lexemes()
+
+            if checkpointing:
+                # Checkpoints of a previous extraction are not valid for the new one.
+                for path in [lexemes_checkpoint_path, wordforms_checkpoint_path]:
+                    if os.path.isfile(path):
+                        os.remove(path)
+                save_checkpoint(
+                    extraction_checkpoint_path,
+                    get_file_sizes(out_path, ['lexemes.jsonl', 'wordforms.jsonl']),
+                )
+
+        if dry_run:
+            for listener in pipeline_listeners:
+                listener.started_checking_lexemes()
+            (lexeme_counts, lexeme_ids) = dry_run_lexemes(
+                lexemes_jsonl_path, lexeme_cleaners, num_processes
+            )
+            for listener in pipeline_listeners:
+                listener.ended_checking_lexemes()
+
+            for listener in pipeline_listeners:
+                listener.started_checking_wordforms()
+            wordform_counts = dry_run_wordforms(
+                wordforms_jsonl_path, wordform_cleaners, lexeme_ids, num_processes
+            )
+            for listener in pipeline_listeners:
+                listener.ended_checking_wordforms()
+
+            with open(os.path.join(out_path, DRY_RUN_REPORT_FNAME), 'w', encoding='utf-8') as f:
+                json.dump({'lexemes': lexeme_counts, 'wordforms': wordform_counts}, f, indent=1)
+            return
 
         for listener in pipeline_listeners:
             listener.started_exporting_lexemes()
         lexeme_pipeline = LexemePipeline(lexeme_cleaners, lexeme_exporter)
         for lexeme_listener in lexeme_pipeline_listeners:
             lexeme_pipeline.add_listener(lexeme_listener)
-        lexeme_pipeline.create(out_path)
-        lexeme_pipeline.convert_file(os.path.join(tmp_path, 'lexemes.jsonl'))
+        if resume and os.path.isfile(lexemes_checkpoint_path):
+            lexeme_pipeline.resume(
+                out_path, load_checkpoint(lexemes_checkpoint_path), lexemes_checkpoint_path
+            )
+        else:
+            lexeme_pipeline.create(out_path)
+        lexeme_pipeline.convert_file(
+            lexemes_jsonl_path,
+            os.path.join(out_path, 'lexemes.jsonl.idx') if index_jsonl else None,
+            lexemes_checkpoint_path if checkpointing else None,
+            checkpoint_interval,
+        )
         lexeme_ids = lexeme_pipeline.get_id_map()
         for listener in pipeline_listeners:
             listener.ended_exporting_lexemes()
 
+        # Once the wordforms export starts, the wordforms are already sorted and sorting them
+        # again is avoided, although it would not change them as the sort is stable.
+        wordforms_started = resume and os.path.isfile(wordforms_checkpoint_path)
+        if wordform_order_by is not None and not wordforms_started:
+            for listener in pipeline_listeners:
+                listener.started_sorting_wordforms()
+            sort_jsonl_file(
+                wordforms_jsonl_path,
+                wordforms_jsonl_path,
+                get_wordform_order_key(wordform_order_by, lexeme_ids),
+                tmp_path,
+            )
+            if checkpointing:
+                save_checkpoint(
+                    extraction_checkpoint_path,
+                    get_file_sizes(out_path, ['lexemes.jsonl', 'wordforms.jsonl']),
+                )
+            for listener in pipeline_listeners:
+                listener.ended_sorting_wordforms()
+
         for listener in pipeline_listeners:
             listener.started_exporting_wordforms()
         wordform_pipeline = WordformPipeline(wordform_cleaners, wordform_exporter)
         for wordform_listener in wordform_pipeline_listeners:
             wordform_pipeline.add_listener(wordform_listener)
-        wordform_pipeline.create(out_path)
-        wordform_pipeline.convert_file(os.path.join(tmp_path, 'wordforms.jsonl'), lexeme_ids)
+        if wordforms_started:
+            wordform_pipeline.resume(
+                out_path, load_checkpoint(wordforms_checkpoint_path), wordforms_checkpoint_path
+            )
+        else:
+            wordform_pipeline.create(out_path)
+        wordform_pipeline.convert_file(
+            wordforms_jsonl_path,
+            lexeme_ids,
+            os.path.join(out_path, 'wordforms.jsonl.idx') if index_jsonl else None,
+            wordforms_checkpoint_path if checkpointing else None,
+            checkpoint_interval,
+        )
         for listener in pipeline_listeners:
             listener.ended_exporting_wordforms()
+
+        if checkpointing:
+            for path in [
+                extraction_checkpoint_path, lexemes_checkpoint_path, wordforms_checkpoint_path,
+            ]:
+                remove_checkpoint(path)
+            # The listeners' temporary files are only removed once the checkpoints that need
+            # them to resume are gone.
+            lexeme_pipeline.remove_tmp_files()
+            wordform_pipeline.remove_tmp_files()
+            if not index_jsonl:
+                os.remove(lexemes_jsonl_path)
+                os.remove(wordforms_jsonl_path)
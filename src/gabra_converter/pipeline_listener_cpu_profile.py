@@ -0,0 +1,211 @@
+'''
+Profile every stage of the pipeline separately.
+'''
+
+from gabra_converter.converters.cpu_profiler import CPUProfiler
+from gabra_converter.pipeline import PipelineListener
+
+__all__ = [
+    'PipelineListenerCPUProfile',
+]
+
+
+#########################################
+class PipelineListenerCPUProfile(PipelineListener):
+    '''
+    Start profiling a stage with a CPU profiler whenever it starts and save its profile whenever
+    it ends.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        profiler: CPUProfiler,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param profiler: The CPU profiler to profile the stages with.
+        '''
+        super().__init__()
+        self.profiler: CPUProfiler = profiler
+
+    #########################################
+    def started_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump started being extracted into BSON files.
+        '''
+        self.profiler.start_stage('extracting')
+
+    #########################################
+    def ended_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump stopped being extracted into BSON files.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_converting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes BSON file started being converted into a JSONL file.
+        '''
+        self.profiler.start_stage('converting_lexemes')
+
+    #########################################
+    def ended_converting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes BSON file stopped being converted into a JSONL file.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_converting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms BSON file started being converted into a JSONL file.
+        '''
+        self.profiler.start_stage('converting_wordforms')
+
+    #########################################
+    def ended_converting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms BSON file stopped being converted into a JSONL file.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files started being sampled.
+        '''
+        self.profiler.start_stage('sampling')
+
+    #########################################
+    def ended_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files stopped being sampled.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being sorted into the export order.
+        '''
+        self.profiler.start_stage('sorting_lexemes')
+
+    #########################################
+    def ended_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being sorted into the export order.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being checked in a dry run.
+        '''
+        self.profiler.start_stage('checking_lexemes')
+
+    #########################################
+    def ended_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being checked in a dry run.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being checked in a dry run.
+        '''
+        self.profiler.start_stage('checking_wordforms')
+
+    #########################################
+    def ended_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being checked in a dry run.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being exported into the target format.
+        '''
+        self.profiler.start_stage('exporting_lexemes')
+
+    #########################################
+    def ended_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being exported into the target format.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being sorted into the export order.
+        '''
+        self.profiler.start_stage('sorting_wordforms')
+
+    #########################################
+    def ended_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being sorted into the export order.
+        '''
+        self.profiler.end_stage()
+
+    #########################################
+    def started_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being exported into the target format.
+        '''
+        self.profiler.start_stage('exporting_wordforms')
+
+    #########################################
+    def ended_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being exported into the target format.
+        '''
+        self.profiler.end_stage()
@@ -0,0 +1,211 @@
+'''
+Take snapshots of the memory allocations at the start and end of every stage of the pipeline.
+'''
+
+from gabra_converter.converters.memory_profiler import MemoryProfiler
+from gabra_converter.pipeline import PipelineListener
+
+__all__ = [
+    'PipelineListenerMemoryProfile',
+]
+
+
+#########################################
+class PipelineListenerMemoryProfile(PipelineListener):
+    '''
+    Take a snapshot with a memory profiler, labelled by the stage, whenever a stage of the
+    pipeline starts or ends.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        profiler: MemoryProfiler,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param profiler: The started memory profiler to take the snapshots with.
+        '''
+        super().__init__()
+        self.profiler: MemoryProfiler = profiler
+
+    #########################################
+    def started_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump started being extracted into BSON files.
+        '''
+        self.profiler.take_snapshot('started_extracting')
+
+    #########################################
+    def ended_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump stopped being extracted into BSON files.
+        '''
+        self.profiler.take_snapshot('ended_extracting')
+
+    #########################################
+    def started_converting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes BSON file started being converted into a JSONL file.
+        '''
+        self.profiler.take_snapshot('started_converting_lexemes')
+
+    #########################################
+    def ended_converting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes BSON file stopped being converted into a JSONL file.
+        '''
+        self.profiler.take_snapshot('ended_converting_lexemes')
+
+    #########################################
+    def started_converting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms BSON file started being converted into a JSONL file.
+        '''
+        self.profiler.take_snapshot('started_converting_wordforms')
+
+    #########################################
+    def ended_converting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms BSON file stopped being converted into a JSONL file.
+        '''
+        self.profiler.take_snapshot('ended_converting_wordforms')
+
+    #########################################
+    def started_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files started being sampled.
+        '''
+        self.profiler.take_snapshot('started_sampling')
+
+    #########################################
+    def ended_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files stopped being sampled.
+        '''
+        self.profiler.take_snapshot('ended_sampling')
+
+    #########################################
+    def started_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being sorted into the export order.
+        '''
+        self.profiler.take_snapshot('started_sorting_lexemes')
+
+    #########################################
+    def ended_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being sorted into the export order.
+        '''
+        self.profiler.take_snapshot('ended_sorting_lexemes')
+
+    #########################################
+    def started_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being checked in a dry run.
+        '''
+        self.profiler.take_snapshot('started_checking_lexemes')
+
+    #########################################
+    def ended_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being checked in a dry run.
+        '''
+        self.profiler.take_snapshot('ended_checking_lexemes')
+
+    #########################################
+    def started_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being checked in a dry run.
+        '''
+        self.profiler.take_snapshot('started_checking_wordforms')
+
+    #########################################
+    def ended_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being checked in a dry run.
+        '''
+        self.profiler.take_snapshot('ended_checking_wordforms')
+
+    #########################################
+    def started_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being exported into the target format.
+        '''
+        self.profiler.take_snapshot('started_exporting_lexemes')
+
+    #########################################
+    def ended_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being exported into the target format.
+        '''
+        self.profiler.take_snapshot('ended_exporting_lexemes')
+
+    #########################################
+    def started_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being sorted into the export order.
+        '''
+        self.profiler.take_snapshot('started_sorting_wordforms')
+
+    #########################################
+    def ended_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being sorted into the export order.
+        '''
+        self.profiler.take_snapshot('ended_sorting_wordforms')
+
+    #########################################
+    def started_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being exported into the target format.
+        '''
+        self.profiler.take_snapshot('started_exporting_wordforms')
+
+    #########################################
+    def ended_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being exported into the target format.
+        '''
+        self.profiler.take_snapshot('ended_exporting_wordforms')
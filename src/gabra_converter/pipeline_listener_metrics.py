@@ -0,0 +1,211 @@
+'''
+Keep the stage being run in the metrics of a conversion.
+'''
+
+from gabra_converter.converters.conversion_metrics import ConversionMetrics
+from gabra_converter.pipeline import PipelineListener
+
+__all__ = [
+    'PipelineListenerMetrics',
+]
+
+
+#########################################
+class PipelineListenerMetrics(PipelineListener):
+    '''
+    Set the stage being run in the metrics of a conversion and write them whenever a stage of
+    the pipeline starts or ends.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        metrics: ConversionMetrics,
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param metrics: The metrics of the conversion.
+        '''
+        super().__init__()
+        self.metrics: ConversionMetrics = metrics
+
+    #########################################
+    def started_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump started being extracted into BSON files.
+        '''
+        self.metrics.start_stage('extracting')
+
+    #########################################
+    def ended_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump stopped being extracted into BSON files.
+        '''
+        self.metrics.end_stage('extracting')
+
+    #########################################
+    def started_converting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes BSON file started being converted into a JSONL file.
+        '''
+        self.metrics.start_stage('converting_lexemes')
+
+    #########################################
+    def ended_converting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes BSON file stopped being converted into a JSONL file.
+        '''
+        self.metrics.end_stage('converting_lexemes')
+
+    #########################################
+    def started_converting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms BSON file started being converted into a JSONL file.
+        '''
+        self.metrics.start_stage('converting_wordforms')
+
+    #########################################
+    def ended_converting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms BSON file stopped being converted into a JSONL file.
+        '''
+        self.metrics.end_stage('converting_wordforms')
+
+    #########################################
+    def started_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files started being sampled.
+        '''
+        self.metrics.start_stage('sampling')
+
+    #########################################
+    def ended_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files stopped being sampled.
+        '''
+        self.metrics.end_stage('sampling')
+
+    #########################################
+    def started_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being sorted into the export order.
+        '''
+        self.metrics.start_stage('sorting_lexemes')
+
+    #########################################
+    def ended_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being sorted into the export order.
+        '''
+        self.metrics.end_stage('sorting_lexemes')
+
+    #########################################
+    def started_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being checked in a dry run.
+        '''
+        self.metrics.start_stage('checking_lexemes')
+
+    #########################################
+    def ended_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being checked in a dry run.
+        '''
+        self.metrics.end_stage('checking_lexemes')
+
+    #########################################
+    def started_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being checked in a dry run.
+        '''
+        self.metrics.start_stage('checking_wordforms')
+
+    #########################################
+    def ended_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being checked in a dry run.
+        '''
+        self.metrics.end_stage('checking_wordforms')
+
+    #########################################
+    def started_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being exported into the target format.
+        '''
+        self.metrics.start_stage('exporting_lexemes')
+
+    #########################################
+    def ended_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being exported into the target format.
+        '''
+        self.metrics.end_stage('exporting_lexemes')
+
+    #########################################
+    def started_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being sorted into the export order.
+        '''
+        self.metrics.start_stage('sorting_wordforms')
+
+    #########################################
+    def ended_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being sorted into the export order.
+        '''
+        self.metrics.end_stage('sorting_wordforms')
+
+    #########################################
+    def started_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being exported into the target format.
+        '''
+        self.metrics.start_stage('exporting_wordforms')
+
+    #########################################
+    def ended_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being exported into the target format.
+        '''
+        self.metrics.end_stage('exporting_wordforms')
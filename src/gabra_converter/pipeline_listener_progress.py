@@ -0,0 +1,108 @@
+'''
+Report the stages of the whole pipeline on the console.
+'''
+
+from gabra_converter.pipeline import PipelineListener
+
+__all__ = [
+    'PipelineListenerProgress',
+]
+
+
+#########################################
+class PipelineListenerProgress(PipelineListener):
+    '''
+    Print a line when every stage of the pipeline starts, together with a new line after the
+    exported rows counts of ``LexemePipelineListenerProgress`` and
+    ``WordformPipelineListenerProgress``.
+    '''
+
+    #########################################
+    def started_extracting(
+        self,
+    ) -> None:
+        '''
+        Listen for when the compressed database dump started being extracted into BSON files.
+        '''
+        print('Extracting and processing database dump.')
+
+    #########################################
+    def started_sampling(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes and wordforms JSONL files started being sampled.
+        '''
+        print('Sampling lexemes and wordforms.')
+
+    #########################################
+    def started_sorting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being sorted into the export order.
+        '''
+        print('Sorting lexemes.')
+
+    #########################################
+    def started_checking_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being checked in a dry run.
+        '''
+        print('Checking lexemes.')
+
+    #########################################
+    def started_checking_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being checked in a dry run.
+        '''
+        print('Checking wordforms.')
+
+    #########################################
+    def started_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file started being exported into the target format.
+        '''
+        print('Exporting lexemes...')
+
+    #########################################
+    def ended_exporting_lexemes(
+        self,
+    ) -> None:
+        '''
+        Listen for when the lexemes JSONL file stopped being exported into the target format.
+        '''
+        print()
+
+    #########################################
+    def started_sorting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being sorted into the export order.
+        '''
+        print('Sorting wordforms.')
+
+    #########################################
+    def started_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file started being exported into the target format.
+        '''
+        print('Exporting wordforms...')
+
+    #########################################
+    def ended_exporting_wordforms(
+        self,
+    ) -> None:
+        '''
+        Listen for when the wordforms JSONL file stopped being exported into the target format.
+        '''
+        print()
@@ -0,0 +1,105 @@
+'''
+Iterate over the fixed, validated, and cleaned rows of a Ġabra database without exporting them.
+
+Rows are read, processed, and yielded one at a time, so memory usage does not grow with the size
+of the database and nothing is written to disk, even when reading from a database dump.
+'''
+
+from typing import Iterator, Optional
+from gabra_converter.converters.archive_extractor import (
+    read_bson_file_lines,
+    read_archived_collection_lines,
+)
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+__all__ = [
+    'read_collection_lines',
+    'iter_lexemes',
+    'iter_wordforms',
+]
+
+
+#########################################
+def read_collection_lines(
+    source_path: str,
+    collection_name: str,
+) -> Iterator[bytes]:
+    '''
+    Read the JSON lines of a collection from a database dump, a BSON file, or a JSON lines file.
+
+    :param source_path: The path to the .tar.gz Ġabra dump file downloaded from the website, a
+        .bson file of the collection, or an extracted JSON lines file of the collection (any
+        other extension).
+    :param collection_name: The name of the collection in the dump, such as 'lexemes' or
+        'wordforms'.
+        This is ignored for the other types of files.
+    :return: An iterator of lines, each including its line terminator.
+    '''
+    if source_path.endswith(('.tar.gz', '.tgz')):
+        return read_archived_collection_lines(source_path, collection_name)
+    if source_path.endswith('.bson'):
+        return read_bson_file_lines(source_path)
+    return read_jsonl_lines(source_path)
+
+
+#########################################
+def iter_lexemes(
+    source_path: str,
+    cleaners: Optional[list[LexemeCleaner]] = None,
+    id_map: Optional[dict[str, int]] = None,
+) -> Iterator[LexemeRow]:
+    '''
+    Iterate over the lexemes that would be exported from a database.
+
+    :param source_path: The path to the database dump or to a lexemes BSON or JSON lines file
+        (see ``read_collection_lines``).
+    :param cleaners: A list of cleaners to apply to the lexemes or None to not apply any.
+    :param id_map: A dictionary to fill with the integer ID of every yielded lexeme, keyed by
+        its Ġabra ID, as numbered by the exporters, or None if not needed.
+        This can be passed on to ``iter_wordforms``.
+    :return: An iterator of lexeme rows.
+    '''
+    exporter = NullLexemeExporter()
+    lexeme_pipeline = LexemePipeline(cleaners if cleaners is not None else [], exporter)
+    lexeme_pipeline.create('')
+    if id_map is not None:
+        exporter.id_map = id_map
+    yield from lexeme_pipeline.iter_rows(read_collection_lines(source_path, 'lexemes'))
+
+
+#########################################
+def iter_wordforms(
+    source_path: str,
+    cleaners: Optional[list[WordformCleaner]] = None,
+    lexemes_id_map: Optional[dict[str, int]] = None,
+) -> Iterator[WordformRow]:
+    '''
+    Iterate over the wordforms that would be exported from a database.
+
+    :param source_path: The path to the database dump or to a wordforms BSON or JSON lines file
+        (see ``read_collection_lines``).
+    :param cleaners: A list of cleaners to apply to the wordforms or None to not apply any.
+    :param lexemes_id_map: A dictionary mapping lexeme Ġabra IDs to integer IDs, as filled by
+        ``iter_lexemes``, or None for an empty one.
+        Cleaners that check the lexeme of a wordform, such as ``missing_lexeme``, need it.
+    :return: An iterator of wordform rows.
+    '''
+    wordform_pipeline = WordformPipeline(
+        cleaners if cleaners is not None else [], NullWordformExporter()
+    )
+    wordform_pipeline.create('')
+    yield from wordform_pipeline.iter_rows(
+        read_collection_lines(source_path, 'wordforms'),
+        lexemes_id_map if lexemes_id_map is not None else {},
+    )
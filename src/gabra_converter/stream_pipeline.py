@@ -0,0 +1,155 @@
+'''
+Convert a stream of JSON lines documents, such as standard input, into a single output stream,
+such as standard output, so that conversion can be composed with other commands using pipes.
+
+Rows are written out as soon as they are converted and the output is flushed periodically, so
+the output starts flowing before the input ends and nothing is written to disk.
+'''
+
+import csv
+from typing import BinaryIO, Optional, TextIO
+from gabra_converter.converters.jsonl_reader import read_jsonl_stream_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.exporters.csv_lexeme_exporter import (
+    LEXEMES_CSV_COLUMNS,
+    get_lexeme_csv_values,
+)
+from gabra_converter.converters.lexemes.exporters.jsonl_lexeme_exporter import (
+    get_lexeme_json_line
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.exporters.csv_wordform_exporter import (
+    WORDFORMS_CSV_COLUMNS,
+    get_wordform_csv_values,
+)
+from gabra_converter.converters.wordforms.exporters.jsonl_wordform_exporter import (
+    get_wordform_json_line
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+__all__ = [
+    'STREAM_FORMATS',
+    'DEFAULT_STREAM_FLUSH_INTERVAL',
+    'UnknownStreamFormatException',
+    'stream_lexemes',
+    'stream_wordforms',
+]
+
+
+STREAM_FORMATS = ['ndjson', 'csv']
+DEFAULT_STREAM_FLUSH_INTERVAL = 100
+
+
+#########################################
+class UnknownStreamFormatException(Exception):
+    '''
+    A stream format that is not in ``STREAM_FORMATS`` was requested.
+    '''
+
+
+#########################################
+def stream_lexemes(
+    in_f: BinaryIO,
+    out_f: TextIO,
+    cleaners: Optional[list[LexemeCleaner]] = None,
+    stream_format: str = 'ndjson',
+    flush_interval: int = DEFAULT_STREAM_FLUSH_INTERVAL,
+    id_map: Optional[dict[str, int]] = None,
+) -> None:
+    '''
+    Convert a stream of lexeme documents into a stream of rows.
+
+    :param in_f: The stream of lexemes collection documents in JSON lines format, opened in
+        binary mode.
+    :param out_f: The stream to write the rows to.
+        CSV output is written with ``\\r\\n`` line terminators so the stream should be opened
+        with ``newline=''``.
+    :param cleaners: A list of cleaners to apply to the lexemes or None to not apply any.
+    :param stream_format: The format of the output, one of ``STREAM_FORMATS``.
+        'ndjson' writes the lines of the jsonl exporter (see ``get_lexeme_json_line``) whilst
+        'csv' writes the lexemes table of the CSV exporter (without the other tables).
+    :param flush_interval: The number of rows to write between flushes of the output stream.
+    :param id_map: A dictionary to fill with the integer ID of every written lexeme, keyed by
+        its Ġabra ID, or None if not needed.
+    '''
+    if stream_format not in STREAM_FORMATS:
+        raise UnknownStreamFormatException(stream_format)
+
+    exporter = NullLexemeExporter()
+    lexeme_pipeline = LexemePipeline(cleaners if cleaners is not None else [], exporter)
+    lexeme_pipeline.create('')
+    if id_map is not None:
+        exporter.id_map = id_map
+
+    writer = csv.writer(out_f)
+    if stream_format == 'csv':
+        writer.writerow(LEXEMES_CSV_COLUMNS)
+    num_written = 0
+    for row in lexeme_pipeline.iter_rows(read_jsonl_stream_lines(in_f)):
+        num_written += 1
+        if stream_format == 'csv':
+            writer.writerow(get_lexeme_csv_values(num_written, row))
+        else:
+            out_f.write(get_lexeme_json_line(num_written, row))
+        if num_written % flush_interval == 0:
+            out_f.flush()
+    out_f.flush()
+
+
+#########################################
+def stream_wordforms(
+    in_f: BinaryIO,
+    out_f: TextIO,
+    cleaners: Optional[list[WordformCleaner]] = None,
+    stream_format: str = 'ndjson',
+    flush_interval: int = DEFAULT_STREAM_FLUSH_INTERVAL,
+    lexemes_id_map: Optional[dict[str, int]] = None,
+) -> None:
+    '''
+    Convert a stream of wordform documents into a stream of rows.
+
+    :param in_f: The stream of wordforms collection documents in JSON lines format, opened in
+        binary mode.
+    :param out_f: The stream to write the rows to.
+        CSV output is written with ``\\r\\n`` line terminators so the stream should be opened
+        with ``newline=''``.
+    :param cleaners: A list of cleaners to apply to the wordforms or None to not apply any.
+    :param stream_format: The format of the output, one of ``STREAM_FORMATS``.
+        'ndjson' writes the lines of the jsonl exporter (see ``get_wordform_json_line``) whilst
+        'csv' writes the wordforms table of the CSV exporter (without the other tables).
+    :param flush_interval: The number of rows to write between flushes of the output stream.
+    :param lexemes_id_map: A dictionary mapping lexeme Ġabra IDs to integer IDs, as filled by
+        ``stream_lexemes`` or ``iter_lexemes``, or None for an empty one.
+        Cleaners that check the lexeme of a wordform, such as ``missing_lexeme``, need it and
+        the 'new_lexeme_id' of the output is left empty (null in NDJSON) for lexemes not in
+        it.
+    '''
+    if stream_format not in STREAM_FORMATS:
+        raise UnknownStreamFormatException(stream_format)
+    if lexemes_id_map is None:
+        lexemes_id_map = {}
+
+    wordform_pipeline = WordformPipeline(
+        cleaners if cleaners is not None else [], NullWordformExporter()
+    )
+    wordform_pipeline.create('')
+
+    writer = csv.writer(out_f)
+    if stream_format == 'csv':
+        writer.writerow(WORDFORMS_CSV_COLUMNS)
+    num_written = 0
+    for row in wordform_pipeline.iter_rows(read_jsonl_stream_lines(in_f), lexemes_id_map):
+        num_written += 1
+        if stream_format == 'csv':
+            writer.writerow(get_wordform_csv_values(num_written, row, lexemes_id_map))
+        else:
+            out_f.write(get_wordform_json_line(num_written, row, lexemes_id_map))
+        if num_written % flush_interval == 0:
+            out_f.flush()
+    out_f.flush()
@@ -6,6 +6,7 @@ import os
 import unittest
 import json
 import gabra_converter
+from gabra_converter.converters.text_properties import get_text_properties
 from gabra_converter.converters.lexemes.row.lexeme_row import LexemeRow
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
     get_all_lexeme_cleaners
@@ -338,6 +339,37 @@ class TestWordforms(unittest.TestCase):
             self.assertEqual(accepted, entry['accepted'])
 
 
+#########################################
+class TestTextProperties(unittest.TestCase):
+    '''
+    Test the shared text properties used by the text cleaners.
+    '''
+
+    #########################################
+    def test_properties(
+        self,
+    ) -> None:
+        '''
+        Test that each property is detected independently of the others.
+        '''
+        for (text, has_space, has_uppercase, all_maltese, has_new_line) in [
+            ('ħobż', False, False, True, False),
+            ('ħ obż', True, False, True, False),
+            ('Ħobż', False, True, True, False),
+            ('ħobży', False, False, False, False),
+            ('ħobż\n', False, False, False, True),
+            ('Ġ-ħobż', False, True, False, False),
+            ("ta'l-", False, False, False, False),
+            ("ta' ", True, False, True, False),
+            ('', False, False, True, False),
+        ]:
+            properties = get_text_properties(text)
+            self.assertEqual(properties.has_space, has_space, msg=text)
+            self.assertEqual(properties.has_uppercase, has_uppercase, msg=text)
+            self.assertEqual(properties.all_maltese, all_maltese, msg=text)
+            self.assertEqual(properties.has_new_line, has_new_line, msg=text)
+
+
 #########################################
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,158 @@
+'''
+Test the converted_tables requirement.
+'''
+
+import os
+import csv
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.converted_tables import (
+    InvalidConvertedTableException,
+    load_converted_tables,
+)
+from gabra_converter.converters.lexemes.row.lexeme_row import POS
+from gabra_converter.converters.wordforms.row.wordform_row import Number
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+#########################################
+def export_test_input(
+    out_path: str,
+) -> None:
+    '''
+    Export the pipeline test input to CSV files.
+
+    :param out_path: The folder in which to export.
+    '''
+    in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+    lexeme_exporter = [
+        exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+    ][0]
+    lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+    lexeme_pipeline.create(out_path)
+    lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+    wordform_exporter = [
+        exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+    ][0]
+    wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+    wordform_pipeline.create(out_path)
+    wordform_pipeline.convert_file(
+        os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+    )
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_tables(
+        self,
+    ) -> None:
+        '''
+        Test that the loaded tables have the same values as the CSV files.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            export_test_input(tmp_path)
+            tables = load_converted_tables(tmp_path)
+
+            for (name, table) in tables.tables.items():
+                with open(
+                    os.path.join(tmp_path, f'{name}.csv'), 'r', encoding='utf-8', newline=''
+                ) as f:
+                    rows = list(csv.DictReader(f))
+                self.assertEqual(len(table), len(rows), name)
+                for row in rows:
+                    id_ = int(row['new_id'])
+                    for (column_name, column) in table.columns.items():
+                        self.assertEqual(column.get_text(id_), row[column_name], column_name)
+                        if row[column_name] == '':
+                            self.assertIsNone(column[id_])
+                    self.assertEqual(table.get_row(id_)['new_id'], id_)
+
+    #########################################
+    def test_queries(
+        self,
+    ) -> None:
+        '''
+        Test finding rows and following the links between tables.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            export_test_input(tmp_path)
+            tables = load_converted_tables(tmp_path)
+            lexemes = tables['lexemes']
+            wordforms = tables['wordforms']
+
+            [nikkiet_id] = lexemes.find('lemma', 'nikkiet')
+            self.assertEqual(lexemes.get('pos', nikkiet_id), POS.NOUN)
+            self.assertEqual(lexemes.get('root-variant', nikkiet_id), 1)
+            self.assertEqual(lexemes.get('pending', nikkiet_id), False)
+            self.assertIn(nikkiet_id, lexemes.find('pos', POS.NOUN))
+            self.assertEqual(lexemes.find('lemma', 'xxx'), [])
+            self.assertEqual(
+                tables.get_child_values('lexemes_alternatives', 'alternative', nikkiet_id),
+                ['nekkiet', 'nukkiet'],
+            )
+            self.assertEqual(
+                tables.get_child_values('lexemes_glosses', 'gloss', nikkiet_id),
+                ['sb. who dots or punctuates'],
+            )
+            self.assertEqual(
+                [
+                    wordforms.get('surface_form', wordform_id)
+                    for wordform_id in tables.get_lexeme_wordform_ids(nikkiet_id)
+                ][:3],
+                ['nikkitin', 'nikkieta', 'nikkiet'],
+            )
+            self.assertIn(
+                tables.get_lexeme_wordform_ids(nikkiet_id)[0], wordforms.find('number', Number.PL)
+            )
+
+            for gloss_id in range(1, len(tables['lexemes_glosses']) + 1):
+                lexeme_id = tables['lexemes_glosses'].get('new_lexeme_id', gloss_id)
+                self.assertIn(gloss_id, tables.get_child_ids('lexemes_glosses', lexeme_id))
+                for example_id in tables.get_child_ids('lexemes_examples', gloss_id):
+                    self.assertEqual(
+                        tables['lexemes_examples'].get('new_gloss_id', example_id), gloss_id
+                    )
+
+            expected_pairs = sorted(
+                (wordforms.get('new_lexeme_id', wordform_id), wordform_id)
+                for wordform_id in range(1, len(wordforms) + 1)
+                if wordforms.get('new_lexeme_id', wordform_id) is not None
+            )
+            self.assertEqual(tables.join_lexeme_wordforms(), expected_pairs)
+            self.assertEqual(
+                tables.join_lexeme_wordforms([nikkiet_id]),
+                [
+                    (nikkiet_id, wordform_id)
+                    for wordform_id in tables.get_lexeme_wordform_ids(nikkiet_id)
+                ],
+            )
+
+            with open(os.path.join(tmp_path, 'lexemes_sources.csv'), 'a', encoding='utf-8') as f:
+                f.write('100,1,x\n')
+            with self.assertRaises(InvalidConvertedTableException):
+                load_converted_tables(tmp_path)
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+'''
+Test the cpu_profile requirement.
+'''
+
+import os
+import time
+import pstats
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.pipeline_listener_cpu_profile import PipelineListenerCPUProfile
+from gabra_converter.converters.cpu_profiler import (
+    CPU_PROFILE_SUMMARY_FNAME,
+    CPUProfilerStageException,
+    CPUProfiler,
+)
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+
+
+#########################################
+def busy_wait(
+    seconds: float,
+) -> None:
+    '''
+    Keep the CPU busy for a number of seconds.
+
+    :param seconds: The number of seconds.
+    '''
+    end_time = time.perf_counter() + seconds
+    while time.perf_counter() < end_time:
+        pass
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_deterministic(
+        self,
+    ) -> None:
+        '''
+        Test that every stage is saved in a separate pstats file with only its own calls.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            profile_path = os.path.join(tmp_path, 'profile')
+            profiler = CPUProfiler(profile_path, 'deterministic')
+            listener = PipelineListenerCPUProfile(profiler)
+            try:
+                listener.started_exporting_lexemes()
+                lexeme_pipeline = LexemePipeline([], NullLexemeExporter())
+                lexeme_pipeline.create(tmp_path)
+                lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+                listener.ended_exporting_lexemes()
+
+                listener.started_sorting_wordforms()
+                busy_wait(0.01)
+                listener.ended_sorting_wordforms()
+            finally:
+                profiler.stop()
+
+            self.assertEqual(
+                sorted(os.listdir(profile_path)),
+                [
+                    'exporting_lexemes.pstats',
+                    'sorting_wordforms.pstats',
+                    CPU_PROFILE_SUMMARY_FNAME,
+                ],
+            )
+            exporting_functions = set(
+                pstats.Stats(os.path.join(profile_path, 'exporting_lexemes.pstats'))
+                .get_stats_profile().func_profiles
+            )
+            sorting_functions = set(
+                pstats.Stats(os.path.join(profile_path, 'sorting_wordforms.pstats'))
+                .get_stats_profile().func_profiles
+            )
+            self.assertIn('convert_file', exporting_functions)
+            self.assertNotIn('busy_wait', exporting_functions)
+            self.assertIn('busy_wait', sorting_functions)
+            self.assertNotIn('convert_file', sorting_functions)
+
+            with open(
+                os.path.join(profile_path, CPU_PROFILE_SUMMARY_FNAME), 'r', encoding='utf-8'
+            ) as f:
+                summary = f.read().split('\n')
+            self.assertEqual(summary[0], 'CPU profile (deterministic)')
+            self.assertTrue(summary[2].endswith('  exporting_lexemes'))
+            self.assertTrue(summary[3].endswith('  sorting_wordforms'))
+
+    #########################################
+    def test_sampling(
+        self,
+    ) -> None:
+        '''
+        Test that the call stacks of every stage are saved in a separate collapsed stack file.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            profiler = CPUProfiler(tmp_path, 'sampling', 0.001)
+            listener = PipelineListenerCPUProfile(profiler)
+            listener.started_extracting()
+            busy_wait(0.2)
+            listener.ended_extracting()
+            listener.started_sampling()
+            time.sleep(0.2)
+            listener.ended_sampling()
+            profiler.stop()
+
+            for stage in ['extracting', 'sampling']:
+                with open(
+                    os.path.join(tmp_path, f'{stage}.collapsed'), 'r', encoding='utf-8'
+                ) as f:
+                    lines = f.read().strip().split('\n')
+                stacks = {}
+                for line in lines:
+                    (stack, count) = line.rsplit(' ', 1)
+                    stacks[stack.split(';')[-1]] = int(count)
+                    self.assertIn(';test_sampling (', stack)
+                self.assertGreater(sum(stacks.values()), 10)
+                top_function = max(stacks, key=stacks.__getitem__)
+                if stage == 'extracting':
+                    self.assertTrue(top_function.startswith('busy_wait ('))
+                else:
+                    self.assertTrue(top_function.startswith('test_sampling ('))
+
+            with open(
+                os.path.join(tmp_path, CPU_PROFILE_SUMMARY_FNAME), 'r', encoding='utf-8'
+            ) as f:
+                summary = f.read().split('\n')
+            self.assertEqual(summary[0], 'CPU profile (sampling)')
+            (wall_time, cpu_time, _, _) = summary[3].split()
+            self.assertGreater(float(wall_time), float(cpu_time))
+
+    #########################################
+    def test_stage_errors(
+        self,
+    ) -> None:
+        '''
+        Test that stages cannot overlap and that a stage left running is saved when stopping.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            profiler = CPUProfiler(tmp_path, 'deterministic')
+            with self.assertRaises(CPUProfilerStageException):
+                profiler.end_stage()
+            profiler.start_stage('extracting')
+            with self.assertRaises(CPUProfilerStageException):
+                profiler.start_stage('sampling')
+            profiler.stop()
+            self.assertTrue(os.path.isfile(os.path.join(tmp_path, 'extracting.pstats')))
+            self.assertEqual([stage for (stage, _, _, _) in profiler.summary], ['extracting'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+'''
+Test the dafsa requirement.
+'''
+
+import os
+import csv
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.checkpoint import load_checkpoint, remove_checkpoint
+from gabra_converter.converters.dafsa import (
+    InvalidDAFSAException,
+    UnsortedDAFSAWordsException,
+    build_dafsa,
+    get_word_line,
+    build_dafsa_from_words_file,
+    DAFSAReader,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_dafsa import (
+    LexemePipelineListenerDAFSA
+)
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_dafsa \
+    import WordformPipelineListenerDAFSA
+
+
+#########################################
+def sort_words(
+    words: set[str],
+) -> list[str]:
+    '''
+    Sort words in the order that they are enumerated by a DAFSA reader.
+
+    :param words: The words.
+    :return: The sorted words.
+    '''
+    return sorted(words, key=lambda word: word.encode('utf-8'))
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_build(
+        self,
+    ) -> None:
+        '''
+        Test building a DAFSA file directly and reading it.
+        '''
+        words = {
+            f'{stem}{suffix}'
+            for stem in ['kiteb', 'ktib', 'ħobż', 'ċaqlaq', 'żiemel', 'ż']
+            for suffix in ['', 't', 'na', 'tu', 'hom', 'ha']
+        }
+        with tempfile.TemporaryDirectory() as tmp_path:
+            dafsa_path = os.path.join(tmp_path, 'words.dafsa')
+            build_dafsa(
+                dafsa_path, sorted(word.encode('utf-8') for word in list(words) + list(words))
+            )
+            with DAFSAReader(dafsa_path) as reader:
+                self.assertEqual(len(reader), len(words))
+                for word in words:
+                    self.assertIn(word, reader)
+                for word in ['', 'k', 'kite', 'kitebx', 'ħ', 'x']:
+                    self.assertNotIn(word, reader)
+                self.assertEqual(list(reader), sort_words(words))
+                self.assertEqual(
+                    list(reader.iter_words('ż')),
+                    sort_words({word for word in words if word.startswith('ż')}),
+                )
+                self.assertEqual(
+                    list(reader.iter_words('kitebna')), ['kitebna']
+                )
+                self.assertEqual(list(reader.iter_words('x')), [])
+
+            build_dafsa(dafsa_path, [])
+            with DAFSAReader(dafsa_path) as reader:
+                self.assertEqual(len(reader), 0)
+                self.assertNotIn('', reader)
+                self.assertEqual(list(reader), [])
+
+            build_dafsa(dafsa_path, [b'', b'a'])
+            with DAFSAReader(dafsa_path) as reader:
+                self.assertIn('', reader)
+                self.assertEqual(list(reader), ['', 'a'])
+
+            with self.assertRaises(UnsortedDAFSAWordsException):
+                build_dafsa(dafsa_path, [b'a', b'b', b'a'])
+
+            with open(dafsa_path, 'wb') as f:
+                f.write(b'not a DAFSA file')
+            with self.assertRaises(InvalidDAFSAException):
+                DAFSAReader(dafsa_path)
+
+    #########################################
+    def test_words_file(
+        self,
+    ) -> None:
+        '''
+        Test building a DAFSA file from an unsorted words file that is sorted on disk.
+        '''
+        words = [f'kelma{i%50}' for i in range(200)] + ['ħobż', 'line\nbreak', '"quoted"', '']
+        with tempfile.TemporaryDirectory() as tmp_path:
+            words_path = os.path.join(tmp_path, 'words.tmp')
+            with open(words_path, 'wb') as f:
+                for word in reversed(words):
+                    f.write(get_word_line(word))
+            dafsa_path = os.path.join(tmp_path, 'words.dafsa')
+            build_dafsa_from_words_file(dafsa_path, words_path, tmp_path, 100)
+            with DAFSAReader(dafsa_path) as reader:
+                self.assertEqual(list(reader), sort_words(set(words)))
+
+    #########################################
+    def test_listeners(
+        self,
+    ) -> None:
+        '''
+        Test building DAFSA files whilst converting and compare them to the exported rows.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(LexemePipelineListenerDAFSA())
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            wordform_exporter = [
+                exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+            ][0]
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(WordformPipelineListenerDAFSA())
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+
+            for (name, word_field) in [('lexemes', 'lemma'), ('wordforms', 'surface_form')]:
+                expected: set[str] = set()
+                with open(
+                    os.path.join(tmp_path, f'{name}.csv'), 'r', encoding='utf-8', newline=''
+                ) as f:
+                    expected.update(row[word_field] for row in csv.DictReader(f))
+                with open(
+                    os.path.join(tmp_path, f'{name}_alternatives.csv'),
+                    'r', encoding='utf-8', newline=''
+                ) as f:
+                    expected.update(row['alternative'] for row in csv.DictReader(f))
+
+                self.assertFalse(os.path.exists(os.path.join(tmp_path, f'{name}_words.tmp')))
+                with DAFSAReader(os.path.join(tmp_path, f'{name}.dafsa')) as reader:
+                    self.assertEqual(list(reader), sort_words(expected))
+
+
+    #########################################
+    def test_resume_after_end(
+        self,
+    ) -> None:
+        '''
+        Test that conversions with the DAFSA listeners can be resumed from their final
+        checkpoints, which need the words files to be kept until the checkpoints are removed, and
+        that the DAFSA files are the same.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexemes_checkpoint_path = os.path.join(tmp_path, 'lexemes_checkpoint.json')
+            wordforms_checkpoint_path = os.path.join(tmp_path, 'wordforms_checkpoint.json')
+            dafsas = []
+            for resuming in [False, True]:
+                lexeme_pipeline = LexemePipeline(
+                    get_all_lexeme_cleaners(), get_all_lexeme_exporters()[0]
+                )
+                lexeme_pipeline.add_listener(LexemePipelineListenerDAFSA())
+                wordform_pipeline = WordformPipeline(
+                    get_all_wordform_cleaners(), get_all_wordform_exporters()[0]
+                )
+                wordform_pipeline.add_listener(WordformPipelineListenerDAFSA())
+                if resuming:
+                    lexeme_pipeline.resume(
+                        tmp_path, load_checkpoint(lexemes_checkpoint_path), lexemes_checkpoint_path
+                    )
+                    wordform_pipeline.resume(
+                        tmp_path,
+                        load_checkpoint(wordforms_checkpoint_path),
+                        wordforms_checkpoint_path,
+                    )
+                else:
+                    lexeme_pipeline.create(tmp_path)
+                    wordform_pipeline.create(tmp_path)
+                lexeme_pipeline.convert_file(
+                    os.path.join(in_path, 'lexemes.jsonl'), None, lexemes_checkpoint_path, 2
+                )
+                wordform_pipeline.convert_file(
+                    os.path.join(in_path, 'wordforms.jsonl'),
+                    lexeme_pipeline.get_id_map(),
+                    None,
+                    wordforms_checkpoint_path,
+                    2,
+                )
+                dafsa = []
+                for name in ['lexemes', 'wordforms']:
+                    self.assertTrue(os.path.isfile(os.path.join(tmp_path, f'{name}_words.tmp')))
+                    with open(os.path.join(tmp_path, f'{name}.dafsa'), 'rb') as f:
+                        dafsa.append(f.read())
+                dafsas.append(dafsa)
+            self.assertEqual(dafsas[0], dafsas[1])
+
+            remove_checkpoint(lexemes_checkpoint_path)
+            remove_checkpoint(wordforms_checkpoint_path)
+            lexeme_pipeline.remove_tmp_files()
+            wordform_pipeline.remove_tmp_files()
+            for name in ['lexemes', 'wordforms']:
+                self.assertFalse(os.path.exists(os.path.join(tmp_path, f'{name}_words.tmp')))
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
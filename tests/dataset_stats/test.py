@@ -0,0 +1,249 @@
+'''
+Test the dataset_stats requirement.
+'''
+
+import os
+import json
+import tempfile
+import unittest
+from typing import Any
+import gabra_converter
+from gabra_converter.converters.sketches import (
+    IncompatibleSketchesException,
+    HyperLogLog,
+    Log2Histogram,
+)
+from gabra_converter.converters.dataset_stats import (
+    IncompatibleStatsException,
+    DatasetStats,
+    merge_stats_reports,
+    load_stats_report,
+)
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_stats \
+    import LexemePipelineListenerStats
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_stats \
+    import WordformPipelineListenerStats
+from gabra_converter.row_iterators import iter_lexemes, iter_wordforms
+
+
+#########################################
+def get_reports(
+    lexemes_path: str,
+    wordforms_path: str,
+    out_path: str,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    '''
+    Export the lexemes and wordforms of a pair of files with statistics listeners.
+
+    :param lexemes_path: The path to the lexemes JSON lines file.
+    :param wordforms_path: The path to the wordforms JSON lines file.
+    :param out_path: The path to the folder to save the reports in.
+    :return: A tuple with the lexemes report and the wordforms report.
+    '''
+    lexeme_pipeline = LexemePipeline([], NullLexemeExporter())
+    lexeme_pipeline.add_listener(LexemePipelineListenerStats())
+    lexeme_pipeline.create(out_path)
+    lexeme_pipeline.convert_file(lexemes_path)
+
+    wordform_pipeline = WordformPipeline([], NullWordformExporter())
+    wordform_pipeline.add_listener(WordformPipelineListenerStats())
+    wordform_pipeline.create(out_path)
+    wordform_pipeline.convert_file(wordforms_path, lexeme_pipeline.get_id_map())
+
+    return (
+        load_stats_report(os.path.join(out_path, 'lexemes_stats.json')),
+        load_stats_report(os.path.join(out_path, 'wordforms_stats.json')),
+    )
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_hyperloglog(
+        self,
+    ) -> None:
+        '''
+        Test that HyperLogLog estimates are accurate and that merged or restored HyperLogLogs
+        give the same estimates.
+        '''
+        hll = HyperLogLog()
+        hll_1 = HyperLogLog()
+        hll_2 = HyperLogLog()
+        for i in range(100000):
+            hll.add(str(i%50000))
+            (hll_1 if i%3 == 0 else hll_2).add(str(i%50000))
+        self.assertAlmostEqual(hll.estimate()/50000, 1.0, delta=0.03)
+
+        hll_1.merge(hll_2)
+        self.assertEqual(hll_1.estimate(), hll.estimate())
+
+        restored = HyperLogLog(4)
+        restored.load_state(json.loads(json.dumps(hll.get_state())))
+        self.assertEqual(restored.precision, 14)
+        self.assertEqual(restored.estimate(), hll.estimate())
+
+        small = HyperLogLog()
+        for i in range(100):
+            small.add(str(i))
+        self.assertAlmostEqual(small.estimate(), 100, delta=2)
+        self.assertEqual(HyperLogLog().estimate(), 0)
+
+        with self.assertRaises(IncompatibleSketchesException):
+            small.merge(HyperLogLog(10))
+
+    #########################################
+    def test_histogram(
+        self,
+    ) -> None:
+        '''
+        Test that integers are counted in power of two buckets.
+        '''
+        histogram = Log2Histogram()
+        for value in [0, 1, 2, 3, 4, 7, 8, 100]:
+            histogram.add(value)
+        other = Log2Histogram()
+        other.load_state(json.loads(json.dumps(histogram.get_state())))
+        other.add(0)
+        histogram.merge(other)
+        self.assertEqual(
+            histogram.get_summary(),
+            {
+                'count': 17,
+                'total': 250,
+                'mean': 250/17,
+                'max': 100,
+                'buckets': [
+                    {'min': 0, 'max': 0, 'count': 3},
+                    {'min': 1, 'max': 1, 'count': 2},
+                    {'min': 2, 'max': 3, 'count': 4},
+                    {'min': 4, 'max': 7, 'count': 4},
+                    {'min': 8, 'max': 15, 'count': 2},
+                    {'min': 64, 'max': 127, 'count': 2},
+                ],
+            },
+        )
+        with self.assertRaises(ValueError):
+            histogram.add(-1)
+
+    #########################################
+    def test_listeners(
+        self,
+    ) -> None:
+        '''
+        Test that the reports saved by the listeners match the exported rows.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        lexemes_path = os.path.join(in_path, 'lexemes.jsonl')
+        wordforms_path = os.path.join(in_path, 'wordforms.jsonl')
+        lexemes = list(iter_lexemes(lexemes_path))
+        wordforms = list(iter_wordforms(wordforms_path))
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (lexemes_report, wordforms_report) = get_reports(
+                lexemes_path, wordforms_path, tmp_path
+            )
+
+        self.assertEqual(lexemes_report['num_rows'], len(lexemes))
+        pos_counts: dict[str, int] = {}
+        for lexeme in lexemes:
+            key = lexeme.pos.value if lexeme.pos is not None else 'null'
+            pos_counts[key] = pos_counts.get(key, 0) + 1
+        self.assertEqual(lexemes_report['value_counts']['pos'], pos_counts)
+        self.assertEqual(
+            lexemes_report['value_shares']['pending']['false'],
+            sum(lexeme.pending is False for lexeme in lexemes)/len(lexemes),
+        )
+        self.assertEqual(
+            lexemes_report['distinct_counts']['lemma'],
+            len({lexeme.lemma for lexeme in lexemes}),
+        )
+        self.assertEqual(
+            lexemes_report['histograms']['glosses_per_lexeme']['total'],
+            sum(len(lexeme.glosses) for lexeme in lexemes if lexeme.glosses is not None),
+        )
+
+        self.assertEqual(wordforms_report['num_rows'], len(wordforms))
+        self.assertEqual(
+            wordforms_report['distinct_counts']['surface_form'],
+            len({wordform.surface_form for wordform in wordforms}),
+        )
+        self.assertEqual(
+            wordforms_report['histograms']['wordforms_per_lexeme']['count'],
+            len({wordform.lexeme_id.oid for wordform in wordforms}),
+        )
+        self.assertEqual(
+            wordforms_report['histograms']['wordforms_per_lexeme']['total'],
+            len(wordforms),
+        )
+
+    #########################################
+    def test_merge(
+        self,
+    ) -> None:
+        '''
+        Test that merging the reports of parts of the collections gives the report of the whole
+        collections.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        lexemes_path = os.path.join(in_path, 'lexemes.jsonl')
+        wordforms_path = os.path.join(in_path, 'wordforms.jsonl')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            whole_reports = get_reports(lexemes_path, wordforms_path, tmp_path)
+
+            part_reports = []
+            for part in range(2):
+                part_path = os.path.join(tmp_path, str(part))
+                os.makedirs(part_path)
+                for (fname, path) in [
+                    ('lexemes.jsonl', lexemes_path), ('wordforms.jsonl', wordforms_path),
+                ]:
+                    with open(os.path.join(part_path, fname), 'wb') as f:
+                        f.writelines(
+                            line for (i, line) in enumerate(read_jsonl_lines(path))
+                            if i%2 == part
+                        )
+                part_reports.append(get_reports(
+                    os.path.join(part_path, 'lexemes.jsonl'),
+                    os.path.join(part_path, 'wordforms.jsonl'),
+                    part_path,
+                ))
+
+        for collection_index in range(2):
+            self.assertEqual(
+                merge_stats_reports([reports[collection_index] for reports in part_reports]),
+                whole_reports[collection_index],
+            )
+        with self.assertRaises(IncompatibleStatsException):
+            merge_stats_reports([whole_reports[0], whole_reports[1]])
+
+    #########################################
+    def test_resume(
+        self,
+    ) -> None:
+        '''
+        Test that the statistics are restored from a checkpoint.
+        '''
+        listener = LexemePipelineListenerStats()
+        stats = DatasetStats('lexemes')
+        stats.add_row()
+        stats.count_value('pos', None)
+        stats.add_distinct('lemma', 'kiteb')
+        stats.add_to_histogram('glosses_per_lexeme', 2)
+        stats.add_to_group('lexemes_per_root', 'k-t-b')
+        listener.stats = stats
+        checkpoint = json.loads(json.dumps(listener.get_checkpoint()))
+        with tempfile.TemporaryDirectory() as tmp_path:
+            listener.create(tmp_path)
+            self.assertEqual(listener.stats.num_rows, 0)
+            listener.resume(tmp_path, checkpoint)
+        self.assertEqual(listener.stats.get_report(), stats.get_report())
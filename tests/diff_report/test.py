@@ -0,0 +1,166 @@
+'''
+Test the diff_report requirement.
+'''
+
+import os
+import csv
+import json
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.diff_report import (
+    DIFF_REPORT_COLUMNS,
+    diff_sorted_objects,
+    get_changed_fields,
+    write_diff_report,
+)
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import get_lexeme_exporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_wordform_exporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_merge_join(
+        self,
+    ) -> None:
+        '''
+        Test that sorted objects are matched by ID, including repeated IDs.
+        '''
+        old_objects = [
+            {'_id': 'a', 'x': 1},
+            {'_id': 'b', 'x': 1},
+            {'_id': 'b', 'x': 2},
+            {'_id': 'c', 'x': 1},
+            {'_id': 'e', 'x': 1},
+        ]
+        new_objects = [
+            {'_id': 'b', 'x': 1},
+            {'_id': 'c', 'x': 2, 'y': 1},
+            {'_id': 'd', 'x': 1},
+            {'_id': 'e', 'x': 1},
+            {'_id': 'f', 'x': 1},
+        ]
+        self.assertEqual(
+            [
+                (change, oid)
+                for (change, oid, _, _) in diff_sorted_objects(old_objects, new_objects)
+            ],
+            [
+                ('removed', 'a'),
+                ('removed', 'b'),
+                ('modified', 'c'),
+                ('added', 'd'),
+                ('added', 'f'),
+            ],
+        )
+        self.assertEqual(list(diff_sorted_objects(old_objects, old_objects)), [])
+        self.assertEqual(
+            get_changed_fields({'_id': 'c', 'x': 1, 'z': 1}, {'_id': 'c', 'x': 2, 'y': 1}),
+            ['x', 'y', 'z'],
+        )
+
+    #########################################
+    def test_diff_report(
+        self,
+    ) -> None:
+        '''
+        Test that the differences between databases and conversions are reported by Ġabra ID
+        regardless of the order of the rows.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        lexemes_path = os.path.join(in_path, 'lexemes.jsonl')
+        wordforms_path = os.path.join(in_path, 'wordforms.jsonl')
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            # The new database has its lexemes in reverse order, with the first valid lexeme
+            # removed, the second modified, and a new one added.
+            lexeme_lines = [line.rstrip(b'\n') for line in read_jsonl_lines(lexemes_path)]
+            valid_indexes = []
+            for (i, line) in enumerate(lexeme_lines):
+                try:
+                    json.loads(line)
+                except ValueError:
+                    continue
+                valid_indexes.append(i)
+            removed_lexeme = json.loads(lexeme_lines[valid_indexes[0]])
+            modified_lexeme = json.loads(lexeme_lines[valid_indexes[1]])
+            modified_lexeme['lemma'] += 'x'
+            modified_lexeme['pos'] = 'VERB'
+            added_lexeme = dict(modified_lexeme)
+            added_lexeme['_id'] = {'$oid': 'ffffffffffffffffffffffff'}
+            new_lexeme_lines = [
+                json.dumps(modified_lexeme, ensure_ascii=False).encode('utf-8')
+                if i == valid_indexes[1] else line
+                for (i, line) in enumerate(lexeme_lines)
+                if i != valid_indexes[0]
+            ][::-1] + [json.dumps(added_lexeme, ensure_ascii=False).encode('utf-8')]
+            new_lexemes_path = os.path.join(tmp_path, 'new_lexemes.jsonl')
+            with open(new_lexemes_path, 'wb') as f:
+                f.write(b'\n'.join(new_lexeme_lines) + b'\n')
+
+            # The conversion of the old database is compared to the new database.
+            conversion_path = os.path.join(tmp_path, 'conversion')
+            os.makedirs(conversion_path)
+            lexeme_pipeline = LexemePipeline([], get_lexeme_exporter('jsonl'))
+            lexeme_pipeline.create(conversion_path)
+            lexeme_pipeline.convert_file(lexemes_path)
+            wordform_pipeline = WordformPipeline([], get_wordform_exporter('jsonl'))
+            wordform_pipeline.create(conversion_path)
+            wordform_pipeline.convert_file(wordforms_path, lexeme_pipeline.get_id_map())
+
+            report_path = os.path.join(tmp_path, 'diff.csv')
+            for (old_lexemes_path, old_wordforms_path) in [
+                (lexemes_path, wordforms_path),
+                (
+                    os.path.join(conversion_path, 'lexemes.ndjson'),
+                    os.path.join(conversion_path, 'wordforms.ndjson'),
+                ),
+            ]:
+                with self.subTest(old_lexemes_path=old_lexemes_path):
+                    counts = write_diff_report(
+                        old_lexemes_path,
+                        new_lexemes_path,
+                        old_wordforms_path,
+                        wordforms_path,
+                        report_path,
+                        tmp_path,
+                        max_run_size=500,
+                    )
+                    self.assertEqual(counts, {
+                        'lexemes': {'added': 1, 'removed': 1, 'modified': 1},
+                        'wordforms': {'added': 0, 'removed': 0, 'modified': 0},
+                    })
+                    with open(report_path, 'r', encoding='utf-8', newline='') as f:
+                        self.assertEqual(list(csv.reader(f)), [
+                            DIFF_REPORT_COLUMNS,
+                            ['lexemes', 'removed', removed_lexeme['_id']['$oid'], '', '', ''],
+                            [
+                                'lexemes', 'modified', modified_lexeme['_id']['$oid'], 'lemma',
+                                json.dumps(modified_lexeme['lemma'][:-1], ensure_ascii=False),
+                                json.dumps(modified_lexeme['lemma'], ensure_ascii=False),
+                            ],
+                            [
+                                'lexemes', 'modified', modified_lexeme['_id']['$oid'], 'pos',
+                                json.dumps(json.loads(lexeme_lines[valid_indexes[1]])['pos']),
+                                '"VERB"',
+                            ],
+                            ['lexemes', 'added', 'ffffffffffffffffffffffff', '', '', ''],
+                        ])
+                    self.assertEqual(
+                        sorted(os.listdir(tmp_path)),
+                        ['conversion', 'diff.csv', 'new_lexemes.jsonl'],
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+'''
+Test the dry_run requirement.
+'''
+
+import os
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.dry_run import dry_run_lexemes, dry_run_wordforms
+from gabra_converter.converters.jsonl_reader import (
+    read_jsonl_lines,
+    read_jsonl_lines_in_range,
+    split_jsonl_file,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import get_lexeme_cleaner
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_counts \
+    import LexemePipelineListenerCounts
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_wordform_cleaner
+)
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_counts \
+    import WordformPipelineListenerCounts
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_split(
+        self,
+    ) -> None:
+        '''
+        Test that splitting a file gives parts that together have every line exactly once.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        for fname in ['lexemes.jsonl', 'wordforms.jsonl']:
+            in_file_path = os.path.join(in_path, fname)
+            expected_lines = list(read_jsonl_lines(in_file_path))
+            for num_parts in [1, 2, 3, 7, 1000]:
+                with self.subTest(fname=fname, num_parts=num_parts):
+                    parts = split_jsonl_file(in_file_path, num_parts)
+                    self.assertLessEqual(len(parts), num_parts)
+                    self.assertEqual(parts[0][0], 0)
+                    self.assertEqual(parts[-1][1], os.path.getsize(in_file_path))
+                    for ((_, end_offset), (start_offset, _)) in zip(parts, parts[1:]):
+                        self.assertEqual(end_offset, start_offset)
+                    lines = [
+                        line
+                        for (start_offset, end_offset) in parts
+                        for line in read_jsonl_lines_in_range(
+                            in_file_path, start_offset, end_offset
+                        )
+                    ]
+                    self.assertEqual(lines, expected_lines)
+
+        self.assertEqual(
+            len(split_jsonl_file(os.path.join(in_path, 'lexemes.jsonl'), 8, 1000000)), 1
+        )
+        with tempfile.TemporaryDirectory() as tmp_path:
+            empty_path = os.path.join(tmp_path, 'empty.jsonl')
+            with open(empty_path, 'wb'):
+                pass
+            self.assertEqual(split_jsonl_file(empty_path, 8), [])
+
+    #########################################
+    def test_dry_run(
+        self,
+    ) -> None:
+        '''
+        Test that a dry run counts the same rows as an export, whether in parallel or not.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        lexemes_path = os.path.join(in_path, 'lexemes.jsonl')
+        wordforms_path = os.path.join(in_path, 'wordforms.jsonl')
+        lexeme_cleaners = [get_lexeme_cleaner('pending'), get_lexeme_cleaner('lemma_spaces')]
+        wordform_cleaners = [
+            get_wordform_cleaner('pending'), get_wordform_cleaner('missing_lexeme')
+        ]
+
+        lexeme_counts_listener = LexemePipelineListenerCounts()
+        lexeme_pipeline = LexemePipeline(lexeme_cleaners, NullLexemeExporter())
+        lexeme_pipeline.add_listener(lexeme_counts_listener)
+        lexeme_pipeline.create('')
+        lexeme_pipeline.convert_file(lexemes_path)
+        expected_lexeme_counts = lexeme_counts_listener.get_counts()
+        expected_id_map = lexeme_pipeline.get_id_map()
+
+        wordform_counts_listener = WordformPipelineListenerCounts()
+        wordform_pipeline = WordformPipeline(wordform_cleaners, NullWordformExporter())
+        wordform_pipeline.add_listener(wordform_counts_listener)
+        wordform_pipeline.create('')
+        wordform_pipeline.convert_file(wordforms_path, expected_id_map)
+        expected_wordform_counts = wordform_counts_listener.get_counts()
+
+        self.assertEqual(
+            expected_lexeme_counts['num_rows'], len(list(read_jsonl_lines(lexemes_path)))
+        )
+        self.assertEqual(
+            expected_wordform_counts['num_rows'], len(list(read_jsonl_lines(wordforms_path)))
+        )
+        self.assertGreater(sum(expected_wordform_counts['num_skipped_by_cleaner'].values()), 0)
+
+        for (num_processes, min_part_size) in [(1, 0), (2, 0), (2, 1000000)]:
+            with self.subTest(num_processes=num_processes, min_part_size=min_part_size):
+                (lexeme_counts, id_map) = dry_run_lexemes(
+                    lexemes_path, lexeme_cleaners, num_processes, min_part_size
+                )
+                self.assertEqual(lexeme_counts, expected_lexeme_counts)
+                self.assertEqual(id_map, expected_id_map)
+                wordform_counts = dry_run_wordforms(
+                    wordforms_path, wordform_cleaners, id_map, num_processes, min_part_size
+                )
+                self.assertEqual(wordform_counts, expected_wordform_counts)
+
+    #########################################
+    def test_stateful_cleaners(
+        self,
+    ) -> None:
+        '''
+        Test that cleaners that keep state between rows see every row in a single process.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        wordforms_path = os.path.join(in_path, 'wordforms.jsonl')
+        wordform_cleaners = [get_wordform_cleaner('duplicate_id')]
+
+        wordform_counts_listener = WordformPipelineListenerCounts()
+        wordform_pipeline = WordformPipeline(wordform_cleaners, NullWordformExporter())
+        wordform_pipeline.add_listener(wordform_counts_listener)
+        wordform_pipeline.create('')
+        wordform_pipeline.convert_file(wordforms_path, {})
+        expected_wordform_counts = wordform_counts_listener.get_counts()
+        self.assertGreater(expected_wordform_counts['num_skipped_by_cleaner']['duplicate_id'], 0)
+
+        wordform_counts = dry_run_wordforms(wordforms_path, wordform_cleaners, {}, 4, 0)
+        self.assertEqual(wordform_counts, expected_wordform_counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,330 @@
+'''
+Test the duplicate_detection requirement.
+'''
+
+import os
+import csv
+import json
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.duplicate_detection import (
+    KeySizeMismatchException,
+    BloomFilter,
+    CompactKeySet,
+    DuplicateDetector,
+    find_duplicates,
+)
+from gabra_converter.converters.checkpoint import load_checkpoint, remove_checkpoint
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import get_lexeme_cleaner
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_wordform_cleaner
+)
+from gabra_converter.converters.wordforms.exporters.jsonl_wordform_exporter import (
+    JSONLWordformExporter,
+    get_wordform_json_object,
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.row.wordform_row_content import (
+    get_wordform_content_key,
+    get_wordform_content_object,
+)
+from gabra_converter.duplicates_report import write_duplicates_report
+from gabra_converter.row_iterators import iter_lexemes, iter_wordforms
+
+
+#########################################
+def write_duplicated_inputs(
+    tmp_path: str,
+) -> tuple[str, str, list[str], list[str]]:
+    '''
+    Write copies of the pipeline test inputs with duplicates added at the end.
+        A copy of the first lexeme is added to the lexemes whilst a copy of the first wordform
+        and a copy of the second wordform with a new ID are added to the wordforms.
+
+    :param tmp_path: The directory to write the files in.
+    :return: A tuple with the path to the lexemes file, the path to the wordforms file, the IDs
+        of the first lexeme and first wordform, and the IDs of the second wordform and its copy.
+    '''
+    in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+
+    lexeme_lines = list(read_jsonl_lines(os.path.join(in_path, 'lexemes.jsonl')))
+    lexemes_path = os.path.join(tmp_path, 'lexemes.jsonl')
+    with open(lexemes_path, 'wb') as f:
+        f.writelines(lexeme_lines + [lexeme_lines[0]])
+
+    wordform_lines = list(read_jsonl_lines(os.path.join(in_path, 'wordforms.jsonl')))
+    copied_wordform = json.loads(wordform_lines[1])
+    copied_wordform['_id']['$oid'] = 'ffffffffffffffffffffffff'
+    wordforms_path = os.path.join(tmp_path, 'wordforms.jsonl')
+    with open(wordforms_path, 'wb') as f:
+        f.writelines(
+            wordform_lines
+            + [wordform_lines[0], (json.dumps(copied_wordform) + '\n').encode('utf-8')]
+        )
+
+    return (
+        lexemes_path,
+        wordforms_path,
+        [
+            json.loads(lexeme_lines[0])['_id']['$oid'],
+            json.loads(wordform_lines[0])['_id']['$oid'],
+        ],
+        [
+            json.loads(wordform_lines[1])['_id']['$oid'],
+            'ffffffffffffffffffffffff',
+        ],
+    )
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_bloom_filter(
+        self,
+    ) -> None:
+        '''
+        Test that the Bloom filter has no false negatives and few false positives.
+        '''
+        bloom_filter = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom_filter.add(str(i).encode())
+        for i in range(1000):
+            self.assertIn(str(i).encode(), bloom_filter)
+            self.assertTrue(bloom_filter.add(str(i).encode()))
+        num_false_positives = sum(str(i).encode() in bloom_filter for i in range(1000, 11000))
+        self.assertLess(num_false_positives, 300)
+
+    #########################################
+    def test_compact_key_set(
+        self,
+    ) -> None:
+        '''
+        Test that the compact key set keeps every key exactly as it grows.
+        '''
+        key_set = CompactKeySet(4, initial_capacity=4)
+        for i in range(5000):
+            self.assertTrue(key_set.add(i.to_bytes(4, 'little')))
+        for i in range(5000):
+            self.assertFalse(key_set.add(i.to_bytes(4, 'little')))
+            self.assertIn(i.to_bytes(4, 'little'), key_set)
+        self.assertNotIn((5000).to_bytes(4, 'little'), key_set)
+        self.assertNotIn(b'0', key_set)
+        self.assertEqual(len(key_set), 5000)
+        self.assertEqual(
+            key_set.get_packed_keys(4998),
+            (4998).to_bytes(4, 'little') + (4999).to_bytes(4, 'little'),
+        )
+        with self.assertRaises(KeySizeMismatchException):
+            key_set.add(b'0')
+
+    #########################################
+    def test_duplicate_detector(
+        self,
+    ) -> None:
+        '''
+        Test that the duplicate detector only reports repeated keys, of any size.
+        '''
+        detector = DuplicateDetector(key_size=4)
+        for i in range(1000):
+            self.assertFalse(detector.add(i.to_bytes(4, 'little')))
+        for i in range(0, 1000, 10):
+            self.assertTrue(detector.add(i.to_bytes(4, 'little')))
+        self.assertFalse(detector.add(b'a longer key'))
+        self.assertTrue(detector.add(b'a longer key'))
+        self.assertEqual(len(detector), 1001)
+
+        detector.reset()
+        self.assertEqual(len(detector), 0)
+        self.assertFalse(detector.add((0).to_bytes(4, 'little')))
+
+    #########################################
+    def test_find_duplicates(
+        self,
+    ) -> None:
+        '''
+        Test that every occurrence of every repeated key is found.
+        '''
+        keys = [str(i%700).encode() for i in range(1000)]
+        duplicates = find_duplicates(
+            lambda: ((key, i) for (i, key) in enumerate(keys)), expected_count=1000,
+        )
+        self.assertEqual(
+            duplicates,
+            [[i, i + 700] for i in range(300)],
+        )
+
+    #########################################
+    def test_content_key(
+        self,
+    ) -> None:
+        '''
+        Test that the content key of a wordform ignores its ID and that the exported JSON object
+        is made of the IDs and the same content.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (_, wordforms_path, _, copied_ids) = write_duplicated_inputs(tmp_path)
+            rows = list(iter_wordforms(wordforms_path))
+        [row, copied_row] = [
+            [row for row in rows if row.id_.oid == id_][0] for id_ in copied_ids
+        ]
+        self.assertEqual(get_wordform_content_key(row), get_wordform_content_key(copied_row))
+        self.assertNotEqual(get_wordform_content_key(row), get_wordform_content_key(rows[0]))
+
+        json_object = get_wordform_json_object(1, row, {row.lexeme_id.oid: 2})
+        self.assertEqual(
+            list(json_object.items())[:3],
+            [('new_id', 1), ('new_lexeme_id', 2), ('_id', row.id_.oid)],
+        )
+        self.assertEqual(dict(list(json_object.items())[3:]), get_wordform_content_object(row))
+
+    #########################################
+    def test_cleaners(
+        self,
+    ) -> None:
+        '''
+        Test that the duplicate cleaners skip the duplicates and forget them when a pipeline is
+        created again.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (lexemes_path, wordforms_path, _, _) = write_duplicated_inputs(tmp_path)
+            in_path = os.path.join(
+                gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input'
+            )
+            num_lexemes = len(list(iter_lexemes(os.path.join(in_path, 'lexemes.jsonl'))))
+            num_wordforms = len(list(iter_wordforms(os.path.join(in_path, 'wordforms.jsonl'))))
+
+            lexeme_cleaners = [get_lexeme_cleaner('duplicate_id')]
+            wordform_cleaners = [
+                get_wordform_cleaner('duplicate_id'),
+                get_wordform_cleaner('duplicate_wordform'),
+            ]
+            for _ in range(2):
+                self.assertEqual(
+                    len(list(iter_lexemes(lexemes_path, lexeme_cleaners))),
+                    num_lexemes,
+                )
+                # The test input already has 4 valid wordforms with the same ID.
+                self.assertEqual(
+                    len(list(iter_wordforms(wordforms_path, wordform_cleaners))),
+                    num_wordforms - 3,
+                )
+
+            exporter = NullLexemeExporter()
+            lexeme_pipeline = LexemePipeline(lexeme_cleaners, exporter)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(lexemes_path)
+            self.assertEqual(len(lexeme_pipeline.get_id_map()), num_lexemes)
+
+    #########################################
+    def test_resume(
+        self,
+    ) -> None:
+        '''
+        Test that the duplicate cleaners remember the rows cleaned before a checkpoint when a
+        conversion is resumed from it, even if more rows were cleaned after it, so that the output
+        is the same as that of an uninterrupted conversion, including after moving the output
+        folder.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (lexemes_path, wordforms_path, _, _) = write_duplicated_inputs(tmp_path)
+            lexeme_pipeline = LexemePipeline([], NullLexemeExporter())
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(lexemes_path)
+            lexemes_id_map = lexeme_pipeline.get_id_map()
+
+            # The copies at the end of the wordforms are duplicates of the wordforms at the start.
+            wordform_lines = list(read_jsonl_lines(wordforms_path))
+            first_part_path = os.path.join(tmp_path, 'first_part.jsonl')
+            with open(first_part_path, 'wb') as part_f:
+                part_f.writelines(wordform_lines[:len(wordform_lines)//2])
+            second_part_path = os.path.join(tmp_path, 'second_part.jsonl')
+            with open(second_part_path, 'wb') as part_f:
+                part_f.writelines(wordform_lines[:-1])
+
+            #########################################
+            def get_pipeline(
+            ) -> WordformPipeline:
+                '''
+                Get a new wordform pipeline with the duplicate cleaners.
+
+                :return: The pipeline.
+                '''
+                return WordformPipeline(
+                    [
+                        get_wordform_cleaner('duplicate_id'),
+                        get_wordform_cleaner('duplicate_wordform'),
+                    ],
+                    JSONLWordformExporter(),
+                )
+
+            expected_path = os.path.join(tmp_path, 'expected')
+            os.mkdir(expected_path)
+            pipeline = get_pipeline()
+            pipeline.create(expected_path)
+            pipeline.convert_file(wordforms_path, lexemes_id_map)
+
+            out_path = os.path.join(tmp_path, 'out')
+            os.mkdir(out_path)
+            checkpoint_path = os.path.join(out_path, 'wordforms_checkpoint.json')
+            pipeline = get_pipeline()
+            pipeline.create(out_path)
+            pipeline.convert_file(first_part_path, lexemes_id_map, None, checkpoint_path, 2)
+            checkpoint = load_checkpoint(checkpoint_path)
+
+            # Clean more rows after the checkpoint before resuming from it in a new pipeline, as
+            # if the program crashed and was restarted.
+            pipeline = get_pipeline()
+            pipeline.resume(out_path, checkpoint, checkpoint_path)
+            pipeline.convert_file(second_part_path, lexemes_id_map, None, checkpoint_path, 2)
+
+            # The saved keys are found next to the checkpoint even if the folder was moved.
+            moved_out_path = os.path.join(tmp_path, 'moved_out')
+            os.rename(out_path, moved_out_path)
+            out_path = moved_out_path
+            checkpoint_path = os.path.join(out_path, 'wordforms_checkpoint.json')
+            pipeline = get_pipeline()
+            pipeline.resume(out_path, checkpoint, checkpoint_path)
+            pipeline.convert_file(wordforms_path, lexemes_id_map, None, checkpoint_path, 2)
+            remove_checkpoint(checkpoint_path)
+
+            self.assertEqual(os.listdir(out_path), ['wordforms.ndjson'])
+            with open(os.path.join(expected_path, 'wordforms.ndjson'), 'r', encoding='utf-8') as f:
+                expected_output = f.readlines()
+            with open(os.path.join(out_path, 'wordforms.ndjson'), 'r', encoding='utf-8') as f:
+                self.assertEqual(f.readlines(), expected_output)
+
+    #########################################
+    def test_report(
+        self,
+    ) -> None:
+        '''
+        Test that the report lists the duplicates.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            (lexemes_path, wordforms_path, repeated_ids, copied_ids) = write_duplicated_inputs(
+                tmp_path
+            )
+            report_path = os.path.join(tmp_path, 'duplicates.csv')
+            num_duplicates = write_duplicates_report(lexemes_path, wordforms_path, report_path)
+            with open(report_path, 'r', encoding='utf-8', newline='') as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(num_duplicates, 5)
+            self.assertEqual(
+                rows,
+                [
+                    ['collection', 'duplicate_type', 'num_occurrences', '_ids'],
+                    ['lexemes', 'id', '2', f'{repeated_ids[0]} {repeated_ids[0]}'],
+                    ['wordforms', 'id', '2', f'{repeated_ids[1]} {repeated_ids[1]}'],
+                    ['wordforms', 'id', '4', ' '.join(['63b1e1a814e849fa182bcfcd']*4)],
+                    ['wordforms', 'content', '2', f'{repeated_ids[1]} {repeated_ids[1]}'],
+                    ['wordforms', 'content', '2', ' '.join(copied_ids)],
+                ],
+            )
@@ -3,6 +3,7 @@ Test the export requirement.
 '''
 
 import os
+import csv
 import tempfile
 import unittest
 import json
@@ -144,6 +145,83 @@ class Test(unittest.TestCase):
                 self.assertEqual(expected_output, actual_output, msg=fname)
 
 
+    #########################################
+    def test_jsonl(
+        self,
+    ) -> None:
+        '''
+        Test the JSON lines exporters by comparing the fields of their objects to the expected
+        output of the CSV exporters.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'export', 'test_input')
+        expected_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'export', 'test_expected'
+        )
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporters = [
+                exporter for exporter in get_all_lexeme_exporters()
+                if exporter.id_ == 'jsonl'
+            ]
+            self.assertEqual(len(lexeme_exporters), 1)
+            lexeme_exporter = lexeme_exporters[0]
+
+            lexeme_exporter.create(tmp_path)
+            with open(os.path.join(in_path, 'lexemes.jsonl'), 'r', encoding='utf-8') as f:
+                for line in f:
+                    lexeme_exporter.add_row(LexemeRow(**json.loads(line.strip())))
+            lexeme_exporter.conversion_ended()
+            lexeme_ids = lexeme_exporter.get_id_map()
+
+            wordform_exporters = [
+                exporter for exporter in get_all_wordform_exporters()
+                if exporter.id_ == 'jsonl'
+            ]
+            self.assertEqual(len(wordform_exporters), 1)
+            wordform_exporter = wordform_exporters[0]
+
+            wordform_exporter.create(tmp_path)
+            with open(os.path.join(in_path, 'wordforms.jsonl'), 'r', encoding='utf-8') as f:
+                for line in f:
+                    wordform_exporter.add_row(WordformRow(**json.loads(line.strip())), lexeme_ids)
+            wordform_exporter.conversion_ended()
+
+            self.assertEqual(
+                set(os.listdir(tmp_path)), {'lexemes.ndjson', 'wordforms.ndjson'}
+            )
+            for name in ['lexemes', 'wordforms']:
+                with open(
+                    os.path.join(tmp_path, f'{name}.ndjson'), 'r', encoding='utf-8'
+                ) as f:
+                    objects = [json.loads(line) for line in f]
+                with open(
+                    os.path.join(expected_path, f'{name}.csv'), 'r', encoding='utf-8', newline=''
+                ) as f:
+                    expected_rows = list(csv.DictReader(f))
+                with open(
+                    os.path.join(expected_path, f'{name}_alternatives.csv'),
+                    'r', encoding='utf-8', newline=''
+                ) as f:
+                    num_expected_alternatives = len(list(csv.DictReader(f)))
+
+                self.assertEqual(len(objects), len(expected_rows), msg=name)
+                for (obj, expected_row) in zip(objects, expected_rows):
+                    for (column, expected_value) in expected_row.items():
+                        value = obj
+                        for key in column.split('-'):
+                            value = value[key] if value is not None else None
+                        if value is None:
+                            value = ''
+                        elif isinstance(value, bool):
+                            value = '1' if value else '0'
+                        self.assertEqual(
+                            str(value), expected_value, msg=f'{name} {obj["new_id"]} {column}'
+                        )
+                self.assertEqual(
+                    sum(len(obj['alternatives'] or []) for obj in objects),
+                    num_expected_alternatives,
+                    msg=name,
+                )
+
 #########################################
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,133 @@
+'''
+Test the fts_index requirement.
+'''
+
+import os
+import csv
+import sqlite3
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_fts_index \
+    import LexemePipelineListenerFTSIndex
+
+
+#########################################
+def read_index(
+    index_path: str,
+) -> tuple[list[tuple[int, str, int]], list[tuple[int, str, int]]]:
+    '''
+    Read the whole contents of an FTS5 index.
+
+    :param index_path: The path to the index.
+    :return: A pair consisting of the (rowid, gloss, new_lexeme_id) triples of the glosses
+        table and the (rowid, example, new_gloss_id) triples of the examples table.
+    '''
+    conn = sqlite3.connect(index_path)
+    try:
+        glosses = list(conn.execute(
+            'SELECT rowid, gloss, new_lexeme_id FROM glosses ORDER BY rowid'
+        ))
+        examples = list(conn.execute(
+            'SELECT rowid, example, new_gloss_id FROM examples ORDER BY rowid'
+        ))
+    finally:
+        conn.close()
+    return (glosses, examples)
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_(
+        self,
+    ) -> None:
+        '''
+        Test building an index whilst converting and compare it to the exported CSV files.
+        '''
+        in_file_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'lexemes.jsonl'
+        )
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(LexemePipelineListenerFTSIndex())
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(in_file_path)
+
+            with open(
+                os.path.join(tmp_path, 'lexemes_glosses.csv'), 'r', encoding='utf-8', newline=''
+            ) as f:
+                expected_glosses = [
+                    (int(row['new_id']), row['gloss'], int(row['new_lexeme_id']))
+                    for row in csv.DictReader(f)
+                ]
+            with open(
+                os.path.join(tmp_path, 'lexemes_examples.csv'), 'r', encoding='utf-8', newline=''
+            ) as f:
+                expected_examples = [
+                    (int(row['new_id']), row['example'], int(row['new_gloss_id']))
+                    for row in csv.DictReader(f)
+                ]
+            index_path = os.path.join(tmp_path, 'lexemes_fts.sqlite3')
+            self.assertEqual(read_index(index_path), (expected_glosses, expected_examples))
+
+            conn = sqlite3.connect(index_path)
+            try:
+                self.assertEqual(
+                    list(conn.execute(
+                        'SELECT new_lexeme_id FROM glosses WHERE glosses MATCH ?', ('coarsely',)
+                    )),
+                    [(3,)],
+                )
+            finally:
+                conn.close()
+
+    #########################################
+    def test_resume(
+        self,
+    ) -> None:
+        '''
+        Test that resuming from a checkpoint discards the rows added after it.
+        '''
+        lines = list(read_jsonl_lines(os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'lexemes.jsonl'
+        )))
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            listener = LexemePipelineListenerFTSIndex()
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(listener)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.add_row(lines[0])
+            checkpoint = listener.get_checkpoint()
+            expected = read_index(os.path.join(tmp_path, 'lexemes_fts.sqlite3'))
+            for line in lines[1:]:
+                lexeme_pipeline.add_row(line)
+            listener.get_checkpoint()
+
+            resumed_listener = LexemePipelineListenerFTSIndex()
+            resumed_listener.resume(tmp_path, checkpoint)
+            resumed_listener.conversion_ended()
+            self.assertEqual(read_index(os.path.join(tmp_path, 'lexemes_fts.sqlite3')), expected)
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
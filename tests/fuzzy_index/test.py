@@ -0,0 +1,223 @@
+'''
+Test the fuzzy_index requirement.
+'''
+
+import os
+import csv
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.checkpoint import load_checkpoint, remove_checkpoint
+from gabra_converter.converters.fuzzy_index import (
+    InvalidFuzzyIndexException,
+    fold_diacritics,
+    build_fuzzy_index,
+    FuzzyIndexReader,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_fuzzy_index \
+    import LexemePipelineListenerFuzzyIndex
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners import (
+    wordform_pipeline_listener_fuzzy_index
+)
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_fold_diacritics(
+        self,
+    ) -> None:
+        '''
+        Test folding words.
+        '''
+        self.assertEqual(fold_diacritics('Ħobż'), 'hobz')
+        self.assertEqual(fold_diacritics('ĊĠĦŻċġħż'), 'cghzcghz')
+        self.assertEqual(fold_diacritics('kafè àèìòù'), 'kafe aeiou')
+        self.assertEqual(fold_diacritics("ta'"), "ta'")
+
+    #########################################
+    def test_build(
+        self,
+    ) -> None:
+        '''
+        Test building an index directly and querying it.
+        '''
+        postings = {
+            'ħobż': [1, 7],
+            'Hobz': [3],
+            'żiemel': [2],
+            'ziemel': [4],
+            'ċaqlaq': [5],
+            'kafè': [6],
+            'kiteb': [8],
+            'kitbu': [9],
+            'ktibt': [10],
+        }
+        with tempfile.TemporaryDirectory() as tmp_path:
+            index_path = os.path.join(tmp_path, 'fuzzy.idx')
+            build_fuzzy_index(index_path, postings)
+            with FuzzyIndexReader(index_path) as reader:
+                self.assertEqual(len(reader), 7)
+                self.assertEqual(reader.get('hobz'), [1, 3, 7])
+                self.assertEqual(reader.get('ĦOBŻ'), [1, 3, 7])
+                self.assertEqual(reader.get('ziemel'), [2, 4])
+                self.assertEqual(reader.get('kafe'), [6])
+                self.assertEqual(reader.get('kafeè'), [])
+                self.assertEqual(reader.get(''), [])
+
+                self.assertEqual(reader.get_candidates('caqlaq', 0), [5])
+                self.assertEqual(reader.get_candidates('caqlak'), [5])
+                self.assertEqual(reader.get_candidates('hobs'), [1, 3, 7])
+                self.assertEqual(reader.get_candidates('kiteb'), [8])
+                self.assertEqual(reader.get_candidates('kiteb', 2), [8, 9])
+                self.assertEqual(reader.get_candidates('xxxxx', 2), [])
+
+            build_fuzzy_index(index_path, {})
+            with FuzzyIndexReader(index_path) as reader:
+                self.assertEqual(len(reader), 0)
+                self.assertEqual(reader.get('hobz'), [])
+                self.assertEqual(reader.get_candidates('hobz'), [])
+
+            with open(index_path, 'wb') as f:
+                f.write(b'not an index')
+            with self.assertRaises(InvalidFuzzyIndexException):
+                FuzzyIndexReader(index_path)
+
+    #########################################
+    def test_listeners(
+        self,
+    ) -> None:
+        '''
+        Test building indexes whilst converting and compare them to the exported rows.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(LexemePipelineListenerFuzzyIndex())
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            wordform_exporter = [
+                exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+            ][0]
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(
+                wordform_pipeline_listener_fuzzy_index.WordformPipelineListenerFuzzyIndex()
+            )
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+
+            for (name, word_field) in [('lexemes', 'lemma'), ('wordforms', 'surface_form')]:
+                expected: dict[str, list[int]] = {}
+                with open(
+                    os.path.join(tmp_path, f'{name}.csv'), 'r', encoding='utf-8', newline=''
+                ) as f:
+                    for row in csv.DictReader(f):
+                        expected.setdefault(fold_diacritics(row[word_field]), []).append(
+                            int(row['new_id'])
+                        )
+
+                self.assertFalse(
+                    os.path.exists(os.path.join(tmp_path, f'{name}_fuzzy_postings.tmp'))
+                )
+                with FuzzyIndexReader(os.path.join(tmp_path, f'{name}_fuzzy.idx')) as reader:
+                    self.assertEqual(len(reader), len(expected))
+                    for (folded, ids) in expected.items():
+                        self.assertEqual(reader.get(folded), ids)
+                        self.assertEqual(reader.get_candidates(folded, 0), ids)
+                        self.assertTrue(set(ids) <= set(reader.get_candidates(folded + 'x')))
+
+
+    #########################################
+    def test_resume_after_end(
+        self,
+    ) -> None:
+        '''
+        Test that conversions with the fuzzy index listeners can be resumed from their final
+        checkpoints, which need the postings files to be kept until the checkpoints are removed,
+        and that the indexes are the same.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexemes_checkpoint_path = os.path.join(tmp_path, 'lexemes_checkpoint.json')
+            wordforms_checkpoint_path = os.path.join(tmp_path, 'wordforms_checkpoint.json')
+            indexes = []
+            for resuming in [False, True]:
+                lexeme_pipeline = LexemePipeline(
+                    get_all_lexeme_cleaners(), get_all_lexeme_exporters()[0]
+                )
+                lexeme_pipeline.add_listener(LexemePipelineListenerFuzzyIndex())
+                wordform_pipeline = WordformPipeline(
+                    get_all_wordform_cleaners(), get_all_wordform_exporters()[0]
+                )
+                wordform_pipeline.add_listener(
+                    wordform_pipeline_listener_fuzzy_index.WordformPipelineListenerFuzzyIndex()
+                )
+                if resuming:
+                    lexeme_pipeline.resume(
+                        tmp_path, load_checkpoint(lexemes_checkpoint_path), lexemes_checkpoint_path
+                    )
+                    wordform_pipeline.resume(
+                        tmp_path,
+                        load_checkpoint(wordforms_checkpoint_path),
+                        wordforms_checkpoint_path,
+                    )
+                else:
+                    lexeme_pipeline.create(tmp_path)
+                    wordform_pipeline.create(tmp_path)
+                lexeme_pipeline.convert_file(
+                    os.path.join(in_path, 'lexemes.jsonl'), None, lexemes_checkpoint_path, 2
+                )
+                wordform_pipeline.convert_file(
+                    os.path.join(in_path, 'wordforms.jsonl'),
+                    lexeme_pipeline.get_id_map(),
+                    None,
+                    wordforms_checkpoint_path,
+                    2,
+                )
+                index = []
+                for name in ['lexemes', 'wordforms']:
+                    self.assertTrue(
+                        os.path.isfile(os.path.join(tmp_path, f'{name}_fuzzy_postings.tmp'))
+                    )
+                    with open(os.path.join(tmp_path, f'{name}_fuzzy.idx'), 'rb') as f:
+                        index.append(f.read())
+                indexes.append(index)
+            self.assertEqual(indexes[0], indexes[1])
+
+            remove_checkpoint(lexemes_checkpoint_path)
+            remove_checkpoint(wordforms_checkpoint_path)
+            lexeme_pipeline.remove_tmp_files()
+            wordform_pipeline.remove_tmp_files()
+            for name in ['lexemes', 'wordforms']:
+                self.assertFalse(
+                    os.path.exists(os.path.join(tmp_path, f'{name}_fuzzy_postings.tmp'))
+                )
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+'''
+Test the jsonl_index requirement.
+'''
+
+import os
+import json
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.jsonl_index import (
+    InvalidJSONLIndexException,
+    JSONLIndexReader,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_(
+        self,
+    ) -> None:
+        '''
+        Test building an index whilst converting and then reading lines using the index.
+        '''
+        in_file_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'lexemes.jsonl'
+        )
+        with open(in_file_path, 'rb') as f:
+            lines = [line.rstrip(b'\r\n') for line in f if line.strip() != b'']
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(tmp_path)
+            index_path = os.path.join(tmp_path, 'lexemes.jsonl.idx')
+            lexeme_pipeline.convert_file(in_file_path, index_path)
+
+            with JSONLIndexReader(in_file_path, index_path) as reader:
+                self.assertEqual(len(reader), len(lines))
+                for (line_num, line) in enumerate(lines):
+                    self.assertEqual(reader.get_line(line_num), line)
+                    id_ = json.loads(line.decode('utf-8').replace(',}', '}'))['_id']['$oid']
+                    self.assertEqual(reader.get_line_num(id_), line_num)
+                    self.assertEqual(reader.get_line_by_id(id_), line)
+                with self.assertRaises(IndexError):
+                    reader.get_line(len(lines))
+                with self.assertRaises(KeyError):
+                    reader.get_line_by_id('000000000000000000000000')
+                with self.assertRaises(KeyError):
+                    reader.get_line_by_id('not an ID')
+
+            with self.assertRaises(InvalidJSONLIndexException):
+                JSONLIndexReader(in_file_path, os.path.join(tmp_path, 'lexemes.csv'))
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+'''
+Test the memory_profile requirement.
+'''
+
+import os
+import tempfile
+import tracemalloc
+import unittest
+import gabra_converter
+from gabra_converter.pipeline_listener_memory_profile import PipelineListenerMemoryProfile
+from gabra_converter.converters.memory_profiler import (
+    MemoryProfilerNotStartedException,
+    MemoryProfiler,
+)
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners \
+    .lexeme_pipeline_listener_memory_profile import LexemePipelineListenerMemoryProfile
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners \
+    .wordform_pipeline_listener_memory_profile import WordformPipelineListenerMemoryProfile
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_memory_profile(
+        self,
+    ) -> None:
+        '''
+        Test that snapshots are taken at the stage boundaries and every number of rows and that
+        they are reported with their allocation sites and growth.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            report_path = os.path.join(tmp_path, 'memory_profile.txt')
+            profiler = MemoryProfiler(report_path, num_top=5)
+            with self.assertRaises(MemoryProfilerNotStartedException):
+                profiler.take_snapshot('too early')
+
+            pipeline_listener = PipelineListenerMemoryProfile(profiler)
+            profiler.start()
+            self.assertTrue(tracemalloc.is_tracing())
+            try:
+                pipeline_listener.started_exporting_lexemes()
+                lexeme_pipeline = LexemePipeline([], NullLexemeExporter())
+                lexeme_pipeline.add_listener(LexemePipelineListenerMemoryProfile(profiler, 3))
+                lexeme_pipeline.create(tmp_path)
+                lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+                pipeline_listener.ended_exporting_lexemes()
+
+                pipeline_listener.started_exporting_wordforms()
+                wordform_pipeline = WordformPipeline([], NullWordformExporter())
+                wordform_pipeline.add_listener(WordformPipelineListenerMemoryProfile(profiler, 5))
+                wordform_pipeline.create(tmp_path)
+                wordform_pipeline.convert_file(
+                    os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+                )
+                pipeline_listener.ended_exporting_wordforms()
+            finally:
+                profiler.stop()
+            self.assertFalse(tracemalloc.is_tracing())
+
+            expected_labels = [
+                'started_exporting_lexemes',
+                'lexemes: 3 rows',
+                'lexemes: 6 rows',
+                'lexemes: conversion ended after 7 rows',
+                'ended_exporting_lexemes',
+                'started_exporting_wordforms',
+                'wordforms: 5 rows',
+                'wordforms: 10 rows',
+                'wordforms: conversion ended after 14 rows',
+                'ended_exporting_wordforms',
+            ]
+            self.assertEqual([label for (label, _, _) in profiler.summary], expected_labels)
+
+            with open(report_path, 'r', encoding='utf-8') as f:
+                report = f.read()
+            sections = report.split('\n=== ')[1:]
+            self.assertEqual(
+                [section.split(' ===\n')[0] for section in sections],
+                expected_labels + ['Summary'],
+            )
+            for (i, section) in enumerate(sections[:-1]):
+                lines = section.split('\n')
+                self.assertTrue(lines[1].startswith('Traced memory: '))
+                self.assertEqual(lines[2], 'Largest allocation sites:')
+                self.assertIn('.py:', lines[3])
+                if i > 0:
+                    self.assertIn(f'Largest growth since {expected_labels[i - 1]}:', lines)
+            for label in expected_labels:
+                self.assertIn(f'  {label}\n', sections[-1])
+
+    #########################################
+    def test_already_tracing(
+        self,
+    ) -> None:
+        '''
+        Test that tracing started by someone else is not stopped by the profiler.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            tracemalloc.start()
+            try:
+                profiler = MemoryProfiler(os.path.join(tmp_path, 'memory_profile.txt'))
+                profiler.start()
+                profiler.take_snapshot('snapshot')
+                profiler.stop()
+                self.assertTrue(tracemalloc.is_tracing())
+            finally:
+                tracemalloc.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
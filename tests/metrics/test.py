@@ -0,0 +1,204 @@
+'''
+Test the metrics requirement.
+'''
+
+import os
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.pipeline_listener_metrics import PipelineListenerMetrics
+from gabra_converter.converters.conversion_metrics import LatencyHistogram, ConversionMetrics
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import get_lexeme_cleaner
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_counts \
+    import LexemePipelineListenerCounts
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_metrics \
+    import LexemePipelineListenerMetrics
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_wordform_cleaner
+)
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_counts \
+    import WordformPipelineListenerCounts
+from gabra_converter.converters.wordforms.pipeline.listeners \
+    .wordform_pipeline_listener_metrics import WordformPipelineListenerMetrics
+
+
+#########################################
+def read_samples(
+    path: str,
+) -> dict[str, float]:
+    '''
+    Read the samples of a metrics file.
+
+    :param path: The path to the file.
+    :return: A dictionary mapping the sample names with their labels to their values.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    if lines[-2:] != ['# EOF', '']:
+        raise ValueError('The metrics file does not end with # EOF.')
+    samples = {}
+    for line in lines[:-2]:
+        if not line.startswith('#'):
+            (name, value) = line.rsplit(' ', 1)
+            samples[name] = float(value)
+    return samples
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_histogram(
+        self,
+    ) -> None:
+        '''
+        Test that durations are counted in the buckets of their upper bounds.
+        '''
+        histogram = LatencyHistogram([0.1, 0.2])
+        for duration in [0.05, 0.1, 0.15, 0.2, 0.3, 5.0]:
+            histogram.observe(duration)
+        self.assertEqual(
+            histogram.get_cumulative_counts(), [(0.1, 2), (0.2, 4), (float('inf'), 6)]
+        )
+        self.assertAlmostEqual(histogram.sum, 5.8)
+
+    #########################################
+    def test_metrics(
+        self,
+    ) -> None:
+        '''
+        Test that the metrics file has the same counts as the rows converted.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            metrics_path = os.path.join(tmp_path, 'gabra_converter.prom')
+            metrics = ConversionMetrics(metrics_path, 0.0)
+            pipeline_listener = PipelineListenerMetrics(metrics)
+
+            pipeline_listener.started_exporting_lexemes()
+            samples = read_samples(metrics_path)
+            self.assertEqual(samples['gabra_converter_stage{stage="exporting_lexemes"}'], 1)
+            self.assertEqual(samples['gabra_converter_rows_read_total{collection="lexemes"}'], 0)
+
+            lexeme_counts_listener = LexemePipelineListenerCounts()
+            lexeme_exporter = NullLexemeExporter()
+            lexeme_pipeline = LexemePipeline(
+                [get_lexeme_cleaner('pending'), get_lexeme_cleaner('lemma_spaces')],
+                lexeme_exporter,
+            )
+            lexeme_pipeline.add_listener(lexeme_counts_listener)
+            lexeme_pipeline.add_listener(LexemePipelineListenerMetrics(metrics, lexeme_exporter))
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+            pipeline_listener.ended_exporting_lexemes()
+
+            pipeline_listener.started_exporting_wordforms()
+            wordform_counts_listener = WordformPipelineListenerCounts()
+            wordform_pipeline = WordformPipeline(
+                [get_wordform_cleaner('pending'), get_wordform_cleaner('missing_lexeme')],
+                NullWordformExporter(),
+            )
+            wordform_pipeline.add_listener(wordform_counts_listener)
+            wordform_pipeline.add_listener(WordformPipelineListenerMetrics(metrics))
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+            pipeline_listener.ended_exporting_wordforms()
+
+            self.assertEqual(os.listdir(tmp_path), ['gabra_converter.prom'])
+            samples = read_samples(metrics_path)
+            self.assertEqual(samples['gabra_converter_stage{stage="exporting_lexemes"}'], 0)
+            self.assertEqual(samples['gabra_converter_stage{stage="exporting_wordforms"}'], 0)
+            self.assertEqual(
+                samples['gabra_converter_id_map_size'], len(lexeme_pipeline.get_id_map())
+            )
+            self.assertGreater(samples['gabra_converter_last_update_timestamp_seconds'], 0)
+            for (collection, counts) in [
+                ('lexemes', lexeme_counts_listener.get_counts()),
+                ('wordforms', wordform_counts_listener.get_counts()),
+            ]:
+                label = f'collection="{collection}"'
+                self.assertEqual(
+                    samples[f'gabra_converter_rows_read_total{{{label}}}'], counts['num_rows']
+                )
+                self.assertEqual(
+                    samples[f'gabra_converter_rows_exported_total{{{label}}}'],
+                    counts['num_exported'],
+                )
+                self.assertEqual(
+                    samples[
+                        f'gabra_converter_rows_skipped_total{{{label},reason="invalid_json"'
+                        ',cleaner=""}'
+                    ],
+                    counts['num_invalid_json'],
+                )
+                self.assertEqual(
+                    samples[
+                        f'gabra_converter_rows_skipped_total{{{label},reason="schema_mismatch"'
+                        ',cleaner=""}'
+                    ],
+                    counts['num_schema_mismatch'],
+                )
+                for (cleaner_id, count) in counts['num_skipped_by_cleaner'].items():
+                    self.assertEqual(
+                        samples[
+                            f'gabra_converter_rows_skipped_total{{{label},reason="cleaner"'
+                            f',cleaner="{cleaner_id}"}}'
+                        ],
+                        count,
+                    )
+                # The first row is not timed as there is no previous row.
+                self.assertEqual(
+                    samples[f'gabra_converter_row_latency_seconds_count{{{label}}}'],
+                    counts['num_rows'] - 1,
+                )
+                self.assertEqual(
+                    samples[f'gabra_converter_row_latency_seconds_bucket{{{label},le="+Inf"}}'],
+                    counts['num_rows'] - 1,
+                )
+            self.assertGreater(
+                sum(wordform_counts_listener.get_counts()['num_skipped_by_cleaner'].values()), 0
+            )
+
+    #########################################
+    def test_interval(
+        self,
+    ) -> None:
+        '''
+        Test that the metrics are not written for every row before the interval passes.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            metrics_path = os.path.join(tmp_path, 'gabra_converter.prom')
+            metrics = ConversionMetrics(metrics_path, 3600.0)
+            PipelineListenerMetrics(metrics).started_exporting_lexemes()
+            lexeme_pipeline = LexemePipeline([], NullLexemeExporter())
+            lexeme_pipeline.add_listener(LexemePipelineListenerMetrics(metrics))
+            lexeme_pipeline.create(tmp_path)
+            lines = list(read_jsonl_lines(os.path.join(in_path, 'lexemes.jsonl')))
+            for line in lines:
+                lexeme_pipeline.add_row(line)
+            samples = read_samples(metrics_path)
+            self.assertEqual(samples['gabra_converter_rows_read_total{collection="lexemes"}'], 0)
+
+            metrics.next_write_time = 0.0
+            lexeme_pipeline.add_row(lines[0])
+            samples = read_samples(metrics_path)
+            self.assertEqual(
+                samples['gabra_converter_rows_read_total{collection="lexemes"}'], len(lines) + 1
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+'''
+Test the ordered_export requirement.
+'''
+
+import os
+import csv
+import random
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.external_sort import UnknownOrderException, sort_jsonl_file
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import get_lexeme_exporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.row.lexeme_row_order import get_lexeme_order_key
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_wordform_exporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.row.wordform_row_order import get_wordform_order_key
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_external_sort(
+        self,
+    ) -> None:
+        '''
+        Test that files are sorted stably regardless of how many runs are spilled and merged.
+        '''
+        rng = random.Random(0)
+        lines = [
+            f'{{"key":{rng.randrange(50)},"line":{i}}}\n'.encode('utf-8') for i in range(1000)
+        ]
+        expected_lines = sorted(lines, key=lambda line: int(line[7:line.index(b',')]))
+        with tempfile.TemporaryDirectory() as tmp_path:
+            in_path = os.path.join(tmp_path, 'in.jsonl')
+            with open(in_path, 'wb') as f:
+                f.writelines(lines[:-1] + [lines[-1].rstrip(b'\n'), b'\n'])
+
+            for (max_run_size, max_merge_fan_in, expected_num_runs) in [
+                (1000000, 64, 0),
+                (1000, 64, 22),
+                (1000, 2, 22),
+                (100, 3, 200),
+            ]:
+                with self.subTest(max_run_size=max_run_size, max_merge_fan_in=max_merge_fan_in):
+                    out_path = os.path.join(tmp_path, 'out.jsonl')
+                    num_runs = sort_jsonl_file(
+                        in_path,
+                        out_path,
+                        lambda line: int(line[7:line.index(b',')]),
+                        tmp_path,
+                        max_run_size,
+                        max_merge_fan_in,
+                    )
+                    self.assertEqual(num_runs, expected_num_runs)
+                    with open(out_path, 'rb') as f:
+                        self.assertEqual(f.readlines(), expected_lines)
+                    self.assertEqual(sorted(os.listdir(tmp_path)), ['in.jsonl', 'out.jsonl'])
+
+            sort_jsonl_file(in_path, in_path, lambda line: 0, tmp_path, 1000)
+            with open(in_path, 'rb') as f:
+                self.assertEqual(f.readlines(), lines)
+
+    #########################################
+    def test_unknown_order(
+        self,
+    ) -> None:
+        '''
+        Test that unknown orders are rejected.
+        '''
+        with self.assertRaises(UnknownOrderException):
+            get_lexeme_order_key('gloss')
+        with self.assertRaises(UnknownOrderException):
+            get_wordform_order_key('lemma', {})
+
+    #########################################
+    def test_ordered_export(
+        self,
+    ) -> None:
+        '''
+        Test that the exported lexemes and wordforms are in the requested order and numbered in
+        that order.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexemes_path = os.path.join(tmp_path, 'lexemes.jsonl')
+            wordforms_path = os.path.join(tmp_path, 'wordforms.jsonl')
+            sort_jsonl_file(
+                os.path.join(in_path, 'lexemes.jsonl'),
+                lexemes_path,
+                get_lexeme_order_key('lemma'),
+                tmp_path,
+                max_run_size=500,
+            )
+            self.assertEqual(
+                sorted(read_jsonl_lines(lexemes_path)),
+                sorted(
+                    line if line.endswith(b'\n') else line + b'\n'
+                    for line in read_jsonl_lines(os.path.join(in_path, 'lexemes.jsonl'))
+                ),
+            )
+
+            out_path = os.path.join(tmp_path, 'out')
+            os.makedirs(out_path)
+            lexeme_pipeline = LexemePipeline([], get_lexeme_exporter('csv'))
+            lexeme_pipeline.create(out_path)
+            lexeme_pipeline.convert_file(lexemes_path)
+
+            sort_jsonl_file(
+                os.path.join(in_path, 'wordforms.jsonl'),
+                wordforms_path,
+                get_wordform_order_key('new_lexeme_id', lexeme_pipeline.get_id_map()),
+                tmp_path,
+                max_run_size=500,
+            )
+            wordform_pipeline = WordformPipeline([], get_wordform_exporter('csv'))
+            wordform_pipeline.create(out_path)
+            wordform_pipeline.convert_file(wordforms_path, lexeme_pipeline.get_id_map())
+
+            with open(os.path.join(out_path, 'lexemes.csv'), 'r', encoding='utf-8') as f:
+                lexemes = list(csv.DictReader(f))
+            self.assertGreater(len(lexemes), 1)
+            self.assertEqual(
+                [lexeme['new_id'] for lexeme in lexemes],
+                [str(i) for i in range(1, len(lexemes) + 1)],
+            )
+            self.assertEqual(
+                [lexeme['lemma'] for lexeme in lexemes],
+                sorted(lexeme['lemma'] for lexeme in lexemes),
+            )
+
+            with open(os.path.join(out_path, 'wordforms.csv'), 'r', encoding='utf-8') as f:
+                wordforms = list(csv.DictReader(f))
+            self.assertGreater(len(wordforms), 1)
+            new_lexeme_ids = [
+                int(wordform['new_lexeme_id']) for wordform in wordforms
+                if wordform['new_lexeme_id'] != ''
+            ]
+            self.assertGreater(len(set(new_lexeme_ids)), 1)
+            self.assertEqual(new_lexeme_ids, sorted(new_lexeme_ids))
+            self.assertEqual(
+                [wordform['new_lexeme_id'] for wordform in wordforms[len(new_lexeme_ids):]],
+                [''] * (len(wordforms) - len(new_lexeme_ids)),
+            )
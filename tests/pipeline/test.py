@@ -5,7 +5,9 @@ Test the pipeline requirement.
 import os
 import tempfile
 import unittest
+from typing import Optional
 import gabra_converter
+from gabra_converter.converters.checkpoint import load_checkpoint, remove_checkpoint
 from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
     get_all_lexeme_cleaners
 )
@@ -21,9 +23,60 @@ from gabra_converter.converters.wordforms.exporters.wordform_exporter_list impor
 from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
     get_all_wordform_cleaners
 )
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
 from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
 from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener_skip_log \
     import WordformPipelineListenerSkipLog
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+from gabra_converter.converters.wordforms.row.wordform_row import WordformRow
+
+
+#########################################
+class SimulatedCrashException(Exception):
+    '''
+    Raised to simulate a crash during a conversion.
+    '''
+
+
+#########################################
+class CrashingWordformListener(WordformPipelineListener):
+    '''
+    Simulate a crash after a number of wordforms are exported.
+    '''
+
+    #########################################
+    def __init__(
+        self,
+        crash_after: Optional[int],
+    ) -> None:
+        '''
+        Initialiser.
+
+        :param crash_after: The number of rows to export before crashing or None to not crash.
+        '''
+        super().__init__()
+        self.crash_after = crash_after
+        self.count = 0
+
+    #########################################
+    def row_exported(
+        self,
+        json_line: bytes,
+        row: WordformRow,
+    ) -> None:
+        '''
+        Listen for when a row is successfully exported.
+
+        :param json_line: The raw UTF-8 encoded JSON line that was processed.
+        :param row: The processed row that was exported.
+        '''
+        self.count += 1
+        if self.crash_after is not None and self.count == self.crash_after:
+            raise SimulatedCrashException()
 
 
 #########################################
@@ -102,6 +155,175 @@ class Test(unittest.TestCase):
                 self.assertEqual(expected_output, actual_output, msg=fname)
 
 
+    #########################################
+    def test_resume(
+        self,
+    ) -> None:
+        '''
+        Test that resuming the pipelines from checkpoints after a crash gives the same output as
+        an uninterrupted conversion.
+        '''
+        lexemes_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'lexemes.jsonl'
+        )
+        wordforms_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'wordforms.jsonl'
+        )
+        lexeme_exporter = [
+            exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+        ][0]
+        wordform_exporter = [
+            exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+        ][0]
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexemes_checkpoint_path = os.path.join(tmp_path, 'lexemes_checkpoint.json')
+            wordforms_checkpoint_path = os.path.join(tmp_path, 'wordforms_checkpoint.json')
+
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(LexemePipelineListenerSkipLog())
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(lexemes_path, None, lexemes_checkpoint_path, 2)
+
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(WordformPipelineListenerSkipLog())
+            wordform_pipeline.add_listener(CrashingWordformListener(3))
+            wordform_pipeline.create(tmp_path)
+            with self.assertRaises(SimulatedCrashException):
+                wordform_pipeline.convert_file(
+                    wordforms_path, lexeme_pipeline.get_id_map(), None, wordforms_checkpoint_path, 2
+                )
+
+            # Resume in new pipelines as if the program was restarted.
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(LexemePipelineListenerSkipLog())
+            lexeme_pipeline.resume(
+                tmp_path, load_checkpoint(lexemes_checkpoint_path), lexemes_checkpoint_path
+            )
+            lexeme_pipeline.convert_file(lexemes_path, None, lexemes_checkpoint_path, 2)
+
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(WordformPipelineListenerSkipLog())
+            wordform_pipeline.add_listener(CrashingWordformListener(None))
+            wordform_pipeline.resume(
+                tmp_path, load_checkpoint(wordforms_checkpoint_path), wordforms_checkpoint_path
+            )
+            wordform_pipeline.convert_file(
+                wordforms_path, lexeme_pipeline.get_id_map(), None, wordforms_checkpoint_path, 2
+            )
+
+            remove_checkpoint(lexemes_checkpoint_path)
+            remove_checkpoint(wordforms_checkpoint_path)
+            for fname in os.listdir(tmp_path):
+                with open(
+                    os.path.join(
+                        gabra_converter.path, '..', '..', 'tests', 'pipeline',
+                        'test_expected', fname
+                    ),
+                    'r', encoding='utf-8'
+                ) as f:
+                    expected_output = f.readlines()
+                with open(os.path.join(tmp_path, fname), 'r', encoding='utf-8') as f:
+                    actual_output = f.readlines()
+                self.assertEqual(expected_output, actual_output, msg=fname)
+
+
+    #########################################
+    def test_resume_jsonl(
+        self,
+    ) -> None:
+        '''
+        Test that resuming the pipelines with the JSON lines exporters, which keep their files
+        open between rows, gives the same output as an uninterrupted conversion.
+        '''
+        lexemes_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'lexemes.jsonl'
+        )
+        wordforms_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'wordforms.jsonl'
+        )
+        lexeme_exporter = [
+            exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'jsonl'
+        ][0]
+        wordform_exporter = [
+            exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'jsonl'
+        ][0]
+
+        with tempfile.TemporaryDirectory() as expected_path, \
+                tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(expected_path)
+            lexeme_pipeline.convert_file(lexemes_path)
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.create(expected_path)
+            wordform_pipeline.convert_file(wordforms_path, lexeme_pipeline.get_id_map())
+
+            lexemes_checkpoint_path = os.path.join(tmp_path, 'lexemes_checkpoint.json')
+            wordforms_checkpoint_path = os.path.join(tmp_path, 'wordforms_checkpoint.json')
+
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(lexemes_path, None, lexemes_checkpoint_path, 2)
+
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(CrashingWordformListener(3))
+            wordform_pipeline.create(tmp_path)
+            with self.assertRaises(SimulatedCrashException):
+                wordform_pipeline.convert_file(
+                    wordforms_path, lexeme_pipeline.get_id_map(), None, wordforms_checkpoint_path, 2
+                )
+
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(CrashingWordformListener(None))
+            wordform_pipeline.resume(
+                tmp_path, load_checkpoint(wordforms_checkpoint_path), wordforms_checkpoint_path
+            )
+            wordform_pipeline.convert_file(
+                wordforms_path, lexeme_pipeline.get_id_map(), None, wordforms_checkpoint_path, 2
+            )
+
+            for fname in ['lexemes.ndjson', 'wordforms.ndjson']:
+                with open(os.path.join(expected_path, fname), 'r', encoding='utf-8') as f:
+                    expected_output = f.readlines()
+                with open(os.path.join(tmp_path, fname), 'r', encoding='utf-8') as f:
+                    actual_output = f.readlines()
+                self.assertGreater(len(expected_output), 0, msg=fname)
+                self.assertEqual(expected_output, actual_output, msg=fname)
+
+    #########################################
+    def test_listeners(
+        self,
+    ) -> None:
+        '''
+        Test that listeners added after creating the pipelines are notified and that the
+        cleaners and listeners cannot be changed without recompiling the row processing.
+        '''
+        wordforms_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'wordforms.jsonl'
+        )
+        lexeme_exporter = [
+            exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+        ][0]
+        with tempfile.TemporaryDirectory() as tmp_path:
+            wordform_pipeline = WordformPipeline([], NullWordformExporter())
+            wordform_pipeline.create(tmp_path)
+            listener = CrashingWordformListener(None)
+            wordform_pipeline.add_listener(listener)
+            wordform_pipeline.convert_file(wordforms_path, {})
+            self.assertGreater(listener.count, 0)
+
+            with self.assertRaises(AttributeError):
+                wordform_pipeline.listeners.append(listener)  # type: ignore
+            with self.assertRaises(AttributeError):
+                wordform_pipeline.cleaners.append(  # type: ignore
+                    get_all_wordform_cleaners()[0]
+                )
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            with self.assertRaises(AttributeError):
+                lexeme_pipeline.listeners.append(LexemePipelineListenerSkipLog())  # type: ignore
+            with self.assertRaises(AttributeError):
+                lexeme_pipeline.cleaners.append(get_all_lexeme_cleaners()[0])  # type: ignore
+
 #########################################
 if __name__ == '__main__':
     unittest.main()
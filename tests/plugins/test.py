@@ -0,0 +1,190 @@
+'''
+Test the plugins requirement.
+'''
+
+import os
+import sys
+import tempfile
+import textwrap
+import subprocess
+import unittest
+import gabra_converter
+from gabra_converter.converters.plugin_info import (
+    InvalidPluginException,
+    PluginInfo,
+    get_entry_point_plugin_infos,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_lexeme_cleaner_infos
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_lexeme_exporter_infos
+)
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_wordform_cleaner_infos
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_wordform_exporter_infos
+)
+
+
+#########################################
+def _get_import_times(
+    code: str,
+) -> dict[str, int]:
+    '''
+    Run Python code in a new interpreter and get the modules it imported.
+
+    :param code: The code to run.
+    :return: A dictionary mapping the name of every imported module to the time in microseconds
+        it took to import it, including the modules it imported.
+    '''
+    src_path = os.path.abspath(os.path.join(gabra_converter.path, '..'))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        env={**os.environ, 'PYTHONPATH': src_path},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and not line.endswith('| package'):
+            (_, cumulative, name) = line.split('|')
+            if cumulative.strip().isdigit():
+                import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_infos_match_plugins(
+        self,
+    ) -> None:
+        '''
+        Test that the descriptions of the plugins match the plugins themselves.
+        '''
+        for get_infos in [
+            get_lexeme_cleaner_infos,
+            get_wordform_cleaner_infos,
+            get_lexeme_exporter_infos,
+            get_wordform_exporter_infos,
+        ]:
+            for info in get_infos():
+                plugin = info.load()
+                self.assertIs(info.load(), plugin, msg=info.id_)
+                self.assertEqual(plugin.id_, info.id_, msg=info.id_)
+                self.assertEqual(plugin.description, info.description, msg=info.id_)
+                self.assertEqual(
+                    getattr(plugin, 'required_cleaners', set()), info.required_cleaners,
+                    msg=info.id_,
+                )
+
+    #########################################
+    def test_lazy_import(
+        self,
+    ) -> None:
+        '''
+        Test that listing the plugins does not import their implementations and that it takes
+        less time to import than the pipeline.
+        '''
+        import_times = _get_import_times(textwrap.dedent('''\
+            from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+                get_lexeme_cleaner_infos
+            )
+            from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+                get_lexeme_exporter_infos
+            )
+            from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+                get_wordform_cleaner_infos
+            )
+            from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+                get_wordform_exporter_infos
+            )
+            get_lexeme_cleaner_infos()
+            get_lexeme_exporter_infos()
+            get_wordform_cleaner_infos()
+            get_wordform_exporter_infos()
+        '''))
+        self.assertNotIn('pydantic', import_times)
+        for get_infos in [
+            get_lexeme_cleaner_infos,
+            get_wordform_cleaner_infos,
+            get_lexeme_exporter_infos,
+            get_wordform_exporter_infos,
+        ]:
+            for info in get_infos():
+                self.assertNotIn(info.module_name, import_times)
+        lists_time = sum(
+            import_time for (name, import_time) in import_times.items()
+            if name.endswith('_list')
+        )
+
+        pipeline_time = _get_import_times('import gabra_converter.pipeline')[
+            'gabra_converter.pipeline'
+        ]
+        self.assertLess(lists_time, pipeline_time)
+
+    #########################################
+    def test_entry_points(
+        self,
+    ) -> None:
+        '''
+        Test that plugins provided by installed packages through entry points are found.
+        '''
+        with tempfile.TemporaryDirectory() as tmp_path:
+            dist_info_path = os.path.join(tmp_path, 'gabra_test_plugin-1.0.dist-info')
+            os.makedirs(dist_info_path)
+            with open(os.path.join(dist_info_path, 'METADATA'), 'w', encoding='utf-8') as f:
+                f.write('Metadata-Version: 2.1\nName: gabra_test_plugin\nVersion: 1.0\n')
+            with open(
+                os.path.join(dist_info_path, 'entry_points.txt'), 'w', encoding='utf-8'
+            ) as f:
+                f.write(
+                    '[gabra_test_plugin.good]\n'
+                    'upper = gabra_test_plugin:UPPER_INFO\n'
+                    '[gabra_test_plugin.bad]\n'
+                    'upper = gabra_test_plugin:NOT_AN_INFO\n'
+                )
+            with open(os.path.join(tmp_path, 'gabra_test_plugin.py'), 'w', encoding='utf-8') as f:
+                f.write(textwrap.dedent('''\
+                    from gabra_converter.converters.plugin_info import PluginInfo
+                    UPPER_INFO = PluginInfo(
+                        'upper', 'Upper.', 'gabra_test_plugin_impl', 'UpperCleaner'
+                    )
+                    NOT_AN_INFO = 'upper'
+                '''))
+            with open(
+                os.path.join(tmp_path, 'gabra_test_plugin_impl.py'), 'w', encoding='utf-8'
+            ) as f:
+                f.write(textwrap.dedent('''\
+                    class UpperCleaner:
+                        def __init__(self):
+                            self.id_ = 'upper'
+                            self.description = 'Upper.'
+                '''))
+
+            sys.path.insert(0, tmp_path)
+            try:
+                infos = get_entry_point_plugin_infos('gabra_test_plugin.good')
+                self.assertEqual([info.id_ for info in infos], ['upper'])
+                self.assertIsInstance(infos[0], PluginInfo)
+                self.assertNotIn('gabra_test_plugin_impl', sys.modules)
+                self.assertEqual(infos[0].load().description, 'Upper.')
+
+                with self.assertRaises(InvalidPluginException):
+                    get_entry_point_plugin_infos('gabra_test_plugin.bad')
+            finally:
+                sys.path.remove(tmp_path)
+                for name in ['gabra_test_plugin', 'gabra_test_plugin_impl']:
+                    sys.modules.pop(name, None)
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+'''
+Test the root_index requirement.
+'''
+
+import os
+import csv
+import tempfile
+import unittest
+from typing import Optional
+import gabra_converter
+from gabra_converter.converters.checkpoint import load_checkpoint, remove_checkpoint
+from gabra_converter.converters.root_index import (
+    InvalidRootIndexException,
+    build_root_index,
+    RootIndexReader,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_root_index \
+    import LexemePipelineListenerRootIndex
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_build(
+        self,
+    ) -> None:
+        '''
+        Test building an index directly and querying it.
+        '''
+        postings: dict[tuple[str, Optional[int]], list[int]] = {
+            ('g-r-x', 2): [3],
+            ('g-r-x', 1): [5, 1],
+            ('g-r-x', None): [7],
+            ('g-r-x-x', None): [2],
+            ('ħ-b-ż', None): [4],
+            ('g-r', 10): [6],
+        }
+        with tempfile.TemporaryDirectory() as tmp_path:
+            index_path = os.path.join(tmp_path, 'roots.idx')
+            build_root_index(index_path, postings)
+            with RootIndexReader(index_path) as reader:
+                self.assertEqual(len(reader), 6)
+                self.assertEqual(reader.get('g-r-x', 1), [1, 5])
+                self.assertEqual(reader.get('g-r-x', 2), [3])
+                self.assertEqual(reader.get('g-r-x'), [7])
+                self.assertEqual(reader.get('g-r-x', 3), [])
+                self.assertEqual(reader.get('ħ-b-ż'), [4])
+                self.assertEqual(reader.get('g-r'), [])
+                self.assertEqual(reader.get_variants('g-r-x'), [None, 1, 2])
+                self.assertEqual(reader.get_variants('g-r'), [10])
+                self.assertEqual(reader.get_variants('g'), [])
+                self.assertEqual(reader.get_all_variants('g-r-x'), [1, 3, 5, 7])
+                self.assertEqual(reader.get_all_variants('x'), [])
+                self.assertIn(('g-r-x', 2), reader)
+                self.assertNotIn(('g-r-x', 3), reader)
+                self.assertNotIn('g-r-x', reader)
+                self.assertEqual(list(reader), [
+                    ('g-r', 10),
+                    ('g-r-x', None),
+                    ('g-r-x', 1),
+                    ('g-r-x', 2),
+                    ('g-r-x-x', None),
+                    ('ħ-b-ż', None),
+                ])
+                self.assertEqual(list(reader.iter_roots('g-r-x')), [
+                    ('g-r-x', None),
+                    ('g-r-x', 1),
+                    ('g-r-x', 2),
+                    ('g-r-x-x', None),
+                ])
+                self.assertEqual(list(reader.iter_roots('ħ')), [('ħ-b-ż', None)])
+                self.assertEqual(list(reader.iter_roots('k')), [])
+
+            build_root_index(index_path, {})
+            with RootIndexReader(index_path) as reader:
+                self.assertEqual(len(reader), 0)
+                self.assertEqual(reader.get('g-r-x'), [])
+                self.assertEqual(reader.get_all_variants('g-r-x'), [])
+                self.assertEqual(list(reader), [])
+
+            with open(index_path, 'wb') as f:
+                f.write(b'not an index')
+            with self.assertRaises(InvalidRootIndexException):
+                RootIndexReader(index_path)
+
+    #########################################
+    def test_listener(
+        self,
+    ) -> None:
+        '''
+        Test building an index whilst converting and compare it to the exported rows.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.add_listener(LexemePipelineListenerRootIndex())
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            expected: dict[tuple[str, Optional[int]], list[int]] = {}
+            with open(
+                os.path.join(tmp_path, 'lexemes.csv'), 'r', encoding='utf-8', newline=''
+            ) as f:
+                for row in csv.DictReader(f):
+                    if row['root-radicals'] != '':
+                        expected.setdefault((
+                            row['root-radicals'],
+                            int(row['root-variant']) if row['root-variant'] != '' else None,
+                        ), []).append(int(row['new_id']))
+            self.assertGreater(len(expected), 0)
+
+            self.assertFalse(os.path.exists(os.path.join(tmp_path, 'lexemes_roots.tmp')))
+            with RootIndexReader(os.path.join(tmp_path, 'lexemes_roots.idx')) as reader:
+                self.assertEqual(len(reader), len(expected))
+                self.assertEqual(list(reader), sorted(
+                    expected, key=lambda root: (root[0].encode('utf-8'), root[1] or -1)
+                ))
+                for ((radicals, variant), ids) in expected.items():
+                    self.assertEqual(reader.get(radicals, variant), ids)
+
+
+    #########################################
+    def test_resume_after_end(
+        self,
+    ) -> None:
+        '''
+        Test that a conversion with the root index listener can be resumed from its final
+        checkpoint, which needs the roots file to be kept until the checkpoint is removed, and
+        that the index is the same.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            checkpoint_path = os.path.join(tmp_path, 'lexemes_checkpoint.json')
+            roots_path = os.path.join(tmp_path, 'lexemes_roots.tmp')
+            indexes = []
+            for resuming in [False, True]:
+                lexeme_pipeline = LexemePipeline(
+                    get_all_lexeme_cleaners(), get_all_lexeme_exporters()[0]
+                )
+                lexeme_pipeline.add_listener(LexemePipelineListenerRootIndex())
+                if resuming:
+                    lexeme_pipeline.resume(
+                        tmp_path, load_checkpoint(checkpoint_path), checkpoint_path
+                    )
+                else:
+                    lexeme_pipeline.create(tmp_path)
+                lexeme_pipeline.convert_file(
+                    os.path.join(in_path, 'lexemes.jsonl'), None, checkpoint_path, 2
+                )
+                self.assertTrue(os.path.isfile(roots_path))
+                with open(os.path.join(tmp_path, 'lexemes_roots.idx'), 'rb') as f:
+                    indexes.append(f.read())
+            self.assertEqual(indexes[0], indexes[1])
+
+            remove_checkpoint(checkpoint_path)
+            lexeme_pipeline.remove_tmp_files()
+            self.assertFalse(os.path.exists(roots_path))
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
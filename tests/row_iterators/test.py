@@ -0,0 +1,150 @@
+'''
+Test the row_iterators requirement.
+'''
+
+import os
+import csv
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.row_iterators import iter_lexemes, iter_wordforms
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_jsonl(
+        self,
+    ) -> None:
+        '''
+        Test that the rows yielded from JSON lines files are the ones that are exported.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            wordform_exporter = [
+                exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+            ][0]
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+
+            with open(
+                os.path.join(tmp_path, 'lexemes.csv'), 'r', encoding='utf-8', newline=''
+            ) as f:
+                expected_lexemes = [(row['_id'], row['lemma']) for row in csv.DictReader(f)]
+            with open(
+                os.path.join(tmp_path, 'wordforms.csv'), 'r', encoding='utf-8', newline=''
+            ) as f:
+                expected_wordforms = [
+                    (row['_id'], row['surface_form']) for row in csv.DictReader(f)
+                ]
+
+        id_map: dict[str, int] = {}
+        self.assertEqual(
+            [
+                (row.id_.oid, row.lemma)
+                for row in iter_lexemes(
+                    os.path.join(in_path, 'lexemes.jsonl'), get_all_lexeme_cleaners(), id_map
+                )
+            ],
+            expected_lexemes,
+        )
+        self.assertEqual(id_map, lexeme_pipeline.get_id_map())
+        self.assertEqual(
+            [
+                (row.id_.oid, row.surface_form)
+                for row in iter_wordforms(
+                    os.path.join(in_path, 'wordforms.jsonl'), get_all_wordform_cleaners(), id_map
+                )
+            ],
+            expected_wordforms,
+        )
+
+        self.assertGreaterEqual(
+            len(list(iter_lexemes(os.path.join(in_path, 'lexemes.jsonl')))),
+            len(expected_lexemes),
+        )
+
+    #########################################
+    def test_laziness(
+        self,
+    ) -> None:
+        '''
+        Test that rows are only read as they are requested.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexemes_path = os.path.join(tmp_path, 'lexemes.jsonl')
+            with open(os.path.join(in_path, 'lexemes.jsonl'), 'rb') as f:
+                lines = f.read().splitlines(keepends=True)
+            with open(lexemes_path, 'wb') as f:
+                f.write(lines[0])
+                f.write(b'{"invalid json\n')
+
+            rows = iter_lexemes(lexemes_path)
+            self.assertEqual(next(rows).lemma, 'nikkiet')
+            with open(lexemes_path, 'ab') as f:
+                f.write(lines[1])
+            self.assertEqual(next(rows).lemma, 'ftaħir')
+            with self.assertRaises(StopIteration):
+                next(rows)
+
+    #########################################
+    def test_dump(
+        self,
+    ) -> None:
+        '''
+        Test that the rows yielded from a database dump are the ones in its collections.
+        '''
+        archive_extractor_path = os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'archive_extractor'
+        )
+        dump_path = os.path.join(archive_extractor_path, 'mock_dump.tar.gz')
+        self.assertEqual(
+            [row.id_.oid for row in iter_lexemes(dump_path)],
+            [
+                row.id_.oid for row in iter_lexemes(
+                    os.path.join(archive_extractor_path, 'mock_lexemes.jsonl')
+                )
+            ],
+        )
+        self.assertEqual(
+            [row.id_.oid for row in iter_wordforms(dump_path)],
+            [
+                row.id_.oid for row in iter_wordforms(
+                    os.path.join(archive_extractor_path, 'mock_wordforms.jsonl')
+                )
+            ],
+        )
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
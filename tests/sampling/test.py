@@ -0,0 +1,142 @@
+'''
+Test the sampling requirement.
+'''
+
+import os
+import json
+import tempfile
+import unittest
+from typing import Optional
+import gabra_converter
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.sampling import (
+    RowSampler,
+    sample_lexemes_file,
+    sample_wordforms_file,
+)
+
+
+#########################################
+def get_oid(
+    json_line: bytes,
+    field: str,
+) -> Optional[str]:
+    '''
+    Get a Ġabra ID field from a line.
+
+    :param json_line: The line.
+    :param field: The name of the ID field.
+    :return: The ID or None if it cannot be read.
+    '''
+    try:
+        oid = json.loads(json_line)[field]['$oid']
+    except (ValueError, KeyError, TypeError):
+        return None
+    return oid if isinstance(oid, str) else None
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_sampler(
+        self,
+    ) -> None:
+        '''
+        Test that samples are deterministic, of about the requested fraction, and differ by seed.
+        '''
+        keys = [f'{i:024x}'.encode('utf-8') for i in range(10000)]
+        for fraction in [0.01, 0.1, 0.5]:
+            with self.subTest(fraction=fraction):
+                sample = [key for key in keys if RowSampler(fraction).is_sampled(key)]
+                self.assertEqual(
+                    sample, [key for key in keys if RowSampler(fraction).is_sampled(key)]
+                )
+                self.assertAlmostEqual(len(sample)/len(keys), fraction, delta=0.01)
+
+                other_sample = [
+                    key for key in keys if RowSampler(fraction, 'other').is_sampled(key)
+                ]
+                self.assertNotEqual(sample, other_sample)
+
+        # A smaller fraction takes a subset of the sample of a larger one.
+        sampler_1 = RowSampler(0.1)
+        sampler_2 = RowSampler(0.5)
+        self.assertTrue(all(sampler_2.is_sampled(key) for key in keys if sampler_1.is_sampled(key)))
+
+        self.assertTrue(all(RowSampler(1.0).is_sampled(key) for key in keys))
+        for fraction in [0.0, -0.5, 1.5]:
+            with self.assertRaises(ValueError):
+                RowSampler(fraction)
+
+    #########################################
+    def test_sample_files(
+        self,
+    ) -> None:
+        '''
+        Test that the sampled wordforms are exactly those of the sampled lexemes and of the
+        sampled missing lexemes.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        lexemes_path = os.path.join(in_path, 'lexemes.jsonl')
+        wordforms_path = os.path.join(in_path, 'wordforms.jsonl')
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            sampled_lexemes_path = os.path.join(tmp_path, 'lexemes.jsonl')
+            sampled_wordforms_path = os.path.join(tmp_path, 'wordforms.jsonl')
+            for (fraction, seed) in [(0.5, ''), (0.5, 'other'), (0.2, ''), (1.0, '')]:
+                with self.subTest(fraction=fraction, seed=seed):
+                    sampler = RowSampler(fraction, seed)
+                    num_lexemes = sample_lexemes_file(lexemes_path, sampled_lexemes_path, sampler)
+                    num_wordforms = sample_wordforms_file(
+                        wordforms_path, sampled_wordforms_path, sampler
+                    )
+                    self.assertEqual(sorted(os.listdir(tmp_path)), sorted([
+                        'lexemes.jsonl', 'wordforms.jsonl',
+                    ]))
+
+                    all_lexeme_lines = list(read_jsonl_lines(lexemes_path))
+                    lexeme_lines = list(read_jsonl_lines(sampled_lexemes_path))
+                    self.assertEqual(len(lexeme_lines), num_lexemes)
+                    self.assertEqual(
+                        [line.rstrip(b'\n') for line in lexeme_lines],
+                        [
+                            line.rstrip(b'\n') for line in all_lexeme_lines
+                            if sampler.is_line_sampled(line, '_id')
+                        ],
+                    )
+                    all_lexeme_ids = {get_oid(line, '_id') for line in all_lexeme_lines}
+                    lexeme_ids = {get_oid(line, '_id') for line in lexeme_lines}
+
+                    wordform_lines = list(read_jsonl_lines(sampled_wordforms_path))
+                    self.assertEqual(len(wordform_lines), num_wordforms)
+                    expected_wordform_lines = []
+                    for line in read_jsonl_lines(wordforms_path):
+                        lexeme_id = get_oid(line, 'lexeme_id')
+                        if lexeme_id is None:
+                            if sampler.is_line_sampled(line, 'lexeme_id'):
+                                expected_wordform_lines.append(line.rstrip(b'\n'))
+                        elif lexeme_id in all_lexeme_ids:
+                            if lexeme_id in lexeme_ids:
+                                expected_wordform_lines.append(line.rstrip(b'\n'))
+                        elif sampler.is_sampled(lexeme_id.encode('utf-8')):
+                            expected_wordform_lines.append(line.rstrip(b'\n'))
+                    self.assertEqual(
+                        [line.rstrip(b'\n') for line in wordform_lines], expected_wordform_lines
+                    )
+
+                    if fraction == 1.0:
+                        self.assertEqual(num_lexemes, len(all_lexeme_lines))
+                        self.assertEqual(
+                            num_wordforms, len(list(read_jsonl_lines(wordforms_path)))
+                        )
+                    else:
+                        self.assertLess(num_lexemes, len(all_lexeme_lines))
+                        self.assertGreater(num_lexemes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+'''
+Test the stream_pipeline requirement.
+'''
+
+import io
+import os
+import json
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.stream_pipeline import stream_lexemes, stream_wordforms
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_csv(
+        self,
+    ) -> None:
+        '''
+        Test that the streamed CSV tables are the same as the exported main CSV files.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            wordform_exporter = [
+                exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+            ][0]
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+
+            with open(os.path.join(tmp_path, 'lexemes.csv'), 'r', encoding='utf-8') as f:
+                expected_lexemes = f.read()
+            with open(os.path.join(tmp_path, 'wordforms.csv'), 'r', encoding='utf-8') as f:
+                expected_wordforms = f.read()
+
+        lexemes_id_map: dict[str, int] = {}
+        with open(os.path.join(in_path, 'lexemes.jsonl'), 'rb') as in_f:
+            out_f = io.StringIO(newline=None)
+            stream_lexemes(
+                in_f,
+                out_f,
+                cleaners=get_all_lexeme_cleaners(),
+                stream_format='csv',
+                id_map=lexemes_id_map,
+            )
+        self.assertEqual(out_f.getvalue(), expected_lexemes)
+        self.assertEqual(lexemes_id_map, lexeme_pipeline.get_id_map())
+
+        with open(os.path.join(in_path, 'wordforms.jsonl'), 'rb') as in_f:
+            out_f = io.StringIO(newline=None)
+            stream_wordforms(
+                in_f,
+                out_f,
+                cleaners=get_all_wordform_cleaners(),
+                stream_format='csv',
+                lexemes_id_map=lexemes_id_map,
+            )
+        self.assertEqual(out_f.getvalue(), expected_wordforms)
+
+    #########################################
+    def test_ndjson(
+        self,
+    ) -> None:
+        '''
+        Test that the streamed NDJSON lines are the same as the lines exported by the jsonl
+        exporters and that the output is flushed incrementally.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'jsonl'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            wordform_exporter = [
+                exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'jsonl'
+            ][0]
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+
+            with open(os.path.join(tmp_path, 'lexemes.ndjson'), 'r', encoding='utf-8') as f:
+                expected_lexemes = f.read()
+            with open(os.path.join(tmp_path, 'wordforms.ndjson'), 'r', encoding='utf-8') as f:
+                expected_wordforms = f.read()
+
+        #########################################
+        class _FlushCounter(io.StringIO):
+            '''
+            A string stream that counts the number of lines written by the time of each flush.
+            '''
+
+            #########################################
+            def __init__(
+                self,
+            ) -> None:
+                '''
+                Initialiser.
+                '''
+                super().__init__()
+                self.flushed_line_counts: list[int] = []
+
+            #########################################
+            def flush(
+                self,
+            ) -> None:
+                '''
+                Record the number of lines written so far.
+                '''
+                super().flush()
+                self.flushed_line_counts.append(self.getvalue().count('\n'))
+
+        lexemes_id_map: dict[str, int] = {}
+        with open(os.path.join(in_path, 'lexemes.jsonl'), 'rb') as in_f:
+            out_f = _FlushCounter()
+            stream_lexemes(
+                in_f,
+                out_f,
+                cleaners=get_all_lexeme_cleaners(),
+                flush_interval=1,
+                id_map=lexemes_id_map,
+            )
+        self.assertEqual(out_f.getvalue(), expected_lexemes)
+        lines = out_f.getvalue().splitlines()
+        self.assertEqual(out_f.flushed_line_counts[:len(lines)], list(range(1, len(lines) + 1)))
+        self.assertEqual(
+            [json.loads(line)['_id'] for line in lines],
+            list(lexemes_id_map.keys()),
+        )
+
+        with open(os.path.join(in_path, 'wordforms.jsonl'), 'rb') as in_f:
+            out_f = _FlushCounter()
+            stream_wordforms(
+                in_f,
+                out_f,
+                cleaners=get_all_wordform_cleaners(),
+                lexemes_id_map=lexemes_id_map,
+            )
+        self.assertGreater(len(out_f.getvalue().splitlines()), 0)
+        self.assertEqual(out_f.getvalue(), expected_wordforms)
@@ -0,0 +1,172 @@
+'''
+Test the surface_form_lookup requirement.
+'''
+
+import os
+import csv
+import tempfile
+import unittest
+import gabra_converter
+from gabra_converter.converters.checkpoint import load_checkpoint, remove_checkpoint
+from gabra_converter.converters.surface_form_lookup import (
+    InvalidSurfaceFormLookupException,
+    build_surface_form_lookup,
+    SurfaceFormLookupReader,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners import (
+    wordform_pipeline_listener_surface_form_lookup
+)
+
+
+#########################################
+class Test(unittest.TestCase):
+    '''
+    As described.
+    '''
+
+    #########################################
+    def test_build(
+        self,
+    ) -> None:
+        '''
+        Test building a lookup file directly and looking up surface forms in it.
+        '''
+        postings = {
+            f'kelma{i}': list(range(i, 3*i + 1, i)) for i in range(1, 1001)
+        }
+        postings['ħobż'] = [5, 2]
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lookup_path = os.path.join(tmp_path, 'lookup.bin')
+            build_surface_form_lookup(lookup_path, postings)
+            with SurfaceFormLookupReader(lookup_path) as reader:
+                self.assertEqual(len(reader), len(postings))
+                for (surface_form, ids) in postings.items():
+                    self.assertIn(surface_form, reader)
+                    self.assertEqual(reader.get(surface_form), sorted(ids))
+                self.assertNotIn('kelma0', reader)
+                self.assertEqual(reader.get('kelma0'), [])
+                self.assertEqual(reader.get(''), [])
+
+            build_surface_form_lookup(lookup_path, {})
+            with SurfaceFormLookupReader(lookup_path) as reader:
+                self.assertEqual(len(reader), 0)
+                self.assertEqual(reader.get('kelma'), [])
+
+            with open(lookup_path, 'wb') as f:
+                f.write(b'not a lookup file')
+            with self.assertRaises(InvalidSurfaceFormLookupException):
+                SurfaceFormLookupReader(lookup_path)
+
+    #########################################
+    def test_listener(
+        self,
+    ) -> None:
+        '''
+        Test building a lookup file whilst converting and compare it to the exported wordforms.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_exporter = [
+                exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+            ][0]
+            lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            wordform_exporter = [
+                exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+            ][0]
+            wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+            wordform_pipeline.add_listener(
+                wordform_pipeline_listener_surface_form_lookup
+                .WordformPipelineListenerSurfaceFormLookup()
+            )
+            wordform_pipeline.create(tmp_path)
+            wordform_pipeline.convert_file(
+                os.path.join(in_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+            )
+
+            expected: dict[str, list[int]] = {}
+            with open(
+                os.path.join(tmp_path, 'wordforms.csv'), 'r', encoding='utf-8', newline=''
+            ) as f:
+                for row in csv.DictReader(f):
+                    expected.setdefault(row['surface_form'], []).append(int(row['new_id']))
+
+            self.assertFalse(
+                os.path.exists(os.path.join(tmp_path, 'wordforms_lookup_postings.tmp'))
+            )
+            with SurfaceFormLookupReader(os.path.join(tmp_path, 'wordforms_lookup.bin')) as reader:
+                self.assertEqual(len(reader), len(expected))
+                for (surface_form, ids) in expected.items():
+                    self.assertEqual(reader.get(surface_form), ids)
+
+
+    #########################################
+    def test_resume_after_end(
+        self,
+    ) -> None:
+        '''
+        Test that a conversion can be resumed from its final checkpoint, which needs the temporary
+        file to be kept until the checkpoint is removed, and that the lookup file is the same.
+        '''
+        in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+        with tempfile.TemporaryDirectory() as tmp_path:
+            lexeme_pipeline = LexemePipeline(
+                get_all_lexeme_cleaners(), get_all_lexeme_exporters()[0]
+            )
+            lexeme_pipeline.create(tmp_path)
+            lexeme_pipeline.convert_file(os.path.join(in_path, 'lexemes.jsonl'))
+
+            checkpoint_path = os.path.join(tmp_path, 'wordforms_checkpoint.json')
+            postings_path = os.path.join(tmp_path, 'wordforms_lookup_postings.tmp')
+            lookup_path = os.path.join(tmp_path, 'wordforms_lookup.bin')
+            lookups = []
+            for resuming in [False, True]:
+                wordform_pipeline = WordformPipeline(
+                    get_all_wordform_cleaners(), get_all_wordform_exporters()[0]
+                )
+                wordform_pipeline.add_listener(
+                    wordform_pipeline_listener_surface_form_lookup
+                    .WordformPipelineListenerSurfaceFormLookup()
+                )
+                if resuming:
+                    wordform_pipeline.resume(
+                        tmp_path, load_checkpoint(checkpoint_path), checkpoint_path
+                    )
+                else:
+                    wordform_pipeline.create(tmp_path)
+                wordform_pipeline.convert_file(
+                    os.path.join(in_path, 'wordforms.jsonl'),
+                    lexeme_pipeline.get_id_map(),
+                    None,
+                    checkpoint_path,
+                    2,
+                )
+                self.assertTrue(os.path.isfile(postings_path))
+                with open(lookup_path, 'rb') as f:
+                    lookups.append(f.read())
+            self.assertEqual(lookups[0], lookups[1])
+
+            remove_checkpoint(checkpoint_path)
+            wordform_pipeline.remove_tmp_files()
+            self.assertFalse(os.path.exists(postings_path))
+
+
+#########################################
+if __name__ == '__main__':
+    unittest.main()
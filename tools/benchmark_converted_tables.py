@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Benchmark the load time, memory usage, and lexeme to wordforms join time of the column oriented
+tables in ``converted_tables`` versus loading the exported CSV files into lists of dictionaries
+(and into pandas data frames if pandas is installed).
+'''
+
+import os
+import re
+import csv
+import time
+import argparse
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+import gabra_converter
+from gabra_converter.converters.converted_tables import load_converted_tables
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_all_wordform_exporters
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+
+
+_OID_PATTERN = re.compile(rb'"\$oid":"[0-9a-f]{8}([0-9a-f]{16})"')
+_TABLE_NAMES = [
+    'lexemes',
+    'lexemes_alternatives',
+    'lexemes_sources',
+    'lexemes_glosses',
+    'lexemes_examples',
+    'wordforms',
+    'wordforms_alternatives',
+    'wordforms_sources',
+]
+
+
+#########################################
+def generate_export(
+    out_path: str,
+    copies: int,
+) -> None:
+    '''
+    Export a synthetic database made by repeating the pipeline test input, with the Ġabra IDs
+    changed in every copy so that each copy's wordforms belong to the same copy's lexemes.
+
+    :param out_path: The folder in which to export.
+    :param copies: The number of times to repeat the test input.
+    '''
+    in_path = os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input')
+    for name in ['lexemes', 'wordforms']:
+        lines = [
+            line.rstrip(b'\r\n')
+            for line in read_jsonl_lines(os.path.join(in_path, f'{name}.jsonl'))
+        ]
+        with open(os.path.join(out_path, f'{name}.jsonl'), 'wb') as f:
+            for copy in range(copies):
+                prefix = f'{copy:08x}'.encode('ascii')
+                for line in lines:
+                    f.write(_OID_PATTERN.sub(b'"$oid":"' + prefix + rb'\1"', line) + b'\n')
+
+    lexeme_exporter = [
+        exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+    ][0]
+    lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+    lexeme_pipeline.create(out_path)
+    lexeme_pipeline.convert_file(os.path.join(out_path, 'lexemes.jsonl'))
+
+    wordform_exporter = [
+        exporter for exporter in get_all_wordform_exporters() if exporter.id_ == 'csv'
+    ][0]
+    wordform_pipeline = WordformPipeline(get_all_wordform_cleaners(), wordform_exporter)
+    wordform_pipeline.create(out_path)
+    wordform_pipeline.convert_file(
+        os.path.join(out_path, 'wordforms.jsonl'), lexeme_pipeline.get_id_map()
+    )
+
+
+#########################################
+def load_dicts(
+    out_path: str,
+) -> dict[str, list[dict[str, str]]]:
+    '''
+    Load the exported CSV files into lists of dictionaries.
+
+    :param out_path: The folder with the exported files.
+    :return: A dictionary mapping table names to their rows.
+    '''
+    tables: dict[str, list[dict[str, str]]] = {}
+    for name in _TABLE_NAMES:
+        with open(os.path.join(out_path, f'{name}.csv'), 'r', encoding='utf-8', newline='') as f:
+            tables[name] = list(csv.DictReader(f))
+    return tables
+
+
+#########################################
+def join_dicts(
+    tables: dict[str, list[dict[str, str]]],
+) -> list[tuple[int, int]]:
+    '''
+    Join lexemes to their wordforms using lists of dictionaries.
+
+    :param tables: The tables returned by ``load_dicts``.
+    :return: Pairs of lexeme and wordform IDs.
+    '''
+    lexeme_wordforms: dict[int, list[int]] = {}
+    for row in tables['wordforms']:
+        if row['new_lexeme_id'] != '':
+            lexeme_wordforms.setdefault(int(row['new_lexeme_id']), []).append(int(row['new_id']))
+    return [
+        (int(row['new_id']), wordform_id)
+        for row in tables['lexemes']
+        for wordform_id in lexeme_wordforms.get(int(row['new_id']), [])
+    ]
+
+
+#########################################
+def measure(
+    label: str,
+    load: Callable[[], Any],
+    join: Callable[[Any], list[tuple[int, int]]],
+) -> None:
+    '''
+    Measure and print the load time, memory usage, and join time of a way of loading the tables.
+
+    :param label: The name of the way of loading the tables.
+    :param load: A function that loads the tables.
+    :param join: A function that joins lexemes to their wordforms using the loaded tables.
+    '''
+    start_time = time.perf_counter()
+    tables = load()
+    load_duration = time.perf_counter() - start_time
+    del tables
+
+    # Memory is measured in a separate load as tracing allocations slows loading down.
+    tracemalloc.start()
+    tables = load()
+    (retained_size, peak_size) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start_time = time.perf_counter()
+    num_pairs = len(join(tables))
+    join_duration = time.perf_counter() - start_time
+
+    print(
+        f'{label}: load {load_duration:.2f}s,'
+        f' retained {retained_size/2**20:.1f}MiB,'
+        f' peak {peak_size/2**20:.1f}MiB,'
+        f' join {join_duration*1e3:.1f}ms ({num_pairs} pairs)'
+    )
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description=(
+            'Benchmark the load time, memory usage, and lexeme to wordforms join time of the'
+            ' column oriented converted tables versus lists of dictionaries (and pandas if'
+            ' installed).'
+        )
+    )
+    parser.add_argument(
+        '--out_path',
+        required=False,
+        default=None,
+        help=(
+            'A folder with lexemes and wordforms exported using the CSV exporters'
+            ' (a synthetic export is generated if not given).'
+        ),
+    )
+    parser.add_argument(
+        '--copies',
+        required=False,
+        type=int,
+        default=20000,
+        help='The number of times to repeat the test input in a synthetic export.',
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        out_path = args.out_path
+        if out_path is None:
+            out_path = tmp_path
+            generate_export(out_path, args.copies)
+            print(f'Generated a synthetic export with {args.copies} copies of the test input.')
+
+        measure(
+            'Column oriented tables',
+            lambda: load_converted_tables(out_path),
+            lambda tables: tables.join_lexeme_wordforms(),
+        )
+        measure(
+            'Lists of dictionaries',
+            lambda: load_dicts(out_path),
+            join_dicts,
+        )
+
+        try:
+            import pandas # pylint: disable=import-outside-toplevel
+        except ImportError:
+            print('pandas is not installed so it was not measured.')
+        else:
+            measure(
+                'pandas data frames',
+                lambda: {
+                    name: pandas.read_csv(
+                        os.path.join(out_path, f'{name}.csv'), dtype=str, keep_default_na=False
+                    )
+                    for name in _TABLE_NAMES
+                },
+                lambda tables: list(tables['lexemes'][['new_id']].merge(
+                    tables['wordforms'][['new_id', 'new_lexeme_id']],
+                    left_on='new_id',
+                    right_on='new_lexeme_id',
+                )[['new_id_x', 'new_id_y']].itertuples(index=False, name=None)),
+            )
+
+
+#########################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Benchmark the latency of looking up lexemes by a word in their glosses or examples using the
+FTS5 index versus a linear scan of the exported CSV files.
+'''
+
+import os
+import csv
+import re
+import argparse
+import sqlite3
+import tempfile
+import timeit
+import gabra_converter
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_all_lexeme_exporters
+)
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener_fts_index \
+    import LexemePipelineListenerFTSIndex
+
+
+#########################################
+def generate_export(
+    out_path: str,
+    copies: int,
+) -> None:
+    '''
+    Export a synthetic lexemes collection made by repeating the pipeline test input, together
+    with its FTS5 index.
+
+    :param out_path: The folder in which to export.
+    :param copies: The number of times to repeat the test input.
+    '''
+    lines = list(read_jsonl_lines(os.path.join(
+        gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', 'lexemes.jsonl'
+    )))
+    in_file_path = os.path.join(out_path, 'lexemes.jsonl')
+    with open(in_file_path, 'wb') as f:
+        for _ in range(copies):
+            for line in lines:
+                f.write(line.rstrip(b'\r\n') + b'\n')
+
+    lexeme_exporter = [
+        exporter for exporter in get_all_lexeme_exporters() if exporter.id_ == 'csv'
+    ][0]
+    lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+    lexeme_pipeline.add_listener(LexemePipelineListenerFTSIndex())
+    lexeme_pipeline.create(out_path)
+    lexeme_pipeline.convert_file(in_file_path)
+
+
+#########################################
+def search_csv(
+    out_path: str,
+    word: str,
+) -> set[int]:
+    '''
+    Find the lexemes with a word in their glosses or examples by scanning the CSV files.
+
+    :param out_path: The folder with the exported files.
+    :param word: The word to search for.
+    :return: The lexeme IDs.
+    '''
+    pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+    lexeme_ids: set[int] = set()
+    gloss_to_lexeme: dict[int, int] = {}
+    with open(
+        os.path.join(out_path, 'lexemes_glosses.csv'), 'r', encoding='utf-8', newline=''
+    ) as f:
+        for row in csv.DictReader(f):
+            gloss_to_lexeme[int(row['new_id'])] = int(row['new_lexeme_id'])
+            if pattern.search(row['gloss']) is not None:
+                lexeme_ids.add(int(row['new_lexeme_id']))
+    with open(
+        os.path.join(out_path, 'lexemes_examples.csv'), 'r', encoding='utf-8', newline=''
+    ) as f:
+        for row in csv.DictReader(f):
+            if pattern.search(row['example']) is not None:
+                lexeme_ids.add(gloss_to_lexeme[int(row['new_gloss_id'])])
+    return lexeme_ids
+
+
+#########################################
+def search_fts(
+    conn: sqlite3.Connection,
+    word: str,
+) -> set[int]:
+    '''
+    Find the lexemes with a word in their glosses or examples using the FTS5 index.
+
+    :param conn: The connection to the FTS5 index.
+    :param word: The word to search for.
+    :return: The lexeme IDs.
+    '''
+    query = '"' + word.replace('"', '""') + '"'
+    return {
+        lexeme_id for (lexeme_id,) in conn.execute(
+            'SELECT new_lexeme_id FROM glosses WHERE glosses MATCH ?'
+            ' UNION SELECT new_lexeme_id FROM examples WHERE examples MATCH ?',
+            (query, query),
+        )
+    }
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description=(
+            'Benchmark the latency of looking up lexemes by a word in their glosses or examples'
+            ' using the FTS5 index versus a linear scan of the exported CSV files.'
+        )
+    )
+    parser.add_argument(
+        '--out_path',
+        required=False,
+        default=None,
+        help=(
+            'A folder with lexemes exported using --fts_index'
+            ' (a synthetic export is generated if not given).'
+        ),
+    )
+    parser.add_argument(
+        '--copies',
+        required=False,
+        type=int,
+        default=20000,
+        help='The number of times to repeat the test input in a synthetic export.',
+    )
+    parser.add_argument(
+        '--queries',
+        required=False,
+        nargs='+',
+        default=['boasting', 'coarsely', 'raġel', 'nonexistent'],
+        help='The words to search for.',
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        out_path = args.out_path
+        if out_path is None:
+            out_path = tmp_path
+            generate_export(out_path, args.copies)
+            print(f'Generated a synthetic export with {args.copies} copies of the test input.')
+
+        conn = sqlite3.connect(os.path.join(out_path, 'lexemes_fts.sqlite3'))
+        try:
+            for word in args.queries:
+                fts_result = search_fts(conn, word)
+                if fts_result != search_csv(out_path, word):
+                    print(f'{word}: results differ')
+                fts_duration = min(timeit.repeat(
+                    lambda: search_fts(conn, word), # pylint: disable=cell-var-from-loop
+                    number=1,
+                    repeat=5,
+                ))
+                csv_duration = min(timeit.repeat(
+                    lambda: search_csv(out_path, word), # pylint: disable=cell-var-from-loop
+                    number=1,
+                    repeat=3,
+                ))
+                print(
+                    f'{word} ({len(fts_result)} lexemes):'
+                    f' FTS5 {fts_duration*1e3:.2f}ms,'
+                    f' CSV scan {csv_duration*1e3:.2f}ms'
+                )
+        finally:
+            conn.close()
+
+
+#########################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Benchmark reading and decoding a large synthetic JSON lines file in text mode versus in bytes
+mode.
+
+Note that ``json.loads`` detects the encoding of bytes input in Python code, so passing it an
+explicitly decoded string is faster than passing it the bytes.
+'''
+
+import os
+import argparse
+import json
+import tempfile
+import timeit
+import gabra_converter
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+
+
+#########################################
+def generate_input(
+    path: str,
+    size: int,
+) -> int:
+    '''
+    Generate a JSON lines file by repeating the pipeline test inputs.
+
+    :param path: The path to the file to generate.
+    :param size: The minimum size of the file in bytes.
+    :return: The number of lines in the file.
+    '''
+    lines: list[bytes] = []
+    for fname in ['lexemes.jsonl', 'wordforms.jsonl']:
+        lines.extend(read_jsonl_lines(os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', fname
+        )))
+    block = b''.join(line.rstrip(b'\r\n') + b'\n' for line in lines)*1000
+    num_lines = 0
+    with open(path, 'wb') as f:
+        while f.tell() < size:
+            f.write(block)
+            num_lines += len(lines)*1000
+    return num_lines
+
+
+#########################################
+def read_text(
+    path: str,
+) -> None:
+    '''
+    Decode every line of a file after reading it in text mode (the old way).
+
+    :param path: The path to the file.
+    '''
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line != '\n':
+                try:
+                    json.loads(line)
+                except json.decoder.JSONDecodeError:
+                    pass
+
+
+#########################################
+def read_bytes(
+    path: str,
+) -> None:
+    '''
+    Decode every line of a file after reading it as bytes, passing the bytes directly to the
+    JSON decoder.
+
+    :param path: The path to the file.
+    '''
+    for line in read_jsonl_lines(path):
+        try:
+            json.loads(line)
+        except json.decoder.JSONDecodeError:
+            pass
+
+
+#########################################
+def read_bytes_decoded(
+    path: str,
+) -> None:
+    '''
+    Decode every line of a file after reading it as bytes, converting the bytes to a string
+    before passing it to the JSON decoder (the pipelines' way).
+
+    :param path: The path to the file.
+    '''
+    for line in read_jsonl_lines(path):
+        try:
+            json.loads(line.decode('utf-8'))
+        except json.decoder.JSONDecodeError:
+            pass
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description=(
+            'Benchmark reading and decoding a large synthetic JSON lines file in text mode'
+            ' versus in bytes mode.'
+        )
+    )
+    parser.add_argument(
+        '--size_gb',
+        required=False,
+        type=float,
+        default=2.0,
+        help='The size of the synthetic file to generate in gigabytes.',
+    )
+    parser.add_argument(
+        '--tmp_path',
+        required=False,
+        default=None,
+        help='The folder in which to generate the synthetic file (system default if not given).',
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.tmp_path) as tmp_path:
+        path = os.path.join(tmp_path, 'synthetic.jsonl')
+        num_lines = generate_input(path, int(args.size_gb*1024**3))
+        print(f'Generated {os.path.getsize(path)/1024**3:.2f}GB with {num_lines} lines.')
+
+        for (name, read) in [
+            ('text', read_text),
+            ('bytes', read_bytes),
+            ('bytes decoded', read_bytes_decoded),
+        ]:
+            duration = timeit.timeit(lambda: read(path), number=1) # pylint: disable=cell-var-from-loop
+            print(
+                f'{name}: {duration:.1f}s,'
+                f' {os.path.getsize(path)/1024**2/duration:.1f}MB/s,'
+                f' {duration/num_lines*1e6:.2f}us/line'
+            )
+
+
+#########################################
+if __name__ == '__main__':
+    main()
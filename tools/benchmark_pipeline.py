@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Microbenchmark the per-row cost of the lexeme and wordform pipelines.
+
+Rows are taken from the pipeline test inputs and sent to exporters that do nothing so that the
+measured time is that of the pipeline itself (decoding, fixing, validation, cleaning, and
+listener dispatch).
+'''
+
+import os
+import argparse
+import timeit
+import gabra_converter
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_all_lexeme_cleaners
+)
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.pipeline.listeners.lexeme_pipeline_listener import (
+    LexemePipelineListener
+)
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_all_wordform_cleaners
+)
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.pipeline.listeners.wordform_pipeline_listener import (
+    WordformPipelineListener
+)
+
+
+#########################################
+def read_lines(
+    fname: str,
+) -> list[bytes]:
+    '''
+    Read the non-empty lines of one of the pipeline test inputs.
+
+    :param fname: The file name of the test input.
+    :return: The lines.
+    '''
+    return list(read_jsonl_lines(
+        os.path.join(gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input', fname)
+    ))
+
+
+#########################################
+def benchmark_lexemes(
+    num_listeners: int,
+    repeats: int,
+) -> float:
+    '''
+    Measure the time taken to process a lexeme row.
+
+    :param num_listeners: The number of listeners that do not override any event to add.
+    :param repeats: The number of times to process the test input.
+    :return: The best time in microseconds per row.
+    '''
+    lines = read_lines('lexemes.jsonl')
+    pipeline = LexemePipeline(get_all_lexeme_cleaners(), NullLexemeExporter())
+    for _ in range(num_listeners):
+        pipeline.add_listener(LexemePipelineListener())
+    pipeline.create('')
+
+    def run(
+    ) -> None:
+        '''
+        Process every line once.
+        '''
+        for line in lines:
+            pipeline.add_row(line)
+
+    return min(timeit.repeat(run, number=repeats, repeat=5))/(repeats*len(lines))*1e6
+
+
+#########################################
+def benchmark_wordforms(
+    num_listeners: int,
+    repeats: int,
+) -> float:
+    '''
+    Measure the time taken to process a wordform row.
+
+    :param num_listeners: The number of listeners that do not override any event to add.
+    :param repeats: The number of times to process the test input.
+    :return: The best time in microseconds per row.
+    '''
+    lexeme_exporter = NullLexemeExporter()
+    lexeme_pipeline = LexemePipeline(get_all_lexeme_cleaners(), lexeme_exporter)
+    lexeme_pipeline.create('')
+    for line in read_lines('lexemes.jsonl'):
+        lexeme_pipeline.add_row(line)
+    lexemes_id_map = lexeme_pipeline.get_id_map()
+
+    lines = read_lines('wordforms.jsonl')
+    pipeline = WordformPipeline(get_all_wordform_cleaners(), NullWordformExporter())
+    for _ in range(num_listeners):
+        pipeline.add_listener(WordformPipelineListener())
+    pipeline.create('')
+
+    def run(
+    ) -> None:
+        '''
+        Process every line once.
+        '''
+        for line in lines:
+            pipeline.add_row(line, lexemes_id_map)
+
+    return min(timeit.repeat(run, number=repeats, repeat=5))/(repeats*len(lines))*1e6
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Microbenchmark the per-row cost of the lexeme and wordform pipelines.'
+    )
+    parser.add_argument(
+        '--repeats',
+        required=False,
+        type=int,
+        default=500,
+        help='The number of times to process the test inputs per measurement.',
+    )
+    args = parser.parse_args()
+
+    for num_listeners in [0, 8, 32]:
+        print(
+            f'{num_listeners} idle listeners:'
+            f' lexemes {benchmark_lexemes(num_listeners, args.repeats):.2f}us/row,'
+            f' wordforms {benchmark_wordforms(num_listeners, args.repeats):.2f}us/row'
+        )
+
+
+#########################################
+if __name__ == '__main__':
+    main()
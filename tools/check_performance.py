@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Check that the pipeline stages, cleaners, and exporters did not get slower or use more memory
+than in a baseline saved in the repository.
+
+Every benchmark processes generated lexemes and wordforms of fixed sizes, made by repeating the
+pipeline test inputs with new IDs.
+The throughput of a benchmark is compared to the baseline relative to that of a calibration
+workload (decoding the same JSON lines) measured right before and after it, so that baselines
+saved on one machine can be compared to measurements on another and so that changes in the
+speed of the machine whilst the benchmarks run cancel out.
+The peak memory of a benchmark is the peak size of the Python allocations traced with
+``tracemalloc`` during a separate run, which does not depend on the speed of the machine.
+
+Extracting a dump is not benchmarked as it is done by the external tar and bsondump commands.
+'''
+
+import os
+import gc
+import sys
+import json
+import time
+import argparse
+import tempfile
+import functools
+import statistics
+import tracemalloc
+from typing import Any, Callable, Optional
+import gabra_converter
+from gabra_converter.dry_run import dry_run_lexemes, dry_run_wordforms
+from gabra_converter.converters.external_sort import sort_jsonl_file
+from gabra_converter.converters.jsonl_reader import read_jsonl_lines
+from gabra_converter.converters.sampling import (
+    RowSampler,
+    sample_lexemes_file,
+    sample_wordforms_file,
+)
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner import LexemeCleaner
+from gabra_converter.converters.lexemes.cleaners.lexeme_cleaner_list import (
+    get_lexeme_cleaner_infos,
+    get_lexeme_cleaner,
+)
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter import LexemeExporter
+from gabra_converter.converters.lexemes.exporters.lexeme_exporter_list import (
+    get_lexeme_exporter_infos,
+    get_lexeme_exporter,
+)
+from gabra_converter.converters.lexemes.exporters.null_lexeme_exporter import NullLexemeExporter
+from gabra_converter.converters.lexemes.pipeline.lexeme_pipeline import LexemePipeline
+from gabra_converter.converters.lexemes.row.lexeme_row_order import get_lexeme_order_key
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner import WordformCleaner
+from gabra_converter.converters.wordforms.cleaners.wordform_cleaner_list import (
+    get_wordform_cleaner_infos,
+    get_wordform_cleaner,
+)
+from gabra_converter.converters.wordforms.exporters.wordform_exporter import WordformExporter
+from gabra_converter.converters.wordforms.exporters.wordform_exporter_list import (
+    get_wordform_exporter_infos,
+    get_wordform_exporter,
+)
+from gabra_converter.converters.wordforms.exporters.null_wordform_exporter import (
+    NullWordformExporter
+)
+from gabra_converter.converters.wordforms.pipeline.wordform_pipeline import WordformPipeline
+from gabra_converter.converters.wordforms.row.wordform_row_order import get_wordform_order_key
+
+
+NUM_LEXEMES = 1000
+NUM_WORDFORMS = 5000
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'performance_baseline.json'
+)
+
+# Differences in peak memory below this many bytes are ignored as noise.
+MEMORY_SLACK = 256*1024
+
+
+#########################################
+def generate_inputs(
+    dir_path: str,
+    num_lexemes: int,
+    num_wordforms: int,
+) -> tuple[str, str]:
+    '''
+    Generate lexemes and wordforms JSON lines files by repeating the valid JSON lines of the
+    pipeline test inputs with new IDs, with every wordform referring to a generated lexeme.
+
+    :param dir_path: The path to the folder in which to write the files.
+    :param num_lexemes: The number of lexemes to generate.
+    :param num_wordforms: The number of wordforms to generate.
+    :return: The paths to the lexemes and wordforms files.
+    '''
+    templates: dict[str, list[dict[str, Any]]] = {}
+    for collection in ['lexemes', 'wordforms']:
+        templates[collection] = []
+        for line in read_jsonl_lines(os.path.join(
+            gabra_converter.path, '..', '..', 'tests', 'pipeline', 'test_input',
+            f'{collection}.jsonl'
+        )):
+            try:
+                templates[collection].append(json.loads(line.decode('utf-8')))
+            except json.decoder.JSONDecodeError:
+                pass
+
+    lexemes_path = os.path.join(dir_path, 'lexemes.jsonl')
+    with open(lexemes_path, 'w', encoding='utf-8') as f:
+        for i in range(num_lexemes):
+            lexeme = dict(templates['lexemes'][i%len(templates['lexemes'])])
+            lexeme['_id'] = {'$oid': f'{i:024x}'}
+            print(json.dumps(lexeme, ensure_ascii=False), file=f)
+
+    wordforms_path = os.path.join(dir_path, 'wordforms.jsonl')
+    with open(wordforms_path, 'w', encoding='utf-8') as f:
+        for i in range(num_wordforms):
+            wordform = dict(templates['wordforms'][i%len(templates['wordforms'])])
+            wordform['_id'] = {'$oid': f'{num_lexemes + i:024x}'}
+            wordform['lexeme_id'] = {'$oid': f'{i%num_lexemes:024x}'}
+            print(json.dumps(wordform, ensure_ascii=False), file=f)
+
+    return (lexemes_path, wordforms_path)
+
+
+#########################################
+def get_benchmarks(
+    lexemes_path: str,
+    wordforms_path: str,
+    tmp_path: str,
+) -> dict[str, Callable[[], int]]:
+    '''
+    Get the benchmarks to run.
+
+    :param lexemes_path: The path to the generated lexemes.
+    :param wordforms_path: The path to the generated wordforms.
+    :param tmp_path: The path to a folder in which the benchmarks can write files.
+    :return: A dictionary mapping benchmark names to functions that run the benchmark once and
+        return the number of rows processed.
+    '''
+    lexeme_pipeline = LexemePipeline([], NullLexemeExporter())
+    lexeme_pipeline.create('')
+    lexeme_pipeline.convert_file(lexemes_path)
+    lexemes_id_map = lexeme_pipeline.get_id_map()
+    out_path = os.path.join(tmp_path, 'out')
+    os.makedirs(out_path, exist_ok=True)
+
+    #########################################
+    def convert_lexemes(
+        cleaners: list[LexemeCleaner],
+        exporter: LexemeExporter,
+    ) -> int:
+        '''
+        Convert the lexemes.
+
+        :param cleaners: The cleaners to apply.
+        :param exporter: The exporter to use.
+        :return: The number of rows processed.
+        '''
+        pipeline = LexemePipeline(cleaners, exporter)
+        pipeline.create(out_path)
+        pipeline.convert_file(lexemes_path)
+        return NUM_LEXEMES
+
+    #########################################
+    def convert_wordforms(
+        cleaners: list[WordformCleaner],
+        exporter: WordformExporter,
+    ) -> int:
+        '''
+        Convert the wordforms.
+
+        :param cleaners: The cleaners to apply.
+        :param exporter: The exporter to use.
+        :return: The number of rows processed.
+        '''
+        pipeline = WordformPipeline(cleaners, exporter)
+        pipeline.create(out_path)
+        pipeline.convert_file(wordforms_path, lexemes_id_map)
+        return NUM_WORDFORMS
+
+    #########################################
+    def sort_lexemes(
+    ) -> int:
+        '''
+        Sort the lexemes by lemma.
+
+        :return: The number of rows processed.
+        '''
+        sort_jsonl_file(
+            lexemes_path, os.path.join(tmp_path, 'sorted.jsonl'), get_lexeme_order_key('lemma'),
+            tmp_path,
+        )
+        return NUM_LEXEMES
+
+    #########################################
+    def sort_wordforms(
+    ) -> int:
+        '''
+        Sort the wordforms by lexeme.
+
+        :return: The number of rows processed.
+        '''
+        sort_jsonl_file(
+            wordforms_path,
+            os.path.join(tmp_path, 'sorted.jsonl'),
+            get_wordform_order_key('new_lexeme_id', lexemes_id_map),
+            tmp_path,
+        )
+        return NUM_WORDFORMS
+
+    #########################################
+    def sample(
+    ) -> int:
+        '''
+        Sample a tenth of the lexemes and wordforms.
+
+        :return: The number of rows processed.
+        '''
+        sampler = RowSampler(0.1)
+        sample_lexemes_file(lexemes_path, os.path.join(tmp_path, 'sampled.jsonl'), sampler)
+        sample_wordforms_file(wordforms_path, os.path.join(tmp_path, 'sampled.jsonl'), sampler)
+        return NUM_LEXEMES + NUM_WORDFORMS
+
+    #########################################
+    def dry_run(
+    ) -> int:
+        '''
+        Check the lexemes and wordforms in a dry run in a single process, so that the result
+        does not depend on the number of cores.
+
+        :return: The number of rows processed.
+        '''
+        (_, id_map) = dry_run_lexemes(lexemes_path, [], 1)
+        dry_run_wordforms(wordforms_path, [], id_map, 1)
+        return NUM_LEXEMES + NUM_WORDFORMS
+
+    benchmarks: dict[str, Callable[[], int]] = {
+        'stage:convert_lexemes': lambda: convert_lexemes([], NullLexemeExporter()),
+        'stage:convert_wordforms': lambda: convert_wordforms([], NullWordformExporter()),
+        'stage:sort_lexemes': sort_lexemes,
+        'stage:sort_wordforms': sort_wordforms,
+        'stage:sample': sample,
+        'stage:dry_run': dry_run,
+    }
+    for info in get_lexeme_cleaner_infos():
+        benchmarks[f'lexeme_cleaner:{info.id_}'] = functools.partial(
+            convert_lexemes, [get_lexeme_cleaner(info.id_)], NullLexemeExporter()
+        )
+    for info in get_wordform_cleaner_infos():
+        benchmarks[f'wordform_cleaner:{info.id_}'] = functools.partial(
+            convert_wordforms, [get_wordform_cleaner(info.id_)], NullWordformExporter()
+        )
+    for info in get_lexeme_exporter_infos():
+        benchmarks[f'lexeme_exporter:{info.id_}'] = functools.partial(
+            convert_lexemes, [], get_lexeme_exporter(info.id_)
+        )
+    for info in get_wordform_exporter_infos():
+        benchmarks[f'wordform_exporter:{info.id_}'] = functools.partial(
+            convert_wordforms, [], get_wordform_exporter(info.id_)
+        )
+    return benchmarks
+
+
+#########################################
+def time_run(
+    run: Callable[[], int],
+) -> float:
+    '''
+    Measure the throughput of a single run of a benchmark.
+        The time is measured as the processor time of this process with the garbage collector
+        disabled, as in ``timeit``, so that it is less affected by other processes.
+
+    :param run: The benchmark function, which returns the number of rows processed.
+    :return: The number of rows processed per second.
+    '''
+    gc.collect()
+    gc.disable()
+    try:
+        start_time = time.process_time()
+        num_rows = run()
+        duration = time.process_time() - start_time
+    finally:
+        gc.enable()
+    return num_rows/max(duration, 1e-9)
+
+
+#########################################
+def measure_throughput(
+    run: Callable[[], int],
+    calibrate: Callable[[], int],
+    repeats: int,
+) -> tuple[float, float]:
+    '''
+    Measure the throughput of a benchmark, both in absolute terms and relative to a calibration
+    workload.
+        Every run of the benchmark is preceded and followed by a run of the calibration workload
+        so that both are affected in the same way by changes in the speed of the machine, such
+        as due to frequency scaling or other virtual machines.
+
+    :param run: The benchmark function, which returns the number of rows processed.
+    :param calibrate: The calibration function, which returns the number of rows processed.
+    :param repeats: The number of times to run the benchmark.
+    :return: A tuple with the best number of rows processed per second and the median ratio of
+        the rows processed per second to those of the calibration workload.
+    '''
+    best = 0.0
+    ratios = []
+    for _ in range(repeats):
+        calibration_before = time_run(calibrate)
+        rows_per_second = time_run(run)
+        calibration_after = time_run(calibrate)
+        best = max(best, rows_per_second)
+        ratios.append(rows_per_second/((calibration_before + calibration_after)/2))
+    return (best, statistics.median(ratios))
+
+
+#########################################
+def measure_peak_memory(
+    run: Callable[[], int],
+) -> int:
+    '''
+    Measure the peak size of the Python allocations made by a benchmark.
+
+    :param run: The benchmark function.
+    :return: The peak size in bytes.
+    '''
+    tracemalloc.start()
+    try:
+        run()
+        (_, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+#########################################
+def run_benchmarks(
+    repeats: int,
+    only: Optional[list[str]] = None,
+) -> dict[str, dict[str, float]]:
+    '''
+    Run every benchmark on generated data.
+
+    :param repeats: The number of times to run each benchmark for its throughput.
+    :param only: The names of the benchmarks to run or None to run them all.
+    :return: A dictionary mapping benchmark names to their 'rows_per_second',
+        'relative_speed' (see ``measure_throughput``), and
+        'peak_memory' (in bytes).
+    '''
+    with tempfile.TemporaryDirectory() as tmp_path:
+        (lexemes_path, wordforms_path) = generate_inputs(tmp_path, NUM_LEXEMES, NUM_WORDFORMS)
+        lines = list(read_jsonl_lines(lexemes_path)) + list(read_jsonl_lines(wordforms_path))
+
+        #########################################
+        def calibrate(
+        ) -> int:
+            '''
+            Decode every generated lexeme and wordform.
+
+            :return: The number of rows processed.
+            '''
+            for line in lines:
+                json.loads(line.decode('utf-8'))
+            return len(lines)
+
+        results: dict[str, dict[str, float]] = {}
+        for (name, run) in get_benchmarks(lexemes_path, wordforms_path, tmp_path).items():
+            if only is not None and name not in only:
+                continue
+            (rows_per_second, relative_speed) = measure_throughput(run, calibrate, repeats)
+            results[name] = {
+                'rows_per_second': rows_per_second,
+                'relative_speed': relative_speed,
+                'peak_memory': measure_peak_memory(run),
+            }
+    return results
+
+
+#########################################
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    speed_tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    '''
+    Compare the results of the benchmarks to a baseline.
+
+    :param results: The results returned by ``run_benchmarks``.
+    :param baseline: The results of the baseline.
+    :param speed_tolerance: The fraction by which the relative speed can drop.
+    :param memory_tolerance: The fraction by which the peak memory can grow, beyond
+        ``MEMORY_SLACK``.
+    :return: A description of every regression.
+    '''
+    regressions = []
+    for (name, result) in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if result['relative_speed'] < expected['relative_speed']*(1 - speed_tolerance):
+            regressions.append(
+                f'{name} is {1 - result["relative_speed"]/expected["relative_speed"]:.0%}'
+                ' slower than the baseline.'
+            )
+        if result['peak_memory'] > expected['peak_memory']*(1 + memory_tolerance) + MEMORY_SLACK:
+            regressions.append(
+                f'{name} uses {result["peak_memory"]/expected["peak_memory"] - 1:.0%} more'
+                ' memory than the baseline.'
+            )
+    return regressions
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description=(
+            'Check the throughput and peak memory of the pipeline stages, cleaners, and exporters'
+            ' against a baseline.'
+        )
+    )
+    parser.add_argument(
+        '--repeats',
+        required=False,
+        type=int,
+        default=3,
+        help='The number of times to run each benchmark, keeping the fastest.',
+    )
+    parser.add_argument(
+        '--speed_tolerance',
+        required=False,
+        type=float,
+        default=0.3,
+        help='The fraction by which the speed relative to the calibration workload can drop.',
+    )
+    parser.add_argument(
+        '--memory_tolerance',
+        required=False,
+        type=float,
+        default=0.1,
+        help='The fraction by which the peak memory can grow.',
+    )
+    parser.add_argument(
+        '--baseline_path',
+        required=False,
+        default=BASELINE_PATH,
+        help='The path to the baseline JSON file.',
+    )
+    parser.add_argument(
+        '--only',
+        required=False,
+        nargs='*',
+        default=None,
+        help='The names of the benchmarks to run (all of them by default).',
+    )
+    parser.add_argument(
+        '--update_baseline',
+        action='store_true',
+        help=(
+            'Save the results as the new baseline instead of checking them, such as after an'
+            ' intended change in performance or when adding a benchmark.'
+        ),
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeats, args.only)
+    baseline: dict[str, dict[str, float]] = {}
+    if os.path.isfile(args.baseline_path):
+        with open(args.baseline_path, 'r', encoding='utf-8') as f:
+            baseline_file = json.load(f)
+        if (baseline_file['num_lexemes'], baseline_file['num_wordforms']) == (
+            NUM_LEXEMES, NUM_WORDFORMS
+        ):
+            baseline = baseline_file['benchmarks']
+        else:
+            print('The baseline was measured on data of different sizes so it is ignored.')
+
+    for (name, result) in results.items():
+        if name in baseline:
+            comparison = (
+                f' ({result["relative_speed"]/baseline[name]["relative_speed"]:.2f}x speed,'
+                f' {result["peak_memory"]/baseline[name]["peak_memory"]:.2f}x memory)'
+            )
+        else:
+            comparison = ' (not in baseline)'
+        print(
+            f'{name}: {result["rows_per_second"]:.0f} rows/s,'
+            f' {result["peak_memory"]/1024:.0f}KB peak{comparison}'
+        )
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'num_lexemes': NUM_LEXEMES,
+                    'num_wordforms': NUM_WORDFORMS,
+                    'benchmarks': dict(sorted(baseline.items())),
+                },
+                f, indent=1,
+            )
+            f.write('\n')
+        print('Baseline updated.')
+        return
+
+    regressions = find_regressions(
+        results, baseline, args.speed_tolerance, args.memory_tolerance
+    )
+    for regression in regressions:
+        print(f'Regression: {regression}')
+    if len(regressions) > 0:
+        sys.exit(1)
+    print('No regressions.')
+
+
+#########################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Write a CSV report of the lexemes and wordforms that were added, removed, or modified between
+two Ġabra database dumps or two conversions made with the jsonl exporters, matching rows by
+their Ġabra ID.
+'''
+
+import argparse
+from gabra_converter.diff_report import write_diff_report
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description=(
+            'Report the differences between two Ġabra databases or conversions.'
+        )
+    )
+    parser.add_argument(
+        '--old_lexemes_path', required=True,
+        help=(
+            'The path to the old .tar.gz Ġabra dump, lexemes .bson or JSON lines file, or'
+            ' lexemes.ndjson file written by the jsonl exporter.'
+        ),
+    )
+    parser.add_argument(
+        '--new_lexemes_path', required=True,
+        help='The path to the new lexemes, in any of the forms of --old_lexemes_path.',
+    )
+    parser.add_argument(
+        '--old_wordforms_path', required=False,
+        help=(
+            'The path to the old .tar.gz Ġabra dump, wordforms .bson or JSON lines file, or'
+            ' wordforms.ndjson file written by the jsonl exporter (defaults to the old lexemes'
+            ' path, for dumps).'
+        ),
+    )
+    parser.add_argument(
+        '--new_wordforms_path', required=False,
+        help=(
+            'The path to the new wordforms, in any of the forms of --old_wordforms_path'
+            ' (defaults to the new lexemes path, for dumps).'
+        ),
+    )
+    parser.add_argument(
+        '--report_path', required=True,
+        help='The path to the CSV report to write.',
+    )
+    parser.add_argument(
+        '--tmp_path', required=False,
+        help='The path to a folder in which to sort the rows (defaults to the temporary folder).',
+    )
+    args = parser.parse_args()
+
+    counts = write_diff_report(
+        args.old_lexemes_path,
+        args.new_lexemes_path,
+        args.old_wordforms_path
+            if args.old_wordforms_path is not None else args.old_lexemes_path,
+        args.new_wordforms_path
+            if args.new_wordforms_path is not None else args.new_lexemes_path,
+        args.report_path,
+        args.tmp_path,
+    )
+    for (collection, collection_counts) in counts.items():
+        print(
+            f'{collection}: {collection_counts["added"]} added,'
+            f' {collection_counts["removed"]} removed,'
+            f' {collection_counts["modified"]} modified.'
+        )
+
+
+#########################################
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Merge the statistics reports of the same collection produced by different exports, such as
+those of parallel workers over parts of a dump, into a single report.
+'''
+
+import argparse
+from gabra_converter.converters.dataset_stats import (
+    merge_stats_reports,
+    save_stats_report,
+    load_stats_report,
+)
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description='Merge statistics reports (lexemes_stats.json or wordforms_stats.json).'
+    )
+    parser.add_argument(
+        '--in_paths', required=True, nargs='+',
+        help='The paths to the reports to merge, all of the same collection.',
+    )
+    parser.add_argument(
+        '--out_path', required=True,
+        help='The path to the merged report to write.',
+    )
+    args = parser.parse_args()
+
+    save_stats_report(
+        args.out_path,
+        merge_stats_reports([load_stats_report(path) for path in args.in_paths]),
+    )
+
+
+#########################################
+if __name__ == '__main__':
+    main()
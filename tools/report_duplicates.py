@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright © 2024 Marc Tanti
+#
+# This file is part of Ġabra Converter project.
+'''
+Write a CSV report of the repeated lexeme IDs, repeated wordform IDs, and duplicated wordforms
+in a Ġabra database dump or in its extracted collection files.
+'''
+
+import argparse
+from gabra_converter.duplicates_report import write_duplicates_report
+
+
+#########################################
+def main(
+) -> None:
+    '''
+    Main function.
+    '''
+    parser = argparse.ArgumentParser(
+        description=(
+            'Report the duplicate lexemes and wordforms in a Ġabra database.'
+        )
+    )
+    parser.add_argument(
+        '--lexemes_path', required=True,
+        help=(
+            'The path to the .tar.gz Ġabra dump or to a lexemes .bson or JSON lines file.'
+        ),
+    )
+    parser.add_argument(
+        '--wordforms_path', required=False,
+        help=(
+            'The path to the .tar.gz Ġabra dump or to a wordforms .bson or JSON lines file'
+            ' (defaults to the lexemes path, for dumps).'
+        ),
+    )
+    parser.add_argument(
+        '--report_path', required=True,
+        help='The path to the CSV report to write.',
+    )
+    args = parser.parse_args()
+
+    num_duplicates = write_duplicates_report(
+        args.lexemes_path,
+        args.wordforms_path if args.wordforms_path is not None else args.lexemes_path,
+        args.report_path,
+    )
+    print(f'{num_duplicates} duplicates found.')
+
+
+#########################################
+if __name__ == '__main__':
+    main()